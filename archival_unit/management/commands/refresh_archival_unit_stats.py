@@ -0,0 +1,11 @@
+from django.core.management import BaseCommand
+
+from archival_unit.services.stats import refresh_stats
+
+
+class Command(BaseCommand):
+    help = "Recount the statistics of every archival unit with grouped aggregate queries."
+
+    def handle(self, *args, **options):
+        units = refresh_stats()
+        self.stdout.write(self.style.SUCCESS(f"Done. Units={units}"))
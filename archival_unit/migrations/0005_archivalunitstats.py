@@ -0,0 +1,41 @@
+# Generated by Django 4.1.13 on 2026-10-16 23:58
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_fonds_stats(apps, schema_editor):
+    ArchivalUnit = apps.get_model('archival_unit', 'ArchivalUnit')
+    ArchivalUnitStats = apps.get_model('archival_unit', 'ArchivalUnitStats')
+    FindingAidsEntity = apps.get_model('finding_aids', 'FindingAidsEntity')
+
+    sizes = FindingAidsEntity.objects.filter(published=True)\
+        .values('archival_unit__parent__parent').annotate(size=models.Count('id')).order_by()
+    sizes = {row['archival_unit__parent__parent']: row['size'] for row in sizes}
+    ArchivalUnitStats.objects.bulk_create([
+        ArchivalUnitStats(archival_unit_id=fonds_id, published_finding_aids=sizes.get(fonds_id, 0))
+        for fonds_id in ArchivalUnit.objects.filter(level='F').values_list('id', flat=True)
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archival_unit', '0004_alter_archivalunit_fonds_and_more'),
+        ('finding_aids', '0026_findingaidsentity_detected_locale'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivalUnitStats',
+            fields=[
+                ('archival_unit', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='archival_unit.archivalunit')),
+                ('published_finding_aids', models.IntegerField(default=0)),
+                ('date_updated', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'archival_unit_stats',
+            },
+        ),
+        migrations.RunPython(populate_fonds_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,103 @@
+# Generated by Django 4.1.13 on 2026-10-17 00:02
+
+from collections import defaultdict
+
+from django.db import migrations, models
+
+COUNTERS = [
+    'finding_aids', 'published_finding_aids', 'restricted_finding_aids', 'online_finding_aids', 'containers'
+]
+
+
+def populate_counters(apps, schema_editor):
+    """
+    Counts every archival unit once, rolling series up into subfonds and fonds.
+    """
+    ArchivalUnit = apps.get_model('archival_unit', 'ArchivalUnit')
+    ArchivalUnitStats = apps.get_model('archival_unit', 'ArchivalUnitStats')
+    Container = apps.get_model('container', 'Container')
+    FindingAidsEntity = apps.get_model('finding_aids', 'FindingAidsEntity')
+
+    totals = defaultdict(lambda: dict({counter: 0 for counter in COUNTERS}, extent={}))
+    finding_aids = FindingAidsEntity.objects.values('archival_unit_id').annotate(
+        finding_aids=models.Count('id', filter=models.Q(is_template=False)),
+        published_finding_aids=models.Count('id', filter=models.Q(published=True)),
+        restricted_finding_aids=models.Count('id', filter=models.Q(access_rights_id=3)),
+        online_finding_aids=models.Count('id', filter=models.Q(digital_version_online=True)),
+    ).order_by()
+    for row in finding_aids:
+        totals[row.pop('archival_unit_id')].update(row)
+    containers = Container.objects.values(
+        'archival_unit_id', 'carrier_type_id', 'carrier_type__type', 'carrier_type__type_original_language'
+    ).annotate(number=models.Count('id'), width=models.Sum('carrier_type__width')).order_by()
+    for row in containers:
+        totals[row['archival_unit_id']]['containers'] += row['number']
+        totals[row['archival_unit_id']]['extent'][row['carrier_type_id']] = {
+            'carrier_type': row['carrier_type__type'],
+            'carrier_type_original': row['carrier_type__type_original_language'],
+            'number': row['number'],
+            'width': row['width'] or 0,
+        }
+
+    units = list(ArchivalUnit.objects.values('id', 'parent_id', 'level'))
+    for level in ['S', 'SF']:
+        for unit in units:
+            if unit['level'] == level and unit['parent_id']:
+                child, parent = totals[unit['id']], totals[unit['parent_id']]
+                for counter in COUNTERS:
+                    parent[counter] += child[counter]
+                for carrier_type_id, extent in child['extent'].items():
+                    if carrier_type_id in parent['extent']:
+                        parent['extent'][carrier_type_id]['number'] += extent['number']
+                        parent['extent'][carrier_type_id]['width'] += extent['width']
+                    else:
+                        parent['extent'][carrier_type_id] = dict(extent)
+
+    ArchivalUnitStats.objects.all().delete()
+    ArchivalUnitStats.objects.bulk_create([
+        ArchivalUnitStats(
+            archival_unit_id=unit['id'],
+            extent=[
+                dict(extent, carrier_type_id=carrier_type_id)
+                for carrier_type_id, extent in sorted(totals[unit['id']]['extent'].items())
+            ],
+            **{counter: totals[unit['id']][counter] for counter in COUNTERS}
+        ) for unit in units
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archival_unit', '0005_archivalunitstats'),
+        ('container', '0013_container_internal_note'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivalunitstats',
+            name='containers',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='archivalunitstats',
+            name='extent',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AddField(
+            model_name='archivalunitstats',
+            name='finding_aids',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='archivalunitstats',
+            name='online_finding_aids',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='archivalunitstats',
+            name='restricted_finding_aids',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -224,4 +224,42 @@ class ArchivalUnit(models.Model, DetectProtectedMixin):
             models.Index(fields=['fonds', 'subfonds', 'series'], name='fsfs_idx'),
             models.Index(fields=['title']),
             models.Index(fields=['reference_code']),
-        ]
\ No newline at end of file
+        ]
+
+
+class ArchivalUnitStats(models.Model):
+    """
+    Denormalized counters of an archival unit, read by the public catalog.
+
+    Every fonds, subfonds and series holds the totals of its whole subtree.
+    The counters are refreshed with grouped aggregate queries (see
+    ``archival_unit.services.stats``) when finding aids entities or
+    containers are saved or deleted, so catalog pages and statistics are
+    served without counting finding aids on every request.
+
+    Attributes:
+        archival_unit: The counted archival unit.
+        finding_aids: Number of finding aids entities (templates excluded).
+        published_finding_aids: Number of published finding aids entities.
+        restricted_finding_aids: Number of finding aids entities with restricted access.
+        online_finding_aids: Number of finding aids entities with a digital version online.
+        containers: Number of containers.
+        extent: Containers per carrier type, as a list of dicts with
+            carrier_type_id, carrier_type, carrier_type_original, number and
+            width (the summed carrier width in millimetres).
+        date_updated: Time of the last refresh.
+    """
+
+    archival_unit = models.OneToOneField(
+        'ArchivalUnit', primary_key=True, related_name='stats', on_delete=models.CASCADE
+    )
+    finding_aids = models.IntegerField(default=0)
+    published_finding_aids = models.IntegerField(default=0)
+    restricted_finding_aids = models.IntegerField(default=0)
+    online_finding_aids = models.IntegerField(default=0)
+    containers = models.IntegerField(default=0)
+    extent = models.JSONField(default=list)
+    date_updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'archival_unit_stats'
@@ -4,6 +4,7 @@ from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
 from archival_unit.models import ArchivalUnit
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from clockwork_api.mixins.user_data_serializer_mixin import UserDataSerializerMixin
 from container.models import Container
 from finding_aids.models import FindingAidsEntity
@@ -36,7 +37,7 @@ class ArchivalUnitSubfondsSerializer(serializers.ModelSerializer):
         Returns serialized series children, or None if no children exist.
         """
         if obj.children.count() > 0:
-            return ArchivalUnitSeriesSerializer(obj.children, many=True).data
+            return ArchivalUnitSeriesSerializer(annotate_removable(obj.children.all()), many=True).data
         else:
             return None
 
@@ -60,7 +61,7 @@ class ArchivalUnitFondsSerializer(serializers.ModelSerializer):
         Returns serialized subfonds children, or None if no children exist.
         """
         if obj.children.count() > 0:
-            return ArchivalUnitSubfondsSerializer(obj.children, many=True).data
+            return ArchivalUnitSubfondsSerializer(annotate_removable(obj.children.all()), many=True).data
         else:
             return None
 
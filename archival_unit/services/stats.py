@@ -0,0 +1,162 @@
+import logging
+from collections import defaultdict
+
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from archival_unit.models import ArchivalUnit, ArchivalUnitStats
+from container.models import Container
+from finding_aids.models import FindingAidsEntity
+
+logger = logging.getLogger(__name__)
+
+# AccessRight id of restricted material.
+RESTRICTED_ACCESS_RIGHTS_ID = 3
+
+COUNTERS = [
+    'finding_aids', 'published_finding_aids', 'restricted_finding_aids', 'online_finding_aids', 'containers'
+]
+
+# Children are rolled up into their parents, so units are totalled bottom-up.
+LEVELS = ['S', 'SF', 'F']
+
+
+def _empty():
+    return dict({counter: 0 for counter in COUNTERS}, extent={})
+
+
+def count_direct(archival_unit_ids=None):
+    """
+    Counts the finding aids entities and containers linked directly to archival units.
+
+    Uses one grouped query for finding aids and one for containers.
+
+    Args:
+        archival_unit_ids: Restricts the count to these units; None counts every unit.
+
+    Returns:
+        dict: {archival unit id: counters}, where counters holds the COUNTERS
+        and `extent`, a dict of {carrier type id: {carrier_type,
+        carrier_type_original, number, width}}. Units without finding aids
+        or containers are missing.
+    """
+    finding_aids = FindingAidsEntity.objects.all()
+    containers = Container.objects.all()
+    if archival_unit_ids is not None:
+        finding_aids = finding_aids.filter(archival_unit_id__in=archival_unit_ids)
+        containers = containers.filter(archival_unit_id__in=archival_unit_ids)
+
+    counts = defaultdict(_empty)
+    finding_aids = finding_aids.values('archival_unit_id').annotate(
+        finding_aids=Count('id', filter=Q(is_template=False)),
+        published_finding_aids=Count('id', filter=Q(published=True)),
+        restricted_finding_aids=Count('id', filter=Q(access_rights_id=RESTRICTED_ACCESS_RIGHTS_ID)),
+        online_finding_aids=Count('id', filter=Q(digital_version_online=True)),
+    ).order_by()
+    for row in finding_aids:
+        counts[row.pop('archival_unit_id')].update(row)
+
+    containers = containers.values(
+        'archival_unit_id', 'carrier_type_id', 'carrier_type__type', 'carrier_type__type_original_language'
+    ).annotate(number=Count('id'), width=Sum('carrier_type__width')).order_by()
+    for row in containers:
+        unit_counts = counts[row['archival_unit_id']]
+        unit_counts['containers'] += row['number']
+        unit_counts['extent'][row['carrier_type_id']] = {
+            'carrier_type': row['carrier_type__type'],
+            'carrier_type_original': row['carrier_type__type_original_language'],
+            'number': row['number'],
+            'width': row['width'] or 0,
+        }
+    return counts
+
+
+def _add(totals, counts):
+    for counter in COUNTERS:
+        totals[counter] += counts[counter]
+    for carrier_type_id, extent in counts['extent'].items():
+        if carrier_type_id in totals['extent']:
+            totals['extent'][carrier_type_id]['number'] += extent['number']
+            totals['extent'][carrier_type_id]['width'] += extent['width']
+        else:
+            totals['extent'][carrier_type_id] = dict(extent)
+
+
+def _from_stats(stats):
+    counts = {counter: getattr(stats, counter) for counter in COUNTERS}
+    counts['extent'] = {extent['carrier_type_id']: dict(extent) for extent in stats.extent}
+    return counts
+
+
+def refresh_stats(archival_unit_ids=None):
+    """
+    Recounts the statistics of archival units and their ancestors.
+
+    The given units are counted from their own finding aids and containers
+    (plus the stored statistics of their children); their subfonds and fonds
+    are then re-totalled from the stored statistics of their children, so a
+    change in one series never scans the rest of the fonds.
+
+    Args:
+        archival_unit_ids: Units whose records changed; None recounts every unit.
+
+    Returns:
+        int: number of refreshed units.
+    """
+    units = ArchivalUnit.objects.all()
+    if archival_unit_ids is not None:
+        ids = set(archival_unit_ids)
+        for row in ArchivalUnit.objects.filter(id__in=ids).values('parent_id', 'parent__parent_id'):
+            ids.update(row.values())
+        ids.discard(None)
+        units = units.filter(id__in=ids)
+    units = list(units.values('id', 'parent_id', 'level'))
+    unit_ids = {unit['id'] for unit in units}
+
+    totals = count_direct(list(unit_ids) if archival_unit_ids is not None else None)
+
+    if archival_unit_ids is not None:
+        # Children that are not refreshed contribute their stored statistics.
+        for stats in ArchivalUnitStats.objects.filter(archival_unit__parent_id__in=unit_ids)\
+                .exclude(archival_unit_id__in=unit_ids).select_related('archival_unit'):
+            _add(totals[stats.archival_unit.parent_id], _from_stats(stats))
+
+    for level in LEVELS:
+        for unit in units:
+            if unit['level'] == level and unit['parent_id'] in unit_ids:
+                _add(totals[unit['parent_id']], totals[unit['id']])
+
+    _store(unit_ids, totals)
+    logger.debug("Refreshed the statistics of %s archival units", len(unit_ids))
+    return len(unit_ids)
+
+
+def _store(unit_ids, totals):
+    now = timezone.now()
+    existing = {s.archival_unit_id: s for s in ArchivalUnitStats.objects.filter(archival_unit_id__in=unit_ids)}
+    to_create = []
+    for unit_id in unit_ids:
+        counts = totals.get(unit_id) or _empty()
+        stats = existing.get(unit_id) or ArchivalUnitStats(archival_unit_id=unit_id)
+        for counter in COUNTERS:
+            setattr(stats, counter, counts[counter])
+        stats.extent = [
+            dict(extent, carrier_type_id=carrier_type_id)
+            for carrier_type_id, extent in sorted(counts['extent'].items())
+        ]
+        stats.date_updated = now
+        if unit_id not in existing:
+            to_create.append(stats)
+
+    ArchivalUnitStats.objects.bulk_update(existing.values(), COUNTERS + ['extent', 'date_updated'], batch_size=500)
+    ArchivalUnitStats.objects.bulk_create(to_create, batch_size=500)
+
+
+def get_stats(archival_unit):
+    """
+    Returns the stored statistics of an archival unit, or empty statistics if it was never counted.
+    """
+    try:
+        return archival_unit.stats
+    except ArchivalUnitStats.DoesNotExist:
+        return ArchivalUnitStats(archival_unit=archival_unit, extent=[])
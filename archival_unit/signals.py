@@ -1,10 +1,15 @@
-from typing import Type, Any
+from typing import Any, Optional, Type
 
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
 from archival_unit.models import ArchivalUnit
-from isad.tasks import index_catalog_isad_record, index_catalog_isad_record_remove
+from archival_unit.services import stats
+from clockwork_api.services import index_queue
+from container.models import Container
+from controlled_list.models import CarrierType
+from finding_aids.models import FindingAidsEntity
 
 
 @receiver(post_save, sender=ArchivalUnit)
@@ -17,9 +22,10 @@ def update_isad_when_archival_unit_saved(
     Updates the index of the related ISAD record whenever an ArchivalUnit is saved.
 
     Behavior:
-        - If the archival unit has an associated ISAD record (reverse OneToOne)
-        - AND the ISAD record is published → reindex the record.
-        - If the ISAD record exists but is not published → remove it from the index.
+        - If the archival unit has an associated ISAD record (reverse OneToOne),
+          the ISAD record is marked as dirty in the coalescing index queue.
+        - The periodic ISAD flush reindexes published records and removes
+          unpublished or draft records from the index.
 
     This allows the ISAD search index to remain in sync with archival unit updates,
     without requiring manual re-indexing.
@@ -30,9 +36,94 @@ def update_isad_when_archival_unit_saved(
         **kwargs: Additional signal metadata (ignored).
     """
     if hasattr(instance, 'isad'):
-        if instance.isad.published:
-            # Reindex published records
-            index_catalog_isad_record.delay(isad_id=instance.isad.id)
-        else:
-            # Remove unpublished or draft records from index
-            index_catalog_isad_record_remove.delay(isad_id=instance.isad.id)
+        index_queue.mark_dirty(index_queue.ISAD, [instance.isad.id])
+
+
+# Fields of finding aids entities and containers that the statistics depend on.
+FINDING_AIDS_STATS_FIELDS = ['archival_unit_id', 'is_template', 'published', 'access_rights_id', 'digital_version_online']
+CONTAINER_STATS_FIELDS = ['archival_unit_id', 'carrier_type_id']
+
+
+def refresh_stats_of_units(archival_unit_ids: list) -> None:
+    """
+    Refreshes the statistics of the given units (and their ancestors) once the transaction is committed.
+    """
+    archival_unit_ids = set(archival_unit_ids) - {None}
+    if archival_unit_ids:
+        transaction.on_commit(lambda: stats.refresh_stats(archival_unit_ids))
+
+
+def remember_stats_fields(instance: Any, fields: list) -> None:
+    """
+    Stores the counted fields of a record as they are in the database before it is saved.
+    """
+    instance._stats_previous = None
+    if instance.pk:
+        instance._stats_previous = type(instance).objects.filter(pk=instance.pk).values(*fields).first()
+
+
+def get_changed_units(instance: Any, fields: list, previous: Optional[dict]) -> list:
+    """
+    Returns the units whose statistics change with a saved record: none if
+    no counted field changed, otherwise its old and new archival unit.
+
+    `previous` holds the values of the record before the save (None for a new record).
+    """
+    if previous is None:
+        return [instance.archival_unit_id]
+    if all(previous[field] == getattr(instance, field) for field in fields):
+        return []
+    return [previous['archival_unit_id'], instance.archival_unit_id]
+
+
+@receiver(post_save, sender=FindingAidsEntity)
+def update_stats_when_finding_aids_saved(
+        sender: Type[FindingAidsEntity],
+        instance: FindingAidsEntity,
+        **kwargs: Any
+) -> None:
+    """
+    Refreshes the statistics when a finding aids entity is created, published,
+    unpublished, restricted, put online or moved to another series.
+
+    Other edits do not change the counters and do not trigger a refresh.
+    """
+    previous = getattr(instance, 'previous_values', None)
+    refresh_stats_of_units(get_changed_units(instance, FINDING_AIDS_STATS_FIELDS, previous))
+
+
+@receiver(post_delete, sender=FindingAidsEntity)
+def update_stats_when_finding_aids_deleted(
+        sender: Type[FindingAidsEntity],
+        instance: FindingAidsEntity,
+        **kwargs: Any
+) -> None:
+    refresh_stats_of_units([instance.archival_unit_id])
+
+
+@receiver(pre_save, sender=Container)
+def remember_container_stats_fields(sender: Type[Container], instance: Container, **kwargs: Any) -> None:
+    remember_stats_fields(instance, CONTAINER_STATS_FIELDS)
+
+
+@receiver(post_save, sender=Container)
+def update_stats_when_container_saved(sender: Type[Container], instance: Container, **kwargs: Any) -> None:
+    """
+    Refreshes the container counts and extent when a container is created, moved or its carrier type changes.
+    """
+    previous = getattr(instance, '_stats_previous', None)
+    refresh_stats_of_units(get_changed_units(instance, CONTAINER_STATS_FIELDS, previous))
+
+
+@receiver(post_delete, sender=Container)
+def update_stats_when_container_deleted(sender: Type[Container], instance: Container, **kwargs: Any) -> None:
+    refresh_stats_of_units([instance.archival_unit_id])
+
+
+@receiver(post_save, sender=CarrierType)
+def update_stats_when_carrier_type_saved(sender: Type[CarrierType], instance: CarrierType, **kwargs: Any) -> None:
+    """
+    Recounts every unit when a carrier type is renamed or resized, as the extent stores its name and width.
+    """
+    if not kwargs.get('created'):
+        transaction.on_commit(stats.refresh_stats)
@@ -0,0 +1,159 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from archival_unit.models import ArchivalUnitStats
+from archival_unit.services import stats
+from catalog.serializers.archival_units_detail_serializer import ArchivalUnitsDetailSerializer
+from archival_unit.tests.helpers import make_fonds, make_subfonds, make_series
+from clockwork_api.tests.no_index_signals_mixin import NoIndexSignalsMixin
+from container.tests.helpers import make_container
+from controlled_list.models import AccessRight, CarrierType, PrimaryType
+from finding_aids.tests.helpers import make_finding_aids
+from isad.tests.helpers import make_isad
+
+
+class ArchivalUnitStatsTests(NoIndexSignalsMixin, TestCase):
+    fixtures = ['carrier_types', 'primary_types', 'access_rights']
+
+    def setUp(self):
+        super().setUp()
+        self.fonds = make_fonds()
+        self.subfonds = make_subfonds(self.fonds)
+        self.series = make_series(self.subfonds)
+        self.other_series = make_series(self.subfonds, series=2, title='Other series')
+        self.carrier_type = CarrierType.objects.get(pk=1)
+        self.container = make_container(self.series, self.carrier_type)
+        self.primary_type = PrimaryType.objects.first()
+        self.access_rights = AccessRight.objects.get(pk=1)
+        self.restricted = AccessRight.objects.get(pk=stats.RESTRICTED_ACCESS_RIGHTS_ID)
+
+    def _make_finding_aids(self, folder_no, container=None, access_rights=None, **kwargs):
+        return make_finding_aids(
+            container or self.container, self.primary_type, access_rights or self.access_rights,
+            folder_no=folder_no, **kwargs
+        )
+
+    def _stats(self, archival_unit):
+        return ArchivalUnitStats.objects.get(archival_unit=archival_unit)
+
+    def test_count_direct_uses_two_grouped_queries(self):
+        self._make_finding_aids(1, published=True)
+        self._make_finding_aids(2, access_rights=self.restricted, digital_version_online=True)
+
+        with self.assertNumQueries(2):
+            counts = stats.count_direct()
+
+        self.assertEqual(
+            {counter: counts[self.series.id][counter] for counter in stats.COUNTERS},
+            {'finding_aids': 2, 'published_finding_aids': 1, 'restricted_finding_aids': 1,
+             'online_finding_aids': 1, 'containers': 1}
+        )
+        self.assertEqual(counts[self.series.id]['extent'][self.carrier_type.id]['width'], self.carrier_type.width)
+
+    def test_refresh_rolls_up_to_subfonds_and_fonds(self):
+        other_container = make_container(self.other_series, self.carrier_type)
+        self._make_finding_aids(1, published=True)
+        self._make_finding_aids(1, container=other_container, published=True)
+
+        self.assertEqual(stats.refresh_stats(), 4)
+
+        fonds_stats = self._stats(self.fonds)
+        self.assertEqual((fonds_stats.published_finding_aids, fonds_stats.containers), (2, 2))
+        self.assertEqual(fonds_stats.extent, [{
+            'carrier_type_id': self.carrier_type.id,
+            'carrier_type': self.carrier_type.type,
+            'carrier_type_original': self.carrier_type.type_original_language,
+            'number': 2,
+            'width': 2 * self.carrier_type.width,
+        }])
+        self.assertEqual(self._stats(self.other_series).published_finding_aids, 1)
+
+    def test_incremental_refresh_reuses_sibling_stats(self):
+        other_container = make_container(self.other_series, self.carrier_type)
+        self._make_finding_aids(1, container=other_container, published=True)
+        stats.refresh_stats()
+
+        self._make_finding_aids(1, published=True)
+        self.assertEqual(stats.refresh_stats([self.series.id]), 3)
+
+        self.assertEqual(self._stats(self.series).published_finding_aids, 1)
+        self.assertEqual(self._stats(self.subfonds).published_finding_aids, 2)
+        self.assertEqual(self._stats(self.fonds).published_finding_aids, 2)
+
+    def test_publish_and_unpublish_refresh_the_stats(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            fa = self._make_finding_aids(1)
+        self.assertEqual(self._stats(self.fonds).published_finding_aids, 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            fa.published = True
+            fa.save()
+        self.assertEqual(self._stats(self.fonds).published_finding_aids, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            fa.published = False
+            fa.save()
+        self.assertEqual(self._stats(self.fonds).published_finding_aids, 0)
+
+    def test_editing_does_not_refresh(self):
+        fa = self._make_finding_aids(1)
+
+        with patch.object(stats, 'refresh_stats') as refresh, self.captureOnCommitCallbacks(execute=True):
+            fa.title = 'New title'
+            fa.save()
+
+        refresh.assert_not_called()
+
+    def test_moving_and_deleting_refresh_both_series(self):
+        fa = self._make_finding_aids(1, published=True)
+        stats.refresh_stats()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            fa.archival_unit = self.other_series
+            fa.save()
+        self.assertEqual((self._stats(self.series).published_finding_aids,
+                          self._stats(self.other_series).published_finding_aids), (0, 1))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            fa.delete()
+        self.assertEqual(self._stats(self.fonds).published_finding_aids, 0)
+
+    def test_container_changes_refresh_the_extent(self):
+        stats.refresh_stats()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            container = make_container(self.other_series, self.carrier_type)
+        self.assertEqual(self._stats(self.subfonds).containers, 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            container.delete()
+        self.assertEqual(self._stats(self.subfonds).containers, 1)
+
+    def test_detail_serializer_reads_the_stats(self):
+        isad = make_isad(self.fonds)
+        self._make_finding_aids(1, published=True, digital_version_online=True)
+        self._make_finding_aids(2, access_rights=self.restricted)
+        stats.refresh_stats()
+        serializer = ArchivalUnitsDetailSerializer()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(serializer.get_folder_item_count(isad), 1)
+            self.assertEqual(serializer.get_container_count(isad), 1)
+            self.assertEqual(serializer.get_digital_content_online(isad), 1)
+            self.assertEqual(
+                serializer.get_access_rights(isad),
+                'Partially Restricted (1 Folder/Item Restricted - 1 Folder/Item Not Restricted)'
+            )
+            self.assertEqual(
+                serializer.get_extent_processed(isad),
+                ['1 %s, %s linear meters' % (self.carrier_type.type, round(self.carrier_type.width / 1000.00, 2))]
+            )
+
+    def test_serializer_without_stats(self):
+        isad = make_isad(self.fonds)
+        serializer = ArchivalUnitsDetailSerializer()
+
+        self.assertEqual(serializer.get_folder_item_count(isad), 0)
+        self.assertEqual(serializer.get_extent_processed(isad), [])
+        self.assertEqual(serializer.get_access_rights(isad), 'Not Restricted')
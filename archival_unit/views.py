@@ -13,6 +13,7 @@ from archival_unit.serializers import ArchivalUnitSelectSerializer, ArchivalUnit
     ArchivalUnitPreCreateSerializer
 from clockwork_api.mixins.allowed_archival_unit_mixin import ListAllowedArchivalUnitMixin
 from clockwork_api.mixins.audit_log_mixin import AuditLogMixin
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from clockwork_api.mixins.method_serializer_mixin import MethodSerializerMixin
 from container.models import Container
 from finding_aids.models import FindingAidsEntity
@@ -104,7 +105,7 @@ class ArchivalUnitList(AuditLogMixin, MethodSerializerMixin, generics.ListCreate
         - Dynamic serializer selection based on HTTP method
         - Filtering support (fonds-level only)
     """
-    queryset = ArchivalUnit.objects.filter(level='F')
+    queryset = annotate_removable(ArchivalUnit.objects.filter(level='F'))
     method_serializer_classes = {
         ('GET', ): ArchivalUnitFondsSerializer,
         ('POST', ): ArchivalUnitWriteSerializer
@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.utils import timezone
 
 
 class AuditLog(models.Model):
@@ -33,7 +34,9 @@ class AuditLog(models.Model):
             The primary key of the affected object, if applicable.
 
         timestamp (datetime):
-            The date and time when the action was logged.
+            The date and time when the action was performed. Entries are
+            written in the background, so it is set by the writer rather
+            than when the row is inserted.
 
         changed_fields (dict | list | None):
             Optional JSON-serializable structure describing what changed.
@@ -51,7 +54,7 @@ class AuditLog(models.Model):
     action = models.CharField(max_length=10, choices=ACTION_CHOICES, db_index=True)
     model_name = models.CharField(max_length=100, db_index=True)
     object_id = models.PositiveIntegerField(blank=True, null=True, db_index=True)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(default=timezone.now)
     changed_fields = models.JSONField(null=True, blank=True)  # Add this field
 
     class Meta:
@@ -0,0 +1,187 @@
+"""
+Deferred writer of audit log entries.
+
+Views describe an action as a plain dict entry. Once the surrounding
+transaction commits, the entries are appended to a Redis list; the periodic
+audit_log.tasks.flush_audit_log_queue task drains the list and writes the
+collected entries with one bulk INSERT per batch. A request does not wait for
+the audit table, and a rolled back change leaves no audit row behind. When
+Redis is unavailable the entries are written right away instead of being lost.
+
+A batch is moved to a processing list while it is written and only removed
+from there afterwards, so a flush that dies halfway leaves it for the next
+one. Entries that can not be written at all are moved to a failed list.
+"""
+import json
+import logging
+
+import redis
+from django.conf import settings
+from django.db import InterfaceError, OperationalError, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from audit_log.models import AuditLog
+
+logger = logging.getLogger(__name__)
+
+_client = None
+
+
+def _get_client():
+    """
+    Returns a process-wide Redis client for the audit log queue.
+
+    AUDIT_LOG_REDIS_URL defaults to the Celery broker URL.
+    """
+    global _client
+    if _client is None:
+        url = getattr(settings, 'AUDIT_LOG_REDIS_URL', None) or \
+            getattr(settings, 'CELERY_BROKER_URL', 'redis://localhost:6379')
+        _client = redis.Redis.from_url(url)
+    return _client
+
+
+def _get_key(suffix=None):
+    key = getattr(settings, 'AUDIT_LOG_QUEUE_KEY', 'clockwork:audit_log')
+    return '%s:%s' % (key, suffix) if suffix else key
+
+
+def get_batch_size():
+    return getattr(settings, 'AUDIT_LOG_BATCH_SIZE', 500)
+
+
+def make_entry(user=None, action=None, instance=None, changed_fields=None):
+    """
+    Describes an action as a JSON serializable entry.
+
+    The timestamp is taken now, not when the entry is written.
+    """
+    return {
+        'user_id': getattr(user, 'pk', None),
+        'action': action,
+        'model_name': instance.__class__.__name__,
+        'object_id': instance.pk,
+        'changed_fields': changed_fields,
+        'timestamp': timezone.now().isoformat(),
+    }
+
+
+def enqueue(entries):
+    """
+    Hands the entries to the background writer once the current transaction commits.
+    """
+    entries = list(entries)
+    if entries:
+        transaction.on_commit(lambda: push(entries))
+
+
+def push(entries):
+    """
+    Appends the entries to the Redis list drained by flush.
+
+    Falls back to writing them synchronously when Redis cannot be reached.
+    """
+    try:
+        _get_client().rpush(_get_key(), *[json.dumps(entry) for entry in entries])
+    except redis.RedisError as e:
+        logger.warning("Audit log queue unavailable, writing %s entries directly: %s", len(entries), e)
+        write(entries)
+
+
+def pending():
+    """
+    Returns the number of entries waiting for the next flush.
+    """
+    client = _get_client()
+    return client.llen(_get_key()) + client.llen(_get_key('processing'))
+
+
+def flush():
+    """
+    Drains the queue, writing up to AUDIT_LOG_BATCH_SIZE entries per INSERT.
+
+    Only one flush runs at a time. Each batch is moved atomically to the
+    processing list and deleted from it once it is written; a batch left
+    there by a flush that crashed is written first. When the database can
+    not be reached the batch stays in the processing list and the error is
+    raised. A batch rejected for any other reason is written entry by
+    entry, and the entries that still fail are moved to the failed list.
+
+    Returns:
+        int: the number of rows written.
+    """
+    client = _get_client()
+    lock = client.lock(_get_key('lock'), timeout=getattr(settings, 'AUDIT_LOG_FLUSH_LOCK_TIMEOUT', 5 * 60))
+    if not lock.acquire(blocking=False):
+        return 0
+
+    processing = _get_key('processing')
+    written = 0
+    try:
+        while True:
+            values = client.lrange(processing, 0, -1) or _take_batch(client, processing)
+            if not values:
+                return written
+            written += _write_batch(client, processing, values)
+            client.delete(processing)
+    finally:
+        try:
+            lock.release()
+        except redis.exceptions.LockError:
+            logger.warning("Audit log flush lock expired before the flush finished.")
+
+
+def _take_batch(client, processing):
+    """
+    Moves up to AUDIT_LOG_BATCH_SIZE entries from the queue to the processing list in one transaction.
+    """
+    pipeline = client.pipeline()
+    for _ in range(get_batch_size()):
+        pipeline.lmove(_get_key(), processing, 'LEFT', 'RIGHT')
+    return [value for value in pipeline.execute() if value is not None]
+
+
+def _write_batch(client, processing, values):
+    """
+    Writes a batch, falling back to one entry at a time if the batch is rejected.
+    """
+    try:
+        return write([json.loads(value) for value in values])
+    except (OperationalError, InterfaceError):
+        raise
+    except Exception as e:
+        logger.warning("Audit log batch of %s entries rejected, writing them one by one: %s", len(values), e)
+
+    written = 0
+    for value in values:
+        try:
+            written += write([json.loads(value)])
+        except (OperationalError, InterfaceError):
+            raise
+        except Exception:
+            logger.exception("Audit log entry could not be written, moved to the failed list: %s", value)
+            client.rpush(_get_key('failed'), value)
+        client.lrem(processing, 1, value)
+    return written
+
+
+def write(entries):
+    """
+    Stores the entries in batches of AUDIT_LOG_BATCH_SIZE rows.
+
+    Returns:
+        int: the number of rows written.
+    """
+    rows = [
+        AuditLog(
+            user_id=entry['user_id'],
+            action=entry['action'],
+            model_name=entry['model_name'],
+            object_id=entry['object_id'],
+            changed_fields=entry['changed_fields'],
+            timestamp=parse_datetime(entry['timestamp']),
+        ) for entry in entries
+    ]
+    AuditLog.objects.bulk_create(rows, batch_size=get_batch_size())
+    return len(rows)
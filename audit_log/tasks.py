@@ -0,0 +1,14 @@
+from celery import shared_task
+
+from audit_log.services import audit_writer
+
+
+@shared_task
+def flush_audit_log_queue():
+    """
+    Writes the audit log entries collected by the audit log mixin since the last flush.
+
+    Returns:
+        int: the number of rows written.
+    """
+    return audit_writer.flush()
@@ -1,10 +1,21 @@
+import json
+from unittest.mock import Mock, patch
+
+import redis
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.db import OperationalError
+from django.test import TestCase, override_settings
+from rest_framework import status
 from rest_framework.reverse import reverse
 
 from audit_log.models import AuditLog
 from audit_log.serializers import AuditLogReadSerializer
+from audit_log.services import audit_writer
+from audit_log.tasks import flush_audit_log_queue
+from authority.models import Language
+from clockwork_api.mixins.audit_log_mixin import AuditLogMixin
 from clockwork_api.tests.test_views_base_class import TestViewsBaseClass
+from isaar.models import Isaar, IsaarOtherName
 
 
 class AuditLogModelTests(TestCase):
@@ -70,3 +81,163 @@ class AuditLogViewTests(TestViewsBaseClass):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]['object_id'], 2)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.lists = {}
+
+    def rpush(self, key, *values):
+        self.lists.setdefault(key, []).extend(values)
+
+    def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    def lrange(self, key, start, end):
+        values = self.lists.get(key, [])
+        return values[start:] if end == -1 else values[start:end + 1]
+
+    def lmove(self, source, destination, wherefrom, whereto):
+        if not self.lists.get(source):
+            return None
+        value = self.lists[source].pop(0)
+        self.rpush(destination, value)
+        return value
+
+    def lrem(self, key, count, value):
+        self.lists[key].remove(value)
+
+    def delete(self, key):
+        self.lists.pop(key, None)
+
+    def lock(self, name, timeout=None):
+        return Mock(**{'acquire.return_value': True})
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.results = []
+
+    def lmove(self, *args):
+        self.results.append(self.client.lmove(*args))
+
+    def execute(self):
+        return self.results
+
+
+@override_settings(AUDIT_LOG_BATCH_SIZE=2)
+class AuditLogWriterTests(TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = patch('audit_log.services.audit_writer._get_client', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.isaar = Isaar.objects.create(name='Alpha Org', type='C', date_existence_from='1990-01-01')
+
+    def test_queued_entries_are_written_in_batches(self):
+        user = User.objects.create_user(username='carol', password='secret')
+        entries = [
+            audit_writer.make_entry(user=user, action='UPDATE', instance=self.isaar, changed_fields=['name'])
+            for _ in range(5)
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            audit_writer.enqueue(entries[:3])
+            audit_writer.enqueue(entries[3:])
+        self.assertEqual(audit_writer.pending(), 5)
+
+        with self.assertNumQueries(3):
+            self.assertEqual(flush_audit_log_queue(), 5)
+
+        self.assertEqual(audit_writer.pending(), 0)
+        log = AuditLog.objects.order_by('id').first()
+        self.assertEqual((log.user, log.model_name, log.object_id), (user, 'Isaar', self.isaar.id))
+        self.assertEqual(log.timestamp.isoformat(), entries[0]['timestamp'])
+
+    def test_nothing_is_queued_until_the_transaction_commits(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            audit_writer.enqueue([audit_writer.make_entry(action='DELETE', instance=self.isaar)])
+
+        self.assertEqual(audit_writer.pending(), 0)
+        self.assertEqual(len(callbacks), 1)
+
+    def test_batch_is_kept_while_the_database_is_down(self):
+        audit_writer.push([audit_writer.make_entry(action='DELETE', instance=self.isaar) for _ in range(3)])
+
+        with patch('audit_log.services.audit_writer.write', side_effect=OperationalError('down')):
+            with self.assertRaises(OperationalError):
+                audit_writer.flush()
+
+        self.assertEqual(audit_writer.pending(), 3)
+        self.assertEqual(len(self.redis.lists['clockwork:audit_log:processing']), 2)
+        self.assertFalse(AuditLog.objects.exists())
+
+        self.assertEqual(audit_writer.flush(), 3)
+        self.assertEqual(audit_writer.pending(), 0)
+
+    def test_rejected_entries_are_moved_to_the_failed_list(self):
+        entry = audit_writer.make_entry(action='DELETE', instance=self.isaar)
+        self.redis.rpush('clockwork:audit_log', json.dumps(entry), json.dumps({'action': 'DELETE'}), json.dumps(entry))
+
+        with self.assertLogs('audit_log.services.audit_writer', level='ERROR'):
+            self.assertEqual(audit_writer.flush(), 2)
+
+        self.assertEqual(AuditLog.objects.count(), 2)
+        self.assertEqual(audit_writer.pending(), 0)
+        self.assertEqual(self.redis.lists['clockwork:audit_log:failed'], [json.dumps({'action': 'DELETE'})])
+
+    def test_entries_are_written_directly_when_redis_is_down(self):
+        client = Mock()
+        client.rpush.side_effect = redis.ConnectionError('down')
+        with patch('audit_log.services.audit_writer._get_client', return_value=client):
+            audit_writer.push([audit_writer.make_entry(action='DELETE', instance=self.isaar)])
+
+        self.assertEqual(AuditLog.objects.get().object_id, self.isaar.id)
+
+
+class AuditLogMixinTests(TestViewsBaseClass):
+    def setUp(self):
+        super().setUp()
+        self.isaar = Isaar.objects.create(name='Alpha Org', type='C', date_existence_from='1990-01-01')
+        self.other_name = IsaarOtherName.objects.create(isaar=self.isaar, name='Alpha', year_from=1990)
+        self.language = Language.objects.create(language='Hungarian')
+        self.url = reverse('isaar-v1:isaar-detail', kwargs={'pk': self.isaar.id})
+        push = patch('audit_log.services.audit_writer.push', side_effect=audit_writer.write)
+        push.start()
+        self.addCleanup(push.stop)
+
+    def patch_isaar(self, payload):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(self.url, data=payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return AuditLog.objects.filter(action='UPDATE', model_name='Isaar', object_id=self.isaar.id)
+
+    def test_relations_missing_from_the_payload_are_not_read(self):
+        with patch.object(AuditLogMixin, 'get_relation_snapshot') as get_relation_snapshot:
+            logs = self.patch_isaar({'name': 'Alpha Organization'})
+
+        get_relation_snapshot.assert_not_called()
+        self.assertEqual(logs.get().changed_fields, ['name'])
+
+    def test_unchanged_update_is_not_logged(self):
+        logs = self.patch_isaar({
+            'name': 'Alpha Org',
+            'other_names': [{'id': self.other_name.id, 'name': 'Alpha', 'year_from': 1990}],
+            'language': [],
+        })
+        self.assertFalse(logs.exists())
+
+    def test_changed_relations_are_logged(self):
+        logs = self.patch_isaar({
+            'other_names': [{'id': self.other_name.id, 'name': 'Alpha', 'year_from': 1991}],
+            'language': [self.language.id],
+        })
+        self.assertEqual(logs.get().changed_fields, ['language', 'other_name'])
+
+    def test_added_and_removed_nested_objects_are_logged(self):
+        logs = self.patch_isaar({'other_names': [{'name': 'A.O.'}]})
+        self.assertEqual(logs.get().changed_fields, ['other_name'])
+        self.assertFalse(IsaarOtherName.objects.filter(pk=self.other_name.pk).exists())
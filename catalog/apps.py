@@ -23,3 +23,9 @@ class CatalogConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'catalog'
+
+    def ready(self):
+        """
+        Imports the signal handlers keeping the materialized archival units tree up to date.
+        """
+        from . import signals
@@ -0,0 +1,11 @@
+from django.core.management import BaseCommand
+
+from catalog.services.archival_units_tree import rebuild
+
+
+class Command(BaseCommand):
+    help = "Rebuild the cached archival units tree of the public catalog."
+
+    def handle(self, *args, **options):
+        fonds = rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Done. Fonds={fonds}"))
@@ -13,14 +13,12 @@ They are optimized for:
 import re
 from typing import List
 
-from django.db.models import Sum, Count
 from rest_framework import serializers
 
-from archival_unit.models import ArchivalUnit
+from archival_unit.models import ArchivalUnit, ArchivalUnitStats
+from archival_unit.services import stats
 from authority.serializers import LanguageSerializer
-from container.models import Container
 from controlled_list.models import ReproductionRight
-from finding_aids.models import FindingAidsEntity
 from isaar.models import Isaar
 from isad.models import Isad
 
@@ -104,12 +102,22 @@ class ArchivalUnitsDetailSerializer(serializers.ModelSerializer):
         """
         return self.get_extent(obj.archival_unit, obj.original_locale.id if obj.original_locale else None)
 
+    def get_unit_stats(self, archival_unit) -> ArchivalUnitStats:
+        """
+        Returns the precomputed statistics of an archival unit, looked up once per serializer.
+        """
+        if not hasattr(self, '_stats'):
+            self._stats = {}
+        if archival_unit.id not in self._stats:
+            self._stats[archival_unit.id] = stats.get_stats(archival_unit)
+        return self._stats[archival_unit.id]
+
     def get_digital_content_online(self, obj) -> int:
         """
-        Counts published finding aids linked to this archival unit
-        that have digital versions available online.
+        Counts finding aids under this archival unit that have digital
+        versions available online.
         """
-        return FindingAidsEntity.objects.filter(archival_unit=obj.archival_unit, digital_version_online=True).count()
+        return self.get_unit_stats(obj.archival_unit).online_finding_aids
 
     def get_access_rights(self, obj) -> str:
         """
@@ -120,31 +128,12 @@ class ArchivalUnitsDetailSerializer(serializers.ModelSerializer):
             - "Restricted" - If all the underlying folders/items are restricted
             - "Partially Restricted (X Folder/Item Restricted - Y Not Restricted)" - If some folders/items are restricted
 
-        The calculation scope depends on description level:
-            - Fonds: all descendant series
-            - Subfonds: all descendant series
-            - Series: direct children only
+        Counts cover every finding aids entity under the archival unit and
+        are read from its ArchivalUnitStats.
         """
-        fa_entity_count = 0
-        restricted_count = 0
-
-        if obj.description_level == 'F':
-            fa_entity_count = FindingAidsEntity.objects.filter(
-                archival_unit__parent__parent=obj.archival_unit, is_template=False).count()
-            restricted_count = FindingAidsEntity.objects.filter(
-                archival_unit__parent__parent=obj.archival_unit, access_rights__id=3).count()
-
-        if obj.description_level == 'SF':
-            fa_entity_count = FindingAidsEntity.objects.filter(
-                archival_unit__parent=obj.archival_unit, is_template=False).count()
-            restricted_count = FindingAidsEntity.objects.filter(
-                archival_unit__parent=obj.archival_unit, access_rights__id=3).count()
-
-        if obj.description_level == 'S':
-            fa_entity_count = FindingAidsEntity.objects.filter(
-                archival_unit=obj.archival_unit, is_template=False).count()
-            restricted_count = FindingAidsEntity.objects.filter(
-                archival_unit=obj.archival_unit, access_rights__id=3).count()
+        unit_stats = self.get_unit_stats(obj.archival_unit)
+        fa_entity_count = unit_stats.finding_aids
+        restricted_count = unit_stats.restricted_finding_aids
 
         if restricted_count == 0:
             return 'Not Restricted'
@@ -160,10 +149,8 @@ class ArchivalUnitsDetailSerializer(serializers.ModelSerializer):
         """
         Calculates physical extent grouped by carrier type.
 
-        The calculation scope depends on archival unit level:
-         - Fonds: all containers within fonds
-         - Subfonds: containers within subfonds
-         - Series: containers directly linked
+        Containers of the whole archival unit (fonds, subfonds or series)
+        are read from its precomputed ArchivalUnitStats extent.
 
         Output is localized based on language code:
          - EN (default)
@@ -175,45 +162,33 @@ class ArchivalUnitsDetailSerializer(serializers.ModelSerializer):
          List[str]: human-readable extent descriptions
         """
         extent = []
-        total = 0
-
-        if archival_unit.level == 'F':
-            containers = Container.objects.filter(archival_unit__fonds=archival_unit.fonds)
-        elif archival_unit.level == 'SF':
-            containers = Container.objects.filter(archival_unit__fonds=archival_unit.fonds,
-                                                  archival_unit__subfonds=archival_unit.subfonds)
-        else:
-            containers = Container.objects.filter(archival_unit=archival_unit)
-
-        containers = containers.values('carrier_type__type', 'carrier_type__type_original_language') \
-            .annotate(width=Sum('carrier_type__width'), number=Count('id'))
 
-        for c in containers:
+        for c in self.get_unit_stats(archival_unit).extent:
             if lang == 'HU':
-                extent.append(str(c['number']) + ' ' + c['carrier_type__type_original_language'] + ', ' +
+                extent.append(str(c['number']) + ' ' + c['carrier_type_original'] + ', ' +
                               str(round(c['width'] / 1000.00, 2)) + u' folyóméter')
             elif lang == 'PL':
-                extent.append(str(c['number']) + ' ' + c['carrier_type__type'] + ', ' +
+                extent.append(str(c['number']) + ' ' + c['carrier_type'] + ', ' +
                               str(round(c['width'] / 1000.00, 2)) + u' metr bieżący')
             elif lang == 'IT':
-                extent.append(str(c['number']) + ' ' + c['carrier_type__type'] + ', ' +
+                extent.append(str(c['number']) + ' ' + c['carrier_type'] + ', ' +
                               str(round(c['width'] / 1000.00, 2)) + u' metro lineare')
             else:
-                extent.append(str(c['number']) + ' ' + c['carrier_type__type'] + ', ' +
+                extent.append(str(c['number']) + ' ' + c['carrier_type'] + ', ' +
                               str(round(c['width'] / 1000.00, 2)) + ' linear meters')
         return extent
 
     def get_folder_item_count(self, obj) -> int:
         """
-        Returns the number of published finding aids linked to the archival unit.
+        Returns the number of published finding aids under the archival unit.
         """
-        return FindingAidsEntity.objects.filter(archival_unit=obj.archival_unit, published=True).count()
+        return self.get_unit_stats(obj.archival_unit).published_finding_aids
 
     def get_container_count(self, obj) -> int:
         """
-        Returns the number of physical containers linked to the archival unit.
+        Returns the number of physical containers under the archival unit.
         """
-        return Container.objects.filter(archival_unit=obj.archival_unit).count()
+        return self.get_unit_stats(obj.archival_unit).containers
 
     class Meta:
         model = Isad
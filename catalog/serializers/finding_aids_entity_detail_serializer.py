@@ -10,6 +10,9 @@ The serializers here:
     - resolve authority-controlled entities (persons, places, subjects, etc.)
     - compute derived display fields (citation, digital identifiers, access copies)
     - are optimized for read-only catalog presentation
+
+Relations are read with `.all()` so the serializers consume the objects
+prefetched by FindingAidsEntityDetailView instead of querying per field.
 """
 
 from rest_framework import serializers
@@ -352,12 +355,21 @@ class FindingAidsEntityDetailSerializer(serializers.ModelSerializer):
 
         return "".join(citation)
 
+    def get_digital_versions(self, obj):
+        """
+        Returns the digital versions of the entity.
+
+        When the view prefetched them, every digital version field reads
+        the same in-memory list.
+        """
+        return obj.digital_versions.all()
+
     def get_digital_version_online(self, obj):
         """
         Indicates whether at least one digital version
         of the entity is available online.
         """
-        return obj.digital_versions.filter(available_online=True).count() > 0
+        return any(digital_version.available_online for digital_version in self.get_digital_versions(obj))
 
     def get_access_copies(self, obj):
         """
@@ -366,7 +378,9 @@ class FindingAidsEntityDetailSerializer(serializers.ModelSerializer):
         Only digital versions marked as access-level ('A')
         are included in the response.
         """
-        digital_versions = obj.digital_versions.filter(level='A')
+        digital_versions = [
+            digital_version for digital_version in self.get_digital_versions(obj) if digital_version.level == 'A'
+        ]
         serializer = DigitalVersionSerializer(instance=digital_versions, many=True)
         return serializer.data
 
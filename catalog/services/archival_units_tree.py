@@ -0,0 +1,290 @@
+"""
+Materialized archival units tree of the public catalog.
+
+The tree served by ArchivalUnitsTreeView only changes when an archival unit
+or ISAD record is published, unpublished, renamed or re-themed, so it is
+built ahead of time and kept in the Django cache instead of being
+assembled from the database on every request.
+
+Cache layout:
+    - one entry per fonds, holding the fonds subtree of every variant
+      ("all" and one per theme id used in the fonds)
+    - one entry per response (full tree, per theme, or a single fonds),
+      assembled from the fonds entries and stored with its ETag under the
+      current tree version
+
+Rebuilding a fonds replaces its entry and, if its subtrees changed, bumps
+the tree version, which retires every assembled response at once. Fonds
+that did not change are not queried again.
+"""
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from archival_unit.models import ArchivalUnit
+
+CACHE_PREFIX = 'catalog:archival-units-tree'
+VERSION_KEY = '%s:version' % CACHE_PREFIX
+ALL = 'all'
+
+FIELDS = [
+    'id', 'fonds', 'subfonds', 'series', 'reference_code', 'title', 'title_original', 'level', 'isad__catalog_id'
+]
+
+
+def get_timeout():
+    """
+    Returns the lifetime of the cache entries in seconds.
+
+    Entries are rebuilt when the data changes; the timeout only bounds the
+    staleness of caches that are not shared between processes.
+    """
+    return getattr(settings, 'ARCHIVAL_UNITS_TREE_CACHE_TIMEOUT', 24 * 60 * 60)
+
+
+def get_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # A timestamp never collides with the versions of entries left over
+        # from before the version key was evicted.
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(VERSION_KEY, time.time_ns())
+    return version
+
+
+def bump_version():
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        get_version()
+
+
+def get_unit_data(archival_unit: dict, themes: list) -> dict:
+    """
+    Serializes an archival unit row into a tree node.
+
+    Args:
+        archival_unit: Row of the values() queryset (see FIELDS).
+        themes: Theme ids shown on the node.
+
+    Returns:
+        Dictionary representing a tree node.
+    """
+    return {
+        'id': archival_unit['id'],
+        'catalog_id': archival_unit['isad__catalog_id'],
+        'key': archival_unit['reference_code'].replace(" ", "_").lower(),
+        'title': archival_unit['title'],
+        'title_original': archival_unit['title_original'],
+        'reference_code': archival_unit['reference_code'],
+        'level': archival_unit['level'],
+        'themes': themes,
+        'children': []
+    }
+
+
+def get_themes(qs) -> dict:
+    """
+    Returns the theme ids of the archival units in the queryset, keyed by archival unit id.
+
+    Units without a theme map to [None].
+    """
+    themes = {}
+    for au in qs.values('id', 'theme'):
+        themes.setdefault(au['id'], []).append(au['theme'])
+    return themes
+
+
+def build_tree(rows: list, themes: dict) -> list:
+    """
+    Assembles fonds → subfonds → series nodes from rows ordered by fonds, subfonds and series.
+
+    Args:
+        rows: Archival unit rows (see FIELDS).
+        themes: Theme ids of every row, keyed by archival unit id.
+
+    Returns:
+        List of fonds nodes.
+    """
+    tree = []
+    fonds = {}
+    subfonds = {}
+    actual_fond = 0
+    actual_subfonds = 0
+
+    for au in rows:
+        if au['level'] == 'F':
+            if actual_fond != au['fonds']:
+                if actual_fond != 0:
+                    tree.append(fonds)
+            fonds = get_unit_data(au, themes[au['id']])
+
+        if au['level'] == 'SF':
+            if au['subfonds'] != 0:
+                subfonds = get_unit_data(au, themes[au['id']])
+                if actual_subfonds != au['subfonds']:
+                    fonds['children'].append(subfonds)
+            else:
+                subfonds = {'children': []}
+
+        if au['level'] == 'S':
+            series = get_unit_data(au, themes[au['id']])
+            if au['subfonds'] == 0:
+                series['subfonds'] = False
+                fonds['children'].append(series)
+            else:
+                series['subfonds'] = True
+                subfonds['children'].append(series)
+
+        actual_fond = au['fonds']
+        actual_subfonds = au['subfonds']
+
+    if rows:
+        tree.append(fonds)
+    return tree
+
+
+def build_fonds_variants(fonds_numbers=None) -> dict:
+    """
+    Builds the subtrees of every variant of the given fonds with two queries.
+
+    A theme variant holds the units tagged with the theme, each showing
+    only that theme. Units whose parent does not carry the theme have no
+    node to hang on, so they are left out (and so is the whole fonds if
+    the fonds level record does not carry it).
+
+    Args:
+        fonds_numbers: Fonds to build; None builds every fonds.
+
+    Returns:
+        dict: {fonds number: {variant: list of fonds nodes}}; fonds without
+        published units map to an empty dict.
+    """
+    qs = ArchivalUnit.objects.filter(isad__published=True).order_by('fonds', 'subfonds', 'series')
+    if fonds_numbers is not None:
+        qs = qs.filter(fonds__in=fonds_numbers)
+
+    rows_by_fonds = {fonds_number: [] for fonds_number in fonds_numbers or []}
+    for au in qs.values(*FIELDS):
+        rows_by_fonds.setdefault(au['fonds'], []).append(au)
+    themes = get_themes(qs)
+
+    variants_by_fonds = {}
+    for fonds_number, rows in rows_by_fonds.items():
+        variants = {}
+        if rows:
+            variants[ALL] = build_tree(rows, themes)
+        theme_ids = sorted({theme for au in rows for theme in themes[au['id']] if theme is not None})
+        for theme in theme_ids:
+            theme_rows = [au for au in rows if theme in themes[au['id']]]
+            subfonds = {au['subfonds'] for au in theme_rows if au['level'] == 'SF'}
+            theme_rows = [
+                au for au in theme_rows if au['level'] != 'S' or au['subfonds'] == 0 or au['subfonds'] in subfonds
+            ]
+            if theme_rows[0]['level'] == 'F':
+                variants[str(theme)] = build_tree(theme_rows, {au['id']: [theme] for au in theme_rows})
+        variants_by_fonds[fonds_number] = variants
+    return variants_by_fonds
+
+
+def get_fonds_key(fonds_number):
+    return '%s:fonds:%s' % (CACHE_PREFIX, fonds_number)
+
+
+def get_response_key(fonds_number, variant):
+    return '%s:response:%s:%s' % (CACHE_PREFIX, ALL if fonds_number is None else fonds_number, variant)
+
+
+def get_fonds_variants(fonds_numbers) -> dict:
+    """
+    Returns the cached variants of the given fonds, building the missing ones in one pass.
+    """
+    keys = {get_fonds_key(fonds_number): fonds_number for fonds_number in fonds_numbers}
+    cached = cache.get_many(keys.keys())
+    variants_by_fonds = {keys[key]: variants for key, variants in cached.items()}
+
+    missing = [fonds_number for fonds_number in fonds_numbers if fonds_number not in variants_by_fonds]
+    if missing:
+        built = build_fonds_variants(missing)
+        cache.set_many({get_fonds_key(fonds_number): built[fonds_number] for fonds_number in missing}, get_timeout())
+        variants_by_fonds.update(built)
+    return variants_by_fonds
+
+
+def get_published_fonds():
+    return list(
+        ArchivalUnit.objects.filter(isad__published=True).order_by('fonds').values_list('fonds', flat=True).distinct()
+    )
+
+
+def get_tree(fonds_number=None, theme=None) -> dict:
+    """
+    Returns a tree response from the cache, assembling it on a miss.
+
+    Args:
+        fonds_number: Restricts the tree to a single fonds; None returns every fonds.
+        theme: Theme id restricting the full tree; None or "all" for no restriction.
+
+    Returns:
+        dict: {'data': list of fonds nodes, 'etag': quoted ETag of the data}
+    """
+    variant = str(theme) if theme and theme != ALL else ALL
+    if variant != ALL and not variant.isdigit():
+        return _make_entry([])
+
+    version = get_version()
+    key = get_response_key(fonds_number, variant)
+    entry = cache.get(key, version=version)
+    if entry is None:
+        fonds_numbers = get_published_fonds() if fonds_number is None else [fonds_number]
+        variants_by_fonds = get_fonds_variants(fonds_numbers)
+        entry = _make_entry([
+            node for fonds in fonds_numbers for node in variants_by_fonds[fonds].get(variant, [])
+        ])
+        cache.set(key, entry, get_timeout(), version=version)
+    return entry
+
+
+def rebuild_fonds(fonds_numbers) -> bool:
+    """
+    Rebuilds the cached subtrees of the given fonds.
+
+    The assembled responses are retired (by bumping the tree version) only
+    if a subtree actually changed, so saves that do not touch the tree
+    (e.g. editing a scope and content note) keep every response cached.
+
+    Returns:
+        bool: True if any subtree changed.
+    """
+    fonds_numbers = list(fonds_numbers)
+    old = cache.get_many([get_fonds_key(fonds_number) for fonds_number in fonds_numbers])
+
+    built = build_fonds_variants(fonds_numbers)
+    new = {get_fonds_key(fonds_number): built[fonds_number] for fonds_number in fonds_numbers}
+    cache.set_many(new, get_timeout())
+
+    changed = any(old.get(key) != variants for key, variants in new.items())
+    if changed:
+        bump_version()
+    return changed
+
+
+def rebuild():
+    """
+    Rebuilds every fonds subtree and retires every assembled response.
+
+    Returns:
+        int: number of fonds with published units.
+    """
+    built = build_fonds_variants()
+    cache.set_many({get_fonds_key(fonds_number): variants for fonds_number, variants in built.items()}, get_timeout())
+    bump_version()
+    return len(built)
+
+
+def _make_entry(data):
+    digest = hashlib.md5(json.dumps(data, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    return {'data': data, 'etag': '"%s"' % digest}
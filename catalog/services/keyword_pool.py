@@ -0,0 +1,103 @@
+"""
+Precomputed pool of the keywords shown by CollectionSpecificTags.
+
+The eligible keywords (used by at least one published finding aids entity)
+only change when entities are published, so they are collected by a
+periodic task (catalog.tasks.refresh_keyword_pool) and kept in the Django
+cache. Each process keeps its own copy for a short while, so a request
+samples the pool in memory without touching the cache or the database.
+
+Pool entries are (keyword id, keyword, number of published entities using it).
+"""
+import heapq
+import random
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+
+from controlled_list.models import Keyword
+
+CACHE_KEY = 'catalog:keyword-pool'
+
+_local_pool = None
+_local_expires = 0
+
+
+def get_timeout():
+    """
+    Returns the lifetime of the shared pool in seconds.
+
+    Longer than the refresh interval, so the pool does not expire between two runs.
+    """
+    return getattr(settings, 'KEYWORD_POOL_CACHE_TIMEOUT', 2 * 60 * 60)
+
+
+def get_local_ttl():
+    """
+    Returns the number of seconds a process reuses its copy of the pool.
+    """
+    return getattr(settings, 'KEYWORD_POOL_LOCAL_TTL', 60)
+
+
+def build_pool() -> list:
+    """
+    Collects the keywords used by published finding aids entities with their usage counts.
+    """
+    return list(
+        Keyword.objects.filter(findingaidsentity__published=True)
+        .annotate(usage=Count('findingaidsentity'))
+        .order_by()
+        .values_list('id', 'keyword', 'usage')
+    )
+
+
+def refresh_pool() -> list:
+    """
+    Rebuilds the shared pool and the copy of the current process.
+    """
+    global _local_pool, _local_expires
+    pool = build_pool()
+    cache.set(CACHE_KEY, pool, get_timeout())
+    _local_pool, _local_expires = pool, time.monotonic() + get_local_ttl()
+    return pool
+
+
+def get_pool() -> list:
+    """
+    Returns the pool, from the process copy, the shared cache, or built on the spot as a last resort.
+    """
+    global _local_pool, _local_expires
+    if _local_pool is not None and time.monotonic() < _local_expires:
+        return _local_pool
+    pool = cache.get(CACHE_KEY)
+    if pool is None:
+        return refresh_pool()
+    _local_pool, _local_expires = pool, time.monotonic() + get_local_ttl()
+    return pool
+
+
+def clear_local_pool():
+    global _local_pool, _local_expires
+    _local_pool, _local_expires = None, 0
+
+
+def sample(size, weighted=False) -> list:
+    """
+    Returns up to `size` distinct keywords picked at random from the pool.
+
+    Args:
+        size: Number of keywords to return.
+        weighted: Favour keywords used by more published entities.
+
+    Returns:
+        list: keyword strings.
+    """
+    pool = get_pool()
+    if weighted:
+        # Weighted sampling without replacement (Efraimidis-Spirakis).
+        picked = heapq.nlargest(size, pool, key=lambda entry: random.random() ** (1.0 / entry[2]))
+    else:
+        picked = random.sample(pool, min(size, len(pool)))
+    return [keyword for keyword_id, keyword, usage in picked]
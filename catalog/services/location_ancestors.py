@@ -0,0 +1,44 @@
+"""
+Cached ancestor nodes of the finding aids location tree.
+
+The fonds, subfonds and series nodes shown above a finding aids entity
+only depend on the series, so they are built once per series and kept in
+the Django cache until an archival unit or ISAD record of the chain is
+saved.
+"""
+from django.core.cache import cache
+from django.db.models import Q
+
+from archival_unit.models import ArchivalUnit
+from catalog.services import response_cache
+
+CACHE_PREFIX = 'catalog:location-ancestors'
+
+
+def get_key(series_id):
+    return '%s:%s' % (CACHE_PREFIX, series_id)
+
+
+def get_nodes(series_id):
+    """
+    Returns the cached ancestor nodes of a series, or None on a miss.
+    """
+    return cache.get(get_key(series_id))
+
+
+def set_nodes(series_id, nodes):
+    cache.set(get_key(series_id), nodes, response_cache.get_timeout())
+
+
+def invalidate(archival_unit_ids):
+    """
+    Drops the cached nodes of every series at or below the given archival units.
+    """
+    archival_unit_ids = set(archival_unit_ids) - {None}
+    if not archival_unit_ids:
+        return
+    series_ids = ArchivalUnit.objects.filter(
+        Q(id__in=archival_unit_ids) | Q(parent_id__in=archival_unit_ids) | Q(parent__parent_id__in=archival_unit_ids),
+        level='S'
+    ).values_list('id', flat=True)
+    cache.delete_many([get_key(series_id) for series_id in series_ids])
@@ -0,0 +1,206 @@
+"""
+Response cache of the public catalog read endpoints.
+
+Responses are cached per URL and keyed on the content versions of the
+records they are built from. Every record a response depends on has a
+version in the cache (a timestamp); saving or publishing the record bumps
+its version, which retires every cached response built from it without
+having to know the URLs they were cached under.
+
+Version scopes:
+    - FINDING_AIDS: a finding aids entity, by catalog_id
+    - CONTAINER: a container and the finding aids entities listed in it, by id
+    - ARCHIVAL_UNIT: an archival unit and its ISAD record, by id
+    - ARCHIVAL_UNIT_CONTENT: the finding aids entities and containers of an
+      archival unit or of its descendants (counts, extent, manifests), by id
+    - PUBLICATIONS: the list of recently published content, a single key
+      bumped on every publish and unpublish
+
+The newest version of a response is also its Last-Modified date.
+"""
+import functools
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+from archival_unit.models import ArchivalUnit
+from finding_aids.models import FindingAidsEntity
+
+CACHE_PREFIX = 'catalog:response'
+
+FINDING_AIDS = 'finding-aids'
+CONTAINER = 'container'
+ARCHIVAL_UNIT = 'archival-unit'
+ARCHIVAL_UNIT_CONTENT = 'archival-unit-content'
+PUBLICATIONS = 'publications'
+PUBLICATIONS_KEY = 'all'
+
+
+def is_enabled():
+    """
+    Returns False when the response cache is turned off (no shared cache backend, or the test suite).
+    """
+    return getattr(settings, 'CATALOG_RESPONSE_CACHE_ENABLED', True)
+
+
+def get_timeout():
+    """
+    Returns the lifetime of the cached responses in seconds.
+    """
+    return getattr(settings, 'CATALOG_RESPONSE_CACHE_TIMEOUT', 24 * 60 * 60)
+
+
+def get_max_age():
+    """
+    Returns the max-age clients and proxies may reuse a response for without revalidating it.
+    """
+    return getattr(settings, 'CATALOG_RESPONSE_MAX_AGE', 60)
+
+
+def get_version_key(scope, key):
+    return '%s:version:%s:%s' % (CACHE_PREFIX, scope, key)
+
+
+def get_versions(dependencies) -> list:
+    """
+    Returns the current versions of the given (scope, key) pairs.
+
+    Records that have no version yet get the current time, so versions
+    never collide with the ones of responses cached before a version was
+    evicted.
+    """
+    keys = [get_version_key(scope, key) for scope, key in dependencies]
+    versions = cache.get_many(keys)
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        now = time.time_ns()
+        for key in missing:
+            cache.add(key, now, timeout=None)
+        versions.update(cache.get_many(missing))
+        return [versions.get(key, now) for key in keys]
+    return [versions[key] for key in keys]
+
+
+def invalidate(scope, keys):
+    """
+    Bumps the versions of the given records, retiring every response built from them.
+
+    Must be called once the change is committed, otherwise a concurrent
+    request could cache the old data under the new version.
+    """
+    keys = set(keys) - {None}
+    if keys:
+        now = time.time_ns()
+        cache.set_many({get_version_key(scope, key): now for key in keys}, timeout=None)
+
+
+def invalidate_archival_unit_content(archival_unit_ids):
+    """
+    Bumps the content versions of the given archival units and of their ancestors.
+    """
+    ids = set(archival_unit_ids) - {None}
+    if ids:
+        for row in ArchivalUnit.objects.filter(id__in=ids).values('parent_id', 'parent__parent_id'):
+            ids.update(row.values())
+        invalidate(ARCHIVAL_UNIT_CONTENT, ids)
+
+
+def get_finding_aids_dependencies(fa_entity_catalog_id, **kwargs):
+    """
+    Returns the records a finding aids entity response is built from, or
+    None if there is no such entity (the view then answers uncached).
+
+    The entity, its container (which also lists the neighbouring entities)
+    and the archival units above it.
+    """
+    finding_aids = FindingAidsEntity.objects.filter(catalog_id=fa_entity_catalog_id).values(
+        'container_id', 'archival_unit_id', 'archival_unit__parent_id', 'archival_unit__parent__parent_id'
+    ).first()
+    if finding_aids is None:
+        return None
+    return [
+        (FINDING_AIDS, fa_entity_catalog_id),
+        (CONTAINER, finding_aids['container_id']),
+        (ARCHIVAL_UNIT, finding_aids['archival_unit_id']),
+        (ARCHIVAL_UNIT, finding_aids['archival_unit__parent_id']),
+        (ARCHIVAL_UNIT, finding_aids['archival_unit__parent__parent_id']),
+    ]
+
+
+def get_archival_unit_dependencies(archival_unit_id, **kwargs):
+    """
+    Returns the records an archival unit response is built from: the unit and its content.
+    """
+    return [(ARCHIVAL_UNIT, archival_unit_id), (ARCHIVAL_UNIT_CONTENT, archival_unit_id)]
+
+
+def get_publications_dependencies(**kwargs):
+    """
+    Returns the records a recently published content response is built from: every publication.
+    """
+    return [(PUBLICATIONS, PUBLICATIONS_KEY)]
+
+
+def get_response_key(request, versions):
+    digest = hashlib.md5(
+        ('%s|%s' % (request.get_full_path(), ','.join(str(version) for version in versions))).encode('utf-8')
+    ).hexdigest()
+    return '%s:%s' % (CACHE_PREFIX, digest)
+
+
+def cache_response(get_dependencies):
+    """
+    Caches the successful responses of a public catalog view method.
+
+    Args:
+        get_dependencies: Called with the URL keyword arguments, returns the
+            (scope, key) pairs the response is built from, or None to skip
+            the cache.
+
+    Responses carry an ETag, a Last-Modified date and a public Cache-Control
+    max-age (CATALOG_RESPONSE_MAX_AGE); conditional requests are answered
+    with 304 Not Modified. Error responses are not cached. The view method
+    is called directly when CATALOG_RESPONSE_CACHE_ENABLED is False.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(view, request, *args, **kwargs):
+            if not is_enabled():
+                return method(view, request, *args, **kwargs)
+            dependencies = get_dependencies(**kwargs)
+            if dependencies is None:
+                return method(view, request, *args, **kwargs)
+
+            versions = get_versions(dependencies)
+            key = get_response_key(request, versions)
+            entry = cache.get(key)
+            if entry is None:
+                response = method(view, request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+                entry = _make_entry(response.data, max(versions) // 10 ** 9)
+                cache.set(key, entry, get_timeout())
+            return _make_response(request, entry)
+        return wrapper
+    return decorator
+
+
+def _make_entry(data, last_modified):
+    digest = hashlib.md5(json.dumps(data, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    return {'data': data, 'etag': '"%s"' % digest, 'last_modified': last_modified}
+
+
+def _make_response(request, entry):
+    response = get_conditional_response(request, etag=entry['etag'], last_modified=entry['last_modified'])
+    if response is None:
+        response = Response(entry['data'])
+    response['ETag'] = entry['etag']
+    response['Last-Modified'] = http_date(entry['last_modified'])
+    patch_cache_control(response, public=True, max_age=get_max_age())
+    return response
@@ -0,0 +1,164 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from archival_unit.models import ArchivalUnit
+from catalog.services import archival_units_tree, location_ancestors, response_cache
+from container.models import Container
+from digitization.models import DigitalVersion
+from finding_aids.models import FindingAidsEntity
+from isad.models import Isad
+
+
+def rebuild_archival_units_tree(fonds_numbers):
+    """
+    Rebuilds the cached tree of the given fonds once the transaction is committed.
+    """
+    fonds_numbers = set(fonds_numbers)
+    if fonds_numbers:
+        transaction.on_commit(lambda: archival_units_tree.rebuild_fonds(sorted(fonds_numbers)))
+
+
+@receiver(post_save, sender=ArchivalUnit)
+@receiver(post_delete, sender=ArchivalUnit)
+def update_tree_upon_archival_unit_change(sender, instance, **kwargs):
+    rebuild_archival_units_tree([instance.fonds])
+
+
+@receiver(post_save, sender=Isad)
+@receiver(post_delete, sender=Isad)
+def update_tree_upon_isad_change(sender, instance, **kwargs):
+    """
+    Publishing, unpublishing or deleting an ISAD record adds or removes its unit from the tree.
+    """
+    fonds = ArchivalUnit.objects.filter(pk=instance.archival_unit_id).values_list('fonds', flat=True)
+    rebuild_archival_units_tree(fonds)
+
+
+@receiver(m2m_changed, sender=ArchivalUnit.theme.through)
+def update_tree_upon_theme_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Rebuilds the fonds of the archival units whose themes changed.
+
+    When the change is made from the theme side, the affected units are
+    not known on clear, so every fonds is rebuilt.
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        rebuild_archival_units_tree([instance.fonds])
+    elif pk_set:
+        rebuild_archival_units_tree(ArchivalUnit.objects.filter(pk__in=pk_set).values_list('fonds', flat=True))
+    else:
+        transaction.on_commit(archival_units_tree.rebuild)
+
+
+def invalidate_responses(scope, keys):
+    """
+    Retires the cached responses built from the given records once the transaction is committed.
+    """
+    keys = set(keys) - {None}
+    if keys:
+        transaction.on_commit(lambda: response_cache.invalidate(scope, keys))
+
+
+def invalidate_archival_unit_content(archival_unit_ids):
+    """
+    Retires the cached responses showing the content of the given units and of their ancestors.
+
+    The archival_unit app refreshes the unit statistics on commit; it is
+    registered before catalog, so its callbacks run first and the counts
+    are up to date by the time the responses are retired.
+    """
+    archival_unit_ids = set(archival_unit_ids) - {None}
+    if archival_unit_ids:
+        transaction.on_commit(lambda: response_cache.invalidate_archival_unit_content(archival_unit_ids))
+
+
+@receiver(post_save, sender=FindingAidsEntity)
+@receiver(post_delete, sender=FindingAidsEntity)
+def invalidate_responses_upon_finding_aids_change(sender, instance, **kwargs):
+    """
+    Retires the responses of the entity, of the entities listed next to it
+    in its container and of the archival units counting it, at its current
+    place and at the place it had before the save (see FindingAidsEntity.save).
+    """
+    previous = getattr(instance, 'previous_values', None) or {}
+    invalidate_responses(response_cache.FINDING_AIDS, [instance.catalog_id, previous.get('catalog_id')])
+    invalidate_responses(response_cache.CONTAINER, [instance.container_id, previous.get('container_id')])
+    invalidate_archival_unit_content([instance.archival_unit_id, previous.get('archival_unit_id')])
+
+
+@receiver(post_save, sender=FindingAidsEntity)
+@receiver(post_delete, sender=FindingAidsEntity)
+def invalidate_publications_upon_finding_aids_change(sender, instance, signal, **kwargs):
+    """
+    Retires the recently published content when a finding aids entity is published, unpublished
+    or moved or deleted while published.
+    """
+    previous = getattr(instance, 'previous_values', None) or {}
+    if signal is post_delete:
+        changed = instance.published
+    else:
+        changed = previous.get('published', False) != instance.published or \
+            previous.get('date_published') != instance.date_published or \
+            (instance.published and previous.get('archival_unit_id') != instance.archival_unit_id)
+    if changed:
+        invalidate_responses(response_cache.PUBLICATIONS, [response_cache.PUBLICATIONS_KEY])
+
+
+@receiver(post_save, sender=Container)
+@receiver(post_delete, sender=Container)
+def invalidate_responses_upon_container_change(sender, instance, **kwargs):
+    invalidate_responses(response_cache.CONTAINER, [instance.id])
+    invalidate_archival_unit_content([instance.archival_unit_id])
+
+
+@receiver(post_save, sender=DigitalVersion)
+@receiver(post_delete, sender=DigitalVersion)
+def invalidate_responses_upon_digital_version_change(sender, instance, **kwargs):
+    """
+    Retires the responses (and manifests) of the entity or container the digital version belongs to.
+    """
+    if instance.finding_aids_entity_id:
+        finding_aids = FindingAidsEntity.objects.filter(pk=instance.finding_aids_entity_id)\
+            .values('catalog_id', 'archival_unit_id').first()
+        if finding_aids:
+            invalidate_responses(response_cache.FINDING_AIDS, [finding_aids['catalog_id']])
+            invalidate_archival_unit_content([finding_aids['archival_unit_id']])
+    if instance.container_id:
+        invalidate_responses(response_cache.CONTAINER, [instance.container_id])
+        invalidate_archival_unit_content(
+            Container.objects.filter(pk=instance.container_id).values_list('archival_unit_id', flat=True)
+        )
+
+
+@receiver(post_save, sender=ArchivalUnit)
+@receiver(post_delete, sender=ArchivalUnit)
+def invalidate_responses_upon_archival_unit_change(sender, instance, **kwargs):
+    invalidate_responses(response_cache.ARCHIVAL_UNIT, [instance.id])
+    if instance.level == 'S':
+        # Series titles are listed in the recently published content.
+        invalidate_responses(response_cache.PUBLICATIONS, [response_cache.PUBLICATIONS_KEY])
+
+
+@receiver(post_save, sender=Isad)
+@receiver(post_delete, sender=Isad)
+def invalidate_responses_upon_isad_change(sender, instance, **kwargs):
+    invalidate_responses(response_cache.ARCHIVAL_UNIT, [instance.archival_unit_id])
+    if instance.description_level == 'S':
+        invalidate_responses(response_cache.PUBLICATIONS, [response_cache.PUBLICATIONS_KEY])
+
+
+@receiver(post_save, sender=ArchivalUnit)
+@receiver(post_delete, sender=ArchivalUnit)
+def invalidate_location_ancestors_upon_archival_unit_change(sender, instance, **kwargs):
+    archival_unit_id = instance.id
+    transaction.on_commit(lambda: location_ancestors.invalidate([archival_unit_id]))
+
+
+@receiver(post_save, sender=Isad)
+@receiver(post_delete, sender=Isad)
+def invalidate_location_ancestors_upon_isad_change(sender, instance, **kwargs):
+    archival_unit_id = instance.archival_unit_id
+    transaction.on_commit(lambda: location_ancestors.invalidate([archival_unit_id]))
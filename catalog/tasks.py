@@ -0,0 +1,14 @@
+from celery import shared_task
+
+from catalog.services import keyword_pool
+
+
+@shared_task
+def refresh_keyword_pool():
+    """
+    Rebuilds the keyword pool sampled by the collection specific tags endpoint.
+
+    Returns:
+        int: the number of keywords in the pool.
+    """
+    return len(keyword_pool.refresh_pool())
@@ -1,62 +1,64 @@
-from types import SimpleNamespace
-from unittest.mock import Mock, call, patch
+from django.urls import reverse
+from rest_framework.test import APIClient
 
-from django.test import SimpleTestCase
-from rest_framework.test import APIRequestFactory
+from archival_unit.models import ArchivalUnit, ArchivalUnitStats
+from clockwork_api.tests.no_index_signals_mixin import NoIndexSignalsMixin
+from clockwork_api.tests.test_views_base_class import TestViewsBaseClass
+from isad.tests.helpers import make_isad
 
-from catalog.views.statistics_views.archival_unit_sizes import ArchivalUnitSizes
 
-
-class ArchivalUnitSizesViewTests(SimpleTestCase):
+class ArchivalUnitSizesViewTests(NoIndexSignalsMixin, TestViewsBaseClass):
     def setUp(self):
-        self.factory = APIRequestFactory()
-        self.view = ArchivalUnitSizes()
+        super().setUp()
+        self.url = reverse("catalog-v1:archival-unit-sizes")
 
-    def test_get_returns_empty_list_when_no_fonds(self):
-        fonds_qs = SimpleNamespace(all=lambda: [])
+    def _make_fonds(self, fonds, title, published=True):
+        archival_unit = ArchivalUnit.objects.create(fonds=fonds, level="F", title=title)
+        make_isad(archival_unit, published=published)
+        return archival_unit
 
-        with patch(
-            "catalog.views.statistics_views.archival_unit_sizes.ArchivalUnit.objects.filter",
-            return_value=fonds_qs,
-        ) as mock_au_filter:
-            response = self.view.get(self.factory.get("/v1/catalog/archival-unit-sizes/"))
+    def test_get_requires_authentication(self):
+        response = APIClient().get(self.url)
+
+        self.assertIn(response.status_code, (401, 403))
+
+    def test_get_returns_empty_list_when_no_fonds(self):
+        response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data, [])
-        mock_au_filter.assert_called_once_with(level="F", isad__published=True)
-
-    def test_get_returns_size_per_fonds(self):
-        fonds_1 = SimpleNamespace(reference_code="HU OSA 100", title="Fonds One")
-        fonds_2 = SimpleNamespace(reference_code="HU OSA 200", title="Fonds Two")
-        fonds_qs = SimpleNamespace(all=lambda: [fonds_1, fonds_2])
-
-        count_qs_1 = Mock()
-        count_qs_1.count.return_value = 12
-        count_qs_2 = Mock()
-        count_qs_2.count.return_value = 3
-
-        with patch(
-            "catalog.views.statistics_views.archival_unit_sizes.ArchivalUnit.objects.filter",
-            return_value=fonds_qs,
-        ), patch(
-            "catalog.views.statistics_views.archival_unit_sizes.FindingAidsEntity.objects.filter",
-            side_effect=[count_qs_1, count_qs_2],
-        ) as mock_fa_filter:
-            response = self.view.get(self.factory.get("/v1/catalog/archival-unit-sizes/"))
+
+    def test_get_returns_size_per_fonds_with_one_query(self):
+        fonds_1 = self._make_fonds(100, "Fonds One")
+        self._make_fonds(200, "Fonds Two")
+        unpublished = self._make_fonds(300, "Fonds Three", published=False)
+        ArchivalUnitStats.objects.create(archival_unit=fonds_1, published_finding_aids=12)
+        ArchivalUnitStats.objects.create(archival_unit=unpublished, published_finding_aids=5)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(
             response.data,
             [
                 {"reference_code": "HU OSA 100", "title": "Fonds One", "size": 12},
-                {"reference_code": "HU OSA 200", "title": "Fonds Two", "size": 3},
+                {"reference_code": "HU OSA 200", "title": "Fonds Two", "size": 0},
             ],
         )
 
-        self.assertEqual(
-            mock_fa_filter.call_args_list,
-            [
-                call(archival_unit__parent__parent=fonds_1, published=True),
-                call(archival_unit__parent__parent=fonds_2, published=True),
-            ],
-        )
+    def test_caching_headers(self):
+        fonds = self._make_fonds(100, "Fonds One")
+        ArchivalUnitStats.objects.create(archival_unit=fonds, published_finding_aids=12)
+
+        response = self.client.get(self.url)
+        self.assertIn("private", response["Cache-Control"])
+        self.assertIn("max-age=", response["Cache-Control"])
+
+        not_modified = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(not_modified.status_code, 304)
+
+        ArchivalUnitStats.objects.filter(archival_unit=fonds).update(published_finding_aids=13)
+        changed = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(changed.data[0]["size"], 13)
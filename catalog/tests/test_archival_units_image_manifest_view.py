@@ -1,126 +1,101 @@
-from types import SimpleNamespace
+import json
 from unittest.mock import Mock, patch
 
-from django.http import Http404
-from django.test import SimpleTestCase, override_settings
-from rest_framework.test import APIRequestFactory
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
 
-from catalog.views.iiif_views.archival_units_image_manifest_view import ArchivalUnitsManifestView
+from archival_unit.tests.helpers import make_fonds, make_subfonds, make_series
+from clockwork_api.tests.no_index_signals_mixin import NoIndexSignalsMixin
+from container.tests.helpers import make_container
+from controlled_list.models import AccessRight, CarrierType, PrimaryType
+from digitization.models import IIIFImageInfo
+from finding_aids.tests.helpers import make_finding_aids
+from isad.models import Isad
+from isad.tests.helpers import make_isad
 
 
-class ArchivalUnitsManifestViewTests(SimpleTestCase):
+@override_settings(BASE_URL="https://catalog.example", BASE_IMAGE_URI="https://images.example/iiif/2/")
+class ArchivalUnitsManifestViewTests(NoIndexSignalsMixin, TestCase):
+    fixtures = ['carrier_types', 'primary_types', 'access_rights']
+
     def setUp(self):
-        self.factory = APIRequestFactory()
-        self.view = ArchivalUnitsManifestView()
-
-    @override_settings(BASE_URL="https://catalog.example")
-    def test_get_builds_manifest_and_adds_only_still_images(self):
-        archival_unit = SimpleNamespace(title_full="Series Title", reference_code="HU OSA 123")
-        isad = SimpleNamespace(archival_unit=archival_unit)
-
-        still_image = SimpleNamespace(
-            primary_type=SimpleNamespace(type="Still Image"),
-            archival_unit=archival_unit,
-            container=SimpleNamespace(container_no=2),
-            folder_no=7,
-            archival_reference_code="HU OSA 123:2/7",
-            title="Photo",
-        )
-        non_still = SimpleNamespace(
-            primary_type=SimpleNamespace(type="Audio"),
-            archival_unit=archival_unit,
-            container=SimpleNamespace(container_no=9),
-            folder_no=1,
-            archival_reference_code="HU OSA 123:9/1",
-            title="Tape",
+        super().setUp()
+        self.client = APIClient()
+        self.session = Mock()
+        patcher = patch("digitization.services.iiif_image_info._create_session", return_value=self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.series = make_series(make_subfonds(make_fonds()))
+        make_isad(self.series, published=True)
+        container = make_container(self.series, CarrierType.objects.get(pk=1))
+        still_image = PrimaryType.objects.get_or_create(type='Still Image')[0]
+        access_rights = AccessRight.objects.get(pk=1)
+        self.photos = [
+            make_finding_aids(container, still_image, access_rights, folder_no=folder_no, title='Photo %s' % folder_no,
+                              digital_version_online=True)
+            for folder_no in (1, 2, 3)
+        ]
+        make_finding_aids(container, PrimaryType.objects.exclude(type='Still Image').first(), access_rights,
+                          folder_no=4, digital_version_online=True)
+        IIIFImageInfo.objects.create(image_id=self._image_id(self.photos[0]), status_code=404)
+        for photo in self.photos[1:]:
+            IIIFImageInfo.objects.create(image_id=self._image_id(photo), status_code=200, width=1000, height=800)
+        self.url = reverse('catalog-v1:archival-units-manifest-view', args=[self.series.id])
+
+    def _image_id(self, fa_entity):
+        reference_code = self.series.reference_code.replace(" ", "_")
+        return 'catalog/%s/%s-%04d-%03d.jpg' % (
+            reference_code, reference_code, fa_entity.container.container_no, fa_entity.folder_no
         )
 
-        factory = Mock()
-        manifest = Mock()
-        seq = Mock()
-        canvas = Mock()
-        factory.manifest.return_value = manifest
-        manifest.sequence.return_value = seq
-        seq.canvas.return_value = canvas
-        manifest.toJSON.return_value = {"manifest": "ok"}
-
-        request = self.factory.get("/v1/catalog/archival-units-image-manifest/10/manifest.json")
-
-        with patch(
-            "catalog.views.iiif_views.archival_units_image_manifest_view.get_object_or_404",
-            return_value=isad,
-        ) as mock_get_object_or_404, patch(
-            "catalog.views.iiif_views.archival_units_image_manifest_view.ManifestFactory",
-            return_value=factory,
-        ), patch(
-            "catalog.views.iiif_views.archival_units_image_manifest_view.FindingAidsEntity.objects.filter",
-            return_value=[still_image, non_still],
-        ) as mock_fa_filter:
-            response = self.view.get(request, archival_unit_id="10")
-
-        self.assertEqual(response.data, {"manifest": "ok"})
-
-        mock_get_object_or_404.assert_called_once()
-        mock_fa_filter.assert_called_once_with(archival_unit=archival_unit, digital_version_online=True)
-
-        factory.set_base_prezi_uri.assert_called_once_with(
-            "https://catalog.example/v1/catalog/archival-units-image-manifest/10/manifest.json"
-        )
-        factory.set_base_image_uri.assert_called_once()
-        factory.set_iiif_image_info.assert_called_once_with(2.0, 2)
-        factory.set_debug.assert_called_once_with("error")
-        factory.manifest.assert_called_once_with(label="Series Title")
-
-        seq.canvas.assert_called_once_with(ident="HU OSA 123:2/7", label="HU OSA 123:2/7 Photo")
-        canvas.set_image_annotation.assert_called_once_with(
-            "catalog%2FHU_OSA_123%2FHU_OSA_123-0002-007.jpg",
-            iiif=True,
+    def test_canvases_use_cached_dimensions(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.session.get.assert_not_called()
+        canvases = response.json()['sequences'][0]['canvases']
+        self.assertEqual([canvas['label'] for canvas in canvases], [
+            '%s Photo 2' % self.photos[1].archival_reference_code, '%s Photo 3' % self.photos[2].archival_reference_code
+        ])
+        self.assertEqual((canvases[0]['height'], canvases[0]['width']), (800, 1000))
+        resource = canvases[0]['images'][0]['resource']
+        self.assertEqual((resource['height'], resource['width']), (800, 1000))
+        self.assertIn('catalog%2FHU_OSA_206-3-1%2FHU_OSA_206-3-1-0001-002.jpg', resource['@id'])
+
+    def test_missing_dimensions_are_fetched_and_cached(self):
+        IIIFImageInfo.objects.filter(image_id=self._image_id(self.photos[1])).delete()
+        self.session.get.return_value = Mock(
+            status_code=200, text=json.dumps({"width": 600, "height": 400}), headers={}
         )
 
-    @override_settings(BASE_URL="https://catalog.example")
-    def test_get_returns_manifest_even_when_no_still_images(self):
-        archival_unit = SimpleNamespace(title_full="Series Title", reference_code="HU OSA 999")
-        isad = SimpleNamespace(archival_unit=archival_unit)
-
-        non_still = SimpleNamespace(
-            primary_type=SimpleNamespace(type="Video"),
-            archival_unit=archival_unit,
-            container=SimpleNamespace(container_no=1),
-            folder_no=1,
-            archival_reference_code="HU OSA 999:1/1",
-            title="Movie",
-        )
+        response = self.client.get(self.url)
+
+        self.assertEqual(self.session.get.call_count, 1)
+        canvas = response.json()['sequences'][0]['canvases'][0]
+        self.assertEqual((canvas['height'], canvas['width']), (400, 600))
+        self.assertEqual(IIIFImageInfo.objects.get(image_id=self._image_id(self.photos[1])).width, 600)
+
+    @override_settings(IIIF_MANIFEST_PAGE_SIZE=2)
+    def test_large_units_are_served_as_collection_of_pages(self):
+        collection = self.client.get(self.url).json()
+
+        self.assertEqual(collection['@type'], 'sc:Collection')
+        self.assertEqual([manifest['@id'] for manifest in collection['manifests']], [
+            'https://catalog.example%s?page=1' % self.url, 'https://catalog.example%s?page=2' % self.url
+        ])
+
+        first_page = self.client.get(self.url, {'page': 1}).json()
+        second_page = self.client.get(self.url, {'page': 2}).json()
+        # The first image has no info.json.
+        self.assertEqual(len(first_page['sequences'][0]['canvases']), 1)
+        self.assertEqual(len(second_page['sequences'][0]['canvases']), 1)
+        self.assertEqual(second_page['label'], '%s (2/2)' % self.series.title_full)
+
+        self.assertEqual(self.client.get(self.url, {'page': 3}).status_code, 404)
+        self.assertEqual(self.client.get(self.url, {'page': 'x'}).status_code, 404)
 
-        factory = Mock()
-        manifest = Mock()
-        seq = Mock()
-        factory.manifest.return_value = manifest
-        manifest.sequence.return_value = seq
-        manifest.toJSON.return_value = {"manifest": "empty"}
-
-        request = self.factory.get("/v1/catalog/archival-units-image-manifest/99/manifest.json")
-
-        with patch(
-            "catalog.views.iiif_views.archival_units_image_manifest_view.get_object_or_404",
-            return_value=isad,
-        ), patch(
-            "catalog.views.iiif_views.archival_units_image_manifest_view.ManifestFactory",
-            return_value=factory,
-        ), patch(
-            "catalog.views.iiif_views.archival_units_image_manifest_view.FindingAidsEntity.objects.filter",
-            return_value=[non_still],
-        ):
-            response = self.view.get(request, archival_unit_id="99")
-
-        self.assertEqual(response.data, {"manifest": "empty"})
-        seq.canvas.assert_not_called()
-
-    def test_get_propagates_not_found(self):
-        request = self.factory.get("/v1/catalog/archival-units-image-manifest/404/manifest.json")
-
-        with patch(
-            "catalog.views.iiif_views.archival_units_image_manifest_view.get_object_or_404",
-            side_effect=Http404,
-        ):
-            with self.assertRaises(Http404):
-                self.view.get(request, archival_unit_id="404")
+    def test_unpublished_units_are_not_found(self):
+        Isad.objects.filter(archival_unit=self.series).update(published=False)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
@@ -1,10 +1,17 @@
 from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
-from django.test import SimpleTestCase
-from rest_framework.test import APIRequestFactory
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient, APIRequestFactory
 
+from archival_unit.models import ArchivalUnit
+from catalog.services import archival_units_tree
 from catalog.views.tree_views.archival_units_tree_view import ArchivalUnitsTreeView
+from clockwork_api.tests.no_index_signals_mixin import NoIndexSignalsMixin
+from controlled_list.models import ArchivalUnitTheme
+from isad.tests.helpers import make_isad
 
 
 class _ValuesQS:
@@ -21,21 +28,6 @@ class _ValuesQS:
         return [{field: row.get(field) for field in fields} for row in self.rows]
 
 
-class _ArchivalUnitQS:
-    def __init__(self, rows):
-        self.rows = list(rows)
-
-    def select_related(self, *args, **kwargs):
-        return self
-
-    def order_by(self, *args, **kwargs):
-        return self
-
-    def values(self, *fields):
-        projected = [{field: row.get(field) for field in fields} for row in self.rows]
-        return _ValuesQS(projected)
-
-
 class _SeriesNode(dict):
     pass
 
@@ -52,12 +44,9 @@ class ArchivalUnitsTreeViewTests(SimpleTestCase):
             {"id": 2, "theme": "C"},
         ])
 
-        self.view.get_themes(qs)
+        self.assertEqual(archival_units_tree.get_themes(qs), {1: ["A", "B"], 2: ["C"]})
 
-        self.assertEqual(self.view.themes, {1: ["A", "B"], 2: ["C"]})
-
-    def test_get_unit_data_uses_preloaded_themes(self):
-        self.view.themes = {5: ["theme-x"]}
+    def test_get_unit_data_uses_given_themes(self):
         au = {
             "id": 5,
             "isad__catalog_id": "ISAD-5",
@@ -67,7 +56,7 @@ class ArchivalUnitsTreeViewTests(SimpleTestCase):
             "level": "S",
         }
 
-        data = self.view.get_unit_data(au)
+        data = archival_units_tree.get_unit_data(au, ["theme-x"])
 
         self.assertEqual(data["catalog_id"], "ISAD-5")
         self.assertEqual(data["key"], "hu_osa_5")
@@ -115,111 +104,125 @@ class ArchivalUnitsTreeViewTests(SimpleTestCase):
             available_online=True,
         )
 
-    def test_get_all_theme_filtered_builds_tree(self):
+    def test_build_tree_nests_subfonds_and_series(self):
         rows = [
-            {
-                "id": 1,
-                "fonds": 1,
-                "subfonds": 0,
-                "series": 0,
-                "reference_code": "HU OSA 100",
-                "title": "Fonds",
-                "title_original": "Fonds Orig",
-                "level": "F",
-                "isad__catalog_id": "ISAD-F",
-            },
-            {
-                "id": 2,
-                "fonds": 1,
-                "subfonds": 1,
-                "series": 0,
-                "reference_code": "HU OSA 100/1",
-                "title": "Subfonds",
-                "title_original": "Subfonds Orig",
-                "level": "SF",
-                "isad__catalog_id": "ISAD-SF",
-            },
-            {
-                "id": 3,
-                "fonds": 1,
-                "subfonds": 1,
-                "series": 1,
-                "reference_code": "HU OSA 100/1/1",
-                "title": "Series A",
-                "title_original": "Series A Orig",
-                "level": "S",
-                "isad__catalog_id": "ISAD-S1",
-            },
-            {
-                "id": 4,
-                "fonds": 1,
-                "subfonds": 0,
-                "series": 2,
-                "reference_code": "HU OSA 100/2",
-                "title": "Series B",
-                "title_original": "Series B Orig",
-                "level": "S",
-                "isad__catalog_id": "ISAD-S2",
-            },
+            {"id": 1, "fonds": 1, "subfonds": 0, "series": 0, "reference_code": "HU OSA 100", "level": "F"},
+            {"id": 2, "fonds": 1, "subfonds": 1, "series": 0, "reference_code": "HU OSA 100-1", "level": "SF"},
+            {"id": 3, "fonds": 1, "subfonds": 1, "series": 1, "reference_code": "HU OSA 100-1-1", "level": "S"},
+            {"id": 4, "fonds": 1, "subfonds": 0, "series": 2, "reference_code": "HU OSA 100-0-2", "level": "S"},
+            {"id": 5, "fonds": 2, "subfonds": 0, "series": 0, "reference_code": "HU OSA 200", "level": "F"},
         ]
         for row in rows:
-            row["theme"] = "theme-a"
+            row.update(title=row["reference_code"], title_original=None, isad__catalog_id=None)
 
-        qs = _ArchivalUnitQS(rows)
-        request = self.factory.get("/v1/catalog/archival-units-tree/all/theme-a/")
+        tree = archival_units_tree.build_tree(rows, {row["id"]: [None] for row in rows})
 
-        with patch(
-            "catalog.views.tree_views.archival_units_tree_view.ArchivalUnit.objects.filter",
-            return_value=qs,
-        ) as mock_filter:
-            response = self.view.get(request, archival_unit_id="all", theme="theme-a")
+        self.assertEqual([node["id"] for node in tree], [1, 5])
+        self.assertEqual([node["id"] for node in tree[0]["children"]], [2, 4])
+        self.assertEqual([node["id"] for node in tree[0]["children"][0]["children"]], [3])
+        self.assertTrue(tree[0]["children"][0]["children"][0]["subfonds"])
+        self.assertFalse(tree[0]["children"][1]["subfonds"])
+
+
+class ArchivalUnitsTreeCacheTests(NoIndexSignalsMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.client = APIClient()
+        self.theme = ArchivalUnitTheme.objects.create(theme="Human Rights")
+        self.fonds = self._make_unit(level="F", fonds=300, title="Fonds 300")
+        self.subfonds = self._make_unit(level="SF", fonds=300, subfonds=1, title="Subfonds", parent=self.fonds)
+        self.series = self._make_unit(
+            level="S", fonds=300, subfonds=1, series=1, title="Series", parent=self.subfonds
+        )
+        self.other_fonds = self._make_unit(level="F", fonds=301, title="Fonds 301")
+        for unit in (self.fonds, self.series):
+            unit.theme.add(self.theme)
+        cache.clear()
+
+    def _make_unit(self, published=True, **kwargs):
+        unit = ArchivalUnit.objects.create(**kwargs)
+        make_isad(unit, published=published)
+        return unit
+
+    def _get(self, *args, **headers):
+        return self.client.get(reverse("catalog-v1:archival-units-tree", args=args), **headers)
+
+    def test_full_tree_is_served_from_cache(self):
+        response = self._get("all")
 
         self.assertEqual(response.status_code, 200)
+        self.assertEqual([node["reference_code"] for node in response.data], ["HU OSA 300", "HU OSA 301"])
+        self.assertEqual(response.data[0]["children"][0]["children"][0]["id"], self.series.id)
+
+        with self.assertNumQueries(0):
+            cached = self._get("all")
+        self.assertEqual(cached.data, response.data)
+        self.assertEqual(cached["ETag"], response["ETag"])
+
+    def test_theme_variant(self):
+        response = self.client.get(
+            reverse("catalog-v1:archival-units-tree-with-theme", args=["all", self.theme.id])
+        )
+
         self.assertEqual(len(response.data), 1)
         fonds = response.data[0]
-        self.assertEqual(fonds["level"], "F")
-        self.assertEqual(len(fonds["children"]), 2)
+        self.assertEqual(fonds["themes"], [self.theme.id])
+        # The subfonds is not tagged with the theme, so the series has no parent in this variant.
+        self.assertEqual(fonds["children"], [])
 
-        subfonds = [node for node in fonds["children"] if node["level"] == "SF"][0]
-        self.assertEqual(len(subfonds["children"]), 1)
-        self.assertTrue(subfonds["children"][0]["subfonds"])
+    def test_fonds_scope(self):
+        response = self._get(self.series.id)
 
-        direct_series = [node for node in fonds["children"] if node["level"] == "S"][0]
-        self.assertFalse(direct_series["subfonds"])
+        self.assertEqual([node["id"] for node in response.data], [self.fonds.id])
 
-        mock_filter.assert_called_once_with(isad__published=True, theme__id="theme-a")
+    def test_if_none_match(self):
+        etag = self._get("all")["ETag"]
 
-    def test_get_specific_archival_unit_scopes_by_fonds(self):
-        rows = [
-            {
-                "id": 11,
-                "fonds": 9,
-                "subfonds": 0,
-                "series": 0,
-                "reference_code": "HU OSA 900",
-                "title": "Scoped Fonds",
-                "title_original": "Scoped Fonds Orig",
-                "level": "F",
-                "isad__catalog_id": "ISAD-900",
-                "theme": "t1",
-            }
-        ]
-        qs = _ArchivalUnitQS(rows)
-        archival_unit = SimpleNamespace(fonds=9)
-        request = self.factory.get("/v1/catalog/archival-units-tree/11/")
+        response = self._get("all", HTTP_IF_NONE_MATCH=etag)
 
-        with patch(
-            "catalog.views.tree_views.archival_units_tree_view.get_object_or_404",
-            return_value=archival_unit,
-        ) as mock_get_object_or_404, patch(
-            "catalog.views.tree_views.archival_units_tree_view.ArchivalUnit.objects.filter",
-            return_value=qs,
-        ) as mock_filter:
-            response = self.view.get(request, archival_unit_id="11", theme=None)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
 
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["id"], 11)
+    def test_unrelated_save_keeps_responses(self):
+        etag = self._get("all")["ETag"]
+        version = archival_units_tree.get_version()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.series.isad.save()
+
+        self.assertEqual(archival_units_tree.get_version(), version)
+        self.assertEqual(self._get("all")["ETag"], etag)
+
+    def test_rename_rebuilds_only_its_fonds(self):
+        etag = self._get("all")["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.series.title = "Renamed series"
+            self.series.save()
+
+        with patch.object(
+            archival_units_tree, "build_fonds_variants", wraps=archival_units_tree.build_fonds_variants
+        ) as build:
+            response = self._get("all")
+
+        build.assert_not_called()
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data[0]["children"][0]["children"][0]["title"], "Renamed series")
+
+    def test_unpublish_removes_fonds(self):
+        self._get("all")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other_fonds.isad.unpublish()
+
+        self.assertEqual([node["id"] for node in self._get("all").data], [self.fonds.id])
+
+    def test_theme_change_rebuilds_fonds(self):
+        url = reverse("catalog-v1:archival-units-tree-with-theme", args=["all", self.theme.id])
+        self.assertEqual(len(self.client.get(url).data), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other_fonds.theme.add(self.theme)
 
-        mock_get_object_or_404.assert_called_once()
-        mock_filter.assert_called_once_with(isad__published=True, fonds=9)
+        self.assertEqual([node["id"] for node in self.client.get(url).data], [self.fonds.id, self.other_fonds.id])
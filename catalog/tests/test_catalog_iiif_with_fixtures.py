@@ -115,17 +115,10 @@ class CatalogIiifFixtureBackedTests(_FixtureSignalsSafeTestCase):
             available_online=True,
         )
 
-        manifest = Mock()
-        canvas = Mock()
-        manifest.make_canvas_from_iiif.return_value = canvas
-        manifest.json.return_value = '{"ok": true}'
-
-        with patch("catalog.views.iiif_views.finding_aids_iiif_presentation_v3_view.Manifest", return_value=manifest):
+        with patch("digitization.services.iiif_manifest.build_manifest", return_value='{"ok": true}') as build:
             response = self.client.get(reverse("catalog-v1:finding-aids-manifest-view", args=[entity.catalog_id]))
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.data, {"ok": True})
-        self.assertTrue(manifest.make_canvas_from_iiif.called)
-        called_url = manifest.make_canvas_from_iiif.call_args.kwargs["url"]
-        self.assertIn("catalog%2FAA_BB_CC_DD_EE%2F", called_url)
-        self.assertIn(dv.filename, called_url)
+        self.assertEqual(response.json(), {"ok": True})
+        digital_versions = build.call_args.args[1]
+        self.assertEqual([digital_version['id'] for digital_version in digital_versions], [dv.id])
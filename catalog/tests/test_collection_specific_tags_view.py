@@ -1,35 +1,17 @@
 from unittest.mock import patch
 
-from django.test import SimpleTestCase
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
 from rest_framework.test import APIRequestFactory
 
+from archival_unit.tests.helpers import make_fonds, make_subfonds, make_series
+from catalog.services import keyword_pool
+from catalog.tasks import refresh_keyword_pool
 from catalog.views.statistics_views.collection_specific_tags import CollectionSpecificTags
-
-
-class _KeywordObj:
-    def __init__(self, value):
-        self.value = value
-
-    def __str__(self):
-        return self.value
-
-
-class _KeywordQS:
-    def __init__(self, items):
-        self._items = list(items)
-        self.order_by_called_with = None
-        self.distinct_called = False
-
-    def order_by(self, value):
-        self.order_by_called_with = value
-        return self
-
-    def distinct(self):
-        self.distinct_called = True
-        return self
-
-    def __iter__(self):
-        return iter(self._items)
+from clockwork_api.tests.no_index_signals_mixin import NoIndexSignalsMixin
+from container.tests.helpers import make_container
+from controlled_list.models import AccessRight, CarrierType, Keyword, PrimaryType
+from finding_aids.tests.helpers import make_finding_aids
 
 
 class CollectionSpecificTagsViewTests(SimpleTestCase):
@@ -37,58 +19,80 @@ class CollectionSpecificTagsViewTests(SimpleTestCase):
         self.factory = APIRequestFactory()
         self.view = CollectionSpecificTags()
 
-    def test_get_returns_empty_list(self):
-        qs = _KeywordQS([])
-
+    def test_get_samples_ten_keywords_from_the_pool(self):
         with patch(
-            "catalog.views.statistics_views.collection_specific_tags.Keyword.objects.filter",
-            return_value=qs,
-        ) as mock_filter:
+            "catalog.views.statistics_views.collection_specific_tags.keyword_pool.sample",
+            return_value=["tag-1", "tag-2"],
+        ) as mock_sample:
             response = self.view.get(self.factory.get("/v1/catalog/collection-specific-tags/"))
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.data, [])
-        mock_filter.assert_called_once_with(findingaidsentity__published=True)
-        self.assertEqual(qs.order_by_called_with, "?")
-        self.assertTrue(qs.distinct_called)
-
-    def test_get_deduplicates_and_limits_to_ten(self):
-        values = [
-            "tag-1",
-            "tag-2",
-            "tag-2",
-            "tag-3",
-            "tag-4",
-            "tag-5",
-            "tag-6",
-            "tag-7",
-            "tag-8",
-            "tag-9",
-            "tag-10",
-            "tag-11",
-            "tag-12",
-        ]
-        qs = _KeywordQS([_KeywordObj(v) for v in values])
+        self.assertEqual(response.data, ["tag-1", "tag-2"])
+        mock_sample.assert_called_once_with(10, weighted=False)
 
+    @override_settings(COLLECTION_SPECIFIC_TAGS_WEIGHTED=True)
+    def test_get_uses_weighting_setting(self):
         with patch(
-            "catalog.views.statistics_views.collection_specific_tags.Keyword.objects.filter",
-            return_value=qs,
-        ):
-            response = self.view.get(self.factory.get("/v1/catalog/collection-specific-tags/"))
+            "catalog.views.statistics_views.collection_specific_tags.keyword_pool.sample",
+            return_value=[],
+        ) as mock_sample:
+            self.view.get(self.factory.get("/v1/catalog/collection-specific-tags/"))
 
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(
-            response.data,
-            [
-                "tag-1",
-                "tag-2",
-                "tag-3",
-                "tag-4",
-                "tag-5",
-                "tag-6",
-                "tag-7",
-                "tag-8",
-                "tag-9",
-                "tag-10",
-            ],
+        mock_sample.assert_called_once_with(10, weighted=True)
+
+
+class KeywordPoolTests(NoIndexSignalsMixin, TestCase):
+    fixtures = ['carrier_types', 'primary_types', 'access_rights']
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        keyword_pool.clear_local_pool()
+        self.addCleanup(keyword_pool.clear_local_pool)
+
+        series = make_series(make_subfonds(make_fonds()))
+        container = make_container(series, CarrierType.objects.get(pk=1))
+        self.published = [
+            make_finding_aids(container, PrimaryType.objects.first(), AccessRight.objects.get(pk=1),
+                              folder_no=folder_no, published=True)
+            for folder_no in (1, 2)
+        ]
+        self.draft = make_finding_aids(container, PrimaryType.objects.first(), AccessRight.objects.get(pk=1),
+                                       folder_no=3)
+
+        self.common = Keyword.objects.create(keyword='common')
+        self.rare = Keyword.objects.create(keyword='rare')
+        self.unpublished = Keyword.objects.create(keyword='unpublished')
+        for finding_aids in self.published:
+            finding_aids.subject_keyword.add(self.common)
+        self.published[0].subject_keyword.add(self.rare)
+        self.draft.subject_keyword.add(self.unpublished, self.common)
+
+    def test_pool_holds_keywords_of_published_entities_with_usage(self):
+        self.assertEqual(refresh_keyword_pool(), 2)
+        self.assertCountEqual(
+            keyword_pool.get_pool(), [(self.common.id, 'common', 2), (self.rare.id, 'rare', 1)]
         )
+
+    def test_sampling_is_distinct_and_bounded(self):
+        refresh_keyword_pool()
+
+        with self.assertNumQueries(0):
+            self.assertCountEqual(keyword_pool.sample(10), ['common', 'rare'])
+            self.assertEqual(len(keyword_pool.sample(1)), 1)
+            self.assertCountEqual(keyword_pool.sample(10, weighted=True), ['common', 'rare'])
+            self.assertEqual(len(keyword_pool.sample(1, weighted=True)), 1)
+
+    def test_missing_pool_is_built_on_first_use(self):
+        with self.assertNumQueries(1):
+            self.assertCountEqual(keyword_pool.sample(10), ['common', 'rare'])
+
+    def test_process_copy_is_reused_until_it_expires(self):
+        refresh_keyword_pool()
+        self.published[1].subject_keyword.add(self.unpublished)
+        cache.set(keyword_pool.CACHE_KEY, keyword_pool.build_pool())
+
+        self.assertNotIn('unpublished', keyword_pool.sample(10))
+
+        with patch('catalog.services.keyword_pool.time.monotonic', return_value=float('inf')):
+            self.assertIn('unpublished', keyword_pool.sample(10))
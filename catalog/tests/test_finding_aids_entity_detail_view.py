@@ -1,11 +1,29 @@
 from types import SimpleNamespace
 from unittest.mock import patch
 
+from django.db import connection
 from django.http import Http404
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
 
+from archival_unit.tests.helpers import make_fonds, make_subfonds, make_series
+from authority.models import Corporation, Person, Place, Subject
+from authority.tests.helpers import make_country, make_genre, make_language
 from catalog.views.finding_aids_views.finding_aids_entity_detail_view import FindingAidsEntityDetailView
-from finding_aids.models import FindingAidsEntity
+from clockwork_api.tests.no_index_signals_mixin import NoIndexSignalsMixin
+from container.tests.helpers import make_container
+from controlled_list.models import AccessRight, CarrierType, CorporationRole, DateType, GeoRole, Keyword, \
+    LanguageUsage, PersonRole, PrimaryType
+from digitization.tests.helpers import make_digital_version_finding_aids
+from finding_aids.tests.helpers import make_finding_aids
+from isad.tests.helpers import make_isad
+
+# Queries answering one detail request: the entity and one per prefetched relation.
+FINDING_AIDS_DETAIL_QUERY_BUDGET = 23
+
+PERSON_NAMES = {1: ('Mikhail', 'Gorbachev'), 2: ('Imre', 'Nagy'), 3: ('Vaclav', 'Havel')}
 
 
 class FindingAidsEntityDetailViewTests(SimpleTestCase):
@@ -13,16 +31,17 @@ class FindingAidsEntityDetailViewTests(SimpleTestCase):
         expected = SimpleNamespace(id=55)
         view = FindingAidsEntityDetailView()
         view.kwargs = {"fa_entity_catalog_id": "FA-12345"}
+        queryset = object()
 
         with patch(
             "catalog.views.finding_aids_views.finding_aids_entity_detail_view.get_object_or_404",
             return_value=expected,
-        ) as mock_get_object_or_404:
+        ) as mock_get_object_or_404, patch.object(view, "get_queryset", return_value=queryset):
             result = view.get_object()
 
         self.assertIs(result, expected)
         mock_get_object_or_404.assert_called_once_with(
-            FindingAidsEntity,
+            queryset,
             catalog_id="FA-12345",
             published=True,
         )
@@ -37,3 +56,85 @@ class FindingAidsEntityDetailViewTests(SimpleTestCase):
         ):
             with self.assertRaises(Http404):
                 view.get_object()
+
+
+class FindingAidsEntityDetailQueryBudgetTests(NoIndexSignalsMixin, TestCase):
+    fixtures = ['carrier_types', 'primary_types', 'access_rights', 'date_types', 'person_roles',
+                'corporation_roles', 'language_usages']
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        series = make_series(make_subfonds(make_fonds(title='Fonds'), title='Subfonds'))
+        make_isad(series, published=True)
+        container = make_container(series, CarrierType.objects.get(pk=1))
+        self.finding_aids = make_finding_aids(
+            container, PrimaryType.objects.first(), AccessRight.objects.get(pk=1), published=True,
+            digital_version_exists=True
+        )
+        self.url = reverse('catalog-v1:finding-aids-full-view', args=[self.finding_aids.catalog_id])
+
+    def _add_metadata(self, index):
+        fa = self.finding_aids
+        language = make_language(language='Language %s' % index, iso_639_1='l%s' % index, iso_639_2='l%s' % index)
+        first_name, last_name = PERSON_NAMES[index]
+        person = Person.objects.create(first_name=first_name, last_name=last_name)
+        person.personotherformat_set.create(first_name='Other %s' % index, last_name='Last', language=language)
+        corporation = Corporation.objects.create(name='Corporation %s' % index)
+        corporation.corporationotherformat_set.create(name='Other corporation %s' % index)
+        country = make_country(country='Country %s' % index, alpha2='C%s' % index, alpha3='CC%s' % index)
+        place = Place.objects.create(place='Place %s' % index)
+
+        fa.genre.add(make_genre(genre='Genre %s' % index))
+        fa.spatial_coverage_country.add(country)
+        fa.spatial_coverage_place.add(place)
+        fa.subject_person.add(person)
+        fa.subject_corporation.add(corporation)
+        fa.subject_heading.add(Subject.objects.create(subject='Subject %s' % index))
+        fa.subject_keyword.add(Keyword.objects.create(keyword='Keyword %s' % index))
+        fa.findingaidsentityalternativetitle_set.create(alternative_title='Alternative %s' % index)
+        fa.findingaidsentitydate_set.create(date_from='2000-01-01', date_type=DateType.objects.first())
+        fa.findingaidsentitycreator_set.create(creator='Creator %s' % index)
+        fa.findingaidsentityplaceofcreation_set.create(place='Place of creation %s' % index)
+        fa.findingaidsentitysubject_set.create(subject='Free subject %s' % index)
+        fa.findingaidsentityassociatedperson_set.create(associated_person=person, role=PersonRole.objects.first())
+        fa.findingaidsentityassociatedcorporation_set.create(
+            associated_corporation=corporation, role=CorporationRole.objects.first()
+        )
+        fa.findingaidsentityassociatedcountry_set.create(
+            associated_country=country, role=GeoRole.objects.get_or_create(role='Depicted')[0]
+        )
+        fa.findingaidsentityassociatedplace_set.create(
+            associated_place=place, role=GeoRole.objects.get_or_create(role='Depicted')[0]
+        )
+        fa.findingaidsentitylanguage_set.create(language=language, language_usage=LanguageUsage.objects.first())
+        make_digital_version_finding_aids(fa, identifier='DV_%s' % index, level='A', available_online=True)
+        make_digital_version_finding_aids(fa, identifier='DV_M_%s' % index, level='M')
+
+    def _get_query_count(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return response, len(context.captured_queries)
+
+    def test_serialized_relations(self):
+        self._add_metadata(1)
+        response, _ = self._get_query_count()
+        data = response.json()
+
+        self.assertEqual(data['archival_unit']['catalog_id'], self.finding_aids.archival_unit.isad.catalog_id)
+        self.assertEqual(data['subject_person'][0]['person_other_formats'][0]['first_name'], 'Other 1')
+        self.assertEqual(data['added_country'][0]['role'], 'Depicted')
+        self.assertEqual(data['languages'][0]['language']['language'], 'Language 1')
+        self.assertEqual([copy['identifier'] for copy in data['access_copies']], ['DV_1'])
+        self.assertTrue(data['digital_version_online'])
+        self.assertIn('Subfonds; Fonds;', data['citation'])
+
+    def test_query_budget_does_not_grow_with_relations(self):
+        self._add_metadata(1)
+        _, queries = self._get_query_count()
+        self.assertLessEqual(queries, FINDING_AIDS_DETAIL_QUERY_BUDGET)
+
+        self._add_metadata(2)
+        self._add_metadata(3)
+        self.assertEqual(self._get_query_count()[1], queries)
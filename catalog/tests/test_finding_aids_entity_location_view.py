@@ -1,35 +1,17 @@
 from types import SimpleNamespace
-from unittest.mock import patch
 
-from django.test import SimpleTestCase
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
 from rest_framework.test import APIRequestFactory
 
+from archival_unit.models import ArchivalUnit
+from archival_unit.tests.helpers import make_fonds, make_subfonds
 from catalog.views.finding_aids_views.finding_aids_entity_location_view import FindingAidsEntityLocationView
-
-
-class _FakeFAQuerySet:
-    def __init__(self, items, count_value=None):
-        self.items = list(items)
-        self._count_value = count_value if count_value is not None else len(self.items)
-
-    def order_by(self, *args, **kwargs):
-        return self
-
-    def count(self):
-        return self._count_value
-
-    def first(self):
-        return self.items[0] if self.items else None
-
-    def last(self):
-        return self.items[-1] if self.items else None
-
-    def filter(self, **kwargs):
-        if "folder_no" in kwargs:
-            folder_no = kwargs["folder_no"]
-            filtered = [item for item in self.items if getattr(item, "folder_no", None) == folder_no]
-            return _FakeFAQuerySet(filtered, count_value=len(filtered))
-        return _FakeFAQuerySet(self.items, count_value=self._count_value)
+from clockwork_api.tests.no_index_signals_mixin import NoIndexSignalsMixin
+from container.tests.helpers import make_container
+from controlled_list.models import AccessRight, CarrierType, PrimaryType
+from finding_aids.tests.helpers import make_finding_aids
+from isad.tests.helpers import make_isad
 
 
 class FindingAidsEntityLocationViewTests(SimpleTestCase):
@@ -111,86 +93,74 @@ class FindingAidsEntityLocationViewTests(SimpleTestCase):
         self.assertEqual(item_data["level"], "item")
         self.assertFalse(item_data["active"])
 
-    def test_get_non_l1_returns_hierarchy_and_container_only(self):
-        _, _, series, container = self._build_hierarchy()
-        fa_entity = self._build_fa(
-            series,
-            container,
-            folder_no=1,
-            archival_reference_code="HU OSA 100:5/1",
-            catalog_id="FA-ACTIVE",
-            description_level="L2",
-        )
-
-        request = self.factory.get("/v1/catalog/finding-aids-location/FA-ACTIVE/")
-        with patch(
-            "catalog.views.finding_aids_views.finding_aids_entity_location_view.get_object_or_404",
-            return_value=fa_entity,
-        ):
-            response = self.view.get(request, fa_entity_catalog_id="FA-ACTIVE")
 
-        self.assertEqual(len(response.data), 4)
-        self.assertEqual(response.data[0]["level"], "F")
-        self.assertEqual(response.data[1]["level"], "SF")
-        self.assertEqual(response.data[2]["level"], "S")
-        self.assertEqual(response.data[3]["level"], "container")
+class FindingAidsEntityLocationTreeTests(NoIndexSignalsMixin, TestCase):
+    fixtures = ['carrier_types', 'primary_types', 'access_rights']
 
-    def test_get_l1_adds_context_nodes_including_placeholders(self):
-        _, _, series, container = self._build_hierarchy()
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.factory = APIRequestFactory()
+        self.view = FindingAidsEntityLocationView()
 
-        fa_first = self._build_fa(series, container, 1, "HU OSA 100:5/1", "FA-1")
-        fa_previous = self._build_fa(series, container, 3, "HU OSA 100:5/3", "FA-3")
-        fa_active = self._build_fa(series, container, 4, "HU OSA 100:5/4", "FA-4")
-        fa_next = self._build_fa(series, container, 5, "HU OSA 100:5/5", "FA-5")
-        fa_last = self._build_fa(series, container, 7, "HU OSA 100:5/7", "FA-7")
-        qs = _FakeFAQuerySet([fa_first, fa_previous, fa_active, fa_next, fa_last], count_value=7)
-
-        request = self.factory.get("/v1/catalog/finding-aids-location/FA-4/")
-        with patch(
-            "catalog.views.finding_aids_views.finding_aids_entity_location_view.get_object_or_404",
-            return_value=fa_active,
-        ), patch(
-            "catalog.views.finding_aids_views.finding_aids_entity_location_view.FindingAidsEntity.objects.filter",
-            return_value=qs,
-        ):
-            response = self.view.get(request, fa_entity_catalog_id="FA-4")
-
-        levels = [node["level"] for node in response.data]
-        self.assertEqual(levels[:4], ["F", "SF", "S", "container"])
-
-        placeholders = [node for node in response.data if node.get("key") == "placeholder"]
-        self.assertEqual(len(placeholders), 2)
-
-        active_nodes = [node for node in response.data if node.get("active")]
-        self.assertEqual(len(active_nodes), 1)
-        self.assertEqual(active_nodes[0]["catalog_id"], "FA-4")
-
-    def test_get_skips_archival_units_without_isad_attribute(self):
-        fonds = SimpleNamespace()
-        subfonds = SimpleNamespace(parent=fonds)
-        series = SimpleNamespace(parent=subfonds, subfonds=0, reference_code="HU OSA 200")
-        container = SimpleNamespace(
-            archival_unit=series,
-            container_no=1,
-            carrier_type=SimpleNamespace(type="Box"),
+        self.fonds = make_fonds(title='Fonds')
+        # Dummy subfonds without an ISAD record
+        subfonds = make_subfonds(self.fonds, subfonds=0, title='')
+        self.series = ArchivalUnit.objects.create(
+            fonds=self.fonds.fonds, subfonds=0, series=1, level='S', title='Series', parent=subfonds
         )
-        fa_entity = SimpleNamespace(
-            catalog_id="FA-MIN",
-            archival_reference_code="HU OSA 200:1/1",
-            title="Minimal",
-            level="F",
-            archival_unit=series,
-            container=container,
-            description_level="L2",
-            folder_no=1,
-        )
-
-        request = self.factory.get("/v1/catalog/finding-aids-location/FA-MIN/")
-        with patch(
-            "catalog.views.finding_aids_views.finding_aids_entity_location_view.get_object_or_404",
-            return_value=fa_entity,
-        ):
-            response = self.view.get(request, fa_entity_catalog_id="FA-MIN")
-
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["level"], "container")
+        for unit in (self.fonds, self.series):
+            make_isad(unit, published=True)
+        container = make_container(self.series, CarrierType.objects.get(pk=1))
+        primary_type = PrimaryType.objects.first()
+        access_rights = AccessRight.objects.get(pk=1)
+        self.folders = {
+            folder_no: make_finding_aids(container, primary_type, access_rights, folder_no=folder_no,
+                                         title='Folder %s' % folder_no)
+            for folder_no in range(1, 8)
+        }
+
+    def _get(self, folder_no):
+        request = self.factory.get('/')
+        return self.view.get(request, fa_entity_catalog_id=self.folders[folder_no].catalog_id)
+
+    def _labels(self, response):
+        return [node.get('title', node['level']) if node['key'] != 'placeholder' else '...' for node in response.data]
+
+    def test_tree_around_a_folder_in_the_middle(self):
+        response = self._get(4)
+
+        self.assertEqual(self._labels(response), [
+            'Fonds', 'Series', 'container', 'Folder 1', '...', 'Folder 3', 'Folder 4', 'Folder 5', '...', 'Folder 7'
+        ])
+        self.assertEqual([node['catalog_id'] for node in response.data if node.get('active')],
+                         [self.folders[4].catalog_id])
+
+    def test_tree_around_the_first_folder(self):
+        response = self._get(1)
+
+        self.assertEqual(self._labels(response), ['Fonds', 'Series', 'container', 'Folder 1', 'Folder 2', '...', 'Folder 7'])
+        self.assertTrue(response.data[3]['active'])
+
+    def test_two_queries_once_the_ancestors_are_cached(self):
+        with self.assertNumQueries(3):
+            self._get(4)
+        with self.assertNumQueries(2):
+            self._get(5)
+
+    def test_non_l1_entities_show_hierarchy_and_container_only(self):
+        self.folders[4].description_level = 'L2'
+        self.folders[4].save()
+
+        with self.assertNumQueries(2):
+            response = self._get(4)
+        self.assertEqual(self._labels(response), ['Fonds', 'Series', 'container'])
+
+    def test_cached_ancestors_are_dropped_when_a_unit_changes(self):
+        self._get(4)
+
+        self.fonds.title = 'Renamed fonds'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.fonds.save()
+
+        self.assertEqual(self._get(4).data[0]['title'], 'Renamed fonds')
@@ -1,23 +1,12 @@
 from types import SimpleNamespace
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
-import requests
 from django.http import Http404
-from django.test import SimpleTestCase, override_settings
+from django.test import SimpleTestCase
 from rest_framework.test import APIRequestFactory
 
 from catalog.views.iiif_views.finding_aids_iiif_presentation_v3_view import FindingAidsIIFPresentationV3View
-
-
-class _DigitalVersionsManager:
-    def __init__(self, versions):
-        self.versions = list(versions)
-
-    def all(self):
-        return self
-
-    def order_by(self, *args, **kwargs):
-        return self.versions
+from digitization.services import iiif_manifest
 
 
 class FindingAidsIIFPresentationV3ViewTests(SimpleTestCase):
@@ -25,61 +14,63 @@ class FindingAidsIIFPresentationV3ViewTests(SimpleTestCase):
         self.factory = APIRequestFactory()
         self.view = FindingAidsIIFPresentationV3View()
 
-    @override_settings(BASE_URL="https://catalog.example", BASE_IMAGE_URI="https://images.example/iiif/2/")
-    def test_get_builds_v3_manifest_and_skips_http_error_canvas(self):
-        archival_unit = SimpleNamespace(title_full="Series title")
-        digital_one = SimpleNamespace(identifier="AA_BB_CC_DD_EE_FF", filename="image 1.jpg", label="Page 1")
-        digital_two = SimpleNamespace(identifier="GG_HH_II_JJ_KK_LL", filename="image2.jpg", label="")
-
+    def test_get_returns_stored_manifest_with_etag(self):
         fa_entity = SimpleNamespace(
             primary_type=SimpleNamespace(type="Still Image"),
             available_online=True,
-            archival_reference_code="HU OSA 1:1/1",
-            title="Record title",
-            archival_unit=archival_unit,
-            digital_versions=_DigitalVersionsManager([digital_one, digital_two]),
         )
-
-        manifest = Mock()
-        canvas_ok = Mock()
-        manifest.make_canvas_from_iiif.side_effect = [canvas_ok, requests.exceptions.HTTPError("bad iiif")]
-        manifest.json.return_value = '{"ok": true}'
-
-        request = self.factory.get("/v1/catalog/finding-aids-image-manifest/FA-1/manifest.json")
+        stored = SimpleNamespace(manifest='{"ok": true}', digital_versions_hash="abc", complete=True)
+        etag = iiif_manifest.get_etag(stored)
 
         with patch(
             "catalog.views.iiif_views.finding_aids_iiif_presentation_v3_view.get_object_or_404",
             return_value=fa_entity,
         ), patch(
-            "catalog.views.iiif_views.finding_aids_iiif_presentation_v3_view.Manifest",
-            return_value=manifest,
-        ) as mock_manifest_cls:
+            "catalog.views.iiif_views.finding_aids_iiif_presentation_v3_view.iiif_manifest.get_manifest",
+            return_value=stored,
+        ) as get_manifest:
+            request = self.factory.get("/v1/catalog/finding-aids-image-manifest/FA-1/manifest.json")
             response = self.view.get(request, fa_entity_catalog_id="FA-1")
 
+            request = self.factory.get(
+                "/v1/catalog/finding-aids-image-manifest/FA-1/manifest.json", HTTP_IF_NONE_MATCH=etag
+            )
+            not_modified = self.view.get(request, fa_entity_catalog_id="FA-1")
+
+        get_manifest.assert_called_with(fa_entity)
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.data, {"ok": True})
+        self.assertEqual(response.content, b'{"ok": true}')
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response['ETag'], etag)
+        self.assertIn('max-age', response['Cache-Control'])
+        self.assertEqual(not_modified.status_code, 304)
 
-        mock_manifest_cls.assert_called_once_with(
-            id="https://catalog.example/v1/catalog/finding-aids-image-manifest/FA-1/manifest.json",
-            label="HU OSA 1:1/1 Record title<br/>Series title<br/>Blinken OSA Archivum",
+    def test_etag_changes_when_an_incomplete_manifest_is_regenerated(self):
+        fa_entity = SimpleNamespace(
+            primary_type=SimpleNamespace(type="Still Image"),
+            available_online=True,
         )
+        incomplete = SimpleNamespace(manifest='{"items": []}', digital_versions_hash="abc", complete=False)
+        complete = SimpleNamespace(manifest='{"items": [1]}', digital_versions_hash="abc", complete=True)
 
-        self.assertEqual(manifest.make_canvas_from_iiif.call_count, 2)
-        first_url = manifest.make_canvas_from_iiif.call_args_list[0].kwargs["url"]
-        second_url = manifest.make_canvas_from_iiif.call_args_list[1].kwargs["url"]
+        with patch(
+            "catalog.views.iiif_views.finding_aids_iiif_presentation_v3_view.get_object_or_404",
+            return_value=fa_entity,
+        ), patch(
+            "catalog.views.iiif_views.finding_aids_iiif_presentation_v3_view.iiif_manifest.get_manifest",
+            side_effect=[incomplete, complete],
+        ):
+            request = self.factory.get("/v1/catalog/finding-aids-image-manifest/FA-1/manifest.json")
+            first = self.view.get(request, fa_entity_catalog_id="FA-1")
 
-        self.assertEqual(
-            first_url,
-            "https://images.example/iiif/2/catalog%2FAA_BB_CC_DD_EE%2Fimage+1.jpg",
-        )
-        self.assertEqual(
-            second_url,
-            "https://images.example/iiif/2/catalog%2FGG_HH_II_JJ_KK%2Fimage2.jpg",
-        )
+            request = self.factory.get(
+                "/v1/catalog/finding-aids-image-manifest/FA-1/manifest.json", HTTP_IF_NONE_MATCH=first['ETag']
+            )
+            second = self.view.get(request, fa_entity_catalog_id="FA-1")
 
-        canvas_ok.add_thumbnail.assert_called_once_with(
-            image_url="https://images.example/iiif/2/catalog%2FAA_BB_CC_DD_EE%2Fimage+1.jpg/full/,300/0/default.jpg"
-        )
+        self.assertIn('no-cache', first['Cache-Control'])
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.content, b'{"items": [1]}')
 
     def test_get_returns_404_for_non_image_or_offline(self):
         fa_entity = SimpleNamespace(
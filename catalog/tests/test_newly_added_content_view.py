@@ -1,11 +1,21 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from types import SimpleNamespace
-from unittest.mock import ANY, patch
+from unittest.mock import patch
 
-from django.test import SimpleTestCase
-from rest_framework.test import APIRequestFactory
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient, APIRequestFactory
 
+from archival_unit.tests.helpers import make_fonds, make_subfonds, make_series
 from catalog.views.statistics_views.newly_added_content import NewlyAddedContent
+from clockwork_api.tests.no_index_signals_mixin import NoIndexSignalsMixin
+from container.models import Container
+from container.tests.helpers import make_container
+from controlled_list.models import AccessRight, CarrierType, PrimaryType
+from finding_aids.tests.helpers import make_finding_aids
+from isad.tests.helpers import make_isad
 
 
 class _QS:
@@ -21,9 +31,10 @@ class _QS:
         return self.items
 
 
-class _FAManager:
+class _Manager:
     def __init__(self, qs):
         self.qs = qs
+        self.last_filter_kwargs = None
 
     def select_related(self, *args):
         return self
@@ -49,11 +60,12 @@ class NewlyAddedContentViewTests(SimpleTestCase):
             for idx in range(1, 7)
         ]
         qs = _QS(isad_items)
+        manager = _Manager(qs)
 
         with patch(
-            "catalog.views.statistics_views.newly_added_content.Isad.objects.filter",
-            return_value=qs,
-        ) as mock_isad_filter:
+            "catalog.views.statistics_views.newly_added_content.Isad.objects",
+            manager,
+        ):
             response = self.view.get(self.factory.get("/v1/catalog/newly-added-content/isad/"), content_type="isad")
 
         self.assertEqual(response.status_code, 200)
@@ -61,70 +73,64 @@ class NewlyAddedContentViewTests(SimpleTestCase):
         self.assertEqual(response.data[0]["id"], "ISAD-1")
         self.assertEqual(response.data[-1]["id"], "ISAD-5")
 
-        mock_isad_filter.assert_called_once_with(description_level="S", published=True)
+        self.assertEqual(manager.last_filter_kwargs, {"description_level": "S", "published": True})
         self.assertEqual(qs.order_by_args, ("-date_published",))
 
-    def test_get_non_isad_returns_max_five_unique_series(self):
-        series_1 = SimpleNamespace(
-            id=101,
-            isad=SimpleNamespace(catalog_id="ISAD-101"),
-            reference_code="HU OSA 101",
-            title_full="Series 101",
-        )
-        series_2 = SimpleNamespace(
-            id=102,
-            isad=SimpleNamespace(catalog_id="ISAD-102"),
-            reference_code="HU OSA 102",
-            title_full="Series 102",
-        )
-        series_3 = SimpleNamespace(
-            id=103,
-            isad=SimpleNamespace(catalog_id="ISAD-103"),
-            reference_code="HU OSA 103",
-            title_full="Series 103",
-        )
-        series_4 = SimpleNamespace(
-            id=104,
-            isad=SimpleNamespace(catalog_id="ISAD-104"),
-            reference_code="HU OSA 104",
-            title_full="Series 104",
-        )
-        series_5 = SimpleNamespace(
-            id=105,
-            isad=SimpleNamespace(catalog_id="ISAD-105"),
-            reference_code="HU OSA 105",
-            title_full="Series 105",
-        )
-        series_6 = SimpleNamespace(
-            id=106,
-            isad=SimpleNamespace(catalog_id="ISAD-106"),
-            reference_code="HU OSA 106",
-            title_full="Series 106",
-        )
-
-        fa_items = [
-            SimpleNamespace(archival_unit=series_1, date_published=datetime(2026, 2, 1)),
-            SimpleNamespace(archival_unit=series_1, date_published=datetime(2026, 2, 2)),
-            SimpleNamespace(archival_unit=series_2, date_published=datetime(2026, 2, 3)),
-            SimpleNamespace(archival_unit=series_3, date_published=datetime(2026, 2, 4)),
-            SimpleNamespace(archival_unit=series_4, date_published=datetime(2026, 2, 5)),
-            SimpleNamespace(archival_unit=series_5, date_published=datetime(2026, 2, 6)),
-            SimpleNamespace(archival_unit=series_6, date_published=datetime(2026, 2, 7)),
-        ]
 
-        qs = _QS(fa_items)
-        manager = _FAManager(qs)
+class NewlyAddedFoldersTests(NoIndexSignalsMixin, TestCase):
+    fixtures = ['carrier_types', 'primary_types', 'access_rights']
 
-        with patch(
-            "catalog.views.statistics_views.newly_added_content.FindingAidsEntity.objects",
-            manager,
-        ):
-            response = self.view.get(self.factory.get("/v1/catalog/newly-added-content/folder/"), content_type="folder")
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse('catalog-v1:newly-added-content', args=['folder'])
+
+        subfonds = make_subfonds(make_fonds())
+        now = timezone.now()
+        self.series = []
+        for series_no in range(1, 8):
+            series = make_series(subfonds, series=series_no, title='Series %s' % series_no)
+            make_isad(series, published=True)
+            container = make_container(series, CarrierType.objects.get(pk=1))
+            # Two folders per series, the later series published more recently.
+            for folder_no in (1, 2):
+                make_finding_aids(
+                    container, PrimaryType.objects.first(), AccessRight.objects.get(pk=1), folder_no=folder_no,
+                    published=True, date_published=now - timedelta(hours=10 * (8 - series_no) + folder_no)
+                )
+            self.series.append(series)
+
+    def test_latest_five_series_in_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 5)
-        self.assertEqual([row["id"] for row in response.data], ["ISAD-101", "ISAD-102", "ISAD-103", "ISAD-104", "ISAD-105"])
+        self.assertEqual(
+            [row['reference_code'] for row in response.json()],
+            [series.reference_code for series in reversed(self.series[2:])]
+        )
+        latest = response.json()[0]
+        self.assertEqual(latest['id'], self.series[-1].isad.catalog_id)
+        self.assertEqual(latest['title'], self.series[-1].title_full)
+
+    @override_settings(CATALOG_RESPONSE_CACHE_ENABLED=True)
+    def test_response_is_cached_until_the_next_publish(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+        finding_aids = make_finding_aids(
+            Container.objects.get(archival_unit=self.series[0]), PrimaryType.objects.first(),
+            AccessRight.objects.get(pk=1), folder_no=3
+        )
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
 
-        self.assertEqual(qs.order_by_args, ("-date_published",))
-        self.assertEqual(manager.last_filter_kwargs["published"], True)
-        self.assertEqual(manager.last_filter_kwargs["date_published__year__gt"], ANY)
+        finding_aids.published = True
+        finding_aids.date_published = timezone.now()
+        with self.captureOnCommitCallbacks(execute=True):
+            finding_aids.save()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.json()[0]['reference_code'], self.series[0].reference_code)
@@ -0,0 +1,131 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from archival_unit.tests.helpers import make_fonds, make_subfonds, make_series
+from catalog.services import response_cache
+from catalog.views.finding_aids_views.finding_aids_entity_location_view import FindingAidsEntityLocationView
+from clockwork_api.tests.no_index_signals_mixin import NoIndexSignalsMixin
+from container.tests.helpers import make_container
+from controlled_list.models import AccessRight, CarrierType, PrimaryType
+from finding_aids.tests.helpers import make_finding_aids
+from isad.tests.helpers import make_isad
+
+
+@override_settings(CATALOG_RESPONSE_CACHE_ENABLED=True)
+class CatalogResponseCacheTests(NoIndexSignalsMixin, TestCase):
+    fixtures = ['carrier_types', 'primary_types', 'access_rights']
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.client = APIClient()
+        self.fonds = make_fonds()
+        self.subfonds = make_subfonds(self.fonds)
+        self.series = make_series(self.subfonds)
+        for unit in (self.fonds, self.subfonds, self.series):
+            make_isad(unit, published=True)
+        self.container = make_container(self.series, CarrierType.objects.get(pk=1))
+        self.finding_aids = make_finding_aids(
+            self.container, PrimaryType.objects.first(), AccessRight.objects.get(pk=1),
+            folder_no=1, title='Folder', published=True
+        )
+        self.url = reverse('catalog-v1:finding-aids-location-view', args=[self.finding_aids.catalog_id])
+
+    def _get(self, **headers):
+        with patch.object(FindingAidsEntityLocationView, 'get_fa_entity_data',
+                          wraps=FindingAidsEntityLocationView().get_fa_entity_data) as built:
+            response = self.client.get(self.url, **headers)
+        return response, built.called
+
+    def test_second_request_is_served_from_cache_with_headers(self):
+        first, built = self._get()
+        self.assertTrue(built)
+        self.assertEqual(first.status_code, 200)
+
+        second, built = self._get()
+        self.assertFalse(built)
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(second['ETag'], first['ETag'])
+        self.assertIn('Last-Modified', second)
+        self.assertIn('public', second['Cache-Control'])
+        self.assertIn('max-age=', second['Cache-Control'])
+
+    def test_conditional_requests_return_not_modified(self):
+        first, _ = self._get()
+
+        response, _ = self._get(HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+        response, _ = self._get(HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_saving_the_entity_retires_its_responses(self):
+        first, _ = self._get()
+
+        self.finding_aids.title = 'Renamed folder'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.finding_aids.save()
+
+        response, built = self._get(HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertTrue(built)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[-1]['title'], 'Renamed folder')
+
+    def test_saving_a_sibling_retires_the_container_responses(self):
+        self._get()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            make_finding_aids(
+                self.container, PrimaryType.objects.first(), AccessRight.objects.get(pk=1), folder_no=2
+            )
+
+        _, built = self._get()
+        self.assertTrue(built)
+
+    def test_renaming_the_fonds_retires_the_responses_below_it(self):
+        self._get()
+
+        self.fonds.title = 'Renamed fonds'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.fonds.save()
+
+        response, built = self._get()
+        self.assertTrue(built)
+        self.assertEqual(response.json()[0]['title'], 'Renamed fonds')
+
+    def test_unrelated_changes_keep_the_response(self):
+        self._get()
+
+        other_fonds = make_fonds(fonds=207, title='Other fonds')
+        with self.captureOnCommitCallbacks(execute=True):
+            other_fonds.save()
+
+        _, built = self._get()
+        self.assertFalse(built)
+
+    def test_changes_are_not_visible_before_commit(self):
+        self._get()
+
+        self.finding_aids.title = 'Renamed folder'
+        with self.captureOnCommitCallbacks(execute=False):
+            self.finding_aids.save()
+
+        _, built = self._get()
+        self.assertFalse(built)
+
+    def test_missing_records_are_not_cached(self):
+        url = reverse('catalog-v1:finding-aids-location-view', args=['missing'])
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.assertIsNone(response_cache.get_finding_aids_dependencies('missing'))
+
+    def test_invalidate_bumps_versions(self):
+        dependencies = [(response_cache.ARCHIVAL_UNIT, self.series.id)]
+        version = response_cache.get_versions(dependencies)
+        self.assertEqual(response_cache.get_versions(dependencies), version)
+
+        response_cache.invalidate(response_cache.ARCHIVAL_UNIT, [self.series.id])
+        self.assertNotEqual(response_cache.get_versions(dependencies), version)
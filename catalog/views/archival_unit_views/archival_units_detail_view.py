@@ -22,6 +22,7 @@ from rest_framework.views import APIView
 
 from catalog.serializers.archival_units_detail_serializer import ArchivalUnitsDetailSerializer, \
     ArchivalUnitsFacetQuerySerializer
+from catalog.services.response_cache import cache_response, get_archival_unit_dependencies
 from isad.models import Isad
 
 
@@ -37,6 +38,9 @@ class ArchivalUnitsDetailView(RetrieveAPIView):
         - Enforces published=True
         - Returns 404 if no published ISAD exists
 
+    Responses are cached until the unit, its ISAD record or its content
+    change (see catalog.services.response_cache).
+
     This is the canonical archival unit detail endpoint used by
     the public catalog frontend.
     """
@@ -44,6 +48,10 @@ class ArchivalUnitsDetailView(RetrieveAPIView):
     permission_classes = []
     serializer_class = ArchivalUnitsDetailSerializer
 
+    @cache_response(get_archival_unit_dependencies)
+    def get(self, request, *args, **kwargs):
+        return self.retrieve(request, *args, **kwargs)
+
     def get_object(self) -> Isad:
         """
         Resolves the requested archival unit ID to a published ISAD record.
@@ -9,10 +9,15 @@ and external clients, returning a fully serialized representation of
 the finding aids entity.
 """
 
+from django.db.models import Prefetch
 from rest_framework.generics import RetrieveAPIView, get_object_or_404
 
+from authority.models import Corporation, Person
 from catalog.serializers.finding_aids_entity_detail_serializer import FindingAidsEntityDetailSerializer
-from finding_aids.models import FindingAidsEntity
+from catalog.services.response_cache import cache_response, get_finding_aids_dependencies
+from finding_aids.models import FindingAidsEntity, FindingAidsEntityDate, FindingAidsEntityAssociatedPerson, \
+    FindingAidsEntityAssociatedCorporation, FindingAidsEntityAssociatedCountry, FindingAidsEntityAssociatedPlace, \
+    FindingAidsEntityLanguage
 
 
 class FindingAidsEntityDetailView(RetrieveAPIView):
@@ -27,6 +32,11 @@ class FindingAidsEntityDetailView(RetrieveAPIView):
         - Lookup is performed via catalog_id, not primary key
         - Only published entities are exposed
         - The response is read-only and publicly accessible
+        - Responses are cached until the entity, its container or its
+          archival units change (see catalog.services.response_cache)
+        - Every relation the serializer renders is loaded up front
+          (select_related_fields / prefetch_related_fields), so the number
+          of queries does not depend on the number of related records
 
     This endpoint is typically used when navigating directly to a
     finding aids record from the public catalog UI.
@@ -35,6 +45,62 @@ class FindingAidsEntityDetailView(RetrieveAPIView):
     permission_classes = []
     serializer_class = FindingAidsEntityDetailSerializer
 
+    select_related_fields = [
+        'archival_unit__isad', 'archival_unit__parent__parent', 'container__carrier_type', 'primary_type',
+        'access_rights'
+    ]
+    prefetch_related_fields = [
+        'genre',
+        'spatial_coverage_country',
+        'spatial_coverage_place',
+        Prefetch('subject_person', queryset=Person.objects.prefetch_related('personotherformat_set')),
+        Prefetch('subject_corporation', queryset=Corporation.objects.prefetch_related('corporationotherformat_set')),
+        'subject_heading',
+        'subject_keyword',
+        'findingaidsentityalternativetitle_set',
+        Prefetch('findingaidsentitydate_set', queryset=FindingAidsEntityDate.objects.select_related('date_type')),
+        'findingaidsentitycreator_set',
+        'findingaidsentityplaceofcreation_set',
+        'findingaidsentitysubject_set',
+        Prefetch(
+            'findingaidsentityassociatedperson_set',
+            queryset=FindingAidsEntityAssociatedPerson.objects.select_related('associated_person', 'role')
+            .prefetch_related('associated_person__personotherformat_set')
+        ),
+        Prefetch(
+            'findingaidsentityassociatedcorporation_set',
+            queryset=FindingAidsEntityAssociatedCorporation.objects.select_related('associated_corporation', 'role')
+            .prefetch_related('associated_corporation__corporationotherformat_set')
+        ),
+        Prefetch(
+            'findingaidsentityassociatedcountry_set',
+            queryset=FindingAidsEntityAssociatedCountry.objects.select_related('associated_country', 'role')
+        ),
+        Prefetch(
+            'findingaidsentityassociatedplace_set',
+            queryset=FindingAidsEntityAssociatedPlace.objects.select_related('associated_place', 'role')
+        ),
+        Prefetch(
+            'findingaidsentitylanguage_set',
+            queryset=FindingAidsEntityLanguage.objects.select_related('language', 'language_usage')
+        ),
+        'digital_versions',
+    ]
+
+    @cache_response(get_finding_aids_dependencies)
+    def get(self, request, *args, **kwargs):
+        return self.retrieve(request, *args, **kwargs)
+
+    def get_queryset(self):
+        """
+        Returns the finding aids entities with every relation rendered by the serializer loaded.
+        """
+        return FindingAidsEntity.objects.select_related(
+            *self.select_related_fields
+        ).prefetch_related(
+            *self.prefetch_related_fields
+        )
+
     def get_object(self) -> FindingAidsEntity:
         """
         Resolves the catalog identifier to a published finding aids entity.
@@ -47,5 +113,5 @@ class FindingAidsEntityDetailView(RetrieveAPIView):
         """
 
         catalog_id = self.kwargs['fa_entity_catalog_id']
-        fa_entity = get_object_or_404(FindingAidsEntity, catalog_id=catalog_id, published=True)
+        fa_entity = get_object_or_404(self.get_queryset(), catalog_id=catalog_id, published=True)
         return fa_entity
@@ -14,14 +14,20 @@ Key characteristics:
     - Public
     - Highly UI-oriented
     - Returns a partially-expanded tree centered on the active entity
+    - Built with two queries: the entity with its series and container, and
+      one range query for the siblings; the ancestor nodes are cached per
+      series
 """
 from typing import Any
 
+from django.db.models import Count, Q, Subquery
 from django.shortcuts import get_object_or_404
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from archival_unit.models import ArchivalUnit
+from catalog.services import location_ancestors
+from catalog.services.response_cache import cache_response, get_finding_aids_dependencies
 from container.models import Container
 from finding_aids.models import FindingAidsEntity
 
@@ -133,6 +139,46 @@ class FindingAidsEntityLocationView(APIView):
             'has_subfonds': fa_entity.archival_unit.subfonds != 0,
         }
 
+    def get_ancestor_nodes(self, series: ArchivalUnit) -> list:
+        """
+        Returns the fonds, subfonds and series nodes of a series.
+
+        Units without an ISAD record are left out. The nodes are cached per
+        series; on a miss the chain is loaded with a single query.
+        """
+        nodes = location_ancestors.get_nodes(series.id)
+        if nodes is None:
+            series = ArchivalUnit.objects.select_related(
+                'isad', 'parent__isad', 'parent__parent__isad'
+            ).get(pk=series.id)
+            subfonds = series.parent
+            fonds = subfonds.parent
+            nodes = [self.get_archival_unit_data(au) for au in (fonds, subfonds, series) if hasattr(au, 'isad')]
+            location_ancestors.set_nodes(series.id, nodes)
+        return nodes
+
+    def get_siblings(self, fa_entity: FindingAidsEntity) -> list:
+        """
+        Returns the entities of the container shown around the active one, with one ordered range query.
+
+        The rows are the first and the last entity of the container and the
+        entities of the folders right before and after the active one, in
+        (folder_no, sequence_no) order. Every row is annotated with the
+        number of entities in the container (`total`).
+        """
+        container_qs = FindingAidsEntity.objects.filter(container_id=fa_entity.container_id)
+        first = container_qs.order_by('folder_no', 'sequence_no').values('pk')[:1]
+        last = container_qs.order_by('-folder_no', '-sequence_no').values('pk')[:1]
+        total = container_qs.order_by().values('container_id').annotate(total=Count('id')).values('total')
+
+        return list(
+            container_qs.filter(
+                Q(folder_no__in=[fa_entity.folder_no - 1, fa_entity.folder_no + 1]) |
+                Q(pk=Subquery(first)) | Q(pk=Subquery(last))
+            ).select_related('archival_unit').annotate(total=Subquery(total)).order_by('folder_no', 'sequence_no')
+        )
+
+    @cache_response(get_finding_aids_dependencies)
     def get(self, request, fa_entity_catalog_id: str):
         """
         Builds and returns a contextual location tree for a finding aids entity.
@@ -146,25 +192,17 @@ class FindingAidsEntityLocationView(APIView):
         to keep the UI responsive and readable.
         """
 
-        tree = []
-
-        fa_entity = get_object_or_404(FindingAidsEntity, catalog_id=fa_entity_catalog_id, archival_unit__isad__published=True)
+        fa_entity = get_object_or_404(
+            FindingAidsEntity.objects.select_related(
+                'archival_unit', 'container__archival_unit', 'container__carrier_type'
+            ),
+            catalog_id=fa_entity_catalog_id, archival_unit__isad__published=True
+        )
 
         # Resolve hierarchy
-        series = fa_entity.archival_unit
-        subfonds = series.parent
-        fonds = subfonds.parent
+        tree = list(self.get_ancestor_nodes(fa_entity.archival_unit))
         container = fa_entity.container
 
-        if hasattr(fonds, 'isad'):
-            tree.append(self.get_archival_unit_data(fonds))
-
-        if hasattr(subfonds, 'isad'):
-            tree.append(self.get_archival_unit_data(subfonds))
-
-        if hasattr(series, 'isad'):
-            tree.append(self.get_archival_unit_data(series))
-
         # Add active container
         tree.append(self.get_container_data(container))
 
@@ -172,10 +210,10 @@ class FindingAidsEntityLocationView(APIView):
         if fa_entity.description_level == 'L1':
 
             # Finding Aids Entities
-            fa_qs = FindingAidsEntity.objects.filter(container=container).order_by('folder_no', 'sequence_no')
-            fa_count = fa_qs.count()
-            fa_first = fa_qs.first()
-            fa_last = fa_qs.last()
+            siblings = self.get_siblings(fa_entity)
+            fa_count = siblings[0].total
+            fa_first = siblings[0]
+            fa_last = siblings[-1]
 
             # Add first FA Entity in container
             tree.append(self.get_fa_entity_data(fa_first, fa_first.archival_reference_code == fa_entity.archival_reference_code))
@@ -186,19 +224,20 @@ class FindingAidsEntityLocationView(APIView):
 
             # Add previous
             if fa_entity.folder_no > 2:
-                fa_previous = fa_qs.filter(folder_no=fa_entity.folder_no-1).first()
-                tree.append(self.get_fa_entity_data(fa_previous, False))
+                fa_previous = next((fa for fa in siblings if fa.folder_no == fa_entity.folder_no - 1), None)
+                if fa_previous:
+                    tree.append(self.get_fa_entity_data(fa_previous, False))
 
             # Add active
-            if container.container_no == fa_entity.container.container_no and \
-               fa_first.archival_reference_code != fa_entity.archival_reference_code and \
+            if fa_first.archival_reference_code != fa_entity.archival_reference_code and \
                fa_last.archival_reference_code != fa_entity.archival_reference_code:
                 tree.append(self.get_fa_entity_data(fa_entity, True))
 
             # Add next
             if fa_entity.folder_no + 1 < fa_count:
-                fa_next = fa_qs.filter(folder_no=fa_entity.folder_no+1).first()
-                tree.append(self.get_fa_entity_data(fa_next, False))
+                fa_next = next((fa for fa in siblings if fa.folder_no == fa_entity.folder_no + 1), None)
+                if fa_next:
+                    tree.append(self.get_fa_entity_data(fa_next, False))
 
             # Add placeholder
             if fa_entity.folder_no + 2 < fa_count:
@@ -13,14 +13,18 @@ This view intentionally:
     - Generates manifests dynamically (not stored)
     - Uses IIIF Presentation API v2 semantics via iiif-prezi
 """
+import math
 import urllib
 
 from django.conf import settings
+from django.http import Http404
 from iiif_prezi.factory import ManifestFactory
 from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from catalog.services.response_cache import cache_response, get_archival_unit_dependencies
+from digitization.services.iiif_image_info import refresh_image_info
 from finding_aids.models import FindingAidsEntity
 from isad.models import Isad
 
@@ -38,6 +42,10 @@ class ArchivalUnitsManifestView(APIView):
         - Image identifiers are constructed deterministically from
           archival reference codes
         - The manifest is generated on-the-fly for freshness
+        - Canvas dimensions come from the local info.json cache; images
+          missing from it are fetched on a bounded thread pool
+        - Units with more images than IIIF_MANIFEST_PAGE_SIZE are served
+          as a IIIF Collection of paged manifests (?page=<n>)
 
     This view serves as the IIIF entry point for archival unit–level
     image galleries in the public catalog.
@@ -45,6 +53,75 @@ class ArchivalUnitsManifestView(APIView):
 
     permission_classes = []
 
+    def get_still_images(self, archival_unit):
+        """
+        Returns the online still image finding aids entities of an archival unit, in a stable order for paging.
+        """
+        return FindingAidsEntity.objects.filter(
+            archival_unit=archival_unit, digital_version_online=True, primary_type__type='Still Image'
+        ).select_related('archival_unit', 'container').order_by('container__container_no', 'folder_no', 'id')
+
+    def get_image_id(self, fa_entity: FindingAidsEntity) -> str:
+        """
+        Returns the (unquoted) IIIF image identifier of a finding aids entity.
+        """
+        archival_unit_ref_code = fa_entity.archival_unit.reference_code.replace(" ", "_")
+        item_reference_code = "%s-%04d-%03d" % (
+            archival_unit_ref_code,
+            fa_entity.container.container_no,
+            fa_entity.folder_no
+        )
+        return 'catalog/%s/%s.jpg' % (archival_unit_ref_code, item_reference_code)
+
+    def get_page_url(self, request, page: int) -> str:
+        return "%s%s?page=%s" % (settings.BASE_URL, request.path, page)
+
+    def get_collection(self, factory, isad: Isad, request, pages: int):
+        """
+        Builds a IIIF Collection referencing every page manifest of an archival unit.
+        """
+        collection = factory.collection(ident="%s%s" % (settings.BASE_URL, request.path),
+                                        label=isad.archival_unit.title_full)
+        for page in range(1, pages + 1):
+            collection.manifest(
+                ident=self.get_page_url(request, page),
+                label="%s (%s/%s)" % (isad.archival_unit.title_full, page, pages)
+            )
+        return collection
+
+    def get_manifest(self, factory, isad: Isad, fa_entities: list, label: str):
+        """
+        Builds a manifest with one canvas per still image.
+
+        Images the image server has no info.json for are left out.
+        """
+        manifest = factory.manifest(label=label)
+        manifest.viewingDirection = "left-to-right"
+        manifest.attribution = '%s<br/>' % isad.archival_unit.title_full + \
+                               'Vera & Donald Blinken Open Society Archives'
+
+        # Sequence construction
+        seq = manifest.sequence(label="Sequence")
+
+        # Canvas dimensions, fetched concurrently for images missing from the cache
+        image_ids = [self.get_image_id(fa_entity) for fa_entity in fa_entities]
+        image_info = refresh_image_info(image_ids)
+
+        # Canvas generation
+        for fa_entity, image_id in zip(fa_entities, image_ids):
+            entry = image_info.get(image_id)
+            if entry is None or not entry.width or not entry.height:
+                continue
+
+            cvs = seq.canvas(ident=fa_entity.archival_reference_code, label="%s %s" % (fa_entity.archival_reference_code, fa_entity.title))
+            image = cvs.annotation().image(ident=urllib.parse.quote_plus(image_id), iiif=True)
+            image.height = entry.height
+            image.width = entry.width
+            cvs.set_hw(entry.height, entry.width)
+
+        return manifest
+
+    @cache_response(get_archival_unit_dependencies)
     def get(self, request, archival_unit_id: str, *args, **kwargs) -> Response:
         """
         Generates and returns a IIIF manifest for an archival unit.
@@ -54,10 +131,13 @@ class ArchivalUnitsManifestView(APIView):
                 Primary key of the archival unit.
 
         Returns:
-            HTTP 200 response containing a IIIF Presentation manifest (JSON).
+            HTTP 200 response containing a IIIF Presentation manifest (JSON),
+            or a IIIF Collection of page manifests if the unit has more
+            images than fit on one page.
 
         Raises:
-            Http404 if no published ISAD record exists for the archival unit.
+            Http404 if no published ISAD record exists for the archival unit,
+            or the requested page does not exist.
         """
         isad = get_object_or_404(Isad, archival_unit__id=archival_unit_id, published=True)
 
@@ -69,32 +149,23 @@ class ArchivalUnitsManifestView(APIView):
         factory.set_iiif_image_info(2.0, 2)
         factory.set_debug("error")
 
-        # Manifest metadata
-        manifest = factory.manifest(label=isad.archival_unit.title_full)
-        manifest.viewingDirection = "left-to-right"
-        manifest.attribution = '%s<br/>' % isad.archival_unit.title_full + \
-                               'Vera & Donald Blinken Open Society Archives'
-
-        # Sequence construction
-        seq = manifest.sequence(label="Sequence")
-
-        # Canvas generation
-        for fa_entity in FindingAidsEntity.objects.filter(archival_unit=isad.archival_unit, digital_version_online=True):
-            if fa_entity.primary_type.type == 'Still Image':
-
-                # Image identifier construction
-                archival_unit_ref_code = fa_entity.archival_unit.reference_code.replace(" ", "_")
-                item_reference_code = "%s-%04d-%03d" % (
-                    archival_unit_ref_code,
-                    fa_entity.container.container_no,
-                    fa_entity.folder_no
-                )
-
-                # Canvas creation
-                image_id = 'catalog/%s/%s.jpg' % (archival_unit_ref_code, item_reference_code)
-                image_id = urllib.parse.quote_plus(image_id)
-
-                cvs = seq.canvas(ident=fa_entity.archival_reference_code, label="%s %s" % (fa_entity.archival_reference_code, fa_entity.title))
-                cvs.set_image_annotation(image_id, iiif=True)
+        # Paging
+        fa_entities = self.get_still_images(isad.archival_unit)
+        page_size = getattr(settings, 'IIIF_MANIFEST_PAGE_SIZE', 500)
+        pages = max(1, math.ceil(fa_entities.count() / page_size))
+        page = request.query_params.get('page')
+
+        if page is None:
+            if pages > 1:
+                return Response(self.get_collection(factory, isad, request, pages).toJSON(top=True))
+            manifest = self.get_manifest(factory, isad, list(fa_entities), isad.archival_unit.title_full)
+        else:
+            if not page.isdigit() or not 1 <= int(page) <= pages:
+                raise Http404
+            page = int(page)
+            manifest = self.get_manifest(
+                factory, isad, list(fa_entities[(page - 1) * page_size:page * page_size]),
+                "%s (%s/%s)" % (isad.archival_unit.title_full, page, pages)
+            )
 
         return Response(manifest.toJSON())
@@ -12,16 +12,14 @@ Unlike archival-unit–level manifests (v2), this endpoint:
 
 The manifest is consumed by IIIF v3–compatible viewers in the public catalog.
 """
-import json
-import urllib
-
-import requests
 from django.conf import settings
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
-from iiif_prezi3 import Manifest
+from django.utils.cache import get_conditional_response, patch_cache_control
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from digitization.services import iiif_manifest
 from finding_aids.models import FindingAidsEntity
 
 
@@ -35,6 +33,12 @@ class FindingAidsIIFPresentationV3View(APIView):
 
     Each associated digital file becomes its own canvas in the manifest.
 
+    Manifests are generated once and stored (see
+    digitization.services.iiif_manifest); the stored JSON is returned as
+    is, with the hash of its content as ETag. Incomplete manifests are
+    revalidated on every request, as they are regenerated until all of
+    their images are available.
+
     This endpoint is typically used for:
         - item-level viewers
         - deep zoom interfaces
@@ -45,7 +49,7 @@ class FindingAidsIIFPresentationV3View(APIView):
 
     def get(self, request, fa_entity_catalog_id: str, *args, **kwargs):
         """
-        Generates and returns a IIIF v3 manifest for a finding aids entity.
+        Returns the stored IIIF v3 manifest of a finding aids entity.
 
         Args:
             fa_entity_catalog_id:
@@ -53,49 +57,27 @@ class FindingAidsIIFPresentationV3View(APIView):
 
         Returns:
             HTTP 200 response containing a IIIF Presentation v3 manifest (JSON),
+            HTTP 304 if the If-None-Match header matches,
             or HTTP 404 if the entity is not a viewable still image.
         """
         fa_entity = get_object_or_404(FindingAidsEntity, catalog_id=fa_entity_catalog_id)
 
         # Eligibility check
         if fa_entity.primary_type.type == 'Still Image' and fa_entity.available_online:
-
-            # Manifest construction
-            base_image_url = getattr(settings, 'BASE_IMAGE_URI', 'http://127.0.0.1:8182/iiif/2/')
-            manifest = Manifest(
-                id="%s%s" % (settings.BASE_URL, request.get_full_path()),
-                label='%s %s<br/>' % (fa_entity.archival_reference_code, fa_entity.title) +
-                      '%s<br/>' % fa_entity.archival_unit.title_full + 'Blinken OSA Archivum'
-            )
-
-            # Canvas generation per digital file
-            for digital_version in fa_entity.digital_versions.all().order_by('filename'):
-
-                # Image identifier resolution
-                main_directory = "_".join(digital_version.identifier.split("_", 5)[:5])
-
-                image_id = "catalog/%s/%s" % (main_directory, digital_version.filename)
-                image_id = urllib.parse.quote_plus(image_id)
-                url = "%s%s" % (base_image_url, image_id)
-
-                # Canvas creation and thumbnails
-                label = digital_version.label if digital_version.label else "Image"
-
-                try:
-                    canvas = manifest.make_canvas_from_iiif(
-                        url=url,
-                        label=label
-                    )
-
-                    canvas.add_thumbnail(
-                        image_url="%s/full/,300/0/default.jpg" % url
-                    )
-                except requests.exceptions.HTTPError:
-                    pass
-
-            response = json.loads(manifest.json(indent=4))
-
-            return Response(response)
+            manifest = iiif_manifest.get_manifest(fa_entity)
+
+            etag = iiif_manifest.get_etag(manifest)
+            response = get_conditional_response(request, etag=etag)
+            if response is None:
+                response = HttpResponse(manifest.manifest, content_type='application/json')
+            response['ETag'] = etag
+            if manifest.complete:
+                patch_cache_control(
+                    response, public=True, max_age=getattr(settings, 'CATALOG_RESPONSE_MAX_AGE', 60)
+                )
+            else:
+                patch_cache_control(response, public=True, no_cache=True)
+            return response
         else:
             # Non-image fallback
             return Response(data={'Record is not an image, or not available online!'}, status=404)
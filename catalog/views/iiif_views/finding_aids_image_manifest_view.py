@@ -20,6 +20,7 @@ from iiif_prezi.factory import ManifestFactory
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from catalog.services.response_cache import cache_response, get_finding_aids_dependencies
 from finding_aids.models import FindingAidsEntity
 
 
@@ -41,6 +42,7 @@ class FindingAidsImageManifestView(APIView):
 
     permission_classes = []
 
+    @cache_response(get_finding_aids_dependencies)
     def get(self, request, fa_entity_catalog_id: str, *args, **kwargs) -> Response:
         """
         Generates and returns a IIIF v2 manifest for a finding aids entity.
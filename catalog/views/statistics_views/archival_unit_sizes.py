@@ -9,13 +9,21 @@ The size metric is used for:
     - public catalog statistics
     - collection overview pages
     - comparative visualizations
+
+Sizes are read from the ArchivalUnitStats counter table, which is refreshed
+when finding aids entities are published or unpublished.
 """
+import hashlib
+import json
 
+from django.conf import settings
+from django.db.models import F
+from django.db.models.functions import Coalesce
+from django.utils.cache import get_conditional_response, patch_cache_control
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from archival_unit.models import ArchivalUnit
-from finding_aids.models import FindingAidsEntity
 
 
 class ArchivalUnitSizes(APIView):
@@ -28,31 +36,33 @@ class ArchivalUnitSizes(APIView):
         - the total number of published finding aids entities
           belonging to that fonds
 
-    Size is calculated by counting all published finding aids entities
-    whose archival unit belongs to the fonds (via subfonds and series).
+    Sizes come from the precomputed ArchivalUnitStats counters, so the
+    response is produced with a single query. Responses carry an ETag and
+    a private Cache-Control max-age (ARCHIVAL_UNIT_SIZES_MAX_AGE), as the
+    endpoint requires authentication.
     """
 
-    def get(self, *args, **kwargs) -> Response:
+    def get(self, request, *args, **kwargs) -> Response:
         """
-        Computes and returns archival unit size statistics.
+        Returns archival unit size statistics.
 
         Returns:
             A list of dictionaries, each containing:
                 - reference_code: Fonds reference code
                 - title: Fonds title
                 - size: Number of published finding aids entities
+            or 304 Not Modified if the If-None-Match header matches.
         """
-        archival_unit_sizes = []
-        for archival_unit in ArchivalUnit.objects.filter(
-            level='F',
-            isad__published=True
-        ).all():
-            au = {}
-            au['reference_code'] = archival_unit.reference_code
-            au['title'] = archival_unit.title
-            au['size'] = FindingAidsEntity.objects.filter(
-                archival_unit__parent__parent=archival_unit,
-                published=True
-            ).count()
-            archival_unit_sizes.append(au)
-        return Response(archival_unit_sizes)
\ No newline at end of file
+        archival_unit_sizes = list(
+            ArchivalUnit.objects.filter(level='F', isad__published=True)
+            .annotate(size=Coalesce(F('stats__published_finding_aids'), 0))
+            .values('reference_code', 'title', 'size')
+        )
+
+        etag = '"%s"' % hashlib.md5(json.dumps(archival_unit_sizes).encode('utf-8')).hexdigest()
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = Response(archival_unit_sizes)
+        response['ETag'] = etag
+        patch_cache_control(response, private=True, max_age=getattr(settings, 'ARCHIVAL_UNIT_SIZES_MAX_AGE', 300))
+        return response
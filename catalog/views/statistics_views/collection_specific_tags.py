@@ -3,7 +3,8 @@ Statistics endpoint for retrieving collection-specific keyword tags.
 
 This module exposes a read-only API endpoint that returns a small,
 randomized selection of keywords associated with published
-finding aids entities.
+finding aids entities, sampled from a precomputed keyword pool
+(see catalog.services.keyword_pool).
 
 The result is typically used for:
     - tag clouds
@@ -11,10 +12,11 @@ The result is typically used for:
     - homepage or collection overview widgets
 """
 
+from django.conf import settings
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from controlled_list.models import Keyword
+from catalog.services import keyword_pool
 
 
 class CollectionSpecificTags(APIView):
@@ -39,18 +41,12 @@ class CollectionSpecificTags(APIView):
 
         Selection criteria:
             - keyword must be associated with at least one published
-              finding aids entity
-            - keywords are randomized at the database level
-            - duplicate string values are filtered out manually
+              finding aids entity (as of the last pool refresh)
+            - keywords are sampled in memory from the keyword pool,
+              weighted by usage if COLLECTION_SPECIFIC_TAGS_WEIGHTED is set
 
         Returns:
             A list of up to 10 keyword strings.
         """
-        keywords = []
-        for keyword in Keyword.objects.filter(
-            findingaidsentity__published=True
-        ).order_by('?').distinct():
-            if len(keywords) < 10:
-                if str(keyword) not in keywords:
-                    keywords.append(str(keyword))
-        return Response(keywords)
\ No newline at end of file
+        weighted = getattr(settings, 'COLLECTION_SPECIFIC_TAGS_WEIGHTED', False)
+        return Response(keyword_pool.sample(10, weighted=weighted))
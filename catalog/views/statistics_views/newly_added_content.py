@@ -7,13 +7,18 @@ publication date.
 
 The returned content depends on the requested content type and applies
 different aggregation rules accordingly.
+
+Responses are cached until the next publish or unpublish (see
+catalog.services.response_cache).
 """
 
 import datetime
 
+from django.db.models import Max
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from catalog.services.response_cache import cache_response, get_publications_dependencies
 from finding_aids.models import FindingAidsEntity
 from isad.models import Isad
 
@@ -40,6 +45,7 @@ class NewlyAddedContent(APIView):
 
     permission_classes = []
 
+    @cache_response(get_publications_dependencies)
     def get(self, *args, **kwargs) -> Response:
         """
         Retrieves newly added or recently published content.
@@ -60,7 +66,7 @@ class NewlyAddedContent(APIView):
         """
         response = []
         if kwargs['content_type'] == 'isad':
-            for isad in Isad.objects.filter(
+            for isad in Isad.objects.select_related('archival_unit').filter(
                 description_level='S',
                 published=True
             ).order_by(
@@ -73,21 +79,24 @@ class NewlyAddedContent(APIView):
                     'date_published': isad.date_published
                 })
         else:
-            added_series = []
-            for finding_aids in FindingAidsEntity.objects.select_related('archival_unit').filter(
+            # The latest publication of each series, newest series first.
+            for series in FindingAidsEntity.objects.filter(
                 published=True,
                 date_published__year__gt=datetime.datetime.now().year-2
+            ).values(
+                'archival_unit_id',
+                'archival_unit__isad__catalog_id',
+                'archival_unit__reference_code',
+                'archival_unit__title_full'
+            ).annotate(
+                latest_published=Max('date_published')
             ).order_by(
-                '-date_published'
-            ).all():
-                if len(added_series) == 5:
-                    break
-                if finding_aids.archival_unit.id not in added_series:
-                    response.append({
-                        'id': finding_aids.archival_unit.isad.catalog_id,
-                        'reference_code': finding_aids.archival_unit.reference_code,
-                        'title': finding_aids.archival_unit.title_full,
-                        'date_published': finding_aids.date_published
-                    })
-                    added_series.append(finding_aids.archival_unit.id)
+                '-latest_published'
+            )[:5]:
+                response.append({
+                    'id': series['archival_unit__isad__catalog_id'],
+                    'reference_code': series['archival_unit__reference_code'],
+                    'title': series['archival_unit__title_full'],
+                    'date_published': series['latest_published']
+                })
         return Response(response)
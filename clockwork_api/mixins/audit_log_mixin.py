@@ -1,6 +1,8 @@
 import re
 
-from audit_log.models import AuditLog
+from django.db import models
+
+from audit_log.services import audit_writer
 
 
 class AuditLogMixin:
@@ -24,9 +26,10 @@ class AuditLogMixin:
 
     Features:
         - Detects changes in regular model fields
-        - Tracks many-to-many relationships
-        - Tracks one-to-many related objects
+        - Tracks many-to-many relationships present in the payload
+        - Tracks one-to-many related objects present in the payload
         - Avoids logging unchanged updates
+        - Writes audit rows in the background, in batches
 
     Intended use:
         Mixed into DRF generic views (CreateAPIView, UpdateAPIView,
@@ -57,77 +60,54 @@ class AuditLogMixin:
         """
         Save an updated instance and log an UPDATE action if changes occurred.
 
-        Compares the original and updated instances to detect:
-            - Modified model fields
+        Detects:
+            - Modified model fields, from a snapshot of the instance taken
+              before the save
             - Changed many-to-many relationships
             - Changed one-to-many related objects
 
+        Relations are only compared when they are present in the payload, so
+        the diff costs one query per submitted relation and nothing else.
+
         Only logs the update if at least one field has changed.
 
         Args:
             serializer: DRF serializer instance containing validated data.
         """
-        changed_fields = []
-        changed_m2m_fields = []
-        changed_o2m_fields = []
-
         user = self.request.user
-
-        # Store original instance for comparison
-        old_instance = self.get_object()
-
-        # Capture original many-to-many values
-        old_m2m_values = {}
-        m2m_fields = self.get_related_fields(old_instance, 'm2m')
-
-        for field in m2m_fields:
-            if hasattr(old_instance, field):
-                old_m2m_values[field] = [
-                    value.id for value in getattr(old_instance, field).all()
-                ]
-
-        # Capture original one-to-many values
-        old_o2m_values = {}
-        o2m_fields = self.get_related_fields(old_instance, 'o2m')
-
-        for field in o2m_fields:
-            if hasattr(old_instance, field):
-                old_o2m_values[field] = [
-                    record for record in getattr(old_instance, field).values().all()
-                ]
+        instance = serializer.instance
+
+        old_values = self.get_field_values(instance)
+        relations = self.get_submitted_relations(serializer)
+        old_relations = {
+            source: self.get_relation_snapshot(instance, relation)
+            for source, (relation, field) in relations.items()
+        }
+        # drf-writable-nested writes the pk of saved objects back into the
+        # payload, so the submitted pks are collected before the save.
+        submitted_pks = {
+            source: self.get_submitted_pks(serializer, relation, field)
+            for source, (relation, field) in relations.items()
+            if not relation.many_to_many
+        }
 
         # Save updated instance
         instance = serializer.save()
 
-        # Detect many-to-many changes
-        for field in m2m_fields:
-            if hasattr(instance, field):
-                if old_m2m_values.get(field, []) != [
-                    value.id for value in getattr(instance, field).all()
-                ]:
-                    changed_m2m_fields.append(field)
-
-        # Detect one-to-many changes
-        for field in o2m_fields:
-            if hasattr(instance, field):
-                if old_o2m_values.get(field, []) != [
-                    record for record in getattr(instance, field).values().all()
-                ]:
-                    instance_model_name = instance._meta.object_name
-                    o2m_model_name = getattr(instance, field).model._meta.object_name
-                    field_name = o2m_model_name.replace(instance_model_name, '')
-
-                    # Convert CamelCase to snake_case
-                    pattern = re.compile(r'(?<!^)(?=[A-Z])')
-                    fn = pattern.sub('_', field_name).lower()
-
-                    changed_o2m_fields.append(fn)
+        changed_fields = []
+        changed_m2m_fields = []
+        changed_o2m_fields = []
+
+        for source, (relation, field) in relations.items():
+            validated = serializer.validated_data[source]
+            if relation.many_to_many:
+                if self.is_m2m_changed(instance, source, old_relations[source], validated):
+                    changed_m2m_fields.append(relation.name)
+            elif self.is_o2m_changed(relation, old_relations[source], submitted_pks[source], validated):
+                changed_o2m_fields.append(self.get_o2m_field_name(instance, relation))
 
         # Detect standard field changes
-        changed_fields += self.compare_objects(
-            old_instance=old_instance,
-            new_instance=instance
-        )
+        changed_fields += self.compare_field_values(old_values, self.get_field_values(instance), instance)
 
         changed_fields += changed_m2m_fields
         changed_fields += changed_o2m_fields
@@ -159,45 +139,138 @@ class AuditLogMixin:
         instance.delete()
 
     @staticmethod
-    def get_related_fields(instance, type):
+    def get_submitted_relations(serializer):
         """
-        Retrieve related field names for the given instance.
+        Collect the many-to-many and one-to-many relations present in the payload.
 
         Args:
-            instance: Django model instance.
-            type (str): Relationship type ('m2m' or 'o2m').
+            serializer: DRF serializer instance containing validated data.
 
         Returns:
-            list[str]: List of related field names.
+            dict: validated data key → (model relation, serializer field).
         """
-        field_list = instance._meta.get_fields()
-        fields = []
+        model_meta = serializer.instance._meta
+        accessors = {}
+        for relation in model_meta.get_fields():
+            if relation.many_to_many or relation.one_to_many or (relation.one_to_one and relation.auto_created):
+                accessor = relation.get_accessor_name() if relation.auto_created else relation.name
+                accessors[accessor] = relation
+
+        relations = {}
+        for field in serializer._writable_fields:
+            if field.source in serializer.validated_data and field.source in accessors:
+                relations[field.source] = (accessors[field.source], field)
+        return relations
 
-        if type == 'm2m':
-            for field in field_list:
-                if field.many_to_many:
-                    fields.append(field.name)
+    @staticmethod
+    def get_relation_snapshot(instance, relation):
+        """
+        Read the current state of a relation with a single query.
 
-        if type == 'o2m':
-            for field in field_list:
-                if field.one_to_many:
-                    if field.related_name:
-                        fields.append(field.related_name)
-                    else:
-                        fields.append(f"{field.name}_set")
+        Returns:
+            set | dict: related pks for many-to-many relations, rows by pk otherwise.
+        """
+        accessor = relation.get_accessor_name() if relation.auto_created else relation.name
+        if relation.many_to_many:
+            return set(getattr(instance, accessor).values_list('pk', flat=True))
+        related_model = relation.related_model
+        return {
+            str(row[related_model._meta.pk.attname]): row
+            for row in related_model.objects.filter(**{relation.field.name: instance}).values()
+        }
 
-        return fields
+    @staticmethod
+    def get_submitted_pks(serializer, relation, field):
+        """
+        Return the pks of the submitted nested objects, None for new ones.
+        """
+        items = serializer.initial_data.get(field.field_name) or []
+        if relation.one_to_one:
+            items = [items]
+        pk_name = relation.related_model._meta.pk.attname
+        return [item.get('pk') or item.get(pk_name) for item in items]
 
     @staticmethod
-    def compare_objects(old_instance, new_instance):
+    def is_m2m_changed(instance, source, old_pks, validated):
         """
-        Compare two model instances and detect changed fields.
+        Compare the submitted objects of a many-to-many relation with the stored ones.
+
+        Nested writable payloads carry no pks, those are read back after the save.
+        """
+        if all(isinstance(value, models.Model) for value in validated):
+            new_pks = {value.pk for value in validated}
+        else:
+            new_pks = set(getattr(instance, source).values_list('pk', flat=True))
+        return old_pks != new_pks
+
+    @classmethod
+    def is_o2m_changed(cls, relation, old_rows, submitted_pks, validated):
+        """
+        Compare the submitted objects of a one-to-many relation with the stored rows.
+
+        The relation changed when an object is added or removed, or when a
+        submitted value differs from the stored one.
+        """
+        if relation.one_to_one:
+            validated = [validated]
+        if None in submitted_pks or {str(pk) for pk in submitted_pks} != set(old_rows):
+            return True
+
+        related_fields = {field.name: field for field in relation.related_model._meta.concrete_fields}
+        for pk, values in zip(submitted_pks, validated):
+            row = old_rows[str(pk)]
+            for name, value in values.items():
+                related_field = related_fields.get(name)
+                if related_field is None:
+                    continue
+                if isinstance(value, models.Model):
+                    value = value.pk
+                if cls.normalize(value) != cls.normalize(row[related_field.attname]):
+                    return True
+        return False
+
+    @staticmethod
+    def get_o2m_field_name(instance, relation):
+        """
+        Name a one-to-many relation after its model without the parent model prefix.
+
+        Example:
+            IsaarOtherName on Isaar → other_name
+        """
+        instance_model_name = instance._meta.object_name
+        field_name = relation.related_model._meta.object_name.replace(instance_model_name, '')
+
+        # Convert CamelCase to snake_case
+        pattern = re.compile(r'(?<!^)(?=[A-Z])')
+        return pattern.sub('_', field_name).lower()
+
+    @staticmethod
+    def get_field_values(instance):
+        """
+        Snapshot the concrete field values of an instance without touching the database.
+
+        Foreign keys are read as ids, so related objects are not loaded.
+        """
+        return {field.attname: getattr(instance, field.attname) for field in instance._meta.concrete_fields}
+
+    @staticmethod
+    def normalize(value):
+        """
+        Normalize empty strings to None.
+        """
+        return None if value == "" else value
+
+    @classmethod
+    def compare_field_values(cls, old_values, new_values, instance):
+        """
+        Compare two field snapshots and detect changed fields.
 
         Ignores system-maintained metadata fields.
 
         Args:
-            old_instance: Original model instance.
-            new_instance: Updated model instance.
+            old_values: Snapshot taken before the save.
+            new_values: Snapshot taken after the save.
+            instance: The saved model instance.
 
         Returns:
             list[str]: Names of fields that changed.
@@ -209,26 +282,18 @@ class AuditLogMixin:
             'date_created', 'date_updated', 'date_published'
         ]
 
-        for field in new_instance._meta.fields:
-            field_name = field.name
-
-            if field_name not in fields_to_skip:
-                old_value = getattr(old_instance, field_name)
-                new_value = getattr(new_instance, field_name)
-
-                # Normalize empty strings
-                old_value = None if old_value == "" else old_value
-                new_value = None if new_value == "" else new_value
-
-                if old_value != new_value:
-                    changed_fields.append(field_name)
+        for field in instance._meta.concrete_fields:
+            if field.name in fields_to_skip:
+                continue
+            if cls.normalize(old_values[field.attname]) != cls.normalize(new_values[field.attname]):
+                changed_fields.append(field.name)
 
         return changed_fields
 
     @staticmethod
     def log_audit_action(user=None, action=None, instance=None, changed_fields=None):
         """
-        Persist an audit log entry.
+        Queue an audit log entry, written in the background once the transaction commits.
 
         Args:
             user: User performing the action.
@@ -236,10 +301,6 @@ class AuditLogMixin:
             instance: Affected model instance.
             changed_fields (list[str], optional): Fields modified during update.
         """
-        AuditLog.objects.create(
-            user=user,
-            action=action,
-            model_name=instance.__class__.__name__,
-            object_id=instance.pk,
-            changed_fields=changed_fields,
-        )
+        audit_writer.enqueue([
+            audit_writer.make_entry(user=user, action=action, instance=instance, changed_fields=changed_fields)
+        ])
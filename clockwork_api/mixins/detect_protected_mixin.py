@@ -1,4 +1,65 @@
+import operator
+from functools import reduce
+
 from django.db import models
+from django.db.models import BooleanField, Exists, ExpressionWrapper, OuterRef, Value
+
+REMOVABLE_ANNOTATION = 'removable'
+
+
+def get_protected_relations(model):
+    """
+    Returns the reverse relations of a model whose related objects block deletion.
+
+    Args:
+        model: Django model class.
+
+    Returns:
+        list: foreign keys (on the related models) defined with `on_delete=models.PROTECT`.
+    """
+    return [
+        relation for relation in model._meta._relation_tree
+        if relation.remote_field.on_delete == models.PROTECT
+    ]
+
+
+def annotate_removable(queryset):
+    """
+    Annotates each row with the `removable` flag read by `is_removable()`.
+
+    The flag is computed by the database with one NOT EXISTS subquery per
+    protected relation, so listing N records costs no extra query per row.
+
+    Args:
+        queryset: QuerySet of a model using DetectProtectedMixin.
+
+    Returns:
+        QuerySet: the annotated queryset.
+    """
+    conditions = [
+        ~Exists(relation.model.objects.filter(**{relation.name: OuterRef('pk')}))
+        for relation in get_protected_relations(queryset.model)
+    ]
+    if conditions:
+        flag = ExpressionWrapper(reduce(operator.and_, conditions), output_field=BooleanField())
+    else:
+        flag = Value(True, output_field=BooleanField())
+    return queryset.annotate(**{REMOVABLE_ANNOTATION: flag})
+
+
+def get_removable_ids(queryset):
+    """
+    Returns the ids of the records in a queryset that can be safely deleted, with one query.
+
+    Args:
+        queryset: QuerySet of a model using DetectProtectedMixin.
+
+    Returns:
+        set: primary keys of the removable records.
+    """
+    return set(
+        annotate_removable(queryset).filter(**{REMOVABLE_ANNOTATION: True}).values_list('pk', flat=True)
+    )
 
 
 class DetectProtectedMixin:
@@ -31,6 +92,10 @@ class DetectProtectedMixin:
     Intended use:
         Mixed into Django models that require controlled deletion behavior.
 
+    List views annotate their querysets with `annotate_removable()`, which
+    computes the same check for every row in the list query; `is_removable()`
+    returns the annotated flag when present.
+
     Example:
         class Researcher(models.Model, DetectProtectedMixin):
             ...
@@ -51,6 +116,9 @@ class DetectProtectedMixin:
                 True  → No protected related objects exist (safe to delete)
                 False → One or more protected relations exist (deletion blocked)
         """
+        if hasattr(self, REMOVABLE_ANNOTATION):
+            return getattr(self, REMOVABLE_ANNOTATION)
+
         state = True
 
         # Iterate over all reverse relationships
@@ -0,0 +1,71 @@
+import redis
+from django.conf import settings
+
+
+FINDING_AIDS = "finding_aids"
+ISAD = "isad"
+
+_client = None
+
+
+def _get_client():
+    """
+    Returns a process-wide Redis client for the index queue.
+
+    INDEX_QUEUE_REDIS_URL defaults to the Celery broker URL.
+    """
+    global _client
+    if _client is None:
+        url = getattr(settings, "INDEX_QUEUE_REDIS_URL", None) or \
+            getattr(settings, "CELERY_BROKER_URL", "redis://localhost:6379")
+        _client = redis.Redis.from_url(url)
+    return _client
+
+
+def _get_key(kind):
+    """
+    Builds the Redis set key holding dirty ids for the given record kind.
+    """
+    return "%s:%s" % (getattr(settings, "INDEX_QUEUE_KEY_PREFIX", "clockwork:index_queue"), kind)
+
+
+def mark_dirty(kind, ids):
+    """
+    Marks records as needing a reindex.
+
+    Ids are stored in a Redis set, so repeated saves of the same record before
+    the next flush collapse into a single reindex.
+    """
+    ids = [int(i) for i in ids]
+    if ids:
+        _get_client().sadd(_get_key(kind), *ids)
+
+
+def pop_dirty(kind, count=None):
+    """
+    Atomically removes and returns up to `count` dirty ids.
+
+    Ids marked while a flush is running are picked up by the next flush.
+    Popped ids are gone from the queue: callers mark the ids they failed to
+    index as dirty again.
+    """
+    count = count or getattr(settings, "INDEX_QUEUE_FLUSH_BATCH_SIZE", 1000)
+    return sorted(int(i) for i in _get_client().spop(_get_key(kind), count))
+
+
+def pending(kind):
+    """
+    Returns the number of ids waiting for the next flush.
+    """
+    return _get_client().scard(_get_key(kind))
+
+
+def lock(name, timeout):
+    """
+    Returns a Redis lock stored next to the queue, used to keep periodic
+    index jobs from running concurrently.
+
+    The lock expires after `timeout` seconds, so a crashed worker can not
+    hold it forever.
+    """
+    return _get_client().lock(_get_key("lock:%s" % name), timeout=timeout)
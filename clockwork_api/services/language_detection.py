@@ -0,0 +1,49 @@
+from functools import lru_cache
+
+from django.conf import settings
+from langdetect import DetectorFactory, LangDetectException, detect
+
+
+# langdetect is non-deterministic unless the factory is seeded.
+DetectorFactory.seed = getattr(settings, "LANGDETECT_SEED", 0)
+
+
+@lru_cache(maxsize=4096)
+def detect_language(text):
+    """
+    Detects the language of a text with a seeded, deterministic profile.
+
+    Returns the ISO 639-1 code reported by langdetect, or an empty string
+    when the text is empty or the language cannot be detected.
+    """
+    if not text or not text.strip():
+        return ""
+    try:
+        return detect(text)
+    except LangDetectException:
+        return ""
+
+
+def detect_languages(values):
+    """
+    Detects the language of a chunk of (id, text) pairs.
+
+    Used by process pools: returns a list of (id, language_code) pairs and
+    does not touch the database.
+    """
+    return [(pk, detect_language(text)) for pk, text in values]
+
+
+def get_detected_locale(finding_aids_entity):
+    """
+    Returns the detected locale of a finding aids entity, detecting it only once.
+
+    The result is stored on `FindingAidsEntity.detected_locale` with a queryset
+    update, so it does not trigger save signals. The stored value is cleared by
+    `FindingAidsEntity.save()` when the title changes.
+    """
+    if finding_aids_entity.detected_locale is None:
+        locale = detect_language(finding_aids_entity.title)
+        type(finding_aids_entity).objects.filter(pk=finding_aids_entity.pk).update(detected_locale=locale)
+        finding_aids_entity.detected_locale = locale
+    return finding_aids_entity.detected_locale
@@ -0,0 +1,160 @@
+import logging
+import os
+from datetime import datetime, timezone
+from itertools import islice
+
+import meilisearch
+from django.conf import settings
+from meilisearch.errors import MeilisearchError
+
+logger = logging.getLogger(__name__)
+
+_client = None
+_client_pid = None
+
+PENDING_STATUSES = ['enqueued', 'processing']
+
+# Indexes of the record types when MEILISEARCH_INDEX is not set.
+FINDING_AIDS_INDEX = 'meilisearch'
+ISAD_INDEX = 'ams'
+
+
+def get_client():
+    """
+    Returns the Meilisearch client of the current process.
+
+    The client is created once per process (Celery workers fork, so the
+    owning pid is checked) instead of once per indexed document.
+    """
+    global _client, _client_pid
+    if _client is None or _client_pid != os.getpid():
+        _client = meilisearch.Client(
+            getattr(settings, 'MEILISEARCH_URL', ''),
+            getattr(settings, 'MEILISEARCH_API_KEY', ''),
+            timeout=getattr(settings, 'MEILISEARCH_TIMEOUT', None)
+        )
+        _client_pid = os.getpid()
+    return _client
+
+
+def get_index_name(default):
+    """
+    Returns MEILISEARCH_INDEX, or `default` (FINDING_AIDS_INDEX or ISAD_INDEX) if it is not set.
+    """
+    return getattr(settings, 'MEILISEARCH_INDEX', default)
+
+
+def get_index(index_name):
+    """
+    Returns a Meilisearch index, using the shared client.
+    """
+    return get_client().index(index_name)
+
+
+def chunked(iterable, size):
+    """
+    Yields lists of at most `size` items from any iterable without materializing it.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def get_chunk_size(chunk_size=None):
+    return chunk_size or getattr(settings, 'MEILISEARCH_SYNC_CHUNK_SIZE', 1000)
+
+
+def add_documents(documents, index_name, chunk_size=None):
+    """
+    Streams documents to Meilisearch in chunks, one indexing task per chunk.
+
+    Args:
+        documents: iterable (or generator) of Meilisearch documents.
+        index_name: target index (see get_index_name).
+        chunk_size: documents per add_documents call (MEILISEARCH_SYNC_CHUNK_SIZE, default 1000).
+
+    Returns:
+        list: the uids of the enqueued Meilisearch tasks.
+    """
+    index = get_index(index_name)
+    task_uids = []
+    for chunk in chunked(documents, get_chunk_size(chunk_size)):
+        task = index.add_documents(chunk)
+        task_uids.append(task.task_uid)
+        logger.debug("Enqueued Meilisearch task %s with %s documents", task.task_uid, len(chunk))
+    return task_uids
+
+
+def delete_documents(document_ids, index_name, chunk_size=None):
+    """
+    Removes documents from Meilisearch in chunks.
+
+    Returns:
+        list: the uids of the enqueued Meilisearch tasks.
+    """
+    index = get_index(index_name)
+    task_uids = []
+    for chunk in chunked(document_ids, get_chunk_size(chunk_size)):
+        task = index.delete_documents(chunk)
+        task_uids.append(task.task_uid)
+    return task_uids
+
+
+def wait_for_tasks(task_uids, timeout_in_ms=None, interval_in_ms=200):
+    """
+    Polls Meilisearch until the given tasks are finished.
+
+    Args:
+        task_uids: uids returned by add_documents / delete_documents.
+        timeout_in_ms: per task timeout (MEILISEARCH_TASK_TIMEOUT, default 60 seconds).
+        interval_in_ms: polling interval.
+
+    Returns:
+        list: the tasks that did not succeed (failed, canceled or timed out).
+    """
+    client = get_client()
+    timeout_in_ms = timeout_in_ms or getattr(settings, 'MEILISEARCH_TASK_TIMEOUT', 60000)
+    failed = []
+    for task_uid in task_uids:
+        try:
+            task = client.wait_for_task(task_uid, timeout_in_ms=timeout_in_ms, interval_in_ms=interval_in_ms)
+        except MeilisearchError as e:
+            logger.warning("Meilisearch task %s did not finish: %s", task_uid, e)
+            failed.append({'uid': task_uid, 'status': 'timeout', 'error': str(e)})
+            continue
+        if task.status != 'succeeded':
+            logger.warning("Meilisearch task %s %s: %s", task_uid, task.status, task.error)
+            failed.append({'uid': task_uid, 'status': task.status, 'error': task.error})
+    return failed
+
+
+def get_lag(index_name):
+    """
+    Returns indexing lag metrics of a Meilisearch index.
+
+    Returns:
+        dict: number of enqueued and processing tasks, the enqueue time of the
+        oldest pending task and its age in seconds (0 when nothing is pending).
+    """
+    client = get_client()
+    metrics = {'index': index_name, 'oldest_enqueued_at': None, 'lag_seconds': 0}
+
+    for status in PENDING_STATUSES:
+        tasks = client.get_tasks({'statuses': [status], 'indexUids': [index_name], 'limit': 1})
+        metrics[status] = tasks.total
+
+    if metrics['enqueued'] or metrics['processing']:
+        # Tasks are returned newest first, so the oldest one is fetched with `reverse`.
+        tasks = client.get_tasks({
+            'statuses': PENDING_STATUSES, 'indexUids': [index_name], 'limit': 1, 'reverse': 'true'
+        })
+        if tasks.results:
+            enqueued_at = tasks.results[0].enqueued_at
+            if enqueued_at.tzinfo is None:
+                enqueued_at = enqueued_at.replace(tzinfo=timezone.utc)
+            metrics['oldest_enqueued_at'] = enqueued_at.isoformat()
+            metrics['lag_seconds'] = round((datetime.now(timezone.utc) - enqueued_at).total_seconds(), 1)
+    return metrics
@@ -23,6 +23,7 @@ INSTALLED_APPS = [
     'catalog',
     'workflow',
     'research',
+    'search_index',
 
     'rest_framework',
     'rest_framework.authtoken',
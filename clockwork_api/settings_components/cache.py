@@ -0,0 +1,26 @@
+import os
+
+# Redis is shared by every process, so invalidating a cached response in
+# one process retires it everywhere. Without CACHE_REDIS_URL each process
+# falls back to its own local-memory cache, which never sees the invalidations
+# made by other processes (e.g. the Celery workers): production.py then turns
+# the catalog response cache off and keeps the other caches short-lived.
+# CACHE_REDIS_URL is required for caching catalog responses.
+CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL')
+
+if CACHE_REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_REDIS_URL,
+            'KEY_PREFIX': 'clockwork',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'clockwork',
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
+    }
@@ -68,6 +68,107 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'Europe/Brussels'
 
+# Coalescing search index queue: signal handlers collect dirty ids in Redis,
+# the flush tasks below send them to Solr / Meilisearch in batches.
+INDEX_QUEUE_FLUSH_INTERVAL = 10
+INDEX_QUEUE_FLUSH_BATCH_SIZE = 1000
+
+# Documents per Meilisearch add_documents request (one indexing task each).
+MEILISEARCH_SYNC_CHUNK_SIZE = 1000
+
+# Incremental sync of everything changed since the last run (see search_index).
+# Each run looks SEARCH_INDEX_SYNC_OVERLAP seconds back past the previous one;
+# records failing SEARCH_INDEX_SYNC_MAX_FAILED_RUNS runs in a row are logged and skipped.
+SEARCH_INDEX_SYNC_INTERVAL = 5 * 60
+SEARCH_INDEX_SYNC_OVERLAP = 60
+SEARCH_INDEX_SYNC_MAX_FAILED_RUNS = 3
+SEARCH_INDEX_SYNC_LOCK_TIMEOUT = 60 * 60
+
+# Full catalog rebuilds write into a shadow core and swap it in ('core' uses
+# CORE SWAP with SOLR_CORE_CATALOG_SHADOW, 'alias' switches a SolrCloud alias
+# between SOLR_CATALOG_COLLECTIONS).
+SOLR_SWAP_MODE = 'core'
+
+# Renaming an authority record reindexes the records referencing it in
+# batches, sleeping between batches.
+AUTHORITY_REINDEX_BATCH_SIZE = 200
+AUTHORITY_REINDEX_THROTTLE = 1.0
+
+# Audit log entries are queued in Redis after the change commits; the flush
+# task below writes them with one INSERT per AUDIT_LOG_BATCH_SIZE rows.
+AUDIT_LOG_BATCH_SIZE = 500
+AUDIT_LOG_FLUSH_INTERVAL = 10
+
+# Without a shared cache (CACHE_REDIS_URL, see cache.py) the invalidations and
+# refreshes made by the Celery workers never reach the web processes, so the
+# caches below only live for LOCAL_CACHE_TIMEOUT seconds.
+LOCAL_CACHE_TIMEOUT = 60
+
+# Lifetime of the cached archival units tree. It is rebuilt whenever it
+# changes; the timeout only limits staleness of per-process caches.
+ARCHIVAL_UNITS_TREE_CACHE_TIMEOUT = 24 * 60 * 60 if CACHE_REDIS_URL else LOCAL_CACHE_TIMEOUT
+
+# Seconds clients may cache the archival unit sizes statistics.
+ARCHIVAL_UNIT_SIZES_MAX_AGE = 5 * 60
+
+# Public catalog responses are cached until the records they are built from
+# change (see catalog.services.response_cache); clients may reuse them for
+# CATALOG_RESPONSE_MAX_AGE seconds before revalidating with ETag / Last-Modified.
+# Invalidations have to reach every process, so it needs CACHE_REDIS_URL.
+CATALOG_RESPONSE_CACHE_ENABLED = bool(CACHE_REDIS_URL)
+CATALOG_RESPONSE_CACHE_TIMEOUT = 24 * 60 * 60
+CATALOG_RESPONSE_MAX_AGE = 60
+
+# The keywords sampled by the collection specific tags endpoint are collected
+# by a periodic task; each process reuses its copy for KEYWORD_POOL_LOCAL_TTL seconds.
+KEYWORD_POOL_REFRESH_INTERVAL = 60 * 60
+KEYWORD_POOL_CACHE_TIMEOUT = 2 * KEYWORD_POOL_REFRESH_INTERVAL if CACHE_REDIS_URL else LOCAL_CACHE_TIMEOUT
+KEYWORD_POOL_LOCAL_TTL = 60
+
+# Favour keywords used by more published finding aids in the collection specific tags.
+COLLECTION_SPECIFIC_TAGS_WEIGHTED = False
+
+# ARKs minted by a container / series publication job between two progress updates.
+PUBLICATION_ARK_BATCH_SIZE = 100
+# Seconds after which a queued or running publication job no longer blocks new jobs.
+PUBLICATION_JOB_TIMEOUT = 6 * 60 * 60
+
+CELERY_BEAT_SCHEDULE = {
+    'flush-finding-aids-index-queue': {
+        'task': 'finding_aids.tasks.flush_finding_aids_index_queue',
+        'schedule': INDEX_QUEUE_FLUSH_INTERVAL,
+    },
+    'flush-isad-index-queue': {
+        'task': 'isad.tasks.flush_isad_index_queue',
+        'schedule': INDEX_QUEUE_FLUSH_INTERVAL,
+    },
+    'flush-audit-log-queue': {
+        'task': 'audit_log.tasks.flush_audit_log_queue',
+        'schedule': AUDIT_LOG_FLUSH_INTERVAL,
+    },
+    'sync-search-indexes': {
+        'task': 'search_index.tasks.sync_search_indexes',
+        'schedule': SEARCH_INDEX_SYNC_INTERVAL,
+    },
+    'refresh-iiif-image-info': {
+        'task': 'digitization.tasks.refresh_iiif_image_info',
+        'schedule': 60 * 60,
+    },
+    'refresh-keyword-pool': {
+        'task': 'catalog.tasks.refresh_keyword_pool',
+        'schedule': KEYWORD_POOL_REFRESH_INTERVAL,
+    },
+}
+
+# Concurrent requests used when filling the local IIIF info.json cache.
+IIIF_INFO_REFRESH_WORKERS = 8
+
+# Seconds after which a failed info.json lookup (e.g. a 404) is retried.
+IIIF_INFO_RETRY_TTL = 24 * 60 * 60
+
+# Archival units with more still images are served as a IIIF Collection of paged manifests.
+IIIF_MANIFEST_PAGE_SIZE = 500
+
 RESEARCH_ROOM_STAFF_EMAIL = ['example@example.com']
 RESTRICTED_DECISION_MAKER_EMAIL = ['example@example.com']
 
@@ -0,0 +1,44 @@
+from django.test import TestCase
+
+from archival_unit.tests.helpers import make_fonds, make_subfonds, make_series
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable, get_protected_relations, \
+    get_removable_ids
+from clockwork_api.tests.no_index_signals_mixin import NoIndexSignalsMixin
+from container.models import Container
+from container.tests.helpers import make_container
+from controlled_list.models import CarrierType, Keyword
+from controlled_list.tests.helpers import make_carrier_types
+
+
+class DetectProtectedMixinTests(NoIndexSignalsMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        series = make_series(make_subfonds(make_fonds()))
+        self.used = make_carrier_types(type='Archival box')
+        self.unused = make_carrier_types(type='Video cassette')
+        make_container(series, self.used)
+
+    def test_protected_relations(self):
+        relations = {(relation.model, relation.name) for relation in get_protected_relations(CarrierType)}
+        self.assertIn((Container, 'carrier_type'), relations)
+        self.assertEqual(get_protected_relations(Keyword), [])
+
+    def test_removable_ids_in_one_query(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(get_removable_ids(CarrierType.objects.all()), {self.unused.id})
+
+    def test_annotation_matches_the_per_instance_check(self):
+        annotated = {carrier_type.id: carrier_type for carrier_type in annotate_removable(CarrierType.objects.all())}
+
+        with self.assertNumQueries(0):
+            flags = {pk: carrier_type.is_removable() for pk, carrier_type in annotated.items()}
+        self.assertEqual(flags, {self.used.id: False, self.unused.id: True})
+        for carrier_type in CarrierType.objects.all():
+            self.assertEqual(carrier_type.is_removable(), flags[carrier_type.id])
+
+    def test_models_without_protected_relations_are_always_removable(self):
+        Keyword.objects.create(keyword='Dissidents')
+
+        with self.assertNumQueries(1):
+            keywords = list(annotate_removable(Keyword.objects.all()))
+        self.assertTrue(keywords[0].is_removable())
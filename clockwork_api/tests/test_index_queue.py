@@ -0,0 +1,121 @@
+from unittest.mock import Mock, patch
+
+from django.test import SimpleTestCase, override_settings
+
+from clockwork_api.services import index_queue
+
+
+class FakeRedis:
+    def __init__(self):
+        self.sets = {}
+
+    def sadd(self, key, *values):
+        self.sets.setdefault(key, set()).update(str(v).encode() for v in values)
+
+    def spop(self, key, count):
+        values = self.sets.get(key, set())
+        popped = [values.pop() for _ in range(min(count, len(values)))]
+        return popped
+
+    def scard(self, key):
+        return len(self.sets.get(key, set()))
+
+
+@override_settings(INDEX_QUEUE_KEY_PREFIX="test:index_queue")
+class IndexQueueTests(SimpleTestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = patch("clockwork_api.services.index_queue._get_client", return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_repeated_marks_collapse(self):
+        index_queue.mark_dirty(index_queue.FINDING_AIDS, [1, 2])
+        index_queue.mark_dirty(index_queue.FINDING_AIDS, [2, 1, 3])
+
+        self.assertEqual(index_queue.pending(index_queue.FINDING_AIDS), 3)
+        self.assertEqual(index_queue.pop_dirty(index_queue.FINDING_AIDS), [1, 2, 3])
+        self.assertEqual(index_queue.pending(index_queue.FINDING_AIDS), 0)
+
+    def test_kinds_are_separate(self):
+        index_queue.mark_dirty(index_queue.FINDING_AIDS, [1])
+        index_queue.mark_dirty(index_queue.ISAD, [1])
+
+        self.assertIn("test:index_queue:finding_aids", self.redis.sets)
+        self.assertIn("test:index_queue:isad", self.redis.sets)
+
+    def test_pop_respects_count(self):
+        index_queue.mark_dirty(index_queue.ISAD, range(10))
+
+        self.assertEqual(len(index_queue.pop_dirty(index_queue.ISAD, count=4)), 4)
+        self.assertEqual(index_queue.pending(index_queue.ISAD), 6)
+
+    def test_empty_mark_does_not_call_redis(self):
+        redis = Mock()
+        with patch("clockwork_api.services.index_queue._get_client", return_value=redis):
+            index_queue.mark_dirty(index_queue.ISAD, [])
+        redis.sadd.assert_not_called()
+
+
+class FlushFindingAidsIndexQueueTests(SimpleTestCase):
+    @patch("finding_aids.tasks._index_meilisearch_batch")
+    @patch("finding_aids.tasks.FindingAidsNewCatalogBulkIndexer")
+    @patch("finding_aids.tasks.index_queue")
+    def test_flush_batches_and_commits_once(self, mock_queue, mock_bulk_indexer, mock_meili_batch):
+        from finding_aids.tasks import flush_finding_aids_index_queue
+
+        mock_queue.pending.return_value = 3
+        mock_queue.pop_dirty.side_effect = [[1, 2], [3], []]
+
+        processed = flush_finding_aids_index_queue()
+
+        self.assertEqual(processed, 3)
+        indexer = mock_bulk_indexer.return_value
+        self.assertEqual(indexer.index_ids.call_count, 2)
+        self.assertEqual(mock_meili_batch.call_count, 2)
+        indexer.commit.assert_called_once()
+
+    @patch("finding_aids.tasks.FindingAidsNewCatalogBulkIndexer")
+    @patch("finding_aids.tasks.index_queue")
+    def test_flush_without_dirty_ids_does_not_commit(self, mock_queue, mock_bulk_indexer):
+        from finding_aids.tasks import flush_finding_aids_index_queue
+
+        mock_queue.pending.return_value = 0
+
+        self.assertEqual(flush_finding_aids_index_queue(), 0)
+        mock_bulk_indexer.assert_not_called()
+
+    @patch("finding_aids.tasks._index_meilisearch_batch", return_value=True)
+    @patch("finding_aids.tasks.FindingAidsNewCatalogBulkIndexer")
+    @patch("finding_aids.tasks.index_queue")
+    def test_failed_batches_are_marked_dirty_again(self, mock_queue, mock_bulk_indexer, mock_meili_batch):
+        from finding_aids.tasks import flush_finding_aids_index_queue
+
+        mock_queue.pending.return_value = 6
+        mock_queue.pop_dirty.side_effect = [[1, 2], [3, 4], [5, 6]]
+        indexer = mock_bulk_indexer.return_value
+        indexer.index_ids.side_effect = [[2], [], ConnectionError("Solr is down")]
+        mock_meili_batch.side_effect = [True, False]
+
+        self.assertEqual(flush_finding_aids_index_queue(), 6)
+        mock_queue.mark_dirty.assert_called_once_with(mock_queue.FINDING_AIDS, [2, 3, 4, 5, 6])
+        indexer.commit.assert_called_once()
+
+
+class FlushIsadIndexQueueTests(SimpleTestCase):
+    @patch("isad.tasks.ISADNewCatalogIndexer")
+    @patch("isad.tasks.ISADMeilisearchIndexer")
+    @patch("isad.tasks.index_isad_solr_batch")
+    @patch("isad.tasks.index_queue")
+    def test_failed_batches_are_marked_dirty_again(self, mock_queue, mock_solr_batch, mock_meilisearch_indexer,
+                                                   mock_solr_indexer):
+        from isad.tasks import flush_isad_index_queue
+
+        mock_queue.pending.return_value = 6
+        mock_queue.pop_dirty.side_effect = [[1, 2], [3, 4], [5, 6]]
+        mock_solr_batch.side_effect = [([1, 2], 0), ([3, 4], 2), ([5, 6], 0)]
+        mock_meilisearch_indexer.sync.side_effect = [None, None, RuntimeError("Meilisearch is down")]
+
+        self.assertEqual(flush_isad_index_queue(), 6)
+        mock_queue.mark_dirty.assert_called_once_with(mock_queue.ISAD, [3, 4, 5, 6])
+        mock_solr_indexer.commit_changes.assert_called_once()
@@ -0,0 +1,44 @@
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from django.test import SimpleTestCase
+
+from clockwork_api.services.language_detection import detect_language, detect_languages, get_detected_locale
+
+
+class LanguageDetectionTests(SimpleTestCase):
+    def test_detection_is_deterministic(self):
+        text = "Records of the Open Society Archives at Central European University"
+        detect_language.cache_clear()
+        first = detect_language(text)
+        detect_language.cache_clear()
+        self.assertEqual(detect_language(text), first)
+        self.assertEqual(first, "en")
+
+    def test_undetectable_text_returns_empty_string(self):
+        self.assertEqual(detect_language(""), "")
+        self.assertEqual(detect_language("1234 5678"), "")
+
+    def test_detect_languages_keeps_ids(self):
+        self.assertEqual(detect_languages([(1, ""), (2, None)]), [(1, ""), (2, "")])
+
+    def test_get_detected_locale_uses_stored_value(self):
+        entity = SimpleNamespace(pk=1, title="Some title", detected_locale="hu")
+
+        with patch("clockwork_api.services.language_detection.detect") as mock_detect:
+            self.assertEqual(get_detected_locale(entity), "hu")
+
+        mock_detect.assert_not_called()
+
+    def test_get_detected_locale_detects_and_stores_once(self):
+        manager = Mock()
+        model = type("Model", (SimpleNamespace,), {"objects": manager})
+        entity = model(pk=5, title="Egy magyar nyelvű cím", detected_locale=None)
+
+        with patch("clockwork_api.services.language_detection.detect", return_value="hu"):
+            detect_language.cache_clear()
+            self.assertEqual(get_detected_locale(entity), "hu")
+            self.assertEqual(get_detected_locale(entity), "hu")
+
+        manager.filter.assert_called_once_with(pk=5)
+        manager.filter.return_value.update.assert_called_once_with(detected_locale="hu")
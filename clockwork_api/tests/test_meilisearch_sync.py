@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+from django.test import SimpleTestCase, override_settings
+from meilisearch.errors import MeilisearchTimeoutError
+
+from clockwork_api.services import meilisearch_sync
+
+
+class MeilisearchClientTests(SimpleTestCase):
+    @patch("clockwork_api.services.meilisearch_sync._client", None)
+    @patch("clockwork_api.services.meilisearch_sync.meilisearch.Client")
+    def test_client_is_reused_within_process(self, client_class):
+        first = meilisearch_sync.get_client()
+        second = meilisearch_sync.get_client()
+
+        self.assertIs(first, second)
+        client_class.assert_called_once()
+
+
+class MeilisearchIndexNameTests(SimpleTestCase):
+    def test_index_name_defaults_per_record_type(self):
+        self.assertEqual(meilisearch_sync.get_index_name(meilisearch_sync.FINDING_AIDS_INDEX), "meilisearch")
+        self.assertEqual(meilisearch_sync.get_index_name(meilisearch_sync.ISAD_INDEX), "ams")
+
+    @override_settings(MEILISEARCH_INDEX="catalog")
+    def test_index_name_setting_overrides_defaults(self):
+        self.assertEqual(meilisearch_sync.get_index_name(meilisearch_sync.FINDING_AIDS_INDEX), "catalog")
+        self.assertEqual(meilisearch_sync.get_index_name(meilisearch_sync.ISAD_INDEX), "catalog")
+
+
+class MeilisearchSyncTests(SimpleTestCase):
+    def setUp(self):
+        self.client = Mock()
+        self.index = self.client.index.return_value
+        self.index.add_documents.side_effect = lambda docs: Mock(task_uid=len(self.index.add_documents.mock_calls))
+        patcher = patch("clockwork_api.services.meilisearch_sync.get_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_add_documents_streams_chunks(self):
+        documents = ({"id": i} for i in range(5))
+
+        task_uids = meilisearch_sync.add_documents(documents, "ams", chunk_size=2)
+
+        self.assertEqual(task_uids, [1, 2, 3])
+        self.client.index.assert_called_once_with("ams")
+        self.assertEqual([len(c.args[0]) for c in self.index.add_documents.call_args_list], [2, 2, 1])
+
+    def test_wait_for_tasks_reports_failures(self):
+        self.client.wait_for_task.side_effect = [
+            Mock(status="succeeded"),
+            Mock(status="failed", error={"code": "invalid_document_id"}),
+            MeilisearchTimeoutError("timeout"),
+        ]
+
+        failed = meilisearch_sync.wait_for_tasks([1, 2, 3])
+
+        self.assertEqual([task["uid"] for task in failed], [2, 3])
+        self.assertEqual(failed[1]["status"], "timeout")
+
+    def test_get_lag(self):
+        enqueued_at = datetime.now(timezone.utc) - timedelta(seconds=30)
+        self.client.get_tasks.side_effect = [
+            Mock(total=3),
+            Mock(total=1),
+            Mock(results=[Mock(enqueued_at=enqueued_at)]),
+        ]
+
+        lag = meilisearch_sync.get_lag("ams")
+
+        self.assertEqual((lag["enqueued"], lag["processing"]), (3, 1))
+        self.assertGreaterEqual(lag["lag_seconds"], 30)
+        self.assertEqual(lag["oldest_enqueued_at"], enqueued_at.isoformat())
+
+    def test_get_lag_without_pending_tasks(self):
+        self.client.get_tasks.return_value = Mock(total=0)
+
+        lag = meilisearch_sync.get_lag("ams")
+
+        self.assertEqual(lag["lag_seconds"], 0)
+        self.assertEqual(self.client.get_tasks.call_count, 2)
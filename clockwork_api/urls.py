@@ -23,6 +23,7 @@ urlpatterns = [
     path('v1/catalog/', include('catalog.urls', namespace='catalog-v1')),
     path('v1/workflow/', include('workflow.urls', namespace='workflow-v1')),
     path('v1/research/', include('research.urls', namespace='research-v1')),
+    path('v1/search_index/', include('search_index.urls', namespace='search_index-v1')),
 
     path('admin/', admin.site.urls),
 
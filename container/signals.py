@@ -1,9 +1,9 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
+from clockwork_api.services import index_queue
 from container.models import Container
 from finding_aids.models import FindingAidsEntity
-from finding_aids.tasks import index_catalog_finding_aids_entity, index_catalog_finding_aids_entity_remove
 
 
 @receiver(post_save, sender=Container)
@@ -16,16 +16,10 @@ def update_finding_aids_index_upon_container_save(sender, instance, **kwargs):
     finding aids are re-indexed appropriately.
 
     Resolution behavior:
-        - Published finding-aid entities are indexed
-        - Unpublished finding-aid entities are removed from the index
-
-    Indexing is performed asynchronously via background tasks.
+        - All finding-aid entities of the container are marked as dirty
+          in the coalescing index queue with a single Redis call
+        - The periodic flush indexes published entities and removes
+          unpublished ones
     """
-    finding_aids_entities = FindingAidsEntity.objects.filter(container=instance)
-
-    # Index the underlying finding aids entities
-    for finding_aids_entity in finding_aids_entities.all():
-        if finding_aids_entity.published:
-            index_catalog_finding_aids_entity.delay(finding_aids_entity_id=finding_aids_entity.id)
-        else:
-            index_catalog_finding_aids_entity_remove.delay(finding_aids_entity_id=finding_aids_entity.id)
+    finding_aids_entity_ids = FindingAidsEntity.objects.filter(container=instance).values_list('id', flat=True)
+    index_queue.mark_dirty(index_queue.FINDING_AIDS, finding_aids_entity_ids)
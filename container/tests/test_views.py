@@ -7,6 +7,7 @@ from archival_unit.tests.helpers import make_fonds, make_subfonds, make_series
 from clockwork_api.tests.test_views_base_class import TestViewsBaseClass
 from container.tests.helpers import make_container
 from controlled_list.tests.helpers import make_carrier_types, make_access_rights, make_primary_types
+from finding_aids.tasks import run_publication_job
 from finding_aids.tests.helpers import make_finding_aids
 
 
@@ -65,17 +66,19 @@ class ContainerViewsTest(TestViewsBaseClass):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 0)
 
-    @patch('finding_aids.signals.index_meilisearch_finding_aids_entity_remove.delay')
-    @patch('finding_aids.signals.index_catalog_finding_aids_entity_remove.delay')
-    @patch('finding_aids.signals.index_meilisearch_finding_aids_entity.delay')
-    @patch('finding_aids.signals.index_catalog_finding_aids_entity.delay')
-    def test_container_publish_triggers_indexing_signals(
-            self,
-            mock_catalog_index,
-            mock_meili_index,
-            mock_catalog_remove,
-            mock_meili_remove,
-    ):
+    def _run_publication(self, url):
+        with patch('finding_aids.tasks.run_publication_job.delay') as delay, \
+                self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(url)
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        delay.assert_called_once_with(response.data['job_id'])
+        run_publication_job(response.data['job_id'])
+        return response.data['job_id']
+
+    @patch('finding_aids.services.publication.create_ark_for_record', return_value='ark:/12345/abc')
+    @patch('clockwork_api.services.index_queue.mark_dirty')
+    def test_container_publish_triggers_indexing_signals(self, mock_mark_dirty, mock_create_ark):
         finding_aids = make_finding_aids(
             container=self.container,
             primary_type=self.primary_type,
@@ -84,32 +87,25 @@ class ContainerViewsTest(TestViewsBaseClass):
         )
         # Creating a FindingAidsEntity can trigger multiple saves/signals
         # (catalog_id generation path). We only assert the publish endpoint effect.
-        mock_catalog_index.reset_mock()
-        mock_meili_index.reset_mock()
-        mock_catalog_remove.reset_mock()
-        mock_meili_remove.reset_mock()
+        mock_mark_dirty.reset_mock()
 
-        response = self.client.put(
+        job_id = self._run_publication(
             reverse('container-v1:container-publish', kwargs={'action': 'publish', 'pk': self.container.id})
         )
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
         finding_aids.refresh_from_db()
         self.assertTrue(finding_aids.published)
-        self.assertEqual(mock_catalog_index.call_count, 1)
-        self.assertEqual(mock_meili_index.call_count, 1)
-
-    @patch('finding_aids.signals.index_meilisearch_finding_aids_entity_remove.delay')
-    @patch('finding_aids.signals.index_catalog_finding_aids_entity_remove.delay')
-    @patch('finding_aids.signals.index_meilisearch_finding_aids_entity.delay')
-    @patch('finding_aids.signals.index_catalog_finding_aids_entity.delay')
-    def test_container_unpublish_triggers_indexing_signals(
-            self,
-            mock_catalog_index,
-            mock_meili_index,
-            mock_catalog_remove,
-            mock_meili_remove,
-    ):
+        self.assertEqual(finding_aids.user_published, self.user.username)
+        self.assertEqual(finding_aids.ark, 'ark:/12345/abc')
+        mock_mark_dirty.assert_called_once_with('finding_aids', [finding_aids.id])
+
+        response = self.client.get(reverse('finding_aids-v1:finding_aids-publication-job', kwargs={'pk': job_id}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], 'finished')
+        self.assertEqual((response.data['processed'], response.data['total']), (1, 1))
+
+    @patch('clockwork_api.services.index_queue.mark_dirty')
+    def test_container_unpublish_triggers_indexing_signals(self, mock_mark_dirty):
         finding_aids = make_finding_aids(
             container=self.container,
             primary_type=self.primary_type,
@@ -118,17 +114,12 @@ class ContainerViewsTest(TestViewsBaseClass):
         )
         # Creating a FindingAidsEntity can trigger multiple saves/signals
         # (catalog_id generation path). We only assert the unpublish endpoint effect.
-        mock_catalog_index.reset_mock()
-        mock_catalog_remove.reset_mock()
-        mock_meili_index.reset_mock()
-        mock_meili_remove.reset_mock()
+        mock_mark_dirty.reset_mock()
 
-        response = self.client.put(
+        self._run_publication(
             reverse('container-v1:container-publish', kwargs={'action': 'unpublish', 'pk': self.container.id})
         )
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
         finding_aids.refresh_from_db()
         self.assertFalse(finding_aids.published)
-        self.assertEqual(mock_catalog_remove.call_count, 1)
-        self.assertEqual(mock_meili_index.call_count, 1)
+        mock_mark_dirty.assert_called_once_with('finding_aids', [finding_aids.id])
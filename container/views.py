@@ -7,12 +7,14 @@ from rest_framework.views import APIView
 
 from archival_unit.models import ArchivalUnit
 from clockwork_api.mixins.audit_log_mixin import AuditLogMixin
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from clockwork_api.mixins.method_serializer_mixin import MethodSerializerMixin
 from container.models import Container
 from container.serializers import ContainerReadSerializer, ContainerWriteSerializer, \
     ContainerListSerializer
 from digitization.models import DigitalVersion
-from finding_aids.models import FindingAidsEntity
+from finding_aids.models import FindingAidsEntity, FindingAidsPublicationJob
+from finding_aids.services import publication
 
 
 class ContainerPreCreate(APIView):
@@ -108,7 +110,7 @@ class ContainerList(generics.ListAPIView):
             ).values('finding_aids_entity__container').annotate(total=Count('id')).values('total')[:1]
 
             def annotate_counts(queryset):
-                return queryset.select_related('archival_unit', 'carrier_type').annotate(
+                return annotate_removable(queryset).select_related('archival_unit', 'carrier_type').annotate(
                     total_number_count=Coalesce(
                         Subquery(total_number_count, output_field=IntegerField()),
                         Value(0)
@@ -180,6 +182,15 @@ class ContainerDetail(AuditLogMixin, MethodSerializerMixin, generics.RetrieveUpd
         containers.update(container_no=F('container_no') - 1)
 
 
+def get_publication_action(action):
+    """
+    Maps the `action` URL parameter to a publication job action; anything but 'publish' unpublishes.
+    """
+    if action == 'publish':
+        return FindingAidsPublicationJob.PUBLISH
+    return FindingAidsPublicationJob.UNPUBLISH
+
+
 class ContainerPublishAll(APIView):
     """
     Publishes or unpublishes all finding-aid entities for an archival series.
@@ -190,22 +201,22 @@ class ContainerPublishAll(APIView):
 
     def put(self, request, *args, **kwargs):
         """
-        Applies the requested publish action to all finding-aid entities in a series.
+        Starts a background job applying the requested publish action to all finding-aid entities in a series.
 
-        Publishing is performed by calling FindingAidsEntity.publish(user).
-        Unpublishing is performed by calling FindingAidsEntity.unpublish().
+        See finding_aids.services.publication. Progress can be polled at the
+        finding aids publication job endpoint.
+
+        Returns:
+            HTTP 202 with the id of the publication job.
         """
         action = self.kwargs.get('action', None)
-        archival_unit_id = self.kwargs.get('series', None)
+        archival_unit = get_object_or_404(ArchivalUnit, pk=self.kwargs.get('series', None))
 
-        finding_aids_entities = FindingAidsEntity.objects.filter(archival_unit_id=archival_unit_id)
-        if action == 'publish':
-            for finding_aids_entity in finding_aids_entities:
-                finding_aids_entity.publish(request.user)
-        else:
-            for finding_aids_entity in finding_aids_entities:
-                finding_aids_entity.unpublish()
-        return Response(status=status.HTTP_200_OK)
+        try:
+            job = publication.start_job(get_publication_action(action), request.user, archival_unit=archival_unit)
+        except publication.PublicationJobConflict as e:
+            return Response({'detail': str(e), 'job_id': e.job.id}, status=status.HTTP_409_CONFLICT)
+        return Response({'job_id': job.id}, status=status.HTTP_202_ACCEPTED)
 
 
 class ContainerPublish(APIView):
@@ -218,23 +229,22 @@ class ContainerPublish(APIView):
 
     def put(self, request, *args, **kwargs):
         """
-        Applies the requested publish action to all finding-aid entities in a container.
+        Starts a background job applying the requested publish action to all finding-aid entities in a container.
 
-        Publishing is performed by calling FindingAidsEntity.publish(user).
-        Unpublishing is performed by calling FindingAidsEntity.unpublish().
+        See finding_aids.services.publication. Progress can be polled at the
+        finding aids publication job endpoint.
+
+        Returns:
+            HTTP 202 with the id of the publication job.
         """
         action = self.kwargs.get('action', None)
-        container_id = self.kwargs.get('pk', None)
-        container = get_object_or_404(Container, pk=container_id)
+        container = get_object_or_404(Container, pk=self.kwargs.get('pk', None))
 
-        finding_aids_entities = FindingAidsEntity.objects.filter(container=container)
-        if action == 'publish':
-            for finding_aids_entity in finding_aids_entities:
-                finding_aids_entity.publish(request.user)
-        else:
-            for finding_aids_entity in finding_aids_entities:
-                finding_aids_entity.unpublish()
-        return Response(status=status.HTTP_200_OK)
+        try:
+            job = publication.start_job(get_publication_action(action), request.user, container=container)
+        except publication.PublicationJobConflict as e:
+            return Response({'detail': str(e), 'job_id': e.job.id}, status=status.HTTP_409_CONFLICT)
+        return Response({'job_id': job.id}, status=status.HTTP_202_ACCEPTED)
 
 
 class ContainerDetailByBarcode(AuditLogMixin, MethodSerializerMixin, generics.RetrieveUpdateAPIView):
@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.reverse import reverse
 
@@ -28,3 +30,18 @@ class ControlledListViewTests(TestViewsBaseClass):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["type"], "Archival Box")
+
+    def test_carrier_type_list_removable_flag_is_annotated(self):
+        make_carrier_types(type="Video cassette", width=5)
+        url = reverse("controlled_list-v1:carrier_type-list")
+
+        with CaptureQueriesContext(connection) as two_rows:
+            self.client.get(url)
+        for type_no in range(5):
+            make_carrier_types(type="Film reel %s" % type_no, width=30)
+
+        with self.assertNumQueries(len(two_rows)):
+            response = self.client.get(url, {"limit": 50})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 7)
+        self.assertTrue(all(row["is_removable"] for row in response.data["results"]))
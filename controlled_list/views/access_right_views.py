@@ -1,6 +1,7 @@
 from rest_framework import generics
 from rest_framework.filters import SearchFilter
 
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from controlled_list.models import AccessRight
 from controlled_list.serializers import AccessRightSerializer, AccessRightSelectSerializer
 
@@ -20,7 +21,7 @@ class AccessRightList(generics.ListCreateAPIView):
         - Supports ordering by: statement
     """
 
-    queryset = AccessRight.objects.all()
+    queryset = annotate_removable(AccessRight.objects.all())
     serializer_class = AccessRightSerializer
     filter_backends = [SearchFilter]
     search_fields = ['statement']
@@ -1,6 +1,7 @@
 from rest_framework import generics
 from rest_framework.filters import SearchFilter
 
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from controlled_list.models import ArchivalUnitTheme
 from controlled_list.serializers import ArchivalUnitThemeSerializer, ArchivalUnitThemeSelectSerializer
 
@@ -13,7 +14,7 @@ class ArchivalUnitThemeList(generics.ListCreateAPIView):
     units for browsing, filtering, and discovery.
     """
 
-    queryset = ArchivalUnitTheme.objects.all()
+    queryset = annotate_removable(ArchivalUnitTheme.objects.all())
     serializer_class = ArchivalUnitThemeSerializer
 
 
@@ -1,6 +1,7 @@
 from rest_framework import generics
 from rest_framework.filters import SearchFilter
 
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from controlled_list.models import Building
 from controlled_list.serializers import BuildingSerializer, BuildingSelectSerializer
 
@@ -13,7 +14,7 @@ class BuildingList(generics.ListCreateAPIView):
     used for location-based metadata and filtering.
     """
 
-    queryset = Building.objects.all()
+    queryset = annotate_removable(Building.objects.all())
     serializer_class = BuildingSerializer
 
 
@@ -1,6 +1,7 @@
 from rest_framework import generics
 from rest_framework.filters import SearchFilter
 
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from controlled_list.models import CarrierType
 from controlled_list.serializers import CarrierTypeSerializer, CarrierTypeSelectSerializer
 
@@ -13,7 +14,7 @@ class CarrierTypeList(generics.ListCreateAPIView):
     and may include dimensional metadata used for storage and labeling.
     """
 
-    queryset = CarrierType.objects.all()
+    queryset = annotate_removable(CarrierType.objects.all())
     serializer_class = CarrierTypeSerializer
 
 
@@ -1,6 +1,7 @@
 from rest_framework import generics
 from rest_framework.filters import SearchFilter
 
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from controlled_list.models import CorporationRole
 from controlled_list.serializers import CorporationRoleSerializer, CorporationRoleSelectSerializer
 
@@ -13,7 +14,7 @@ class CorporationRoleList(generics.ListCreateAPIView):
     (e.g., creator, contributor, subject), enabling consistent indexing and display.
     """
 
-    queryset = CorporationRole.objects.all()
+    queryset = annotate_removable(CorporationRole.objects.all())
     serializer_class = CorporationRoleSerializer
 
 
@@ -1,6 +1,7 @@
 from rest_framework import generics
 from rest_framework.filters import SearchFilter
 
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from controlled_list.models import DateType
 from controlled_list.serializers import DateTypeSerializer, DateTypeSelectSerializer
 
@@ -13,7 +14,7 @@ class DateTypeList(generics.ListCreateAPIView):
     (e.g., creation date, publication date, broadcast date).
     """
 
-    queryset = DateType.objects.all()
+    queryset = annotate_removable(DateType.objects.all())
     serializer_class = DateTypeSerializer
 
 
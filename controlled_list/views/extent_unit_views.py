@@ -1,6 +1,7 @@
 from rest_framework import generics
 from rest_framework.filters import SearchFilter
 
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from controlled_list.models import ExtentUnit
 from controlled_list.serializers import ExtentUnitSerializer, ExtentUnitSelectSerializer
 
@@ -13,7 +14,7 @@ class ExtentUnitList(generics.ListCreateAPIView):
     (e.g., pages, items, reels, gigabytes).
     """
 
-    queryset = ExtentUnit.objects.all()
+    queryset = annotate_removable(ExtentUnit.objects.all())
     serializer_class = ExtentUnitSerializer
 
 
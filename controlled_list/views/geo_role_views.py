@@ -1,6 +1,7 @@
 from rest_framework import generics
 from rest_framework.filters import SearchFilter
 
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from controlled_list.models import GeoRole
 from controlled_list.serializers import GeoRoleSerializer, GeoRoleSelectSerializer
 
@@ -14,7 +15,7 @@ class GeoRoleList(generics.ListCreateAPIView):
     and display.
     """
 
-    queryset = GeoRole.objects.all()
+    queryset = annotate_removable(GeoRole.objects.all())
     serializer_class = GeoRoleSerializer
 
 
@@ -1,6 +1,7 @@
 from rest_framework import generics
 from rest_framework.filters import SearchFilter
 
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from controlled_list.models import IdentifierType
 from controlled_list.serializers import IdentifierTypeSerializer, IdentifierTypeSelectSerializer
 
@@ -13,7 +14,7 @@ class IdentifierTypeList(generics.ListCreateAPIView):
     records (e.g., internal identifier, legacy identifier, external standard).
     """
 
-    queryset = IdentifierType.objects.all()
+    queryset = annotate_removable(IdentifierType.objects.all())
     serializer_class = IdentifierTypeSerializer
 
 
@@ -1,6 +1,7 @@
 from rest_framework import generics
 from rest_framework.filters import SearchFilter
 
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from controlled_list.models import Keyword
 from controlled_list.serializers import KeywordSerializer, KeywordSelectSerializer
 
@@ -18,7 +19,7 @@ class KeywordList(generics.ListCreateAPIView):
         - Searches over: keyword
     """
 
-    queryset = Keyword.objects.all()
+    queryset = annotate_removable(Keyword.objects.all())
     serializer_class = KeywordSerializer
     filter_backends = (SearchFilter,)
     search_fields = ('keyword',)
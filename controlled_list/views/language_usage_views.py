@@ -1,6 +1,7 @@
 from rest_framework import generics
 from rest_framework.filters import SearchFilter
 
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from controlled_list.models import LanguageUsage
 from controlled_list.serializers import LanguageUsageSerializer, LanguageUsageSelectSerializer
 
@@ -14,7 +15,7 @@ class LanguageUsageList(generics.ListCreateAPIView):
     and filtering.
     """
 
-    queryset = LanguageUsage.objects.all()
+    queryset = annotate_removable(LanguageUsage.objects.all())
     serializer_class = LanguageUsageSerializer
 
 
@@ -1,6 +1,7 @@
 from rest_framework import generics
 from rest_framework.filters import SearchFilter
 
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from controlled_list.models import Locale
 from controlled_list.serializers import LocaleSerializer, LocaleSelectSerializer
 
@@ -13,7 +14,7 @@ class LocaleList(generics.ListCreateAPIView):
     human-readable display name. Locale entries use a short string primary key.
     """
 
-    queryset = Locale.objects.all()
+    queryset = annotate_removable(Locale.objects.all())
     serializer_class = LocaleSerializer
 
 
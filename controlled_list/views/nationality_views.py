@@ -1,6 +1,7 @@
 from rest_framework import generics
 from rest_framework.filters import SearchFilter
 
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from controlled_list.models import Locale, Nationality
 from controlled_list.serializers import (
     LocaleSerializer,
@@ -18,7 +19,7 @@ class NationalityList(generics.ListCreateAPIView):
     or entities in descriptive metadata.
     """
 
-    queryset = Nationality.objects.all()
+    queryset = annotate_removable(Nationality.objects.all())
     serializer_class = NationalitySerializer
 
 
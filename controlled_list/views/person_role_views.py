@@ -1,6 +1,7 @@
 from rest_framework import generics
 from rest_framework.filters import SearchFilter
 
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from controlled_list.models import PersonRole
 from controlled_list.serializers import PersonRoleSerializer, PersonRoleSelectSerializer
 
@@ -14,7 +15,7 @@ class PersonRoleList(generics.ListCreateAPIView):
     and display.
     """
 
-    queryset = PersonRole.objects.all()
+    queryset = annotate_removable(PersonRole.objects.all())
     serializer_class = PersonRoleSerializer
 
 
@@ -1,6 +1,7 @@
 from rest_framework import generics
 from rest_framework.filters import SearchFilter
 
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from controlled_list.models import PrimaryType
 from controlled_list.serializers import PrimaryTypeSerializer, PrimaryTypeSelectSerializer
 
@@ -13,7 +14,7 @@ class PrimaryTypeList(generics.ListCreateAPIView):
     grouping and filtering records at a high level.
     """
 
-    queryset = PrimaryType.objects.all()
+    queryset = annotate_removable(PrimaryType.objects.all())
     serializer_class = PrimaryTypeSerializer
 
 
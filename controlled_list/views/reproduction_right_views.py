@@ -1,6 +1,7 @@
 from rest_framework import generics
 from rest_framework.filters import SearchFilter
 
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from controlled_list.models import ReproductionRight
 from controlled_list.serializers import ReproductionRightSerializer, ReproductionRightSelectSerializer
 
@@ -13,7 +14,7 @@ class ReproductionRightList(generics.ListCreateAPIView):
     may be reproduced, copied, or reused.
     """
 
-    queryset = ReproductionRight.objects.all()
+    queryset = annotate_removable(ReproductionRight.objects.all())
     serializer_class = ReproductionRightSerializer
 
 
@@ -1,6 +1,7 @@
 from rest_framework import generics
 from rest_framework.filters import SearchFilter
 
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from controlled_list.models import RightsRestrictionReason
 from controlled_list.serializers import (
     RightsRestrictionReasonSerializer,
@@ -16,7 +17,7 @@ class RightsRestrictionReasonList(generics.ListCreateAPIView):
     or use of materials is limited (e.g., privacy, legal, donor agreement).
     """
 
-    queryset = RightsRestrictionReason.objects.all()
+    queryset = annotate_removable(RightsRestrictionReason.objects.all())
     serializer_class = RightsRestrictionReasonSerializer
 
 
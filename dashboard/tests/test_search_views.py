@@ -306,3 +306,13 @@ class DashboardSearchViewTests(TestViewsBaseClass):
                 'filter': 'description_level IN ["Folder", "Item"]'
             }
         )
+
+    @patch('dashboard.views.search_views.meilisearch_sync.get_lag')
+    def test_search_status_returns_lag_metrics(self, get_lag):
+        get_lag.return_value = {'index': 'ams', 'enqueued': 2, 'processing': 1, 'lag_seconds': 4.5}
+
+        response = self.client.get(reverse('dashboard-v1:search-status'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['enqueued'], 2)
+        self.assertEqual(response.data['lag_seconds'], 4.5)
@@ -14,7 +14,7 @@ from dashboard.views.analytics_views import AnalyticsActivityView, AnalyticsTota
 from dashboard.views.log_views import AccessionLog, ArchivalUnitLog, IsadCreateLog, IsadUpdateLog, FindingAidsCreateLog, \
     FindingAidsUpdateLog, DigitizationLog
 from dashboard.views.statistics_views import LinearMeterView, PublishedItems, CarrierTypes
-from dashboard.views.search_views import DashboardSearchView
+from dashboard.views.search_views import DashboardSearchView, DashboardSearchStatusView
 
 app_name = 'mlr'
 
@@ -35,6 +35,7 @@ urlpatterns = [
 
     # Search endpoint
     path('search/', DashboardSearchView.as_view(), name='search'),
+    path('search/status/', DashboardSearchStatusView.as_view(), name='search-status'),
 
     # Analytics endpoints (time-series data)
     path('analytics/activity/', AnalyticsActivityView.as_view(), name='analytics-activity-view'),
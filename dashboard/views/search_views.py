@@ -7,6 +7,16 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from clockwork_api.services import meilisearch_sync
+
+
+def get_dashboard_index_name():
+    return getattr(
+        settings,
+        'MEILISEARCH_DASHBOARD_SEARCH_INDEX',
+        getattr(settings, 'MEILISEARCH_INDEX', 'catalog')
+    )
+
 
 class DashboardSearchView(APIView):
     """
@@ -110,14 +120,9 @@ class DashboardSearchView(APIView):
     def _get_index(self):
         meilisearch_url = getattr(settings, 'MEILISEARCH_URL', '')
         meilisearch_api_key = getattr(settings, 'MEILISEARCH_API_KEY', '')
-        index_name = getattr(
-            settings,
-            'MEILISEARCH_DASHBOARD_SEARCH_INDEX',
-            getattr(settings, 'MEILISEARCH_INDEX', 'catalog')
-        )
 
         client = meilisearch.Client(meilisearch_url, meilisearch_api_key)
-        return client.index(index_name)
+        return client.index(get_dashboard_index_name())
 
     def _get_int_query_param(self, request, key, default):
         value = request.query_params.get(key, default)
@@ -234,3 +239,21 @@ class DashboardSearchView(APIView):
         result = dict(hit)
         result['highlights'] = hit.get('_formatted', {})
         return result
+
+
+class DashboardSearchStatusView(APIView):
+    """
+    Reports how far the Meilisearch index lags behind the database.
+
+    Returns the number of enqueued and processing indexing tasks and the age
+    of the oldest pending task.
+    """
+
+    def get(self, request):
+        try:
+            return Response(meilisearch_sync.get_lag(get_dashboard_index_name()))
+        except Exception as exc:
+            return Response({
+                'detail': 'Search service unavailable.',
+                'error': str(exc)
+            }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
@@ -6,3 +6,9 @@ from django.apps import AppConfig
 
 class DigitizationConfig(AppConfig):
     name = 'digitization'
+
+    def ready(self):
+        """
+        Imports the signal handlers regenerating the stored IIIF manifests.
+        """
+        from . import signals
@@ -0,0 +1,24 @@
+from django.core.management import BaseCommand
+
+from digitization.services.iiif_image_info import refresh_still_images
+
+
+class Command(BaseCommand):
+    help = "Fetch IIIF info.json payloads of still image finding aids entities into the local cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Revalidate cached entries as well, not only the missing ones.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of concurrent requests to the IIIF image server.",
+        )
+
+    def handle(self, *args, **options):
+        processed = refresh_still_images(force=options["force"], max_workers=options["workers"])
+        self.stdout.write(self.style.SUCCESS(f"Done. Images={processed}"))
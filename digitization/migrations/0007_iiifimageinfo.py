@@ -0,0 +1,29 @@
+# Generated by Django 4.1.13 on 2026-10-16 23:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('digitization', '0006_alter_digitalversion_options_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IIIFImageInfo',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('image_id', models.CharField(max_length=500, unique=True)),
+                ('info', models.TextField(blank=True, null=True)),
+                ('width', models.IntegerField(blank=True, null=True)),
+                ('height', models.IntegerField(blank=True, null=True)),
+                ('etag', models.CharField(blank=True, max_length=200, null=True)),
+                ('status_code', models.IntegerField(blank=True, null=True)),
+                ('date_fetched', models.DateTimeField(blank=True, db_index=True, null=True)),
+            ],
+            options={
+                'db_table': 'iiif_image_info',
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.1.13 on 2026-10-17 00:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('digitization', '0007_iiifimageinfo'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IIIFManifest',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('catalog_id', models.CharField(max_length=100, unique=True)),
+                ('digital_versions_hash', models.CharField(max_length=32)),
+                ('manifest', models.TextField()),
+                ('date_generated', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'iiif_manifests',
+            },
+        ),
+    ]
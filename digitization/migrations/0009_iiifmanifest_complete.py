@@ -0,0 +1,18 @@
+# Generated by Django 4.1.13 on 2026-10-17 01:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('digitization', '0008_iiifmanifest'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='iiifmanifest',
+            name='complete',
+            field=models.BooleanField(default=True),
+        ),
+    ]
@@ -69,4 +69,55 @@ class DigitalVersionPhysicalCopy(models.Model):
 
     class Meta:
         db_table = 'digital_version_physical_copies'
-        ordering = ['-storage_unit', 'storage_unit_label']
\ No newline at end of file
+        ordering = ['-storage_unit', 'storage_unit_label']
+
+
+class IIIFImageInfo(models.Model):
+    """
+    Local cache of IIIF Image API info.json payloads.
+
+    Entries are keyed by the (unquoted) image identifier used on the IIIF
+    image server, e.g. ``catalog/HU_OSA_300_1_1/HU_OSA_300_1_1_0001_0001.jpg``.
+    Indexers and manifest builders read technical metadata and canvas
+    dimensions from this table instead of calling the image server.
+
+    Failed lookups are cached as well (with their status code), so missing
+    images are not requested again on every reindex; they are retried once
+    they are older than IIIF_INFO_RETRY_TTL seconds.
+    """
+
+    id = models.AutoField(primary_key=True)
+    image_id = models.CharField(max_length=500, unique=True)
+    info = models.TextField(blank=True, null=True)
+    width = models.IntegerField(blank=True, null=True)
+    height = models.IntegerField(blank=True, null=True)
+    etag = models.CharField(max_length=200, blank=True, null=True)
+    status_code = models.IntegerField(blank=True, null=True)
+    date_fetched = models.DateTimeField(blank=True, null=True, db_index=True)
+
+    class Meta:
+        db_table = 'iiif_image_info'
+
+
+class IIIFManifest(models.Model):
+    """
+    Stored IIIF Presentation v3 manifest of a finding aids entity.
+
+    A manifest is looked up by the catalog_id of the entity and the hash of
+    everything it is built from (the manifest label and the digital
+    versions of the entity), so an entry whose digital versions changed is
+    never served. Manifests are regenerated in the background when digital
+    versions change, and on demand when no entry matches. Manifests built
+    while some info.json payloads were unavailable are stored with
+    complete=False and regenerated on the next request.
+    """
+
+    id = models.AutoField(primary_key=True)
+    catalog_id = models.CharField(max_length=100, unique=True)
+    digital_versions_hash = models.CharField(max_length=32)
+    manifest = models.TextField()
+    complete = models.BooleanField(default=True)
+    date_generated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'iiif_manifests'
@@ -0,0 +1,198 @@
+import json
+import logging
+import urllib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+
+from clockwork_api.http import Session
+from digitization.models import IIIFImageInfo
+from finding_aids.models import FindingAidsEntity
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 500
+
+
+def get_finding_aids_image_id(finding_aids_entity):
+    """
+    Returns the IIIF image identifier of a still image finding aids entity.
+
+    Format: catalog/<archival_unit_ref>/<archival_unit_ref>_<container_no>_<folder_no>.jpg
+    """
+    archival_unit_ref_code = finding_aids_entity.archival_unit.reference_code\
+        .replace(" ", "_")\
+        .replace("-", "_")
+    item_reference_code = "%s_%04d_%04d" % (
+        archival_unit_ref_code,
+        finding_aids_entity.container.container_no,
+        finding_aids_entity.folder_no
+    )
+    return 'catalog/%s/%s.jpg' % (archival_unit_ref_code, item_reference_code)
+
+
+def get_still_image_ids():
+    """
+    Returns the IIIF image ids of every non-template still image finding aids entity.
+    """
+    qs = FindingAidsEntity.objects.filter(primary_type__type='Still Image', is_template=False)\
+        .select_related('archival_unit', 'container')\
+        .only('folder_no', 'archival_unit__reference_code', 'container__container_no')
+    return [get_finding_aids_image_id(fa) for fa in qs.iterator()]
+
+
+def refresh_still_images(force=False, max_workers=None):
+    """
+    Refreshes the info.json cache for every still image, one chunk at a time.
+
+    Returns:
+        int: number of image ids processed.
+    """
+    image_ids = get_still_image_ids()
+    for start in range(0, len(image_ids), CHUNK_SIZE):
+        refresh_image_info(image_ids[start:start + CHUNK_SIZE], force=force, max_workers=max_workers)
+    return len(image_ids)
+
+
+def get_image_info_url(image_id):
+    """
+    Returns the info.json URL of an image on the IIIF image server.
+    """
+    iiif_url = getattr(settings, 'BASE_IMAGE_URI', 'http://127.0.0.1:8182/iiif/2/')
+    return "%s%s/info.json" % (iiif_url, urllib.parse.quote_plus(image_id))
+
+
+def is_expired(entry):
+    """
+    Returns True if a cached failed lookup should be retried.
+
+    Entries without an info.json payload are kept for IIIF_INFO_RETRY_TTL
+    seconds (default one day), so images added to the image server later,
+    or missed because of a transient error, are picked up again.
+    """
+    if entry.status_code == 200 or entry.date_fetched is None:
+        return False
+    retry_ttl = getattr(settings, 'IIIF_INFO_RETRY_TTL', 24 * 60 * 60)
+    return entry.date_fetched < timezone.now() - timedelta(seconds=retry_ttl)
+
+
+def get_cached_image_info(image_ids):
+    """
+    Returns cached entries for the given image ids as {image_id: IIIFImageInfo}.
+    """
+    image_ids = list(image_ids)
+    entries = {}
+    for start in range(0, len(image_ids), CHUNK_SIZE):
+        for entry in IIIFImageInfo.objects.filter(image_id__in=image_ids[start:start + CHUNK_SIZE]):
+            entries[entry.image_id] = entry
+    return entries
+
+
+def get_image_info(image_id, fetch_on_miss=True):
+    """
+    Returns the cached info.json text of an image.
+
+    On a cache miss, or when a cached failed lookup expired, the payload is
+    fetched once and stored (unless fetch_on_miss is False). Returns None
+    when the image server has no info.json for the image.
+    """
+    entry = IIIFImageInfo.objects.filter(image_id=image_id).first()
+    if (entry is None or is_expired(entry)) and fetch_on_miss:
+        entry = refresh_image_info([image_id]).get(image_id)
+    return entry.info if entry else None
+
+
+def refresh_image_info(image_ids, force=False, max_workers=None):
+    """
+    Fetches info.json payloads concurrently and stores them in the cache.
+
+    Only ids missing from the cache or whose failed lookup expired (see
+    is_expired) are fetched, unless force is True. Forced refreshes send
+    If-None-Match with the stored ETag, so unchanged images only cost a 304
+    response.
+
+    Requests run on a bounded thread pool (IIIF_INFO_REFRESH_WORKERS, default 8)
+    sharing one pooled HTTP session; database writes happen on the calling thread.
+
+    Returns:
+        dict: {image_id: IIIFImageInfo} for every requested id that is cached.
+    """
+    image_ids = list(dict.fromkeys(image_ids))
+    entries = get_cached_image_info(image_ids)
+    to_fetch = image_ids if force else [
+        image_id for image_id in image_ids if image_id not in entries or is_expired(entries[image_id])
+    ]
+    if not to_fetch:
+        return entries
+
+    max_workers = max_workers or getattr(settings, 'IIIF_INFO_REFRESH_WORKERS', 8)
+    session = _create_session(max_workers)
+
+    def fetch(image_id):
+        entry = entries.get(image_id)
+        etag = entry.etag if entry and entry.status_code == 200 else None
+        return image_id, _fetch(session, image_id, etag)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for image_id, response in executor.map(fetch, to_fetch):
+            if response is None:
+                continue
+            if response.status_code == 304 and image_id in entries:
+                entries[image_id].date_fetched = timezone.now()
+                entries[image_id].save(update_fields=['date_fetched'])
+                continue
+            entries[image_id] = _store(image_id, response)
+
+    session.close()
+    return entries
+
+
+def _create_session(pool_size):
+    """
+    Creates an HTTP session whose connection pool matches the worker count.
+    """
+    session = Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _fetch(session, image_id, etag=None):
+    """
+    Requests info.json for an image. Returns None on connection errors.
+    """
+    headers = {'If-None-Match': etag} if etag else {}
+    try:
+        return session.get(get_image_info_url(image_id), headers=headers)
+    except RequestException as e:
+        logger.warning("info.json request failed for %s: %s", image_id, e)
+        return None
+
+
+def _store(image_id, response):
+    """
+    Stores an info.json response (successful or not) in the cache.
+    """
+    defaults = {
+        'info': None,
+        'width': None,
+        'height': None,
+        'etag': response.headers.get('ETag'),
+        'status_code': response.status_code,
+        'date_fetched': timezone.now(),
+    }
+    if response.status_code == 200:
+        defaults['info'] = response.text
+        try:
+            data = json.loads(response.text)
+            defaults['width'] = data.get('width')
+            defaults['height'] = data.get('height')
+        except (ValueError, AttributeError):
+            pass
+    entry, created = IIIFImageInfo.objects.update_or_create(image_id=image_id, defaults=defaults)
+    return entry
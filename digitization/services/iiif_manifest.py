@@ -0,0 +1,194 @@
+import hashlib
+import json
+import logging
+import urllib
+
+from django.conf import settings
+from django.urls import reverse
+from iiif_prezi3 import Annotation, AnnotationBody, AnnotationPage, Manifest, ServiceV2, ServiceV3
+
+from digitization.models import IIIFManifest
+from digitization.services.iiif_image_info import refresh_image_info
+
+logger = logging.getLogger(__name__)
+
+DIGITAL_VERSION_FIELDS = ['id', 'identifier', 'filename', 'label']
+
+
+def get_image_id(digital_version):
+    """
+    Returns the IIIF image identifier of a digital version row.
+
+    Format: catalog/<first five parts of the identifier>/<filename>
+    """
+    main_directory = "_".join(digital_version['identifier'].split("_", 5)[:5])
+    return "catalog/%s/%s" % (main_directory, digital_version['filename'])
+
+
+def get_image_url(image_id):
+    base_image_url = getattr(settings, 'BASE_IMAGE_URI', 'http://127.0.0.1:8182/iiif/2/')
+    return "%s%s" % (base_image_url, urllib.parse.quote_plus(image_id))
+
+
+def get_label(finding_aids_entity):
+    return '%s %s<br/>' % (finding_aids_entity.archival_reference_code, finding_aids_entity.title) + \
+           '%s<br/>' % finding_aids_entity.archival_unit.title_full + 'Blinken OSA Archivum'
+
+
+def get_digital_versions(finding_aids_entity):
+    return list(finding_aids_entity.digital_versions.order_by('filename').values(*DIGITAL_VERSION_FIELDS))
+
+
+def get_manifest_hash(finding_aids_entity, digital_versions):
+    """
+    Returns the hash of everything a manifest is built from.
+    """
+    source = json.dumps({'label': get_label(finding_aids_entity), 'digital_versions': digital_versions}, sort_keys=True)
+    return hashlib.md5(source.encode('utf-8')).hexdigest()
+
+
+def make_canvas(manifest, info, label):
+    """
+    Adds a canvas showing an image to a manifest, using a stored info.json payload.
+
+    Builds the same canvas as Manifest.make_canvas_from_iiif, without
+    requesting info.json from the image server.
+    """
+    canvas = manifest.make_canvas(label=label)
+    body = AnnotationBody(id="http://example.com", type="Image")
+    body.set_hwd(info['height'], info['width'])
+
+    if 'type' not in info:
+        # IIIF Image API 2: the profile list starts with the compliance level URI.
+        profile = next((item for item in info['profile'] if isinstance(item, str)), '')
+        body.service = [ServiceV2(id=info['@id'], profile=profile, type="ImageService2")]
+        body.id = '%s/full/full/0/default.jpg' % info['@id']
+    else:
+        body.service = [ServiceV3(id=info['id'], profile=info['profile'], type=info['type'])]
+        body.id = '%s/full/max/0/default.jpg' % info['id']
+    body.format = "image/jpeg"
+
+    annotation_page = AnnotationPage()
+    annotation_page.add_item(Annotation(motivation='painting', body=body, target=canvas.id))
+    canvas.add_item(annotation_page)
+    canvas.set_hwd(info['height'], info['width'])
+    return canvas
+
+
+def get_image_entries(digital_versions):
+    """
+    Returns the info.json cache entries of the images of the digital versions.
+
+    Images missing from the cache are fetched concurrently in one pass.
+
+    Returns:
+        dict: {image_id: IIIFImageInfo}
+    """
+    return refresh_image_info([get_image_id(digital_version) for digital_version in digital_versions])
+
+
+def is_complete(digital_versions, entries):
+    """
+    Returns True if every image of the digital versions has an info.json payload.
+    """
+    for digital_version in digital_versions:
+        entry = entries.get(get_image_id(digital_version))
+        if entry is None or not entry.info:
+            return False
+    return True
+
+
+def build_manifest(finding_aids_entity, digital_versions, entries=None):
+    """
+    Builds the IIIF Presentation v3 manifest of a finding aids entity.
+
+    Canvas dimensions come from the local info.json cache (entries, loaded
+    with get_image_entries when not given). Images without an info.json
+    payload are left out.
+
+    Returns:
+        str: the manifest JSON.
+    """
+    manifest = Manifest(
+        id="%s%s" % (settings.BASE_URL, reverse('catalog-v1:finding-aids-manifest-view',
+                                                args=[finding_aids_entity.catalog_id])),
+        label=get_label(finding_aids_entity)
+    )
+
+    if entries is None:
+        entries = get_image_entries(digital_versions)
+
+    for digital_version in digital_versions:
+        image_id = get_image_id(digital_version)
+        entry = entries.get(image_id)
+        if entry is None or not entry.info:
+            logger.warning("No info.json for %s, left out of the manifest", image_id)
+            continue
+
+        url = get_image_url(image_id)
+        canvas = make_canvas(manifest, json.loads(entry.info), digital_version['label'] or "Image")
+        canvas.add_thumbnail(image_url="%s/full/,300/0/default.jpg" % url)
+
+    return manifest.json(indent=4)
+
+
+def generate_manifest(finding_aids_entity, digital_versions=None):
+    """
+    Builds and stores the manifest of a finding aids entity, replacing the previous one.
+
+    A manifest missing images (because their info.json could not be fetched)
+    is stored as incomplete, so it is regenerated on the next request instead
+    of being served until the digital versions change.
+
+    Returns:
+        IIIFManifest: the stored manifest.
+    """
+    if digital_versions is None:
+        digital_versions = get_digital_versions(finding_aids_entity)
+    entries = get_image_entries(digital_versions)
+    complete = is_complete(digital_versions, entries)
+    if not complete:
+        logger.warning("Manifest of %s is incomplete, it will be regenerated", finding_aids_entity.catalog_id)
+    iiif_manifest, created = IIIFManifest.objects.update_or_create(
+        catalog_id=finding_aids_entity.catalog_id,
+        defaults={
+            'digital_versions_hash': get_manifest_hash(finding_aids_entity, digital_versions),
+            'manifest': build_manifest(finding_aids_entity, digital_versions, entries),
+            'complete': complete,
+        }
+    )
+    return iiif_manifest
+
+
+def get_manifest(finding_aids_entity):
+    """
+    Returns the stored manifest of a finding aids entity, generating it if
+    there is no complete one for its current digital versions.
+
+    Returns:
+        IIIFManifest: the stored manifest.
+    """
+    digital_versions = get_digital_versions(finding_aids_entity)
+    iiif_manifest = IIIFManifest.objects.filter(
+        catalog_id=finding_aids_entity.catalog_id,
+        digital_versions_hash=get_manifest_hash(finding_aids_entity, digital_versions),
+        complete=True
+    ).first()
+    if iiif_manifest is None:
+        iiif_manifest = generate_manifest(finding_aids_entity, digital_versions)
+    return iiif_manifest
+
+
+def get_etag(iiif_manifest):
+    """
+    Returns the ETag of a stored manifest, the hash of its JSON.
+
+    The digital versions hash is not enough: a manifest regenerated for the
+    same digital versions once the missing info.json payloads are fetched
+    has the same hash but more canvases.
+    """
+    return '"%s"' % hashlib.md5(iiif_manifest.manifest.encode('utf-8')).hexdigest()
+
+
+def delete_manifest(catalog_id):
+    IIIFManifest.objects.filter(catalog_id=catalog_id).delete()
@@ -0,0 +1,17 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from digitization.models import DigitalVersion
+from digitization.tasks import regenerate_iiif_manifest
+
+
+@receiver(post_save, sender=DigitalVersion)
+@receiver(post_delete, sender=DigitalVersion)
+def regenerate_iiif_manifest_upon_digital_version_change(sender, instance, **kwargs):
+    """
+    Regenerates the stored manifest of the finding aids entity in the background once the change is committed.
+    """
+    finding_aids_entity_id = instance.finding_aids_entity_id
+    if finding_aids_entity_id:
+        transaction.on_commit(lambda: regenerate_iiif_manifest.delay(finding_aids_entity_id))
@@ -0,0 +1,34 @@
+# Create your tasks here
+from celery import shared_task
+
+from digitization.services import iiif_manifest
+from digitization.services.iiif_image_info import refresh_still_images
+from finding_aids.models import FindingAidsEntity
+
+
+@shared_task
+def refresh_iiif_image_info(force=False):
+    """
+    Fills the local IIIF info.json cache for still image finding aids entities.
+
+    By default only images missing from the cache are fetched. With force=True
+    every cached entry is revalidated against the image server (using ETags).
+    """
+    return refresh_still_images(force=force)
+
+
+@shared_task
+def regenerate_iiif_manifest(finding_aids_entity_id):
+    """
+    Regenerates the stored IIIF v3 manifest of a finding aids entity after its digital versions changed.
+
+    Manifests of entities that are no longer online still images are deleted.
+    """
+    finding_aids_entity = FindingAidsEntity.objects.filter(pk=finding_aids_entity_id)\
+        .select_related('primary_type', 'archival_unit').first()
+    if finding_aids_entity is None or not finding_aids_entity.catalog_id:
+        return
+    if finding_aids_entity.primary_type.type == 'Still Image' and finding_aids_entity.available_online:
+        iiif_manifest.generate_manifest(finding_aids_entity)
+    else:
+        iiif_manifest.delete_manifest(finding_aids_entity.catalog_id)
@@ -0,0 +1,100 @@
+import json
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from digitization.models import IIIFImageInfo
+from digitization.services.iiif_image_info import (
+    get_finding_aids_image_id,
+    get_image_info,
+    get_image_info_url,
+    refresh_image_info,
+)
+
+
+def _response(status_code, payload=None, etag=None):
+    return Mock(
+        status_code=status_code,
+        text=json.dumps(payload) if payload is not None else "",
+        headers={"ETag": etag} if etag else {},
+    )
+
+
+class IIIFImageInfoTests(TestCase):
+    def setUp(self):
+        self.session = Mock()
+        patcher = patch("digitization.services.iiif_image_info._create_session", return_value=self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_image_id_and_url(self):
+        entity = SimpleNamespace(
+            archival_unit=SimpleNamespace(reference_code="HU OSA 300-1-1"),
+            container=SimpleNamespace(container_no=2),
+            folder_no=5,
+        )
+        image_id = get_finding_aids_image_id(entity)
+        self.assertEqual(image_id, "catalog/HU_OSA_300_1_1/HU_OSA_300_1_1_0002_0005.jpg")
+
+        with override_settings(BASE_IMAGE_URI="https://images.example/iiif/2/"):
+            self.assertEqual(
+                get_image_info_url(image_id),
+                "https://images.example/iiif/2/catalog%2FHU_OSA_300_1_1%2FHU_OSA_300_1_1_0002_0005.jpg/info.json"
+            )
+
+    def test_refresh_fetches_missing_entries_only(self):
+        IIIFImageInfo.objects.create(image_id="cached.jpg", info="{}", status_code=200)
+        self.session.get.side_effect = [
+            _response(200, {"width": 1000, "height": 800}, etag='"abc"'),
+            _response(404),
+        ]
+
+        entries = refresh_image_info(["cached.jpg", "new.jpg", "missing.jpg"])
+
+        self.assertEqual(self.session.get.call_count, 2)
+        self.assertEqual(set(entries), {"cached.jpg", "new.jpg", "missing.jpg"})
+        new = IIIFImageInfo.objects.get(image_id="new.jpg")
+        self.assertEqual((new.width, new.height, new.etag), (1000, 800, '"abc"'))
+        missing = IIIFImageInfo.objects.get(image_id="missing.jpg")
+        self.assertIsNone(missing.info)
+        self.assertEqual(missing.status_code, 404)
+
+    @override_settings(IIIF_INFO_RETRY_TTL=60 * 60)
+    def test_failed_lookups_are_retried_after_the_ttl(self):
+        now = timezone.now()
+        IIIFImageInfo.objects.create(image_id="recent.jpg", status_code=404, date_fetched=now - timedelta(minutes=5))
+        IIIFImageInfo.objects.create(
+            image_id="expired.jpg", status_code=404, etag='"gone"', date_fetched=now - timedelta(hours=2)
+        )
+        self.session.get.return_value = _response(200, {"width": 10, "height": 20})
+
+        entries = refresh_image_info(["recent.jpg", "expired.jpg"])
+
+        self.session.get.assert_called_once()
+        _, kwargs = self.session.get.call_args
+        self.assertEqual(kwargs["headers"], {})
+        self.assertIsNone(entries["recent.jpg"].info)
+        self.assertEqual(IIIFImageInfo.objects.get(image_id="expired.jpg").width, 10)
+
+    def test_forced_refresh_revalidates_with_etag(self):
+        IIIFImageInfo.objects.create(image_id="cached.jpg", info='{"width": 1}', etag='"v1"', status_code=200)
+        self.session.get.return_value = _response(304)
+
+        refresh_image_info(["cached.jpg"], force=True)
+
+        _, kwargs = self.session.get.call_args
+        self.assertEqual(kwargs["headers"], {"If-None-Match": '"v1"'})
+        self.assertEqual(IIIFImageInfo.objects.get(image_id="cached.jpg").info, '{"width": 1}')
+
+    def test_get_image_info_reads_cache_and_fetches_once_on_miss(self):
+        self.session.get.return_value = _response(200, {"width": 10, "height": 20})
+
+        first = get_image_info("image.jpg")
+        second = get_image_info("image.jpg")
+
+        self.assertEqual(json.loads(first), {"width": 10, "height": 20})
+        self.assertEqual(first, second)
+        self.assertEqual(self.session.get.call_count, 1)
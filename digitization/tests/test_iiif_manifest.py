@@ -0,0 +1,128 @@
+import json
+from unittest.mock import Mock, patch
+
+from django.test import TestCase, override_settings
+
+from archival_unit.tests.helpers import make_fonds, make_subfonds, make_series
+from clockwork_api.tests.no_index_signals_mixin import NoIndexSignalsMixin
+from container.tests.helpers import make_container
+from controlled_list.models import AccessRight, CarrierType, PrimaryType
+from digitization.models import IIIFImageInfo, IIIFManifest
+from digitization.services import iiif_manifest
+from digitization.tasks import regenerate_iiif_manifest
+from digitization.tests.helpers import make_digital_version_finding_aids
+from finding_aids.tests.helpers import make_finding_aids
+
+
+def _info(image_id, width, height):
+    return json.dumps({
+        "@context": "http://iiif.io/api/image/2/context.json",
+        "@id": "https://images.example/iiif/2/%s" % image_id,
+        "profile": ["http://iiif.io/api/image/2/level2.json", {"formats": ["jpg"]}],
+        "width": width,
+        "height": height,
+    })
+
+
+@override_settings(BASE_URL="https://catalog.example", BASE_IMAGE_URI="https://images.example/iiif/2/")
+class IIIFManifestTests(NoIndexSignalsMixin, TestCase):
+    fixtures = ['carrier_types', 'primary_types', 'access_rights']
+
+    def setUp(self):
+        super().setUp()
+        session = patch("digitization.services.iiif_image_info._create_session", return_value=Mock())
+        self.session = session.start()
+        self.addCleanup(session.stop)
+
+        series = make_series(make_subfonds(make_fonds()))
+        container = make_container(series, CarrierType.objects.get(pk=1))
+        self.finding_aids = make_finding_aids(
+            container, PrimaryType.objects.get_or_create(type='Still Image')[0], AccessRight.objects.get(pk=1),
+            folder_no=1, title='Photo'
+        )
+        self.page_one = make_digital_version_finding_aids(
+            self.finding_aids, identifier="AA_BB_CC_DD_EE_FF", filename="image1.jpg", label="Page 1",
+            available_online=True
+        )
+        self.page_two = make_digital_version_finding_aids(
+            self.finding_aids, identifier="AA_BB_CC_DD_EE_FF", filename="image2.jpg", available_online=True
+        )
+        IIIFImageInfo.objects.create(
+            image_id="catalog/AA_BB_CC_DD_EE/image1.jpg", status_code=200,
+            info=_info("catalog%2FAA_BB_CC_DD_EE%2Fimage1.jpg", 1000, 800)
+        )
+        IIIFImageInfo.objects.create(image_id="catalog/AA_BB_CC_DD_EE/image2.jpg", status_code=404)
+
+    def test_canvases_are_built_from_the_local_info_cache(self):
+        stored = iiif_manifest.generate_manifest(self.finding_aids)
+
+        self.session.get.assert_not_called()
+        manifest = json.loads(stored.manifest)
+        self.assertEqual(
+            manifest['id'],
+            "https://catalog.example/v1/catalog/finding-aids-image-manifest/%s/manifest.json" %
+            self.finding_aids.catalog_id
+        )
+        self.assertEqual(len(manifest['items']), 1)
+        canvas = manifest['items'][0]
+        self.assertEqual((canvas['width'], canvas['height']), (1000, 800))
+        self.assertEqual(canvas['label'], {'none': ['Page 1']})
+        body = canvas['items'][0]['items'][0]['body']
+        self.assertEqual(
+            body['id'], "https://images.example/iiif/2/catalog%2FAA_BB_CC_DD_EE%2Fimage1.jpg/full/full/0/default.jpg"
+        )
+        self.assertEqual(body['service'][0]['@type'], 'ImageService2')
+        self.assertEqual(
+            canvas['thumbnail'][0]['id'],
+            "https://images.example/iiif/2/catalog%2FAA_BB_CC_DD_EE%2Fimage1.jpg/full/,300/0/default.jpg"
+        )
+
+    def test_stored_manifest_is_reused_until_digital_versions_change(self):
+        IIIFImageInfo.objects.filter(image_id="catalog/AA_BB_CC_DD_EE/image2.jpg").update(
+            status_code=200, info=_info("catalog%2FAA_BB_CC_DD_EE%2Fimage2.jpg", 600, 800)
+        )
+        stored = iiif_manifest.get_manifest(self.finding_aids)
+        self.assertTrue(stored.complete)
+
+        with patch.object(iiif_manifest, 'build_manifest') as build:
+            self.assertEqual(iiif_manifest.get_manifest(self.finding_aids).id, stored.id)
+            build.assert_not_called()
+
+        self.page_two.label = 'Page 2'
+        self.page_two.save()
+        with patch.object(iiif_manifest, 'build_manifest', return_value='{}') as build:
+            regenerated = iiif_manifest.get_manifest(self.finding_aids)
+        build.assert_called_once()
+        self.assertNotEqual(regenerated.digital_versions_hash, stored.digital_versions_hash)
+        self.assertEqual(IIIFManifest.objects.count(), 1)
+
+    def test_incomplete_manifest_is_regenerated_on_the_next_request(self):
+        stored = iiif_manifest.get_manifest(self.finding_aids)
+        self.assertFalse(stored.complete)
+
+        IIIFImageInfo.objects.filter(image_id="catalog/AA_BB_CC_DD_EE/image2.jpg").update(
+            status_code=200, info=_info("catalog%2FAA_BB_CC_DD_EE%2Fimage2.jpg", 600, 800)
+        )
+        regenerated = iiif_manifest.get_manifest(self.finding_aids)
+
+        self.assertEqual(regenerated.id, stored.id)
+        self.assertTrue(regenerated.complete)
+        self.assertEqual(len(json.loads(regenerated.manifest)['items']), 2)
+
+    def test_digital_version_changes_regenerate_the_manifest_in_the_background(self):
+        with patch('digitization.signals.regenerate_iiif_manifest.delay') as delay, \
+                self.captureOnCommitCallbacks(execute=True):
+            self.page_one.label = 'Cover'
+            self.page_one.save()
+
+        delay.assert_called_once_with(self.finding_aids.id)
+
+    def test_task_deletes_manifests_of_entities_no_longer_online(self):
+        iiif_manifest.generate_manifest(self.finding_aids)
+
+        regenerate_iiif_manifest(self.finding_aids.id)
+        self.assertTrue(IIIFManifest.objects.filter(catalog_id=self.finding_aids.catalog_id).exists())
+
+        self.finding_aids.digital_versions.update(available_online=False)
+        regenerate_iiif_manifest(self.finding_aids.id)
+        self.assertFalse(IIIFManifest.objects.filter(catalog_id=self.finding_aids.catalog_id).exists())
@@ -4,6 +4,7 @@ from rest_framework.filters import OrderingFilter
 from rest_framework.filters import SearchFilter
 
 from clockwork_api.mixins.audit_log_mixin import AuditLogMixin
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from clockwork_api.mixins.method_serializer_mixin import MethodSerializerMixin
 from donor.models import Donor
 from donor.serializers import DonorSelectSerializer, DonorReadSerializer, DonorWriteSerializer, DonorListSerializer
@@ -62,7 +63,7 @@ class DonorList(AuditLogMixin, MethodSerializerMixin, generics.ListCreateAPIView
             - country__country
     """
 
-    queryset = Donor.objects.all().order_by('name')
+    queryset = annotate_removable(Donor.objects.all().order_by('name'))
     filterset_class = DonorFilterClass
     filter_backends = [OrderingFilter, filters.DjangoFilterBackend]
     filterset_fields = ['city', 'country']
@@ -92,13 +92,31 @@ class DigitalVersionIdentifierGenerator:
             - IIIF/derivative addressing (when applicable)
             - client-side linking to digitized representations
 
+        Returns:
+            str: identifier string; empty string when no identifier can be generated.
+        """
+        entity_level = self.finding_aids_entity.digital_versions.count() > 0
+        container_level = not entity_level and self.finding_aids_entity.container.digital_versions.count() > 0
+        return self.format_identifier(entity_level, container_level)
+
+    def format_identifier(self, entity_level, container_level):
+        """
+        Formats the identifier from already resolved digitization state.
+
+        Shared by `generate_identifier()` and the set-based DigitalVersionResolver,
+        so both produce the same identifiers.
+
+        Args:
+            entity_level: True if the entity has DigitalVersion records.
+            container_level: True if the container has DigitalVersion records.
+
         Returns:
             str: identifier string; empty string when no identifier can be generated.
         """
         barcode = ''
 
         # Entity-level digital versions or flags
-        if self.finding_aids_entity.digital_versions.count() > 0:
+        if entity_level:
             if self.finding_aids_entity.description_level == 'L1':
                 return "%s_%04d_%04d" % (
                     self.finding_aids_entity.archival_unit.reference_code.replace(" ", "_").replace("-", "_"),
@@ -114,7 +132,7 @@ class DigitalVersionIdentifierGenerator:
                 )
 
         # Container-level digitization fallback
-        if self.finding_aids_entity.container.digital_versions.count() > 0:
+        if container_level:
             if self.finding_aids_entity.container.barcode:
                 return self.finding_aids_entity.container.barcode
             return "%s_%04d" % (
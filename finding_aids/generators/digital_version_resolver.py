@@ -0,0 +1,95 @@
+from django.db.models import Count, Q
+
+from digitization.models import DigitalVersion
+from finding_aids.generators.digital_version_identifier_generator import DigitalVersionIdentifierGenerator
+
+
+class DigitalVersionResolver:
+    """
+    Resolves digital-version state for many finding aids entities at once.
+
+    DigitalVersionIdentifierGenerator answers the same questions for a single
+    entity, but every answer costs one or more COUNT queries. The resolver
+    collects the state for a whole batch of entities (and their containers)
+    with two aggregated queries:
+        - DigitalVersion counts grouped by finding_aids_entity
+        - DigitalVersion counts grouped by container
+
+    Results are memoized per resolver instance, so one resolver should live
+    for the duration of an indexer run (or a request).
+
+    The info dictionary returned for every entity contains:
+        - digital_version_exists: entity or container has DigitalVersion records
+        - digital_version_online: entity or container has online DigitalVersion records
+        - digital_version_barcode: identifier as produced by DigitalVersionIdentifierGenerator
+        - entity_digital_version_exists: entity has DigitalVersion records
+        - entity_digital_version_online: entity has online DigitalVersion records
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    def resolve(self, finding_aids_entities):
+        """
+        Resolves and memoizes the digital-version state of the given entities.
+
+        Entities already resolved by this instance are not queried again.
+
+        Args:
+            finding_aids_entities: Iterable of FindingAidsEntity instances
+                (archival_unit and container should be select_related).
+
+        Returns:
+            dict: entity id -> info dictionary.
+        """
+        finding_aids_entities = [fa for fa in finding_aids_entities if fa.id not in self._cache]
+        if finding_aids_entities:
+            entity_counts = self._count_by(
+                'finding_aids_entity_id', [fa.id for fa in finding_aids_entities]
+            )
+            container_counts = self._count_by(
+                'container_id', {fa.container_id for fa in finding_aids_entities if fa.container_id}
+            )
+            for fa in finding_aids_entities:
+                self._cache[fa.id] = self._build_info(
+                    fa,
+                    entity_counts.get(fa.id, (0, 0)),
+                    container_counts.get(fa.container_id, (0, 0))
+                )
+        return self._cache
+
+    def get(self, finding_aids_entity):
+        """
+        Returns the info dictionary for one entity, resolving it when needed.
+        """
+        if finding_aids_entity.id not in self._cache:
+            self.resolve([finding_aids_entity])
+        return self._cache[finding_aids_entity.id]
+
+    def _count_by(self, field, ids):
+        """
+        Returns {<field value>: (total, online)} for DigitalVersion records.
+        """
+        if not ids:
+            return {}
+        qs = DigitalVersion.objects.filter(**{'%s__in' % field: ids})\
+            .order_by()\
+            .values(field)\
+            .annotate(total=Count('id'), online=Count('id', filter=Q(available_online=True)))
+        return {row[field]: (row['total'], row['online']) for row in qs}
+
+    def _build_info(self, finding_aids_entity, entity_counts, container_counts):
+        entity_total, entity_online = entity_counts
+        container_total, container_online = container_counts
+
+        entity_level = entity_total > 0
+        container_level = not entity_level and container_total > 0
+        generator = DigitalVersionIdentifierGenerator(finding_aids_entity)
+
+        return {
+            'digital_version_exists': entity_level or container_total > 0,
+            'digital_version_online': entity_online > 0 or container_online > 0,
+            'digital_version_barcode': generator.format_identifier(entity_level, container_level),
+            'entity_digital_version_exists': entity_level,
+            'entity_digital_version_online': entity_online > 0,
+        }
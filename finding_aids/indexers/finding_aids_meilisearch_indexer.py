@@ -1,16 +1,8 @@
-import urllib
-
-import meilisearch
-import pysolr
-from clockwork_api.http import get
-from django.conf import settings
 from django.utils.html import strip_tags
 from hashids import Hashids
-from langdetect import detect, LangDetectException
-from requests.auth import HTTPBasicAuth
 
-from digitization.models import DigitalVersion
-from finding_aids.generators.digital_version_identifier_generator import DigitalVersionIdentifierGenerator
+from clockwork_api.services import meilisearch_sync
+from finding_aids.generators.digital_version_resolver import DigitalVersionResolver
 from finding_aids.models import FindingAidsEntity
 
 
@@ -19,23 +11,71 @@ class FindingMeilisearchIndexer:
     Class to index Finding Aids records to Solr for the catalog.
     """
 
-    def __init__(self, finding_aids_entity_id):
-        self.finding_aids_entity_id = finding_aids_entity_id
-        self.finding_aids_entity = self._get_finding_aids_record(finding_aids_entity_id)
+    def __init__(self, finding_aids_entity_id=None, digital_version_resolver=None, finding_aids_entity=None):
+        self.finding_aids_entity_id = finding_aids_entity_id or finding_aids_entity.id
+        self.finding_aids_entity = finding_aids_entity or self._get_finding_aids_record(finding_aids_entity_id)
+        self.digital_version_resolver = digital_version_resolver or DigitalVersionResolver()
         self.hashids = Hashids(salt="osacontent", min_length=10)
 
-        self.meilisearch_url = getattr(settings, "MEILISEARCH_URL", "")
-        self.meilisearch_api_key = getattr(settings, "MEILISEARCH_API_KEY", "")
-        self.meilisearch_index = getattr(settings, "MEILISEARCH_INDEX", "meilisearch")
-
-        self.client = meilisearch.Client(self.meilisearch_url, self.meilisearch_api_key)
-        self.meilisearch_index = self.client.index(self.meilisearch_index)
+        self.meilisearch_index = meilisearch_sync.get_index(self.get_index_name())
         self.locales = ['en', 'hu', 'ru', 'pl']
         self.doc = {}
 
-    def index(self):
+    @staticmethod
+    def get_index_name():
+        return meilisearch_sync.get_index_name(meilisearch_sync.FINDING_AIDS_INDEX)
+
+    @classmethod
+    def sync(cls, finding_aids_entity_ids, chunk_size=None, digital_version_resolver=None, wait=False):
+        """
+        Indexes many finding aids entities in Meilisearch.
+
+        Documents are built chunk by chunk (one query and one digital version
+        lookup per chunk) and streamed to Meilisearch, one indexing task per chunk.
+        Ids of deleted entities are skipped.
+
+        Args:
+            finding_aids_entity_ids: iterable of finding aids entity ids.
+            chunk_size: documents per Meilisearch request (MEILISEARCH_SYNC_CHUNK_SIZE).
+            digital_version_resolver: shared resolver, a new one is created if missing.
+            wait: poll Meilisearch until the enqueued tasks are finished.
+
+        Returns:
+            dict: number of documents sent, the enqueued task uids and the failed tasks.
+        """
+        resolver = digital_version_resolver or DigitalVersionResolver()
+        chunk_size = meilisearch_sync.get_chunk_size(chunk_size)
+        result = {'documents': 0, 'task_uids': [], 'failed': []}
+
+        def documents():
+            for ids in meilisearch_sync.chunked(finding_aids_entity_ids, chunk_size):
+                entities = list(cls.get_queryset().filter(pk__in=ids))
+                resolver.resolve(entities)
+                for entity in entities:
+                    result['documents'] += 1
+                    yield cls(finding_aids_entity=entity, digital_version_resolver=resolver).create_document()
+
+        result['task_uids'] = meilisearch_sync.add_documents(documents(), cls.get_index_name(), chunk_size=chunk_size)
+        if wait:
+            result['failed'] = meilisearch_sync.wait_for_tasks(result['task_uids'])
+        return result
+
+    @staticmethod
+    def get_queryset():
+        qs = FindingAidsEntity.objects.all()
+        qs = qs.select_related('archival_unit')
+        qs = qs.select_related('container')
+        qs = qs.select_related('original_locale')
+        qs = qs.select_related('primary_type')
+        return qs
+
+    def create_document(self):
         self._index_record()
         self._remove_duplicates()
+        return self.doc
+
+    def index(self):
+        self.create_document()
         try:
             self.meilisearch_index.add_documents([self.doc])
         except Exception as e:
@@ -45,12 +85,7 @@ class FindingMeilisearchIndexer:
         self.meilisearch_index.delete_document(document_id=self._get_meilisearch_id())
 
     def _get_finding_aids_record(self, finding_aids_entity_id):
-        qs = FindingAidsEntity.objects.filter(pk=finding_aids_entity_id)
-        qs = qs.select_related('archival_unit')
-        qs = qs.select_related('container')
-        qs = qs.select_related('original_locale')
-        qs = qs.select_related('primary_type')
-        return qs.get()
+        return self.get_queryset().get(pk=finding_aids_entity_id)
 
     def _index_record(self):
         self.doc['id'] = self._get_meilisearch_id()
@@ -75,6 +110,12 @@ class FindingMeilisearchIndexer:
         if self.finding_aids_entity.contents_summary_original:
             self.doc['contents_summary_original'] = strip_tags(self.finding_aids_entity.contents_summary_original)
 
+        # Digital Version related fields
+        digital_version_info = self.digital_version_resolver.get(self.finding_aids_entity)
+        self.doc['digital_version_exists'] = digital_version_info['digital_version_exists']
+        self.doc['digital_version_online'] = digital_version_info['digital_version_online']
+        self.doc['digital_version_identifier'] = digital_version_info['digital_version_barcode']
+
     def _get_meilisearch_id(self):
         if self.finding_aids_entity.catalog_id:
             return self.finding_aids_entity.catalog_id
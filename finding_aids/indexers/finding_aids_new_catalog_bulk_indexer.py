@@ -0,0 +1,185 @@
+import time
+
+from clockwork_api.http import Session
+from django.conf import settings
+from requests.auth import HTTPBasicAuth
+
+from digitization.services.iiif_image_info import get_finding_aids_image_id, refresh_image_info
+from finding_aids.generators.digital_version_resolver import DigitalVersionResolver
+from finding_aids.indexers.finding_aids_new_catalog_indexer import FindingAidsNewCatalogIndexer
+from finding_aids.models import FindingAidsEntity
+
+
+class FindingAidsNewCatalogBulkIndexer:
+    """
+    Indexes Finding Aids entities into the Solr "catalog" core in batches.
+
+    Responsibilities:
+        - load entities series by series, one prefetch plan per batch
+        - resolve digital-version state per batch with one shared DigitalVersionResolver
+        - load cached IIIF info.json payloads per batch (missing ones are fetched concurrently)
+        - build documents with FindingAidsNewCatalogIndexer, so the output is
+          identical to the per-record path
+        - send every batch as a single multi-document JSON update
+        - delete unpublished records with one batched delete per batch
+        - commit once at the end (optionally soft commit every N documents)
+        - report per-batch throughput
+
+    Usage:
+        indexer = FindingAidsNewCatalogBulkIndexer()
+        indexer.index_archival_unit(series)
+        indexer.commit()
+    """
+
+    def __init__(self, batch_size=None, soft_commit_interval=None, solr_core=None):
+        """
+        Initializes the bulk indexer and a pooled HTTP session to Solr.
+
+        Args:
+            batch_size: Number of entities loaded and sent to Solr per request.
+                Defaults to SOLR_INDEX_BATCH_SIZE (500).
+            soft_commit_interval: When set, a soft commit is issued after every
+                N indexed documents. Defaults to SOLR_SOFT_COMMIT_INTERVAL (None,
+                meaning a single hard commit at the end).
+            solr_core: Core (or collection) to write into, e.g. a shadow core
+                being rebuilt. Defaults to SOLR_CORE_CATALOG_NEW.
+        """
+        self.batch_size = batch_size or getattr(settings, "SOLR_INDEX_BATCH_SIZE", 500)
+        self.soft_commit_interval = soft_commit_interval or getattr(settings, "SOLR_SOFT_COMMIT_INTERVAL", None)
+        self.solr_core = solr_core or getattr(settings, "SOLR_CORE_CATALOG_NEW", "catalog")
+        self.solr_url = "%s/%s" % (getattr(settings, "SOLR_URL", "http://localhost:8983/solr"), self.solr_core)
+        self.session = Session()
+        self.session.auth = HTTPBasicAuth(
+            getattr(settings, "SOLR_USERNAME", None), getattr(settings, "SOLR_PASSWORD", None)
+        )
+        self.digital_version_resolver = DigitalVersionResolver()
+        self.batch_number = 0
+        self.indexed = 0
+        self.deleted = 0
+        self.errors = 0
+        self._since_soft_commit = 0
+
+    def index_archival_unit(self, archival_unit):
+        """
+        Indexes every non-template entity belonging to a series.
+
+        Args:
+            archival_unit: ArchivalUnit (series) whose entities should be indexed.
+        """
+        ids = FindingAidsEntity.objects.filter(archival_unit=archival_unit, is_template=False)\
+            .order_by('id')\
+            .values_list('id', flat=True)
+        self.index_ids(list(ids))
+
+    def index_ids(self, finding_aids_entity_ids):
+        """
+        Indexes the given entities in chunks of `batch_size`.
+
+        Args:
+            finding_aids_entity_ids: List of FindingAidsEntity primary keys.
+
+        Returns:
+            list: ids of the batches Solr did not accept.
+        """
+        failed_ids = []
+        for start in range(0, len(finding_aids_entity_ids), self.batch_size):
+            batch = finding_aids_entity_ids[start:start + self.batch_size]
+            if not self.index_batch(batch):
+                failed_ids += batch
+        return failed_ids
+
+    def index_batch(self, finding_aids_entity_ids):
+        """
+        Builds and sends one batch of documents to Solr.
+
+        Published entities are added (if the parent ISAD is published) with one
+        multi-document update, unpublished entities are removed with one delete-by-id update.
+
+        Returns:
+            bool: True if Solr accepted every update of the batch.
+        """
+        started = time.monotonic()
+        docs, delete_ids = self.build_batch(finding_aids_entity_ids)
+        accepted = True
+
+        self.batch_number += 1
+        if docs:
+            r = self.session.post("%s/update" % self.solr_url, json=docs)
+            if self._check_response(r, len(docs)):
+                self.indexed += len(docs)
+            else:
+                accepted = False
+        if delete_ids:
+            r = self.session.post("%s/update" % self.solr_url, json={"delete": delete_ids})
+            if self._check_response(r, len(delete_ids)):
+                self.deleted += len(delete_ids)
+            else:
+                accepted = False
+
+        elapsed = time.monotonic() - started
+        rate = len(docs) / elapsed if elapsed > 0 else 0
+        print('Batch %s: %s documents, %s deletes in %.2fs (%.1f docs/s)' % (
+            self.batch_number, len(docs), len(delete_ids), elapsed, rate
+        ))
+
+        if self.soft_commit_interval:
+            self._since_soft_commit += len(docs)
+            if self._since_soft_commit >= self.soft_commit_interval:
+                self.soft_commit()
+        return accepted
+
+    def build_batch(self, finding_aids_entity_ids):
+        """
+        Loads a batch of entities with the shared prefetch plan and builds their documents.
+
+        Returns:
+            tuple: (list of Solr documents, list of Solr ids to delete)
+        """
+        docs = []
+        delete_ids = []
+        qs = FindingAidsNewCatalogIndexer.get_queryset().filter(pk__in=finding_aids_entity_ids).order_by('id')
+        finding_aids_entities = list(qs)
+        self.digital_version_resolver.resolve(finding_aids_entities)
+        image_info = refresh_image_info([
+            get_finding_aids_image_id(fa) for fa in finding_aids_entities
+            if fa.published and fa.primary_type.type == 'Still Image'
+        ])
+
+        for finding_aids_entity in finding_aids_entities:
+            indexer = FindingAidsNewCatalogIndexer(
+                finding_aids_entity=finding_aids_entity,
+                digital_version_resolver=self.digital_version_resolver,
+                image_info=image_info
+            )
+            if finding_aids_entity.published:
+                if indexer.is_indexable():
+                    indexer.create_solr_document()
+                    docs.append(indexer.get_solr_document())
+            else:
+                delete_ids.append(indexer._get_solr_id())
+        return docs, delete_ids
+
+    def soft_commit(self):
+        """
+        Issues a soft commit to make the documents sent so far searchable.
+        """
+        self.session.post("%s/update" % self.solr_url, params={'softCommit': 'true'}, json={})
+        self._since_soft_commit = 0
+
+    def commit(self):
+        """
+        Issues a hard commit and prints a summary of the run.
+        """
+        r = self.session.post("%s/update" % self.solr_url, params={'commit': 'true'}, json={})
+        print(r.text)
+        print('Indexed: %s, deleted: %s, errors: %s' % (self.indexed, self.deleted, self.errors))
+
+    def _check_response(self, response, count):
+        """
+        Returns True on a successful update, otherwise records the failed documents.
+        """
+        if response.status_code == 200:
+            return True
+        self.errors += count
+        print('Error with batch %s: %s' % (self.batch_number, response.text))
+        return False
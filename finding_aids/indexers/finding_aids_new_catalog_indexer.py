@@ -1,14 +1,13 @@
-import urllib
-
 import pysolr
-from clockwork_api.http import get, post
+from clockwork_api.http import post
+from clockwork_api.services.language_detection import get_detected_locale
 from django.conf import settings
 from hashids import Hashids
-from langdetect import detect, LangDetectException
 from requests.auth import HTTPBasicAuth
 
 from digitization.models import DigitalVersion
-from finding_aids.generators.digital_version_identifier_generator import DigitalVersionIdentifierGenerator
+from digitization.services.iiif_image_info import get_finding_aids_image_id, get_image_info
+from finding_aids.generators.digital_version_resolver import DigitalVersionResolver
 from finding_aids.models import FindingAidsEntity
 
 
@@ -30,19 +29,32 @@ class FindingAidsNewCatalogIndexer:
     The resulting Solr document is stored in `self.doc`.
     """
 
-    def __init__(self, finding_aids_entity_id):
+    def __init__(self, finding_aids_entity_id=None, finding_aids_entity=None, digital_version_resolver=None,
+                 image_info=None):
         """
         Initializes the indexer and prepares Solr connectivity.
 
         Args:
             finding_aids_entity_id: Primary key of the FindingAidsEntity to index.
+            finding_aids_entity: Optional FindingAidsEntity already loaded through
+                `get_queryset()`. Used by the bulk indexer to skip the per-record lookup.
+            digital_version_resolver: Optional DigitalVersionResolver shared across an
+                indexer run. A new resolver is created when omitted.
+            image_info: Optional {image_id: IIIFImageInfo} dictionary preloaded by the
+                bulk indexer. Missing images are read from the cache table.
 
         Side effects:
             - loads the FindingAidsEntity with related objects needed for indexing
             - prepares a pysolr client using SOLR_URL and SOLR_CORE_CATALOG_NEW settings
         """
-        self.finding_aids_entity_id = finding_aids_entity_id
-        self.finding_aids_entity = self._get_finding_aids_record(finding_aids_entity_id)
+        if finding_aids_entity is not None:
+            self.finding_aids_entity_id = finding_aids_entity.id
+            self.finding_aids_entity = finding_aids_entity
+        else:
+            self.finding_aids_entity_id = finding_aids_entity_id
+            self.finding_aids_entity = self._get_finding_aids_record(finding_aids_entity_id)
+        self.digital_version_resolver = digital_version_resolver or DigitalVersionResolver()
+        self.image_info = image_info or {}
         self.hashids = Hashids(salt="osacontent", min_length=10)
         self.solr_core = getattr(settings, "SOLR_CORE_CATALOG_NEW", "catalog")
         self.solr_url = "%s/%s" % (getattr(settings, "SOLR_URL", "http://localhost:8983/solr"), self.solr_core)
@@ -71,7 +83,7 @@ class FindingAidsNewCatalogIndexer:
             - adds it to Solr (without committing)
         """
         if hasattr(self.finding_aids_entity.archival_unit, 'isad'):
-            if self.finding_aids_entity.archival_unit.isad.published:
+            if self.is_indexable():
                 self.create_solr_document()
                 try:
                     self.solr.add([self.doc])
@@ -89,16 +101,23 @@ class FindingAidsNewCatalogIndexer:
 
         Indexing is guarded by the same publication rules as `index()`.
         """
+        if self.is_indexable():
+            self.create_solr_document()
+            r = post("%s/update/json/docs/" % self.solr_url, json=self.doc, auth=HTTPBasicAuth(
+                getattr(settings, "SOLR_USERNAME"), getattr(settings, "SOLR_PASSWORD")
+            ))
+            if r.status_code == 200:
+                print('Record successfully indexed: %s' % self.finding_aids_entity.archival_reference_code)
+            else:
+                print('Error with indexing %s: %s' % (self.finding_aids_entity.archival_reference_code, r.text))
+
+    def is_indexable(self):
+        """
+        Returns True when the parent ISAD record exists and is published.
+        """
         if hasattr(self.finding_aids_entity.archival_unit, 'isad'):
-            if self.finding_aids_entity.archival_unit.isad.published:
-                self.create_solr_document()
-                r = post("%s/update/json/docs/" % self.solr_url, json=self.doc, auth=HTTPBasicAuth(
-                    getattr(settings, "SOLR_USERNAME"), getattr(settings, "SOLR_PASSWORD")
-                ))
-                if r.status_code == 200:
-                    print('Record successfully indexed: %s' % self.finding_aids_entity.archival_reference_code)
-                else:
-                    print('Error with indexing %s: %s' % (self.finding_aids_entity.archival_reference_code, r.text))
+            return self.finding_aids_entity.archival_unit.isad.published
+        return False
 
     def commit(self):
         """
@@ -118,18 +137,25 @@ class FindingAidsNewCatalogIndexer:
         """
         self.solr.delete(id=self._get_solr_id(), commit=True)
 
-    def _get_finding_aids_record(self, finding_aids_entity_id):
+    @staticmethod
+    def get_queryset():
         """
-        Loads a FindingAidsEntity with related objects needed for indexing.
+        Returns a FindingAidsEntity queryset with every relation used for indexing.
 
         Uses select_related/prefetch_related to reduce query count when building
-        facets and search fields.
+        facets and search fields. The single-record and the bulk indexing paths share
+        this queryset, so both build their documents from the same data.
         """
-        qs = FindingAidsEntity.objects.filter(pk=finding_aids_entity_id)
+        qs = FindingAidsEntity.objects.all()
         qs = qs.select_related('archival_unit')
+        qs = qs.select_related('archival_unit__isad')
+        qs = qs.select_related('archival_unit__parent__parent')
         qs = qs.select_related('container')
+        qs = qs.select_related('container__carrier_type')
         qs = qs.select_related('original_locale')
         qs = qs.select_related('primary_type')
+        qs = qs.select_related('access_rights')
+        qs = qs.prefetch_related('archival_unit__theme')
         qs = qs.prefetch_related('genre')
         qs = qs.prefetch_related('spatial_coverage_country')
         qs = qs.prefetch_related('spatial_coverage_place')
@@ -137,7 +163,19 @@ class FindingAidsNewCatalogIndexer:
         qs = qs.prefetch_related('subject_corporation')
         qs = qs.prefetch_related('subject_heading')
         qs = qs.prefetch_related('subject_keyword')
-        return qs.get()
+        qs = qs.prefetch_related('findingaidsentitysubject_set')
+        qs = qs.prefetch_related('findingaidsentitydate_set__date_type')
+        qs = qs.prefetch_related('findingaidsentitylanguage_set__language')
+        qs = qs.prefetch_related('findingaidsentitylanguage_set__language_usage')
+        qs = qs.prefetch_related('findingaidsentityassociatedperson_set__associated_person')
+        qs = qs.prefetch_related('findingaidsentityassociatedcorporation_set__associated_corporation')
+        return qs
+
+    def _get_finding_aids_record(self, finding_aids_entity_id):
+        """
+        Loads a FindingAidsEntity with related objects needed for indexing.
+        """
+        return self.get_queryset().get(pk=finding_aids_entity_id)
 
     def create_solr_document(self):
         """
@@ -362,18 +400,14 @@ class FindingAidsNewCatalogIndexer:
         """
         Collects digital-version availability and identifier information.
 
-        Uses DigitalVersionIdentifierGenerator to determine:
+        Uses DigitalVersionResolver to determine:
             - whether a digital version exists
             - whether it is available online
             - the identifier/barcode used in the catalog UI
+
+        The resolver memoizes the result, so repeated calls do not hit the database.
         """
-        did_generator = DigitalVersionIdentifierGenerator(self.finding_aids_entity)
-        val = {
-            'digital_version_exists': did_generator.detect(),
-            'digital_version_online': did_generator.detect_available_online(),
-            'digital_version_barcode': did_generator.generate_identifier()
-        }
-        return val
+        return self.digital_version_resolver.get(self.finding_aids_entity)
 
     def _get_digital_collection(self):
         """
@@ -590,7 +624,8 @@ class FindingAidsNewCatalogIndexer:
             - writes the locale-specific field from the *_original attribute
 
         If no original locale is set:
-            - attempts language detection (langdetect.detect)
+            - uses the language detected from the title (detected once per entity
+              and stored on FindingAidsEntity.detected_locale)
             - writes into <solr_field>_<locale> when locale is supported
             - falls back to <solr_field>_general on detection failure/unsupported locale
         """
@@ -599,46 +634,30 @@ class FindingAidsNewCatalogIndexer:
             self.doc['%s_en' % solr_field] = getattr(self.finding_aids_entity, ams_field)
             self.doc['%s_%s' % (solr_field, locale)] = getattr(self.finding_aids_entity, "%s_original" % ams_field)
         else:
-            try:
-                locale = detect(self.finding_aids_entity.title)
-                if locale in self.locales:
-                    self.doc['%s_%s' % (solr_field, locale)] = getattr(self.finding_aids_entity, ams_field)
-                else:
-                    self.doc['%s_general' % solr_field] = getattr(self.finding_aids_entity, ams_field)
-            except LangDetectException:
+            locale = get_detected_locale(self.finding_aids_entity)
+            if locale in self.locales:
+                self.doc['%s_%s' % (solr_field, locale)] = getattr(self.finding_aids_entity, ams_field)
+            else:
                 self.doc['%s_general' % solr_field] = getattr(self.finding_aids_entity, ams_field)
 
     def _get_digital_version_technical_metadata(self):
         """
-        Fetches technical metadata for still images via IIIF.
+        Returns technical metadata for still images from the local IIIF cache.
 
         For primary type "Still Image", this:
             - constructs an IIIF image id from archival and container/folder identifiers
-            - requests <BASE_IMAGE_URI>/<image_id>/info.json
-            - returns the JSON response text when available
+            - reads the cached <BASE_IMAGE_URI>/<image_id>/info.json payload
+              (IIIFImageInfo); a missing entry is fetched once and stored
 
         Returns:
-            - str containing info.json when successful
-            - None when not available or request fails
+            - str containing info.json when available
+            - None when not available
         """
         if self.finding_aids_entity.primary_type.type == 'Still Image':
-            iiif_url = (getattr(settings, 'BASE_IMAGE_URI', 'http://127.0.0.1:8182/iiif/2/'))
-            archival_unit_ref_code = self.finding_aids_entity.archival_unit.reference_code\
-                .replace(" ", "_")\
-                .replace("-", "_")
-            item_reference_code = "%s_%04d_%04d" % (
-                archival_unit_ref_code,
-                self.finding_aids_entity.container.container_no,
-                self.finding_aids_entity.folder_no
-            )
-            image_id = 'catalog/%s/%s.jpg' % (archival_unit_ref_code, item_reference_code)
-            image_id = urllib.parse.quote_plus(image_id)
-            r = get("%s%s/info.json" % (iiif_url, image_id))
-
-            if r.status_code == 200:
-                return r.text
-            else:
-                return None
+            image_id = get_finding_aids_image_id(self.finding_aids_entity)
+            if image_id in self.image_info:
+                return self.image_info[image_id].info
+            return get_image_info(image_id)
 
     def _remove_duplicates(self):
         """
@@ -0,0 +1,139 @@
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from clockwork_api.http import Session
+from django.conf import settings
+from django.db import connections
+from django.db.models import Count
+from requests.auth import HTTPBasicAuth
+
+from archival_unit.models import ArchivalUnit
+from finding_aids.indexers.finding_aids_new_catalog_bulk_indexer import FindingAidsNewCatalogBulkIndexer
+from finding_aids.models import FindingAidsEntity
+
+
+def _init_worker():
+    """
+    Runs in every worker process: makes it open its own database connection.
+
+    The coordinator closes its connections before forking; an inherited
+    connection is dropped without closing it, because closing would also
+    end the session of the process it was inherited from.
+    """
+    for connection in connections.all():
+        connection.connection = None
+
+
+def index_series_shard(archival_unit_id, batch_size=None, solr_core=None):
+    """
+    Indexes one series in a worker process without committing.
+
+    Every call builds its own bulk indexer, so every worker has its own
+    pooled Solr session and digital version resolver.
+
+    Returns:
+        dict: the series id, per-shard counts, elapsed seconds and the error
+        message if the shard failed.
+    """
+    started = time.monotonic()
+    result = {'archival_unit_id': archival_unit_id, 'indexed': 0, 'deleted': 0, 'errors': 0, 'error': None}
+    try:
+        indexer = FindingAidsNewCatalogBulkIndexer(batch_size=batch_size, solr_core=solr_core)
+        indexer.index_archival_unit(ArchivalUnit.objects.get(pk=archival_unit_id))
+        result.update(indexed=indexer.indexed, deleted=indexer.deleted, errors=indexer.errors)
+    except Exception as e:
+        result['error'] = '%s: %s' % (type(e).__name__, e)
+    result['seconds'] = round(time.monotonic() - started, 2)
+    return result
+
+
+class FindingAidsNewCatalogParallelIndexer:
+    """
+    Indexes Finding Aids entities into the Solr "catalog" core with a pool of processes.
+
+    Work is sharded by series (ArchivalUnit level S). The biggest series are
+    scheduled first, so that a large series started last does not leave the
+    other workers idle at the end of the run. Workers never commit; the
+    coordinator aggregates per-shard counts and failures and commits once.
+
+    Usage:
+        indexer = FindingAidsNewCatalogParallelIndexer(workers=16)
+        indexer.index_all()
+        indexer.commit()
+    """
+
+    def __init__(self, workers=None, batch_size=None, solr_core=None):
+        """
+        Args:
+            workers: Number of worker processes. Defaults to SOLR_INDEX_WORKERS
+                (None, meaning the number of CPUs).
+            batch_size: Passed to every worker's bulk indexer.
+            solr_core: Core (or collection) to write into. Defaults to SOLR_CORE_CATALOG_NEW.
+        """
+        self.workers = workers or getattr(settings, "SOLR_INDEX_WORKERS", None)
+        self.batch_size = batch_size
+        self.solr_core = solr_core or getattr(settings, "SOLR_CORE_CATALOG_NEW", "catalog")
+        self.solr_url = "%s/%s" % (getattr(settings, "SOLR_URL", "http://localhost:8983/solr"), self.solr_core)
+        self.indexed = 0
+        self.deleted = 0
+        self.errors = 0
+        self.failures = []
+
+    @staticmethod
+    def get_shards():
+        """
+        Returns the ids of every series with finding aids, biggest first.
+        """
+        shards = FindingAidsEntity.objects.filter(is_template=False)\
+            .values('archival_unit_id')\
+            .annotate(total=Count('id'))\
+            .order_by('-total', 'archival_unit_id')
+        return [shard['archival_unit_id'] for shard in shards]
+
+    def index_all(self):
+        self.index_archival_units(self.get_shards())
+
+    def index_archival_units(self, archival_unit_ids):
+        """
+        Indexes the given series on the process pool and aggregates the results.
+
+        Args:
+            archival_unit_ids: ids of the series to index, in scheduling order.
+        """
+        # Forked workers must not share the coordinator's database connections.
+        connections.close_all()
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker) as executor:
+            futures = [
+                executor.submit(index_series_shard, archival_unit_id, self.batch_size, self.solr_core)
+                for archival_unit_id in archival_unit_ids
+            ]
+            for done, future in enumerate(as_completed(futures), start=1):
+                self._add_result(future.result())
+                print('Shards: %s/%s, indexed: %s, deleted: %s, errors: %s' % (
+                    done, len(futures), self.indexed, self.deleted, self.errors
+                ))
+
+    def commit(self):
+        """
+        Issues the single hard commit of the run and prints a summary.
+        """
+        session = Session()
+        session.auth = HTTPBasicAuth(getattr(settings, "SOLR_USERNAME", None), getattr(settings, "SOLR_PASSWORD", None))
+        r = session.post(
+            "%s/update" % self.solr_url, params={'commit': 'true'}, json={},
+            timeout=getattr(settings, "SOLR_COMMIT_TIMEOUT", 300)
+        )
+        print(r.text)
+        print('Indexed: %s, deleted: %s, errors: %s, failed shards: %s' % (
+            self.indexed, self.deleted, self.errors, len(self.failures)
+        ))
+        for failure in self.failures:
+            print('Series %s failed: %s' % (failure['archival_unit_id'], failure['error']))
+
+    def _add_result(self, result):
+        self.indexed += result['indexed']
+        self.deleted += result['deleted']
+        self.errors += result['errors']
+        if result['error']:
+            self.failures.append(result)
@@ -0,0 +1,50 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management import BaseCommand
+
+from clockwork_api.services.language_detection import detect_languages
+from finding_aids.models import FindingAidsEntity
+
+
+class Command(BaseCommand):
+    help = "Detect and store the title language of finding aids entities without an original locale."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Re-detect the language even when a detected locale is already stored.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of worker processes (defaults to the number of CPUs).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of records sent to a worker process at once.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        queryset = FindingAidsEntity.objects.filter(original_locale__isnull=True, is_template=False)
+        if not options["force"]:
+            queryset = queryset.filter(detected_locale__isnull=True)
+        values = list(queryset.order_by("id").values_list("id", "title"))
+        chunks = [values[i:i + batch_size] for i in range(0, len(values), batch_size)]
+
+        updated = 0
+        with ProcessPoolExecutor(max_workers=options["workers"]) as executor:
+            for results in executor.map(detect_languages, chunks):
+                FindingAidsEntity.objects.bulk_update(
+                    [FindingAidsEntity(id=pk, detected_locale=locale) for pk, locale in results],
+                    ["detected_locale"],
+                )
+                updated += len(results)
+                self.stdout.write(f"{updated}/{len(values)} records processed")
+
+        self.stdout.write(self.style.SUCCESS(f"Done. Updated={updated}"))
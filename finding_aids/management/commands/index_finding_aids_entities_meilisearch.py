@@ -1,10 +1,8 @@
-import time
-
 from django.core.management import BaseCommand
 
 from archival_unit.models import ArchivalUnit
+from clockwork_api.services import meilisearch_sync
 from finding_aids.indexers.finding_aids_meilisearch_indexer import FindingMeilisearchIndexer
-from finding_aids.indexers.finding_aids_new_catalog_indexer import FindingAidsNewCatalogIndexer
 from finding_aids.models import FindingAidsEntity
 
 
@@ -14,20 +12,22 @@ class Command(BaseCommand):
         parser.add_argument('--subfonds', dest='subfonds', help='Subfonds Number')
         parser.add_argument('--series', dest='series', help='Series Number')
         parser.add_argument('--all', dest='all', help='Index everything.')
+        parser.add_argument('--chunk-size', dest='chunk_size', type=int,
+                            help='Number of documents sent to Meilisearch in one request.')
+        parser.add_argument('--wait', dest='wait', action='store_true',
+                            help='Wait until Meilisearch has processed the enqueued tasks.')
 
     def handle(self, *args, **options):
-        if options['all']:
-            for archival_unit in ArchivalUnit.objects.all():
-                for fa in FindingAidsEntity.objects.filter(archival_unit=archival_unit, is_template=False).iterator():
-                    indexer = FindingMeilisearchIndexer(fa.id)
-                    print("Indexing: %s" % fa.archival_reference_code)
-                    indexer.index()
-        else:
+        finding_aids_entities = FindingAidsEntity.objects.filter(is_template=False)
+        if not options['all']:
             archival_unit = ArchivalUnit.objects.get(fonds=options['fonds'],
                                                      subfonds=options['subfonds'],
                                                      series=options['series'])
-            finding_aids_entities = FindingAidsEntity.objects.filter(archival_unit=archival_unit, is_template=False)
-            for fa in finding_aids_entities.iterator():
-                indexer = FindingMeilisearchIndexer(fa.id)
-                print("Indexing: %s" % fa.archival_reference_code)
-                indexer.index()
\ No newline at end of file
+            finding_aids_entities = finding_aids_entities.filter(archival_unit=archival_unit)
+        ids = finding_aids_entities.order_by('id').values_list('id', flat=True).iterator()
+
+        result = FindingMeilisearchIndexer.sync(ids, chunk_size=options['chunk_size'], wait=options['wait'])
+        print("Sent %s documents in %s Meilisearch tasks." % (result['documents'], len(result['task_uids'])))
+        for task in result['failed']:
+            print("Task %s %s: %s" % (task['uid'], task['status'], task['error']))
+        print("Meilisearch lag: %s" % meilisearch_sync.get_lag(FindingMeilisearchIndexer.get_index_name()))
@@ -1,10 +1,8 @@
-import time
-
 from django.core.management import BaseCommand
 
 from archival_unit.models import ArchivalUnit
-from finding_aids.indexers.finding_aids_new_catalog_indexer import FindingAidsNewCatalogIndexer
-from finding_aids.models import FindingAidsEntity
+from finding_aids.indexers.finding_aids_new_catalog_bulk_indexer import FindingAidsNewCatalogBulkIndexer
+from finding_aids.indexers.finding_aids_new_catalog_parallel_indexer import FindingAidsNewCatalogParallelIndexer
 
 
 class Command(BaseCommand):
@@ -13,47 +11,37 @@ class Command(BaseCommand):
         parser.add_argument('--subfonds', dest='subfonds', help='Subfonds Number')
         parser.add_argument('--series', dest='series', help='Series Number')
         parser.add_argument('--all', dest='all', help='Index everything.')
+        parser.add_argument('--batch-size', dest='batch_size', type=int,
+                            help='Number of records sent to Solr in one update request.')
+        parser.add_argument('--soft-commit-every', dest='soft_commit_every', type=int,
+                            help='Issue a soft commit after every N indexed records.')
+        parser.add_argument('--workers', dest='workers', type=int,
+                            help='Index --all with this many processes, one series at a time per process.')
 
     def handle(self, *args, **options):
+        if options['all'] and options['workers'] and options['workers'] > 1:
+            indexer = FindingAidsNewCatalogParallelIndexer(
+                workers=options['workers'],
+                batch_size=options['batch_size']
+            )
+            indexer.index_all()
+            indexer.commit()
+            return
+
+        indexer = FindingAidsNewCatalogBulkIndexer(
+            batch_size=options['batch_size'],
+            soft_commit_interval=options['soft_commit_every']
+        )
+
         if options['all']:
-            archival_units = ArchivalUnit.objects.filter()
-            counter = 0
+            archival_units = ArchivalUnit.objects.filter(level='S').order_by('fonds', 'subfonds', 'series')
             for archival_unit in archival_units.iterator():
-                for fa in FindingAidsEntity.objects.filter(archival_unit=archival_unit, is_template=False).iterator():
-                    indexer = FindingAidsNewCatalogIndexer(fa.id)
-                    if fa.published:
-                        indexer.index_with_requests()
-
-                        if counter % 500 == 0:
-                            print("Commit changes")
-                            indexer = FindingAidsNewCatalogIndexer(1)
-                            indexer.commit()
-                            time.sleep(3)
-
-                        counter += 1
-                    else:
-                        indexer.delete()
-
+                print("Indexing series: %s" % archival_unit.reference_code)
+                indexer.index_archival_unit(archival_unit)
         else:
             archival_unit = ArchivalUnit.objects.get(fonds=options['fonds'],
                                                      subfonds=options['subfonds'],
                                                      series=options['series'])
-            counter = 0
-            finding_aids_entities = FindingAidsEntity.objects.filter(archival_unit=archival_unit, is_template=False)
-            for fa in finding_aids_entities.iterator():
-                indexer = FindingAidsNewCatalogIndexer(fa.id)
-                if fa.published:
-                    indexer.index_with_requests()
-
-                    if counter % 500 == 0:
-                        print("Commit changes")
-                        indexer = FindingAidsNewCatalogIndexer(1)
-                        indexer.commit()
-                        time.sleep(3)
-
-                    counter += 1
-                else:
-                    indexer.delete()
+            indexer.index_archival_unit(archival_unit)
 
-        indexer = FindingAidsNewCatalogIndexer(1)
-        indexer.commit()
\ No newline at end of file
+        indexer.commit()
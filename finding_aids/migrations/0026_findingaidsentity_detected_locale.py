@@ -0,0 +1,18 @@
+# Generated by Django 4.1.13 on 2026-10-16 23:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finding_aids', '0025_findingaidsentity_ark'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='findingaidsentity',
+            name='detected_locale',
+            field=models.CharField(blank=True, max_length=10, null=True),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.1.13 on 2026-10-17 00:34
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('container', '0013_container_internal_note'),
+        ('archival_unit', '0006_archivalunitstats_counters'),
+        ('finding_aids', '0026_findingaidsentity_detected_locale'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FindingAidsPublicationJob',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('action', models.CharField(choices=[('publish', 'Publish'), ('unpublish', 'Unpublish')], max_length=10)),
+                ('user', models.CharField(blank=True, max_length=100)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('finished', 'Finished'), ('failed', 'Failed')], db_index=True, default='queued', max_length=10)),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('processed', models.PositiveIntegerField(default=0)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('date_created', models.DateTimeField(auto_now_add=True)),
+                ('date_started', models.DateTimeField(blank=True, null=True)),
+                ('date_finished', models.DateTimeField(blank=True, null=True)),
+                ('archival_unit', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='archival_unit.archivalunit')),
+                ('container', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='container.container')),
+            ],
+            options={
+                'db_table': 'finding_aids_publication_jobs',
+                'ordering': ['-date_created'],
+            },
+        ),
+    ]
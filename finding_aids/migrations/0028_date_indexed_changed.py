@@ -0,0 +1,18 @@
+# Generated by Django 4.1.13 on 2026-10-17 01:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finding_aids', '0027_findingaidspublicationjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='findingaidsentity',
+            name='date_indexed_changed',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
@@ -61,6 +61,9 @@ class FindingAidsEntity(CloneMixin, DetectProtectedMixin, models.Model):
     title_given = models.BooleanField(default=False)
     title_original = models.CharField(max_length=300, blank=True, null=True)
 
+    # Language detected from the title (langdetect code, '' if undetectable, None if not yet detected)
+    detected_locale = models.CharField(max_length=10, blank=True, null=True)
+
     date_from = ApproximateDateField(blank=True)
     date_to = ApproximateDateField(blank=True, null=True)
     date_ca_span = models.IntegerField(blank=True, default=0)
@@ -137,6 +140,9 @@ class FindingAidsEntity(CloneMixin, DetectProtectedMixin, models.Model):
     user_updated = models.CharField(max_length=100, blank=True)
     date_updated = models.DateTimeField(blank=True, null=True, db_index=True)
 
+    # Changes made outside of user edits (unpublishing, renumbering) that the search indexes have to pick up.
+    date_indexed_changed = models.DateTimeField(blank=True, null=True, db_index=True)
+
     # Clone fields
     _clone_excluded_fields = ['id', 'uuid', 'legacy_id', 'archival_reference_code', 'old_id', 'catalog_id', 'published']
     _clone_linked_m2m_fields = ['genre', 'spatial_coverage_country', 'spatial_coverage_place',
@@ -190,6 +196,7 @@ class FindingAidsEntity(CloneMixin, DetectProtectedMixin, models.Model):
         self.published = False
         self.user_published = ""
         self.date_published = None
+        self.date_indexed_changed = timezone.now()
         self.save()
 
     def set_confidential(self):
@@ -197,6 +204,7 @@ class FindingAidsEntity(CloneMixin, DetectProtectedMixin, models.Model):
         Marks the entity as confidential.
         """
         self.confidential = True
+        self.date_indexed_changed = timezone.now()
         self.save()
 
     def set_non_confidential(self):
@@ -204,6 +212,7 @@ class FindingAidsEntity(CloneMixin, DetectProtectedMixin, models.Model):
         Removes confidential status.
         """
         self.confidential = False
+        self.date_indexed_changed = timezone.now()
         self.save()
 
     def set_reference_code(self):
@@ -237,6 +246,58 @@ class FindingAidsEntity(CloneMixin, DetectProtectedMixin, models.Model):
             hashids = Hashids(salt="blinkenosa", min_length=10)
             self.catalog_id = hashids.encode(self.id)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remembers the loaded values, so a save can tell what changed without reading the row again.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._saved_values = dict(zip(field_names, values))
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+        self.remember_saved_values(fields)
+
+    def get_saved_values(self):
+        """
+        Returns the field values (by attname) of the entity as they are in the database.
+
+        The values loaded with the entity, or written by its last save, are
+        reused; the row is only read when some fields were deferred or the
+        entity was not loaded from the database. Returns None for a new entity.
+        """
+        if not self.pk:
+            return None
+        saved_values = getattr(self, '_saved_values', {})
+        if len(saved_values) < len(self._meta.concrete_fields):
+            saved_values = type(self).objects.filter(pk=self.pk).values(
+                *[field.attname for field in self._meta.concrete_fields]
+            ).first()
+        return saved_values
+
+    def remember_saved_values(self, update_fields=None):
+        """
+        Stores the values written by a save as the values in the database.
+        """
+        saved_values = dict(getattr(self, '_saved_values', {}))
+        if update_fields is None:
+            fields = self._meta.concrete_fields
+        else:
+            fields = [self._meta.get_field(name) for name in update_fields]
+        for field in fields:
+            if field.attname in self.__dict__:
+                saved_values[field.attname] = self.__dict__[field.attname]
+        self._saved_values = saved_values
+
+    def invalidate_detected_locale(self):
+        """
+        Clears the stored language detection result if the title has changed.
+        """
+        if self.previous_values and self.detected_locale is not None:
+            if self.previous_values['title'] != self.title:
+                self.detected_locale = None
+
     def set_duration(self):
         """
         Computes duration from start and end time fields when available.
@@ -258,9 +319,15 @@ class FindingAidsEntity(CloneMixin, DetectProtectedMixin, models.Model):
             - digital version creation date is populated when applicable
             - duration is computed
             - catalog_id is generated for non-template entities
+            - detected_locale is invalidated when the title changes
+
+        The values in the database before the save are kept in previous_values
+        (None for a new entity) for the post_save handlers comparing them.
         """
+        self.previous_values = self.get_saved_values()
         if not self.date_created:
             self.date_created = timezone.now()
+        self.invalidate_detected_locale()
         self.set_reference_code()
         if self.digital_version_exists and not self.digital_version_creation_date:
             self.digital_version_creation_date = timezone.now().date()
@@ -269,13 +336,17 @@ class FindingAidsEntity(CloneMixin, DetectProtectedMixin, models.Model):
 
         if self._state.adding and needs_catalog_id:
             super(FindingAidsEntity, self).save(**kwargs)
+            self.remember_saved_values(kwargs.get('update_fields'))
+            self.previous_values = self._saved_values
             self.set_catalog_id()
             super(FindingAidsEntity, self).save(update_fields=['catalog_id'])
+            self.remember_saved_values(['catalog_id'])
             return
 
         if needs_catalog_id:
             self.set_catalog_id()
         super(FindingAidsEntity, self).save(**kwargs)
+        self.remember_saved_values(kwargs.get('update_fields'))
 
 
 class FindingAidsEntityAlternativeTitle(models.Model):
@@ -534,3 +605,73 @@ class FindingAidsEntityRelatedMaterial(models.Model):
     class Meta:
         db_table = 'finding_aids_related_materials'
         unique_together = ('id', 'source', 'destination')
+
+
+class FindingAidsPublicationJob(models.Model):
+    """
+    Tracks a background publish or unpublish of every finding aids entity in a container or series.
+
+    Attributes:
+        action (str):
+            'publish' or 'unpublish'.
+
+        container, archival_unit:
+            The container or the series whose entities are (un)published.
+
+        user (str):
+            Username of the user who started the job, stored as ``user_published``.
+
+        status (str):
+            One of STATUS_CHOICES.
+
+        total (int):
+            Number of entities in the job, known once the job has started.
+
+        processed (int):
+            Number of entities fully (un)published, including their ARK.
+
+        error (str | None):
+            The error message of a failed job.
+
+        date_created, date_started, date_finished (datetime):
+            Lifecycle timestamps.
+    """
+    PUBLISH = 'publish'
+    UNPUBLISH = 'unpublish'
+
+    ACTION_CHOICES = [
+        (PUBLISH, 'Publish'),
+        (UNPUBLISH, 'Unpublish'),
+    ]
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    FINISHED = 'finished'
+    FAILED = 'failed'
+
+    STATUS_CHOICES = [
+        (QUEUED, 'Queued'),
+        (RUNNING, 'Running'),
+        (FINISHED, 'Finished'),
+        (FAILED, 'Failed'),
+    ]
+
+    id = models.AutoField(primary_key=True)
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    container = models.ForeignKey('container.Container', blank=True, null=True, on_delete=models.CASCADE)
+    archival_unit = models.ForeignKey('archival_unit.ArchivalUnit', blank=True, null=True, on_delete=models.CASCADE)
+    user = models.CharField(max_length=100, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED, db_index=True)
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True, null=True)
+    date_created = models.DateTimeField(auto_now_add=True)
+    date_started = models.DateTimeField(blank=True, null=True)
+    date_finished = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        db_table = 'finding_aids_publication_jobs'
+        ordering = ['-date_created']
+
+    def __str__(self):
+        return f"{self.action} {self.processed}/{self.total} ({self.status})"
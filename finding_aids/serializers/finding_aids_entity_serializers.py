@@ -11,7 +11,7 @@ from finding_aids.models import FindingAidsEntity, FindingAidsEntityAlternativeT
     FindingAidsEntityCreator, FindingAidsEntityPlaceOfCreation, FindingAidsEntitySubject, \
     FindingAidsEntityAssociatedPerson, FindingAidsEntityAssociatedCorporation, FindingAidsEntityAssociatedCountry, \
     FindingAidsEntityAssociatedPlace, FindingAidsEntityLanguage, FindingAidsEntityExtent, FindingAidsEntityIdentifier, \
-    FindingAidsEntityRelatedMaterial
+    FindingAidsEntityRelatedMaterial, FindingAidsPublicationJob
 
 
 class FindingAidsEntityExtentSerializer(serializers.ModelSerializer):
@@ -179,35 +179,21 @@ class FindingAidsEntityListSerializer(serializers.ModelSerializer):
 
     Intended for list views where only identification and core display fields
     are needed, plus published/confidential/removability flags for UI behavior.
-    """
-
-    digital_versions_masters = serializers.SerializerMethodField()
-    digital_versions_access_copies = serializers.SerializerMethodField()
-    digital_versions_of_container = serializers.SerializerMethodField()
-
-    def get_digital_versions_masters(self, obj):
-        """
-        Returns the count of master digital versions associated with the finding aids record.
-        """
-        if hasattr(obj, 'digital_versions_masters_count'):
-            return obj.digital_versions_masters_count
-        return DigitalVersion.objects.filter(finding_aids_entity=obj, level='M').count()
 
-    def get_digital_versions_access_copies(self, obj):
-        """
-        Returns the count of access copy digital versions associated with the finding aids record.
-        """
-        if hasattr(obj, 'digital_versions_access_copies_count'):
-            return obj.digital_versions_access_copies_count
-        return DigitalVersion.objects.filter(finding_aids_entity=obj, level='A').count()
+    The digital version counts are read from queryset annotations
+    (see FindingAidsList.get_queryset), so listing a container costs the same
+    number of queries whatever its size.
+    """
 
-    def get_digital_versions_of_container(self, obj):
-        """
-        Returns the count of digital versions associated with container entities of the finding aids record.
-        """
-        if hasattr(obj, 'digital_versions_of_container_count'):
-            return obj.digital_versions_of_container_count
-        return DigitalVersion.objects.filter(container=obj.container).count()
+    digital_versions_masters = serializers.IntegerField(
+        source='digital_versions_masters_count', read_only=True
+    )
+    digital_versions_access_copies = serializers.IntegerField(
+        source='digital_versions_access_copies_count', read_only=True
+    )
+    digital_versions_of_container = serializers.IntegerField(
+        source='digital_versions_of_container_count', read_only=True
+    )
 
     class Meta:
         model = FindingAidsEntity
@@ -396,7 +382,7 @@ class FindingAidsEntityWriteSerializer(UserDataSerializerMixin, WritableNestedMo
 
     class Meta:
         model = FindingAidsEntity
-        exclude = ('duration',)
+        exclude = ('duration', 'detected_locale', 'date_indexed_changed')
 
 
 class FindingAidsSelectSerializer(serializers.ModelSerializer):
@@ -410,3 +396,13 @@ class FindingAidsSelectSerializer(serializers.ModelSerializer):
     class Meta:
         model = FindingAidsEntity
         fields = ('id', 'title', 'archival_reference_code', 'description_level', 'level', 'contents_summary')
+
+
+class FindingAidsPublicationJobSerializer(serializers.ModelSerializer):
+    """
+    Read-only serializer exposing the progress of a bulk publication job.
+    """
+
+    class Meta:
+        model = FindingAidsPublicationJob
+        fields = '__all__'
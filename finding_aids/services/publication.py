@@ -0,0 +1,214 @@
+"""
+Bulk publication of the finding aids entities of a container or series.
+
+Publishing entity by entity saves every row (recomputing its reference
+code), mints its ARK over HTTP and queues its reindex one by one. A
+publication job instead:
+    1. (un)publishes every entity with a single UPDATE, setting date_indexed_changed
+       so the search index delta sync sees the change
+    2. refreshes the archival unit statistics and retires the cached
+       catalog responses once for the whole set
+    3. mints the missing ARKs in batches, storing each batch with one
+       bulk update and saving the job progress in between
+    4. marks the entities dirty in the coalescing index queue as soon as
+       they are ready (unpublished, or published with their ARK), one call
+       per batch, so the index flushes pick them up while the job runs
+
+Jobs run in a Celery worker (finding_aids.tasks.run_publication_job); the
+API returns the job id and clients poll its progress. Only one job at a time
+runs for the entities of a series: starting the same action again returns
+the job in progress, starting the other action is refused.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from archival_unit.models import ArchivalUnit
+from archival_unit.services import stats
+from catalog.services import response_cache
+from clockwork_api.services import index_queue
+from clockwork_api.services.ark import create_ark_for_record
+from finding_aids.models import FindingAidsEntity, FindingAidsPublicationJob
+
+logger = logging.getLogger(__name__)
+
+
+class PublicationJobConflict(Exception):
+    """
+    Raised when a job of the other action is in progress for some of the same entities.
+    """
+
+    def __init__(self, job):
+        super().__init__("Publication job %s (%s) is still %s." % (job.id, job.action, job.status))
+        self.job = job
+
+
+def get_batch_size():
+    """
+    Returns the number of ARKs minted between two progress updates.
+    """
+    return getattr(settings, 'PUBLICATION_ARK_BATCH_SIZE', 100)
+
+
+def get_active_job(container=None, archival_unit=None):
+    """
+    Returns the queued or running job overlapping a container or series, or None.
+
+    A container job overlaps the jobs of the container and of its series; a
+    series job overlaps the jobs of the series and of any of its containers.
+    Jobs older than PUBLICATION_JOB_TIMEOUT seconds are considered dead.
+    """
+    if archival_unit:
+        overlapping = Q(archival_unit=archival_unit) | Q(container__archival_unit=archival_unit)
+    else:
+        overlapping = Q(container=container) | Q(archival_unit_id=container.archival_unit_id)
+    timeout = timedelta(seconds=getattr(settings, 'PUBLICATION_JOB_TIMEOUT', 6 * 60 * 60))
+    return FindingAidsPublicationJob.objects.filter(
+        overlapping,
+        status__in=[FindingAidsPublicationJob.QUEUED, FindingAidsPublicationJob.RUNNING],
+        date_created__gte=timezone.now() - timeout,
+    ).first()
+
+
+def start_job(action, user, container=None, archival_unit=None):
+    """
+    Creates a publication job and queues it once the transaction is committed.
+
+    The series row is locked while looking for jobs in progress, so two
+    requests can not start overlapping jobs at the same time.
+
+    Returns:
+        FindingAidsPublicationJob: the queued job, or the job in progress
+        for the same entities and action.
+
+    Raises:
+        PublicationJobConflict: a job of the other action is in progress.
+    """
+    from finding_aids.tasks import run_publication_job
+
+    series_id = archival_unit.id if archival_unit else container.archival_unit_id
+    with transaction.atomic():
+        list(ArchivalUnit.objects.select_for_update().filter(pk=series_id).values_list('id', flat=True))
+        active_job = get_active_job(container=container, archival_unit=archival_unit)
+        if active_job:
+            if active_job.action != action:
+                raise PublicationJobConflict(active_job)
+            return active_job
+
+        job = FindingAidsPublicationJob.objects.create(
+            action=action, container=container, archival_unit=archival_unit, user=user.username
+        )
+        transaction.on_commit(lambda: run_publication_job.delay(job.id))
+    return job
+
+
+def get_entities(job):
+    """
+    Returns the entities of the container or series of a job (templates excluded).
+    """
+    finding_aids_entities = FindingAidsEntity.objects.filter(is_template=False)
+    if job.container_id:
+        return finding_aids_entities.filter(container_id=job.container_id)
+    return finding_aids_entities.filter(archival_unit_id=job.archival_unit_id)
+
+
+def run_job(job):
+    """
+    Runs a publication job, storing its progress on the job.
+    """
+    job.status = FindingAidsPublicationJob.RUNNING
+    job.date_started = timezone.now()
+    job.save(update_fields=['status', 'date_started'])
+
+    try:
+        rows = list(get_entities(job).values('id', 'catalog_id', 'container_id', 'archival_unit_id'))
+        ids = [row['id'] for row in rows]
+        job.total = len(ids)
+        job.save(update_fields=['total'])
+
+        now = timezone.now()
+        with transaction.atomic():
+            if job.action == FindingAidsPublicationJob.PUBLISH:
+                FindingAidsEntity.objects.filter(id__in=ids).update(
+                    published=True, user_published=job.user, date_published=now, date_indexed_changed=now
+                )
+            else:
+                FindingAidsEntity.objects.filter(id__in=ids).update(
+                    published=False, user_published='', date_published=None, date_indexed_changed=now
+                )
+            transaction.on_commit(lambda: notify_changed(rows))
+
+        if job.action == FindingAidsPublicationJob.PUBLISH:
+            mint_arks(job, ids)
+        else:
+            index_queue.mark_dirty(index_queue.FINDING_AIDS, ids)
+            job.processed = job.total
+            job.save(update_fields=['processed'])
+
+        job.status = FindingAidsPublicationJob.FINISHED
+    except Exception as e:
+        logger.exception("Publication job %s failed", job.id)
+        job.status = FindingAidsPublicationJob.FAILED
+        job.error = str(e)
+
+    job.date_finished = timezone.now()
+    job.save(update_fields=['status', 'error', 'date_finished'])
+    return job
+
+
+def notify_changed(rows):
+    """
+    Refreshes the statistics and retires the cached responses depending on the publication of the entities.
+    """
+    archival_unit_ids = {row['archival_unit_id'] for row in rows}
+    stats.refresh_stats(archival_unit_ids)
+    response_cache.invalidate(response_cache.FINDING_AIDS, [row['catalog_id'] for row in rows])
+    response_cache.invalidate(response_cache.CONTAINER, [row['container_id'] for row in rows])
+    response_cache.invalidate_archival_unit_content(archival_unit_ids)
+    response_cache.invalidate(response_cache.PUBLICATIONS, [response_cache.PUBLICATIONS_KEY])
+
+
+def mint_arks(job, ids):
+    """
+    Mints the ARKs of the published entities that have none, one batch at a time.
+
+    Entities the ARK service fails for are left without an ARK, as with
+    FindingAidsEntity.publish. Entities are marked dirty in the index queue
+    batch by batch, once their ARK is stored.
+    """
+    missing = list(
+        FindingAidsEntity.objects.filter(Q(ark__isnull=True) | Q(ark=''), id__in=ids)
+        .only('id', 'catalog_id', 'archival_reference_code', 'ark')
+        .order_by('id')
+    )
+    missing_ids = {finding_aids_entity.id for finding_aids_entity in missing}
+    ready_ids = [pk for pk in ids if pk not in missing_ids]
+    if ready_ids:
+        index_queue.mark_dirty(index_queue.FINDING_AIDS, ready_ids)
+    job.processed = job.total - len(missing)
+    job.save(update_fields=['processed'])
+
+    batch_size = get_batch_size()
+    for start in range(0, len(missing), batch_size):
+        batch = missing[start:start + batch_size]
+        minted = []
+        for finding_aids_entity in batch:
+            finding_aids_entity.ark = create_ark_for_record(
+                record_type='finding_aids',
+                record_id=finding_aids_entity.id,
+                catalog_id=finding_aids_entity.catalog_id,
+                reference_code=finding_aids_entity.archival_reference_code,
+            )
+            if finding_aids_entity.ark:
+                minted.append(finding_aids_entity)
+        FindingAidsEntity.objects.bulk_update(minted, ['ark'])
+        response_cache.invalidate(response_cache.FINDING_AIDS, [fa.catalog_id for fa in minted])
+        index_queue.mark_dirty(index_queue.FINDING_AIDS, [fa.id for fa in batch])
+
+        job.processed += len(batch)
+        job.save(update_fields=['processed'])
+        logger.info("Publication job %s: %s/%s", job.id, job.processed, job.total)
@@ -2,11 +2,10 @@ from django.db.models.signals import post_save, pre_delete
 from django.dispatch import receiver
 from hashids import Hashids
 
+from clockwork_api.services import index_queue
 from finding_aids.models import FindingAidsEntity
 from finding_aids.tasks import (
-    index_catalog_finding_aids_entity,
     index_catalog_finding_aids_entity_remove,
-    index_meilisearch_finding_aids_entity,
     index_meilisearch_finding_aids_entity_remove,
 )
 
@@ -16,20 +15,16 @@ def update_finding_aids_index(sender, instance, **kwargs):
     """
     Updates the search index when a finding aids entity is saved.
 
-    Behavior depends on publication state:
-        - If the entity is published, it is indexed
-        - If the entity is unpublished, it is removed from the index
+    The entity is only marked as dirty in the coalescing index queue.
+    The periodic `flush_finding_aids_index_queue` task then:
+        - indexes published entities in the catalog
+        - removes unpublished entities from the catalog
+        - indexes every saved entity in the internal AMS search index
 
-    Indexing is performed asynchronously via Celery tasks.
+    Repeated saves of the same entity before the next flush collapse into
+    a single reindex.
     """
-    if instance.published:
-        index_catalog_finding_aids_entity.delay(finding_aids_entity_id=instance.id)
-    else:
-        index_catalog_finding_aids_entity_remove.delay(finding_aids_entity_id=instance.id)
-
-    # Internal AMS search index should always contain saved records,
-    # regardless of publication status.
-    index_meilisearch_finding_aids_entity.delay(finding_aids_entity_id=instance.id)
+    index_queue.mark_dirty(index_queue.FINDING_AIDS, [instance.id])
 
 
 @receiver(pre_delete, sender=FindingAidsEntity)
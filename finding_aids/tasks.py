@@ -1,10 +1,12 @@
 # Create your tasks here
-import meilisearch
 from celery import shared_task
-from django.conf import settings
 
+from clockwork_api.services import index_queue
 from finding_aids.indexers.finding_aids_meilisearch_indexer import FindingMeilisearchIndexer
+from finding_aids.indexers.finding_aids_new_catalog_bulk_indexer import FindingAidsNewCatalogBulkIndexer
 from finding_aids.indexers.finding_aids_new_catalog_indexer import FindingAidsNewCatalogIndexer
+from finding_aids.models import FindingAidsPublicationJob
+from finding_aids.services import publication
 
 
 @shared_task
@@ -42,14 +44,6 @@ def index_catalog_finding_aids_entity_remove(finding_aids_entity_id):
     indexer.delete()
 
 
-def _get_meilisearch_index():
-    meilisearch_url = getattr(settings, 'MEILISEARCH_URL', '')
-    meilisearch_api_key = getattr(settings, 'MEILISEARCH_API_KEY', '')
-    index_name = getattr(settings, 'MEILISEARCH_INDEX', 'catalog')
-    client = meilisearch.Client(meilisearch_url, meilisearch_api_key)
-    return client.index(index_name)
-
-
 @shared_task
 def index_meilisearch_finding_aids_entity(finding_aids_entity_id):
     """
@@ -65,4 +59,75 @@ def index_meilisearch_finding_aids_entity_remove(finding_aids_entity_id):
     Removes a finding aids entity in Meilisearch.
     """
     indexer = FindingMeilisearchIndexer(finding_aids_entity_id)
-    indexer.delete()
\ No newline at end of file
+    indexer.delete()
+
+
+@shared_task
+def flush_finding_aids_index_queue():
+    """
+    Drains the coalescing finding aids index queue.
+
+    Signal handlers only mark finding aids entities as dirty (see
+    clockwork_api.services.index_queue). This periodic task:
+        1. Pops the dirty ids in batches
+        2. Indexes / removes them in Solr with batched updates
+        3. Streams them to Meilisearch through the batched sync API
+        4. Issues a single Solr commit at the end of the flush
+        5. Marks the ids of failed batches as dirty again, so the next flush retries them
+
+    Returns:
+        int: number of finding aids entities processed.
+    """
+    remaining = index_queue.pending(index_queue.FINDING_AIDS)
+    processed = 0
+    failed_ids = []
+    solr_indexer = None
+
+    while processed < remaining:
+        ids = index_queue.pop_dirty(index_queue.FINDING_AIDS)
+        if not ids:
+            break
+        if solr_indexer is None:
+            solr_indexer = FindingAidsNewCatalogBulkIndexer()
+        try:
+            solr_failed_ids = solr_indexer.index_ids(ids)
+            meilisearch_indexed = _index_meilisearch_batch(ids, solr_indexer.digital_version_resolver)
+        except Exception as e:
+            print('Error with Finding Aids index queue batch! Error: %s' % e)
+            failed_ids += ids
+        else:
+            failed_ids += solr_failed_ids if meilisearch_indexed else ids
+        processed += len(ids)
+
+    index_queue.mark_dirty(index_queue.FINDING_AIDS, failed_ids)
+    if solr_indexer:
+        solr_indexer.commit()
+    return processed
+
+
+def _index_meilisearch_batch(finding_aids_entity_ids, digital_version_resolver):
+    """
+    Indexes existing finding aids entities in Meilisearch, one request per chunk.
+
+    Returns:
+        bool: False if Meilisearch did not accept the batch.
+    """
+    try:
+        FindingMeilisearchIndexer.sync(finding_aids_entity_ids, digital_version_resolver=digital_version_resolver)
+    except Exception as e:
+        print('Error with Finding Aids Meilisearch batch! Error: %s' % e)
+        return False
+    return True
+
+
+@shared_task
+def run_publication_job(job_id):
+    """
+    Publishes or unpublishes the finding aids entities of a container or series
+    (see finding_aids.services.publication).
+
+    Progress is stored on the FindingAidsPublicationJob.
+    """
+    job = FindingAidsPublicationJob.objects.get(pk=job_id)
+    publication.run_job(job)
+    return job.status
@@ -0,0 +1,80 @@
+from django.test import TestCase
+
+from archival_unit.tests.helpers import make_fonds, make_subfonds, make_series
+from clockwork_api.tests.no_index_signals_mixin import NoIndexSignalsMixin
+from container.tests.helpers import make_container
+from controlled_list.models import AccessRight, CarrierType, PrimaryType
+from digitization.models import DigitalVersion
+from finding_aids.generators.digital_version_identifier_generator import DigitalVersionIdentifierGenerator
+from finding_aids.generators.digital_version_resolver import DigitalVersionResolver
+from finding_aids.models import FindingAidsEntity
+from finding_aids.tests.helpers import make_finding_aids
+
+
+class DigitalVersionResolverTests(NoIndexSignalsMixin, TestCase):
+    fixtures = ['carrier_types', 'primary_types', 'access_rights']
+
+    def setUp(self):
+        super().setUp()
+        series = make_series(make_subfonds(make_fonds()))
+        carrier_type = CarrierType.objects.first()
+        primary_type = PrimaryType.objects.first()
+        access_rights = AccessRight.objects.first()
+
+        container = make_container(series, carrier_type)
+        digitized_container = make_container(series, carrier_type, container_no=2, barcode='HU_OSA_BARCODE')
+
+        self.folder = make_finding_aids(container, primary_type, access_rights, folder_no=1)
+        self.item = make_finding_aids(
+            container, primary_type, access_rights, folder_no=2, sequence_no=3, description_level='L2', level='I'
+        )
+        self.plain = make_finding_aids(container, primary_type, access_rights, folder_no=3)
+        self.in_digitized_container = make_finding_aids(digitized_container, primary_type, access_rights, folder_no=1)
+
+        DigitalVersion.objects.create(finding_aids_entity=self.folder, available_online=True)
+        DigitalVersion.objects.create(finding_aids_entity=self.item)
+        DigitalVersion.objects.create(container=digitized_container, available_online=True)
+
+    def _entities(self):
+        return list(FindingAidsEntity.objects.select_related('archival_unit', 'container').order_by('id'))
+
+    def test_matches_identifier_generator(self):
+        resolver = DigitalVersionResolver()
+        for fa in self._entities():
+            generator = DigitalVersionIdentifierGenerator(fa)
+            info = resolver.get(fa)
+            self.assertEqual(info['digital_version_exists'], generator.detect())
+            self.assertEqual(info['digital_version_online'], generator.detect_available_online())
+            self.assertEqual(info['digital_version_barcode'], generator.generate_identifier())
+
+    def test_entity_and_container_levels(self):
+        resolver = DigitalVersionResolver()
+        resolver.resolve(self._entities())
+
+        folder = resolver.get(self.folder)
+        self.assertEqual(folder['digital_version_barcode'], 'HU_OSA_206_3_1_0001_0001')
+        self.assertTrue(folder['entity_digital_version_online'])
+
+        item = resolver.get(self.item)
+        self.assertEqual(item['digital_version_barcode'], 'HU_OSA_206_3_1_0001_0002_0003')
+        self.assertFalse(item['digital_version_online'])
+
+        container_level = resolver.get(self.in_digitized_container)
+        self.assertEqual(container_level['digital_version_barcode'], 'HU_OSA_BARCODE')
+        self.assertTrue(container_level['digital_version_online'])
+        self.assertFalse(container_level['entity_digital_version_exists'])
+
+        plain = resolver.get(self.plain)
+        self.assertFalse(plain['digital_version_exists'])
+        self.assertEqual(plain['digital_version_barcode'], '')
+
+    def test_batch_uses_two_queries_and_memoizes(self):
+        entities = self._entities()
+        resolver = DigitalVersionResolver()
+
+        with self.assertNumQueries(2):
+            resolver.resolve(entities)
+
+        with self.assertNumQueries(0):
+            for fa in entities:
+                resolver.get(fa)
@@ -0,0 +1,51 @@
+from unittest.mock import Mock, patch
+
+from django.test import TestCase
+
+from archival_unit.tests.helpers import make_fonds, make_subfonds, make_series
+from clockwork_api.tests.no_index_signals_mixin import NoIndexSignalsMixin
+from container.tests.helpers import make_container
+from controlled_list.models import AccessRight, CarrierType, PrimaryType
+from finding_aids.indexers.finding_aids_meilisearch_indexer import FindingMeilisearchIndexer
+from finding_aids.tests.helpers import make_finding_aids
+
+
+class FindingMeilisearchIndexerSyncTests(NoIndexSignalsMixin, TestCase):
+    fixtures = ['carrier_types', 'primary_types', 'access_rights']
+
+    def setUp(self):
+        super().setUp()
+        series = make_series(make_subfonds(make_fonds()))
+        container = make_container(series, CarrierType.objects.first())
+        self.entities = [
+            make_finding_aids(container, PrimaryType.objects.first(), AccessRight.objects.first(), folder_no=i)
+            for i in range(1, 6)
+        ]
+
+        self.index = Mock()
+        self.index.add_documents.side_effect = lambda docs: Mock(task_uid=self.index.add_documents.call_count)
+        patcher = patch('clockwork_api.services.meilisearch_sync.get_index', return_value=self.index)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_sync_sends_one_request_per_chunk(self):
+        ids = [fa.id for fa in self.entities] + [999999]
+
+        result = FindingMeilisearchIndexer.sync(iter(ids), chunk_size=2)
+
+        self.assertEqual(result['documents'], 5)
+        self.assertEqual(result['task_uids'], [1, 2, 3])
+        sent = [doc['ams_id'] for c in self.index.add_documents.call_args_list for doc in c.args[0]]
+        self.assertEqual(sent, ['finding-aids-%s' % fa.id for fa in self.entities])
+
+    def test_sync_documents_match_single_record_path(self):
+        FindingMeilisearchIndexer.sync([self.entities[0].id])
+
+        expected = FindingMeilisearchIndexer(self.entities[0].id).create_document()
+        self.assertEqual(self.index.add_documents.call_args.args[0], [expected])
+
+    def test_sync_waits_for_tasks(self):
+        with patch('clockwork_api.services.meilisearch_sync.wait_for_tasks', return_value=[]) as wait_for_tasks:
+            result = FindingMeilisearchIndexer.sync([fa.id for fa in self.entities], wait=True)
+
+        wait_for_tasks.assert_called_once_with(result['task_uids'])
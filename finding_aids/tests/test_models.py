@@ -1,5 +1,7 @@
 from django.contrib.auth.models import User
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from hashids import Hashids
 from unittest.mock import patch
 
@@ -140,3 +142,41 @@ class FindingAidsTest(NoIndexSignalsMixin, TestCase):
 
         hashids = Hashids(salt="blinkenosa", min_length=10)
         self.assertEqual(entity.catalog_id, hashids.encode(entity.id))
+
+    def test_title_change_invalidates_detected_locale(self):
+        FindingAidsEntity.objects.filter(pk=self.findings_aids_folder.pk).update(detected_locale='en')
+        entity = FindingAidsEntity.objects.get(pk=self.findings_aids_folder.pk)
+
+        entity.contents_summary = 'Changed summary'
+        entity.save()
+        entity.refresh_from_db()
+        self.assertEqual(entity.detected_locale, 'en')
+
+        entity.title = 'Magyar cím'
+        entity.save()
+        entity.refresh_from_db()
+        self.assertIsNone(entity.detected_locale)
+
+    def test_save_compares_with_the_loaded_values(self):
+        entity = FindingAidsEntity.objects.get(pk=self.findings_aids_folder.pk)
+        entity.title = 'Renamed folder'
+
+        with CaptureQueriesContext(connection) as queries:
+            entity.save()
+
+        entity_selects = [
+            query for query in queries
+            if query['sql'].startswith('SELECT') and 'FROM "finding_aids_entities"' in query['sql']
+        ]
+        self.assertEqual(entity_selects, [])
+        self.assertEqual(entity.previous_values['title'], 'Finding Aids test folder')
+
+        entity.title = 'Renamed again'
+        entity.save()
+        self.assertEqual(entity.previous_values['title'], 'Renamed folder')
+
+    def test_saved_values_of_a_partially_loaded_entity_are_read_from_the_database(self):
+        entity = FindingAidsEntity.objects.only('id', 'title').get(pk=self.findings_aids_folder.pk)
+
+        self.assertEqual(entity.get_saved_values()['folder_no'], 1)
+        self.assertIsNone(FindingAidsEntity(title='New').get_saved_values())
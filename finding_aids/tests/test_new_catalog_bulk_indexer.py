@@ -0,0 +1,86 @@
+from unittest.mock import patch, MagicMock
+
+from django.test import TestCase, override_settings
+
+from archival_unit.tests.helpers import make_fonds, make_subfonds, make_series
+from clockwork_api.tests.no_index_signals_mixin import NoIndexSignalsMixin
+from container.tests.helpers import make_container
+from controlled_list.models import AccessRight, CarrierType, PrimaryType
+from finding_aids.indexers.finding_aids_new_catalog_bulk_indexer import FindingAidsNewCatalogBulkIndexer
+from finding_aids.indexers.finding_aids_new_catalog_indexer import FindingAidsNewCatalogIndexer
+from finding_aids.tests.helpers import make_finding_aids
+from isad.tests.helpers import make_isad
+
+
+@override_settings(SOLR_USERNAME='solr', SOLR_PASSWORD='solr')
+@patch('clockwork_api.services.language_detection.detect', return_value='en')
+class FindingAidsNewCatalogBulkIndexerTests(NoIndexSignalsMixin, TestCase):
+    fixtures = ['carrier_types', 'primary_types', 'access_rights']
+
+    def setUp(self):
+        super().setUp()
+        self.series = make_series(make_subfonds(make_fonds()))
+        make_isad(self.series, published=True)
+        container = make_container(self.series, CarrierType.objects.first())
+        primary_type = PrimaryType.objects.exclude(type='Still Image').first()
+        access_rights = AccessRight.objects.first()
+        self.published = [
+            make_finding_aids(container, primary_type, access_rights, folder_no=i, published=True)
+            for i in range(1, 4)
+        ]
+        self.unpublished = make_finding_aids(container, primary_type, access_rights, folder_no=4, published=False)
+
+    def _make_indexer(self, **kwargs):
+        indexer = FindingAidsNewCatalogBulkIndexer(**kwargs)
+        indexer.session.post = MagicMock(return_value=MagicMock(status_code=200, text='{}'))
+        return indexer
+
+    def _solr_id(self, finding_aids_entity):
+        return FindingAidsNewCatalogIndexer(finding_aids_entity=finding_aids_entity)._get_solr_id()
+
+    def test_documents_match_per_record_path(self, mock_detect):
+        indexer = self._make_indexer()
+        docs, delete_ids = indexer.build_batch([fa.id for fa in self.published] + [self.unpublished.id])
+
+        expected = []
+        for fa in self.published:
+            single = FindingAidsNewCatalogIndexer(fa.id)
+            single.create_solr_document()
+            expected.append(single.get_solr_document())
+
+        self.assertEqual(docs, expected)
+        self.assertEqual(delete_ids, [self._solr_id(self.unpublished)])
+
+    def test_batches_updates_and_commits_once(self, mock_detect):
+        indexer = self._make_indexer(batch_size=2)
+        indexer.index_archival_unit(self.series)
+        indexer.commit()
+
+        calls = indexer.session.post.call_args_list
+        update_calls = [c for c in calls if 'params' not in c.kwargs]
+        commit_calls = [c for c in calls if c.kwargs.get('params') == {'commit': 'true'}]
+
+        # 4 entities / batch size 2: [pub, pub] then [pub, unpublished] -> 2 add requests + 1 delete request
+        self.assertEqual(len(update_calls), 3)
+        self.assertEqual(len(update_calls[0].kwargs['json']), 2)
+        self.assertEqual(update_calls[2].kwargs['json'], {'delete': [self._solr_id(self.unpublished)]})
+        self.assertEqual(len(commit_calls), 1)
+        self.assertEqual(indexer.indexed, 3)
+        self.assertEqual(indexer.deleted, 1)
+
+    def test_soft_commit_interval(self, mock_detect):
+        indexer = self._make_indexer(batch_size=1, soft_commit_interval=2)
+        indexer.index_archival_unit(self.series)
+
+        soft_commits = [
+            c for c in indexer.session.post.call_args_list if c.kwargs.get('params') == {'softCommit': 'true'}
+        ]
+        self.assertEqual(len(soft_commits), 1)
+
+    def test_failed_batch_is_counted_as_error(self, mock_detect):
+        indexer = self._make_indexer()
+        indexer.session.post.return_value = MagicMock(status_code=500, text='error')
+        indexer.index_archival_unit(self.series)
+
+        self.assertEqual(indexer.indexed, 0)
+        self.assertEqual(indexer.errors, 4)
@@ -0,0 +1,82 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from archival_unit.tests.helpers import make_fonds, make_subfonds, make_series
+from clockwork_api.tests.no_index_signals_mixin import NoIndexSignalsMixin
+from container.tests.helpers import make_container
+from controlled_list.models import AccessRight, CarrierType, PrimaryType
+from finding_aids.indexers.finding_aids_new_catalog_parallel_indexer import (
+    FindingAidsNewCatalogParallelIndexer,
+    index_series_shard,
+)
+from finding_aids.tests.helpers import make_finding_aids
+from isad.tests.helpers import make_isad
+
+
+@override_settings(SOLR_USERNAME='solr', SOLR_PASSWORD='solr')
+@patch('clockwork_api.services.language_detection.detect', return_value='en')
+class SeriesShardTests(NoIndexSignalsMixin, TestCase):
+    fixtures = ['carrier_types', 'primary_types', 'access_rights']
+
+    def setUp(self):
+        super().setUp()
+        subfonds = make_subfonds(make_fonds())
+        self.series = []
+        for series_no, folders in ((1, 1), (2, 3)):
+            series = make_series(subfonds, series=series_no)
+            make_isad(series, published=True)
+            container = make_container(series, CarrierType.objects.first())
+            for folder_no in range(1, folders + 1):
+                make_finding_aids(
+                    container, PrimaryType.objects.exclude(type='Still Image').first(), AccessRight.objects.first(),
+                    folder_no=folder_no, published=True
+                )
+            self.series.append(series)
+
+    def test_shards_are_ordered_biggest_first(self, mock_detect):
+        self.assertEqual(FindingAidsNewCatalogParallelIndexer.get_shards(), [self.series[1].id, self.series[0].id])
+
+    @patch('finding_aids.indexers.finding_aids_new_catalog_bulk_indexer.Session')
+    def test_shard_indexes_series_without_committing(self, session_class, mock_detect):
+        session = session_class.return_value
+        session.post.return_value = MagicMock(status_code=200, text='{}')
+
+        result = index_series_shard(self.series[1].id, solr_core='catalog_shadow')
+
+        self.assertEqual((result['indexed'], result['errors'], result['error']), (3, 0, None))
+        urls = [c.args[0] for c in session.post.call_args_list]
+        self.assertTrue(all(url.endswith('/catalog_shadow/update') for url in urls))
+        self.assertFalse(any(c.kwargs.get('params', {}).get('commit') for c in session.post.call_args_list))
+
+    def test_failed_shard_reports_error(self, mock_detect):
+        result = index_series_shard(999999)
+
+        self.assertIn('DoesNotExist', result['error'])
+
+
+@override_settings(SOLR_USERNAME='solr', SOLR_PASSWORD='solr')
+@patch('finding_aids.indexers.finding_aids_new_catalog_parallel_indexer.connections')
+@patch('finding_aids.indexers.finding_aids_new_catalog_parallel_indexer.ProcessPoolExecutor', ThreadPoolExecutor)
+class ParallelCoordinatorTests(SimpleTestCase):
+    @patch('finding_aids.indexers.finding_aids_new_catalog_parallel_indexer.index_series_shard')
+    def test_results_are_aggregated(self, index_series_shard, connections):
+        index_series_shard.side_effect = lambda archival_unit_id, batch_size, solr_core: {
+            'archival_unit_id': archival_unit_id, 'indexed': 10, 'deleted': 1, 'errors': 0,
+            'error': 'boom' if archival_unit_id == 3 else None, 'seconds': 0.1
+        }
+        indexer = FindingAidsNewCatalogParallelIndexer(workers=2)
+
+        indexer.index_archival_units([1, 2, 3])
+
+        self.assertEqual((indexer.indexed, indexer.deleted), (30, 3))
+        self.assertEqual([f['archival_unit_id'] for f in indexer.failures], [3])
+        connections.close_all.assert_called_once()
+
+    @patch('finding_aids.indexers.finding_aids_new_catalog_parallel_indexer.Session')
+    def test_commit_once(self, session_class, connections):
+        FindingAidsNewCatalogParallelIndexer(workers=2).commit()
+
+        session_class.return_value.post.assert_called_once()
+        self.assertEqual(session_class.return_value.post.call_args.kwargs['params'], {'commit': 'true'})
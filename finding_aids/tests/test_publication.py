@@ -0,0 +1,151 @@
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from archival_unit.models import ArchivalUnitStats
+from archival_unit.tests.helpers import make_fonds, make_subfonds, make_series
+from catalog.services import response_cache
+from clockwork_api.tests.no_index_signals_mixin import NoIndexSignalsMixin
+from container.tests.helpers import make_container
+from controlled_list.models import AccessRight, CarrierType, PrimaryType
+from finding_aids.models import FindingAidsEntity, FindingAidsPublicationJob
+from finding_aids.services import publication
+from finding_aids.tests.helpers import make_finding_aids
+
+
+@override_settings(PUBLICATION_ARK_BATCH_SIZE=2)
+@patch('finding_aids.services.publication.index_queue.mark_dirty')
+class FindingAidsPublicationTests(NoIndexSignalsMixin, TestCase):
+    fixtures = ['carrier_types', 'primary_types', 'access_rights']
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.user = User.objects.create_user(username='publisher')
+        self.series = make_series(make_subfonds(make_fonds()))
+        primary_type = PrimaryType.objects.first()
+        access_rights = AccessRight.objects.get(pk=1)
+        self.containers = [
+            make_container(self.series, CarrierType.objects.get(pk=1), container_no=container_no)
+            for container_no in (1, 2)
+        ]
+        self.finding_aids = [
+            make_finding_aids(container, primary_type, access_rights, folder_no=folder_no)
+            for container in self.containers for folder_no in (1, 2, 3)
+        ]
+        self.finding_aids[0].ark = 'ark:/12345/existing'
+        self.finding_aids[0].save()
+        self.template = FindingAidsEntity.objects.create(
+            archival_unit=self.series, is_template=True, template_name='Template', primary_type=primary_type,
+            access_rights=access_rights, title='Template', date_from='2020-01-01'
+        )
+
+    def _run(self, action, **scope):
+        job = FindingAidsPublicationJob.objects.create(action=action, user=self.user.username, **scope)
+        with self.captureOnCommitCallbacks(execute=True):
+            return publication.run_job(job)
+
+    @patch('finding_aids.services.publication.create_ark_for_record')
+    def test_publish_series(self, create_ark, mark_dirty):
+        create_ark.side_effect = lambda record_id, **kwargs: 'ark:/12345/%s' % record_id
+        ids = sorted(fa.id for fa in self.finding_aids)
+
+        job = self._run(FindingAidsPublicationJob.PUBLISH, archival_unit=self.series)
+
+        self.assertEqual(job.status, FindingAidsPublicationJob.FINISHED)
+        self.assertEqual((job.processed, job.total), (6, 6))
+        published = FindingAidsEntity.objects.filter(published=True, user_published='publisher')
+        self.assertEqual(sorted(published.values_list('id', flat=True)), ids)
+        self.assertFalse(FindingAidsEntity.objects.get(pk=self.template.pk).published)
+
+        self.assertEqual(create_ark.call_count, 5)
+        self.assertEqual(FindingAidsEntity.objects.get(pk=self.finding_aids[0].pk).ark, 'ark:/12345/existing')
+        self.assertEqual(FindingAidsEntity.objects.get(pk=ids[-1]).ark, 'ark:/12345/%s' % ids[-1])
+        self.assertEqual(
+            [call.args for call in mark_dirty.call_args_list],
+            [('finding_aids', ids[:1]), ('finding_aids', ids[1:3]), ('finding_aids', ids[3:5]),
+             ('finding_aids', ids[5:])]
+        )
+        self.assertFalse(
+            FindingAidsEntity.objects.filter(is_template=False, date_indexed_changed__isnull=True).exists()
+        )
+        self.assertEqual(ArchivalUnitStats.objects.get(archival_unit=self.series).published_finding_aids, 6)
+
+    @patch('finding_aids.services.publication.create_ark_for_record', return_value=None)
+    def test_publish_container_in_one_update(self, create_ark, mark_dirty):
+        job = FindingAidsPublicationJob.objects.create(
+            action=FindingAidsPublicationJob.PUBLISH, user=self.user.username, container=self.containers[1]
+        )
+
+        with patch.object(publication, 'notify_changed'), \
+                self.assertNumQueries(11):
+            # status, entities, total, UPDATE (in a savepoint), missing ARKs,
+            # progress, one progress update per ARK batch, status
+            publication.run_job(job)
+
+        self.assertEqual(FindingAidsEntity.objects.filter(published=True).count(), 3)
+        self.assertTrue(all(fa.container_id == self.containers[1].id
+                            for fa in FindingAidsEntity.objects.filter(published=True)))
+        self.assertFalse(FindingAidsEntity.objects.filter(ark__isnull=False).exclude(pk=self.finding_aids[0].pk))
+
+    def test_unpublish_retires_cached_responses(self, mark_dirty):
+        FindingAidsEntity.objects.update(published=True)
+        dependencies = [(response_cache.FINDING_AIDS, self.finding_aids[3].catalog_id),
+                        (response_cache.PUBLICATIONS, response_cache.PUBLICATIONS_KEY)]
+        versions = response_cache.get_versions(dependencies)
+
+        job = self._run(FindingAidsPublicationJob.UNPUBLISH, container=self.containers[1])
+
+        self.assertEqual((job.status, job.processed), (FindingAidsPublicationJob.FINISHED, 3))
+        self.assertEqual(
+            list(FindingAidsEntity.objects.filter(is_template=False, published=False)
+                 .order_by('id').values_list('id', flat=True)),
+            [fa.id for fa in self.finding_aids[3:]]
+        )
+        new_versions = response_cache.get_versions(dependencies)
+        self.assertTrue(all(new != old for new, old in zip(new_versions, versions)))
+        mark_dirty.assert_called_once_with('finding_aids', [fa.id for fa in self.finding_aids[3:]])
+        self.assertEqual(
+            FindingAidsEntity.objects.filter(is_template=False, date_indexed_changed__isnull=False).count(), 3
+        )
+
+    def test_failures_are_stored_on_the_job(self, mark_dirty):
+        with patch.object(publication, 'get_entities', side_effect=RuntimeError('boom')):
+            job = self._run(FindingAidsPublicationJob.UNPUBLISH, container=self.containers[0])
+
+        self.assertEqual((job.status, job.error), (FindingAidsPublicationJob.FAILED, 'boom'))
+        self.assertIsNotNone(job.date_finished)
+        mark_dirty.assert_not_called()
+
+    @patch('finding_aids.tasks.run_publication_job.delay')
+    def test_start_job_returns_the_job_in_progress(self, delay, mark_dirty):
+        with self.captureOnCommitCallbacks(execute=True):
+            job = publication.start_job(FindingAidsPublicationJob.PUBLISH, self.user, archival_unit=self.series)
+            again = publication.start_job(
+                FindingAidsPublicationJob.PUBLISH, self.user, container=self.containers[0]
+            )
+
+        self.assertEqual(again.id, job.id)
+        delay.assert_called_once_with(job.id)
+
+    @patch('finding_aids.tasks.run_publication_job.delay')
+    def test_start_job_refuses_the_other_action_in_progress(self, delay, mark_dirty):
+        job = publication.start_job(FindingAidsPublicationJob.PUBLISH, self.user, container=self.containers[0])
+
+        with self.assertRaises(publication.PublicationJobConflict) as context:
+            publication.start_job(FindingAidsPublicationJob.UNPUBLISH, self.user, archival_unit=self.series)
+        self.assertEqual(context.exception.job.id, job.id)
+
+        other = publication.start_job(FindingAidsPublicationJob.UNPUBLISH, self.user, container=self.containers[1])
+        self.assertNotEqual(other.id, job.id)
+
+    @patch('finding_aids.tasks.run_publication_job.delay')
+    def test_start_job_after_the_job_is_done(self, delay, mark_dirty):
+        job = publication.start_job(FindingAidsPublicationJob.PUBLISH, self.user, container=self.containers[0])
+        FindingAidsPublicationJob.objects.filter(pk=job.pk).update(status=FindingAidsPublicationJob.FINISHED)
+
+        again = publication.start_job(FindingAidsPublicationJob.UNPUBLISH, self.user, container=self.containers[0])
+
+        self.assertNotEqual(again.id, job.id)
@@ -1,12 +1,23 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.reverse import reverse
 
 from archival_unit.models import ArchivalUnit
+from archival_unit.tests.helpers import make_fonds, make_subfonds, make_series
+from catalog.services import response_cache
 from clockwork_api.tests.no_index_signals_mixin import NoIndexSignalsMixin
 from clockwork_api.tests.test_views_base_class import TestViewsBaseClass
 from container.models import Container
-from controlled_list.models import CarrierType, PrimaryType
+from container.tests.helpers import make_container
+from controlled_list.models import AccessRight, CarrierType, PrimaryType
+from digitization.tests.helpers import make_digital_version_container, make_digital_version_finding_aids
 from finding_aids.models import FindingAidsEntity
+from finding_aids.tests.helpers import make_finding_aids
+from finding_aids.views.finding_aids_views import renumber_entries
 
 
 class FindingAidsExtraViewsTests(NoIndexSignalsMixin, TestViewsBaseClass):
@@ -115,3 +126,106 @@ class FindingAidsExtraViewsTests(NoIndexSignalsMixin, TestViewsBaseClass):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.l1.refresh_from_db()
         self.assertFalse(self.l1.confidential)
+
+    def test_list_reads_digital_version_counts_from_annotations(self):
+        make_digital_version_finding_aids(self.l1, level='M')
+        make_digital_version_finding_aids(self.l1, level='A')
+        make_digital_version_finding_aids(self.l1, level='A')
+        make_digital_version_container(self.container)
+        url = reverse('finding_aids-v1:finding_aids-list', kwargs={'container_id': self.container.id}) + '?limit=50'
+
+        with CaptureQueriesContext(connection) as small_container:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        counts = {
+            row['id']: (row['digital_versions_masters'], row['digital_versions_access_copies'],
+                        row['digital_versions_of_container'])
+            for row in response.data['results']
+        }
+        self.assertEqual(counts, {self.l1.id: (1, 2, 1), self.l2.id: (0, 0, 1)})
+
+        for folder_no in range(2, 12):
+            folder = make_finding_aids(self.container, self.l1.primary_type, AccessRight.objects.get(pk=1),
+                                       folder_no=folder_no)
+            make_digital_version_finding_aids(folder, level='M')
+
+        with self.assertNumQueries(len(small_container)):
+            response = self.client.get(url)
+        self.assertEqual(len(response.data['results']), 12)
+
+
+@patch('finding_aids.views.finding_aids_views.index_queue.mark_dirty')
+class RenumberEntriesTests(NoIndexSignalsMixin, TestCase):
+    fixtures = ['carrier_types', 'primary_types', 'access_rights']
+
+    def setUp(self):
+        super().setUp()
+        series = make_series(make_subfonds(make_fonds()))
+        self.container = make_container(series, CarrierType.objects.first())
+        primary_type = PrimaryType.objects.first()
+        access_rights = AccessRight.objects.get(pk=1)
+        self.folders = [
+            make_finding_aids(self.container, primary_type, access_rights, folder_no=folder_no)
+            for folder_no in range(1, 5)
+        ]
+        self.items = [
+            make_finding_aids(self.container, primary_type, access_rights, folder_no=2, sequence_no=sequence_no,
+                              description_level='L2', level='I')
+            for sequence_no in range(1, 4)
+        ]
+
+    def _numbers(self, entities):
+        numbers = []
+        for entity in entities:
+            entity.refresh_from_db()
+            numbers.append((entity.folder_no, entity.sequence_no, entity.archival_reference_code))
+        return numbers
+
+    def _expected_reference_code(self, entity):
+        entity.set_reference_code()
+        return entity.archival_reference_code
+
+    def test_clone_folder_shifts_following_folders_and_their_items(self, mark_dirty):
+        with self.captureOnCommitCallbacks(execute=True), self.assertNumQueries(5):
+            # savepoint, entities to shift, two UPDATEs, release savepoint
+            renumber_entries(self.folders[0], 'clone')
+
+        prefix = '%s:%s/' % (self.container.archival_unit.reference_code, self.container.container_no)
+        self.assertEqual(self._numbers(self.folders), [
+            (1, 0, prefix + '1'), (3, 0, prefix + '3'), (4, 0, prefix + '4'), (5, 0, prefix + '5')
+        ])
+        self.assertEqual(self._numbers(self.items)[0], (3, 1, prefix + '3-1'))
+        for entity in self.folders + self.items:
+            self.assertEqual(entity.archival_reference_code, self._expected_reference_code(entity))
+        mark_dirty.assert_called_once_with(
+            'finding_aids', [entity.id for entity in self.folders[1:] + self.items]
+        )
+        self.assertEqual(
+            set(FindingAidsEntity.objects.filter(date_indexed_changed__isnull=False).values_list('id', flat=True)),
+            {entity.id for entity in self.folders[1:] + self.items}
+        )
+
+    def test_delete_item_closes_the_gap_in_its_folder(self, mark_dirty):
+        with self.captureOnCommitCallbacks(execute=True):
+            renumber_entries(self.items[0], 'delete')
+        self.items[0].delete()
+
+        prefix = '%s:%s/' % (self.container.archival_unit.reference_code, self.container.container_no)
+        self.assertEqual(self._numbers(self.items[1:]), [(2, 1, prefix + '2-1'), (2, 2, prefix + '2-2')])
+        self.assertEqual(self._numbers(self.folders)[2], (3, 0, prefix + '3'))
+        mark_dirty.assert_called_once_with('finding_aids', [entity.id for entity in self.items[1:]])
+
+    def test_renumbering_retires_the_cached_archival_unit_content(self, mark_dirty):
+        dependencies = [(response_cache.ARCHIVAL_UNIT_CONTENT, self.container.archival_unit_id)]
+        versions = response_cache.get_versions(dependencies)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            renumber_entries(self.folders[0], 'clone')
+
+        self.assertNotEqual(response_cache.get_versions(dependencies), versions)
+
+    def test_nothing_to_shift(self, mark_dirty):
+        with self.captureOnCommitCallbacks(execute=True):
+            renumber_entries(self.folders[-1], 'clone')
+
+        mark_dirty.assert_not_called()
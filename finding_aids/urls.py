@@ -12,6 +12,7 @@ Entity CRUD and helpers:
     - compute the next folder/sequence numbers
     - clone entities
     - state actions (publish/unpublish/confidential)
+    - progress of bulk publication jobs
 
 Templates:
     - list/select templates per series
@@ -42,7 +43,8 @@ from finding_aids.views.finding_aids_label_views import FindingAidsLabelDataView
 from finding_aids.views.finding_aids_template_views import FindingAidsTemplateList, FindingAidsTemplateSelect, \
     FindingAidsTemplateDetail, FindingAidsTemplateCreate, FindingAidsTemplatePreCreate
 from finding_aids.views.finding_aids_views import FindingAidsSelectList, FindingAidsCreate, FindingAidsDetail, \
-    FindingAidsList, FindingAidsClone, FindingAidsAction, FindingAidsPreCreate, FindingAidsGetNextFolder
+    FindingAidsList, FindingAidsClone, FindingAidsAction, FindingAidsPreCreate, FindingAidsGetNextFolder, \
+    FindingAidsPublicationJobDetail
 
 app_name = 'finding_aids'
 
@@ -84,6 +86,10 @@ urlpatterns = [
     # Excel export (series-scoped)
     path('excel/export/<int:series_id>/', FindingAidsExcelExport.as_view(), name='finding_aids-excel-export'),
 
+    # Progress of container / series publication jobs
+    path('publication-jobs/<int:pk>/', FindingAidsPublicationJobDetail.as_view(),
+         name='finding_aids-publication-job'),
+
     # Actions (publish/unpublish/confidential toggles)
     re_path(r'(?P<action>["publish"|"unpublish"|"set_confidential"|"set_non_confidential"]+)/(?P<pk>[0-9]+)/',
             FindingAidsAction.as_view(), name='finding_aids-publish')
@@ -1,7 +1,8 @@
 import uuid
 
-from django.db.models import Count, IntegerField, OuterRef, Subquery, Value, F
-from django.db.models.functions import Coalesce
+from django.db import transaction
+from django.db.models import Case, CharField, Count, IntegerField, OuterRef, Subquery, Value, When, F
+from django.db.models.functions import Cast, Coalesce, Concat
 from django.utils import timezone
 from rest_framework import generics, status
 from rest_framework.filters import SearchFilter
@@ -9,14 +10,17 @@ from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from catalog.services import response_cache
 from clockwork_api.mixins.audit_log_mixin import AuditLogMixin
 from clockwork_api.mixins.method_serializer_mixin import MethodSerializerMixin
 from clockwork_api.permissons.allowed_archival_unit_permission import AllowedArchivalUnitPermission
+from clockwork_api.services import index_queue
 from container.models import Container
 from digitization.models import DigitalVersion
-from finding_aids.models import FindingAidsEntity
+from finding_aids.models import FindingAidsEntity, FindingAidsPublicationJob
 from finding_aids.serializers.finding_aids_entity_serializers import FindingAidsSelectSerializer, \
-    FindingAidsEntityReadSerializer, FindingAidsEntityWriteSerializer, FindingAidsEntityListSerializer
+    FindingAidsEntityReadSerializer, FindingAidsEntityWriteSerializer, FindingAidsEntityListSerializer, \
+    FindingAidsPublicationJobSerializer
 
 
 class FindingAidsList(generics.ListAPIView):
@@ -310,6 +314,18 @@ class FindingAidsAction(APIView):
         return Response(status=status.HTTP_200_OK)
 
 
+class FindingAidsPublicationJobDetail(generics.RetrieveAPIView):
+    """
+    Returns the progress of a bulk publication job.
+
+    Jobs are started by the container publish endpoints; clients poll this
+    endpoint until the status is 'finished' or 'failed'.
+    """
+
+    queryset = FindingAidsPublicationJob.objects.all()
+    serializer_class = FindingAidsPublicationJobSerializer
+
+
 class FindingAidsSelectList(generics.ListAPIView):
     """
     Returns a non-paginated list of finding aids entities for selection widgets.
@@ -414,12 +430,14 @@ def renumber_entries(finding_aids, action):
             - if deleting the last item in a folder, potentially renumber subsequent folders
             - otherwise renumber subsequent items in the same folder by decrementing sequence_no
             - for clone, increment sequence_no for subsequent items in the same folder
+
+    The siblings are shifted with set-based updates (see shift_entries).
     """
+    folders = FindingAidsEntity.objects.filter(container=finding_aids.container,
+                                               folder_no__gt=finding_aids.folder_no)
 
     # L1 entities
     if finding_aids.description_level == 'L1':
-        folders = FindingAidsEntity.objects.filter(container=finding_aids.container,
-                                                   folder_no__gt=finding_aids.folder_no)
 
         # Delete L1 entities
         if action == 'delete':
@@ -427,20 +445,14 @@ def renumber_entries(finding_aids, action):
                                                           description_level='L2',
                                                           folder_no=finding_aids.folder_no).count()
             if item_count == 0:
-                for folder in folders:
-                    folder.folder_no -= 1
-                    folder.save()
+                shift_entries(finding_aids.container, folders, 'folder_no', -1)
 
         # Clone L1 entities
         else:
-            for folder in folders:
-                folder.folder_no += 1
-                folder.save()
+            shift_entries(finding_aids.container, folders, 'folder_no', 1)
 
     # L2 entities
     else:
-        folders = FindingAidsEntity.objects.filter(container=finding_aids.container,
-                                                   folder_no__gt=finding_aids.folder_no)
         items = FindingAidsEntity.objects.filter(container=finding_aids.container,
                                                  level=finding_aids.level,
                                                  folder_no=finding_aids.folder_no,
@@ -452,15 +464,48 @@ def renumber_entries(finding_aids, action):
                                                           description_level='L2',
                                                           folder_no=finding_aids.folder_no).count()
             if item_count == 0:
-                for folder in folders:
-                    folder.folder_no -= 1
-                    folder.save()
+                shift_entries(finding_aids.container, folders, 'folder_no', -1)
             else:
-                for item in items:
-                    item.sequence_no -= 1
-                    item.save()
+                shift_entries(finding_aids.container, items, 'sequence_no', -1)
         # Clone entities
         else:
-            for item in items:
-                item.sequence_no += 1
-                item.save()
+            shift_entries(finding_aids.container, items, 'sequence_no', 1)
+
+
+def shift_entries(container, finding_aids_entities, field, delta):
+    """
+    Adds `delta` to the folder_no or sequence_no of the given entities of a container.
+
+    Instead of saving the entities one by one:
+        - one UPDATE shifts the numbers
+        - one UPDATE recomputes archival_reference_code (as FindingAidsEntity.set_reference_code
+          does) from the container prefix and the new numbers, and sets date_indexed_changed so
+          the search index delta sync picks the entities up
+        - once committed, the entities are marked dirty in the index queue in one call
+          and their cached catalog responses are retired
+    """
+    with transaction.atomic():
+        rows = list(finding_aids_entities.values('id', 'catalog_id'))
+        if not rows:
+            return
+        ids = [row['id'] for row in rows]
+        FindingAidsEntity.objects.filter(id__in=ids).update(**{field: F(field) + delta})
+
+        prefix = '%s:%s/' % (container.archival_unit.reference_code, container.container_no)
+        folder_no = Cast('folder_no', output_field=CharField())
+        FindingAidsEntity.objects.filter(id__in=ids).update(
+            archival_reference_code=Case(
+                When(description_level='L1', then=Concat(Value(prefix), folder_no)),
+                default=Concat(Value(prefix), folder_no, Value('-'), Cast('sequence_no', output_field=CharField())),
+                output_field=CharField()
+            ),
+            date_indexed_changed=timezone.now()
+        )
+
+        def notify():
+            index_queue.mark_dirty(index_queue.FINDING_AIDS, ids)
+            response_cache.invalidate(response_cache.FINDING_AIDS, [row['catalog_id'] for row in rows])
+            response_cache.invalidate(response_cache.CONTAINER, [container.id])
+            response_cache.invalidate_archival_unit_content([container.archival_unit_id])
+
+        transaction.on_commit(notify)
@@ -1,11 +1,10 @@
 import re
 
-import meilisearch
-from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from django.utils.html import strip_tags
 from hashids import Hashids
 
+from clockwork_api.services import meilisearch_sync
 from isad.models import Isad
 
 
@@ -27,26 +26,93 @@ class ISADMeilisearchIndexer:
     Indexing is performed only when ``isad.published`` is True.
     """
 
-    def __init__(self, isad_id):
+    def __init__(self, isad_id=None, isad=None):
         """
         Initializes the Meilisearch indexer for a specific ISAD record.
 
         Parameters
         ----------
-        isad_id : int
+        isad_id : int, optional
             Primary key of the ISAD record to be indexed.
+        isad : isad.models.Isad, optional
+            Already loaded ISAD record (see :meth:`get_queryset`); when given,
+            no query is made.
         """
-        self.isad_id = isad_id
-        self.isad = self._get_isad(isad_id)
-
-        self.meilisearch_url = getattr(settings, "MEILISEARCH_URL", "")
-        self.meilisearch_api_key = getattr(settings, "MEILISEARCH_API_KEY", "")
-        self.meilisearch_index = getattr(settings, "MEILISEARCH_INDEX", "ams")
+        self.isad_id = isad_id or isad.id
+        self.isad = isad or self._get_isad(isad_id)
 
-        self.client = meilisearch.Client(self.meilisearch_url, self.meilisearch_api_key)
-        self.meilisearch_index = self.client.index(self.meilisearch_index)
+        self.meilisearch_index = meilisearch_sync.get_index(self.get_index_name())
         self.doc = {}
 
+    @staticmethod
+    def get_index_name():
+        """
+        Returns the name of the Meilisearch index of ISAD records.
+
+        Returns
+        -------
+        str
+            ``MEILISEARCH_INDEX``, or ``"ams"`` if it is not set.
+        """
+        return meilisearch_sync.get_index_name(meilisearch_sync.ISAD_INDEX)
+
+    @classmethod
+    def sync(cls, isad_ids, chunk_size=None, wait=False):
+        """
+        Indexes many ISAD records in Meilisearch.
+
+        Records are loaded chunk by chunk and their documents are streamed to
+        Meilisearch, one indexing task per chunk. Ids of deleted records are
+        skipped.
+
+        Parameters
+        ----------
+        isad_ids : iterable of int
+            Primary keys of the ISAD records.
+        chunk_size : int, optional
+            Documents per Meilisearch request (``MEILISEARCH_SYNC_CHUNK_SIZE``).
+        wait : bool, optional
+            Poll Meilisearch until the enqueued tasks are finished.
+
+        Returns
+        -------
+        dict
+            Number of documents sent, the enqueued task uids and the failed tasks.
+        """
+        chunk_size = meilisearch_sync.get_chunk_size(chunk_size)
+        result = {'documents': 0, 'task_uids': [], 'failed': []}
+
+        def documents():
+            for ids in meilisearch_sync.chunked(isad_ids, chunk_size):
+                for isad in cls.get_queryset().filter(pk__in=ids):
+                    result['documents'] += 1
+                    yield cls(isad=isad).create_document()
+
+        result['task_uids'] = meilisearch_sync.add_documents(documents(), cls.get_index_name(), chunk_size=chunk_size)
+        if wait:
+            result['failed'] = meilisearch_sync.wait_for_tasks(result['task_uids'])
+        return result
+
+    @staticmethod
+    def get_queryset():
+        """
+        Returns the ISAD queryset with the related objects used for indexing.
+
+        Returns
+        -------
+        django.db.models.QuerySet
+            ISAD records with archival unit, locale and rights prefetched.
+        """
+        qs = Isad.objects.all()
+        qs = qs.select_related('archival_unit')
+        qs = qs.select_related('original_locale')
+        qs = qs.select_related('access_rights')
+        qs = qs.select_related('reproduction_rights')
+        qs = qs.select_related('rights_restriction_reason')
+        qs = qs.select_related('isaar')
+        qs = qs.prefetch_related('isadcreator_set')
+        return qs
+
     def _get_isad(self, isad_id):
         """
         Retrieves the ISAD record with related objects optimized for indexing.
@@ -61,17 +127,24 @@ class ISADMeilisearchIndexer:
         isad.models.Isad or None
             The ISAD instance if found, otherwise None.
         """
-        qs = Isad.objects.filter(pk=isad_id)
-        qs = qs.select_related('archival_unit')
-        qs = qs.select_related('original_locale')
-        qs = qs.select_related('access_rights')
-        qs = qs.select_related('reproduction_rights')
-        qs = qs.select_related('rights_restriction_reason')
         try:
-            return qs.get()
+            return self.get_queryset().get(pk=isad_id)
         except ObjectDoesNotExist:
             return None
 
+    def create_document(self):
+        """
+        Builds the Meilisearch document for the ISAD record.
+
+        Returns
+        -------
+        dict
+            Meilisearch document representing the ISAD record.
+        """
+        self._index_record()
+        self._remove_duplicates()
+        return self.doc
+
     def index(self):
         """
         Indexes the ISAD record into Meilisearch.
@@ -80,8 +153,7 @@ class ISADMeilisearchIndexer:
         -----
         This method indexes only if the record is published.
         """
-        self._index_record()
-        self._remove_duplicates()
+        self.create_document()
         self.meilisearch_index.add_documents([self.doc])
 
     def delete(self):
@@ -39,7 +39,7 @@ class ISADNewCatalogIndexer:
         self.isad_id = isad_id
         self.isad = self._get_isad(isad_id)
         self.solr_core = getattr(settings, "SOLR_CORE_CATALOG_NEW", "catalog")
-        self.solr_url = "%s/%s" % (getattr(settings, "SOLR_URL", "http://localhost:8983/solr"), self.solr_core)
+        self.solr_url = self.get_solr_url()
         self.solr = pysolr.Solr(self.solr_url, auth=HTTPBasicAuth(
                 getattr(settings, "SOLR_USERNAME"), getattr(settings, "SOLR_PASSWORD")
             ))
@@ -102,7 +102,48 @@ class ISADNewCatalogIndexer:
         This uses an explicit commit request to Solr. Some deployment setups may
         rely on auto-commit; others may require manual commits after batches.
         """
-        r = post("%s/update/" % self.solr_url, params={'commit': 'true'}, json={}, auth=HTTPBasicAuth(
+        self.commit_changes()
+
+    @staticmethod
+    def get_solr_url():
+        """
+        Returns the URL of the catalog Solr core.
+        """
+        solr_core = getattr(settings, "SOLR_CORE_CATALOG_NEW", "catalog")
+        return "%s/%s" % (getattr(settings, "SOLR_URL", "http://localhost:8983/solr"), solr_core)
+
+    @classmethod
+    def send_update(cls, payload, solr_url=None):
+        """
+        Posts a JSON update to the catalog Solr core without committing.
+
+        Parameters
+        ----------
+        payload : list or dict
+            A list of Solr documents, or a Solr update command such as
+            ``{"delete": [...]}``.
+        solr_url : str, optional
+            URL of another core (e.g. a shadow core being rebuilt); defaults
+            to the live catalog core.
+
+        Returns
+        -------
+        requests.Response
+            The Solr response.
+        """
+        r = post("%s/update" % (solr_url or cls.get_solr_url()), json=payload, auth=HTTPBasicAuth(
+            getattr(settings, "SOLR_USERNAME"), getattr(settings, "SOLR_PASSWORD")
+        ))
+        if r.status_code != 200:
+            print('Error with ISAD(G) batch update! Error: %s' % r.text)
+        return r
+
+    @classmethod
+    def commit_changes(cls):
+        """
+        Sends a hard commit to the catalog Solr core.
+        """
+        r = post("%s/update/" % cls.get_solr_url(), params={'commit': 'true'}, json={}, auth=HTTPBasicAuth(
                 getattr(settings, "SOLR_USERNAME"), getattr(settings, "SOLR_PASSWORD")
             ))
         print(r.text)
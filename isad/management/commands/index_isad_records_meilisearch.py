@@ -1,13 +1,22 @@
 from django.core.management import BaseCommand
 
+from clockwork_api.services import meilisearch_sync
 from isad.indexers.isad_meilisearch_indexer import ISADMeilisearchIndexer
-from isad.indexers.isad_new_catalog_indexer import ISADNewCatalogIndexer
 from isad.models import Isad
 
 
 class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', dest='chunk_size', type=int,
+                            help='Number of documents sent to Meilisearch in one request.')
+        parser.add_argument('--wait', dest='wait', action='store_true',
+                            help='Wait until Meilisearch has processed the enqueued tasks.')
+
     def handle(self, *args, **options):
-        for isad in Isad.objects.all():
-            indexer = ISADMeilisearchIndexer(isad.id)
-            print("Indexing %s" % indexer.isad.reference_code)
-            indexer.index()
+        ids = Isad.objects.order_by('id').values_list('id', flat=True).iterator()
+
+        result = ISADMeilisearchIndexer.sync(ids, chunk_size=options['chunk_size'], wait=options['wait'])
+        print("Sent %s documents in %s Meilisearch tasks." % (result['documents'], len(result['task_uids'])))
+        for task in result['failed']:
+            print("Task %s %s: %s" % (task['uid'], task['status'], task['error']))
+        print("Meilisearch lag: %s" % meilisearch_sync.get_lag(ISADMeilisearchIndexer.get_index_name()))
@@ -0,0 +1,18 @@
+# Generated by Django 4.1.13 on 2026-10-17 01:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('isad', '0011_isad_ark'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='isad',
+            name='date_indexed_changed',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
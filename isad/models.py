@@ -102,6 +102,9 @@ class Isad(models.Model):
     user_updated = models.CharField(max_length=100, blank=True)
     date_updated = models.DateTimeField(blank=True, null=True, db_index=True)
 
+    # Changes made outside of user edits (unpublishing) that the search indexes have to pick up.
+    date_indexed_changed = models.DateTimeField(blank=True, null=True, db_index=True)
+
     class Meta:
         db_table = 'isad_recrods'
         indexes = [
@@ -149,6 +152,7 @@ class Isad(models.Model):
         self.published = False
         self.user_published = ""
         self.date_published = None
+        self.date_indexed_changed = timezone.now()
         self.save()
 
     def save(self, **kwargs):
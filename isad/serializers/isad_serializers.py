@@ -163,6 +163,7 @@ class IsadWriteSerializer(UserDataSerializerMixin, WritableNestedModelSerializer
     class Meta:
         model = Isad
         fields = '__all__'
+        read_only_fields = ('date_indexed_changed',)
 
 
 class IsadSeriesSerializer(IsadArchivalUnitSerializerMixin, serializers.ModelSerializer):
@@ -2,11 +2,10 @@ from django.db.models.signals import post_save, pre_delete
 from django.dispatch import receiver
 from hashids import Hashids
 
+from clockwork_api.services import index_queue
 from isad.models import Isad
 from isad.tasks import (
-    index_catalog_isad_record,
     index_catalog_isad_record_remove,
-    index_meilisearch_isad_record,
     index_meilisearch_isad_record_remove,
 )
 
@@ -16,30 +15,22 @@ def update_isad_index(sender, instance, **kwargs):
     """
     Updates the catalog search index after an ISAD record is saved.
 
-    This signal handler reacts to ``post_save`` events on :class:`isad.models.Isad`.
-    Depending on the publication state of the record, it either indexes or
-    removes the record from the catalog search index.
+    This signal handler reacts to ``post_save`` events on :class:`isad.models.Isad`
+    and marks the record as dirty in the coalescing index queue.
 
     Behavior
     --------
-    - If ``instance.published`` is True:
-        Triggers an asynchronous task to index the ISAD record.
-    - If ``instance.published`` is False:
-        Triggers an asynchronous task to remove the ISAD record from the index.
+    The periodic :func:`isad.tasks.flush_isad_index_queue` task:
+        - indexes the record in the catalog if ``instance.published`` is True
+        - removes the record from the catalog if ``instance.published`` is False
+        - indexes the record in Meilisearch regardless of publication status
 
     Notes
     -----
-    Indexing operations are delegated to background tasks to avoid blocking
-    the request/response cycle.
+    Repeated saves of the same record before the next flush collapse into a
+    single reindex with a single Solr commit.
     """
-    if instance.published:
-        index_catalog_isad_record.delay(isad_id=instance.id)
-    else:
-        index_catalog_isad_record_remove.delay(isad_id=instance.id)
-
-    # Internal AMS search index should always contain saved records,
-    # regardless of publication status.
-    index_meilisearch_isad_record.delay(isad_id=instance.id)
+    index_queue.mark_dirty(index_queue.ISAD, [instance.id])
 
 
 @receiver(pre_delete, sender=Isad)
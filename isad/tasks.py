@@ -1,8 +1,7 @@
 # Create your tasks here
-import meilisearch
 from celery import shared_task
-from django.conf import settings
 
+from clockwork_api.services import index_queue
 from isad.indexers.isad_meilisearch_indexer import ISADMeilisearchIndexer
 from isad.indexers.isad_new_catalog_indexer import ISADNewCatalogIndexer
 
@@ -79,3 +78,115 @@ def index_meilisearch_isad_record_remove(isad_id):
     if not indexer.isad:
         return
     indexer.delete()
+
+
+@shared_task
+def flush_isad_index_queue():
+    """
+    Drains the coalescing ISAD index queue.
+
+    Signal handlers only mark ISAD records as dirty (see
+    :mod:`clockwork_api.services.index_queue`). This periodic task collapses
+    all pending changes into batched Solr and Meilisearch updates.
+
+    Returns
+    -------
+    int
+        Number of ISAD records processed.
+
+    Notes
+    -----
+    Published records are added to Solr, unpublished records are removed,
+    and a single Solr commit is issued at the end of the flush. Every saved
+    record is (re)indexed in Meilisearch, regardless of publication status.
+    The ids of batches Solr or Meilisearch did not accept are marked dirty
+    again, so the next flush retries them.
+    """
+    remaining = index_queue.pending(index_queue.ISAD)
+    processed = 0
+    failed_ids = []
+
+    while processed < remaining:
+        isad_ids = index_queue.pop_dirty(index_queue.ISAD)
+        if not isad_ids:
+            break
+        try:
+            indexed = _index_isad_batch(isad_ids)
+        except Exception as e:
+            print('Error with ISAD(G) index queue batch! Error: %s' % e)
+            indexed = False
+        if not indexed:
+            failed_ids += isad_ids
+        processed += len(isad_ids)
+
+    index_queue.mark_dirty(index_queue.ISAD, failed_ids)
+    if processed:
+        ISADNewCatalogIndexer.commit_changes()
+    return processed
+
+
+def _index_isad_batch(isad_ids):
+    """
+    Sends one batch of ISAD records to Solr and Meilisearch.
+
+    Parameters
+    ----------
+    isad_ids : list of int
+        Primary keys of the ISAD records to be processed.
+
+    Returns
+    -------
+    bool
+        True if Solr accepted every update of the batch.
+    """
+    existing_ids, errors = index_isad_solr_batch(isad_ids)
+    if existing_ids:
+        ISADMeilisearchIndexer.sync(existing_ids)
+    return not errors
+
+
+def index_isad_solr_batch(isad_ids, solr_url=None):
+    """
+    Sends one batch of ISAD records to the catalog Solr core without committing.
+
+    Published records are added with one update request, unpublished records
+    are removed with one delete request.
+
+    Parameters
+    ----------
+    isad_ids : list of int
+        Primary keys of the ISAD records to be processed.
+    solr_url : str, optional
+        URL of the target core; defaults to the live catalog core.
+
+    Returns
+    -------
+    tuple of (list of int, int)
+        Primary keys of the records that still exist, and the number of
+        records in updates Solr did not accept.
+    """
+    solr_docs = []
+    solr_delete_ids = []
+    existing_ids = []
+
+    for isad_id in isad_ids:
+        solr_indexer = ISADNewCatalogIndexer(isad_id)
+        if not solr_indexer.isad:
+            continue
+        if solr_indexer.isad.published:
+            solr_indexer.create_solr_document()
+            solr_docs.append(solr_indexer.get_solr_document())
+        else:
+            solr_delete_ids.append(solr_indexer._get_solr_id())
+        existing_ids.append(isad_id)
+
+    errors = 0
+    if solr_docs:
+        r = ISADNewCatalogIndexer.send_update(solr_docs, solr_url=solr_url)
+        if r.status_code != 200:
+            errors += len(solr_docs)
+    if solr_delete_ids:
+        r = ISADNewCatalogIndexer.send_update({'delete': solr_delete_ids}, solr_url=solr_url)
+        if r.status_code != 200:
+            errors += len(solr_delete_ids)
+    return existing_ids, errors
@@ -0,0 +1,13 @@
+from isad.models import Isad
+
+
+def make_isad(archival_unit, **kwargs):
+    defaults = {
+        "archival_unit": archival_unit,
+        "title": archival_unit.title,
+        "reference_code": archival_unit.reference_code,
+        "description_level": archival_unit.level,
+        "year_from": 2000,
+    }
+    defaults.update(kwargs)
+    return Isad.objects.create(**defaults)
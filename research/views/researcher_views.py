@@ -9,6 +9,7 @@ from rest_framework.views import APIView
 from authority.models import Country
 from authority.serializers import CountrySelectSerializer
 from clockwork_api.mailer.email_with_template import EmailWithTemplate
+from clockwork_api.mixins.detect_protected_mixin import annotate_removable
 from clockwork_api.mixins.method_serializer_mixin import MethodSerializerMixin
 from controlled_list.models import Nationality
 from controlled_list.serializers import NationalitySelectSerializer
@@ -73,7 +74,7 @@ class ResearcherList(MethodSerializerMixin, generics.ListCreateAPIView):
         - Dynamic serializer selection based on HTTP method
     """
 
-    queryset = Researcher.objects.all().order_by('-date_created', 'last_name', 'first_name')
+    queryset = annotate_removable(Researcher.objects.all().order_by('-date_created', 'last_name', 'first_name'))
     filter_backends = (DjangoFilterBackend, OrderingFilter)
     filterset_fields = ['country', 'citizenship', 'status']
     filterset_class = ResearcherFilterClass
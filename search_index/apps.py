@@ -0,0 +1,19 @@
+from django.apps import AppConfig
+
+
+class SearchIndexConfig(AppConfig):
+    """
+    Application configuration for the search_index module.
+
+    This app keeps the search indexes (Solr catalog, Meilisearch AMS) in sync
+    with the database incrementally: it stores a high-water mark per index and
+    a tombstone for every deleted record.
+    """
+
+    name = 'search_index'
+
+    def ready(self):
+        """
+        Imports signal handlers when the application is ready.
+        """
+        from . import signals
@@ -0,0 +1,54 @@
+from django.core.management import BaseCommand, CommandError
+
+from search_index.services import solr_rebuild
+
+
+class Command(BaseCommand):
+    help = "Rebuild the Solr catalog into a shadow core, validate it and swap it in without downtime."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Number of records sent to Solr in one update request.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Index finding aids with this many processes, sharded by series.",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=int,
+            default=0,
+            help="Allowed difference between Solr and database counts (records published during the rebuild).",
+        )
+        parser.add_argument(
+            "--no-swap",
+            action="store_true",
+            help="Build and validate the shadow core, but keep serving the current one.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Swap even if the live core holds documents not indexed by this application.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            result = solr_rebuild.rebuild(
+                batch_size=options["batch_size"],
+                tolerance=options["tolerance"],
+                swap_cores=not options["no_swap"],
+                force=options["force"],
+                workers=options["workers"],
+            )
+        except solr_rebuild.SolrRebuildError as e:
+            raise CommandError(str(e))
+
+        for record_type, (indexed, in_database) in result["counts"].items():
+            self.stdout.write(f"{record_type}: {indexed} documents, {in_database} in the database")
+        status = "swapped in" if result["swapped"] else "not swapped"
+        self.stdout.write(self.style.SUCCESS(f"Done. Shadow {result['shadow']} {status}."))
@@ -0,0 +1,50 @@
+from django.core.management import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+
+from search_index.models import SearchIndexWatermark
+from search_index.services import delta_sync
+
+
+class Command(BaseCommand):
+    help = "Reindex the records changed since the last sync and remove deleted records."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target",
+            choices=delta_sync.TARGETS,
+            help="Only sync one search index (default: all of them).",
+        )
+        parser.add_argument(
+            "--since",
+            help="Reindex changes after this ISO datetime instead of the stored watermark.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the number of changed records.",
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options["since"]:
+            since = parse_datetime(options["since"])
+            if since is None:
+                raise CommandError("Invalid datetime: %s" % options["since"])
+
+        targets = [options["target"]] if options["target"] else delta_sync.TARGETS
+        for target in targets:
+            result = delta_sync.sync_target(target, since=since, dry_run=options["dry_run"])
+            if "skipped" in result:
+                self.stdout.write(self.style.WARNING(
+                    f"{dict(SearchIndexWatermark.TARGET_CHOICES)[target]} skipped: {result['skipped']}"
+                ))
+                continue
+            self.stdout.write(
+                f"{dict(SearchIndexWatermark.TARGET_CHOICES)[target]} since {result['since'] or 'the beginning'}: "
+                f"finding aids={result['finding_aids']}, isad={result['isad']}, deleted={result['deleted']}, "
+                f"errors={result.get('errors', 0)}"
+            )
+
+        if not options["dry_run"]:
+            pruned = delta_sync.prune_tombstones()
+            self.stdout.write(self.style.SUCCESS(f"Done. Pruned tombstones={pruned}"))
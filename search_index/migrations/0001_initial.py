@@ -0,0 +1,39 @@
+# Generated by Django 4.1.13 on 2026-10-16 23:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchIndexTombstone',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('record_type', models.CharField(choices=[('finding_aids', 'Finding Aids'), ('isad', 'ISAD(G)')], max_length=20)),
+                ('object_id', models.PositiveIntegerField()),
+                ('document_id', models.CharField(max_length=100)),
+                ('date_deleted', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'db_table': 'search_index_tombstones',
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchIndexWatermark',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('target', models.CharField(choices=[('solr_catalog', 'Solr catalog'), ('meilisearch_ams', 'Meilisearch AMS')], max_length=50, unique=True)),
+                ('value', models.DateTimeField()),
+                ('date_updated', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'search_index_watermarks',
+            },
+        ),
+    ]
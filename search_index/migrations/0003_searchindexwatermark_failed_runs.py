@@ -0,0 +1,28 @@
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def seed_watermarks(apps, schema_editor):
+    """
+    Starts the incremental sync from now: the indexes were kept up to date by
+    the index signals until now, so the first run does not reindex everything.
+    """
+    SearchIndexWatermark = apps.get_model('search_index', 'SearchIndexWatermark')
+    for target in ['solr_catalog', 'meilisearch_ams']:
+        SearchIndexWatermark.objects.get_or_create(target=target, defaults={'value': timezone.now()})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search_index', '0002_reindexjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='searchindexwatermark',
+            name='failed_runs',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(seed_watermarks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.1.13 on 2026-10-17 01:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search_index', '0003_searchindexwatermark_failed_runs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reindexjob',
+            name='errors',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,141 @@
+from django.db import models
+
+
+class SearchIndexWatermark(models.Model):
+    """
+    Stores the high-water mark of an incremental search index sync.
+
+    Every record changed after `value` still has to be sent to the target
+    index. The mark is only moved forward after a successful sync, or after
+    SEARCH_INDEX_SYNC_MAX_FAILED_RUNS failed ones.
+
+    Attributes:
+        target (str):
+            The search index the mark belongs to (see TARGET_CHOICES).
+
+        value (datetime):
+            Start time of the last successful sync, minus SEARCH_INDEX_SYNC_OVERLAP.
+
+        failed_runs (int):
+            Number of failed syncs since the mark last moved.
+
+        date_updated (datetime):
+            When the mark was last moved.
+    """
+    SOLR_CATALOG = 'solr_catalog'
+    MEILISEARCH_AMS = 'meilisearch_ams'
+
+    TARGET_CHOICES = [
+        (SOLR_CATALOG, 'Solr catalog'),
+        (MEILISEARCH_AMS, 'Meilisearch AMS'),
+    ]
+
+    id = models.AutoField(primary_key=True)
+    target = models.CharField(max_length=50, choices=TARGET_CHOICES, unique=True)
+    value = models.DateTimeField()
+    failed_runs = models.PositiveIntegerField(default=0)
+    date_updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'search_index_watermarks'
+
+    def __str__(self):
+        return f"{self.target}: {self.value}"
+
+
+class SearchIndexTombstone(models.Model):
+    """
+    Records a deleted record so it can be removed from every search index.
+
+    Tombstones newer than the watermark of a target are deleted from that
+    target on the next sync; tombstones older than every watermark are pruned.
+
+    Attributes:
+        record_type (str):
+            Type of the deleted record (see RECORD_TYPE_CHOICES).
+
+        object_id (int):
+            Primary key of the deleted record.
+
+        document_id (str):
+            Id of the record's document in the search indexes.
+
+        date_deleted (datetime):
+            When the record was deleted.
+    """
+    FINDING_AIDS = 'finding_aids'
+    ISAD = 'isad'
+
+    RECORD_TYPE_CHOICES = [
+        (FINDING_AIDS, 'Finding Aids'),
+        (ISAD, 'ISAD(G)'),
+    ]
+
+    id = models.AutoField(primary_key=True)
+    record_type = models.CharField(max_length=20, choices=RECORD_TYPE_CHOICES)
+    object_id = models.PositiveIntegerField()
+    document_id = models.CharField(max_length=100)
+    date_deleted = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        db_table = 'search_index_tombstones'
+
+    def __str__(self):
+        return f"{self.record_type} {self.object_id} ({self.document_id})"
+
+
+class ReindexJob(models.Model):
+    """
+    Tracks the progress of a background reindex of many records.
+
+    Attributes:
+        source (str):
+            What triggered the job, e.g. "authority.person:12".
+
+        status (str):
+            One of STATUS_CHOICES.
+
+        total (int):
+            Number of records to reindex, known once the job has started.
+
+        processed (int):
+            Number of records reindexed so far.
+
+        errors (int):
+            Number of records the search indexes rejected.
+
+        error (str | None):
+            The error message of a failed job.
+
+        date_created, date_started, date_finished (datetime):
+            Lifecycle timestamps.
+    """
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    FINISHED = 'finished'
+    FAILED = 'failed'
+
+    STATUS_CHOICES = [
+        (QUEUED, 'Queued'),
+        (RUNNING, 'Running'),
+        (FINISHED, 'Finished'),
+        (FAILED, 'Failed'),
+    ]
+
+    id = models.AutoField(primary_key=True)
+    source = models.CharField(max_length=200, db_index=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED, db_index=True)
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    errors = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True, null=True)
+    date_created = models.DateTimeField(auto_now_add=True)
+    date_started = models.DateTimeField(blank=True, null=True)
+    date_finished = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        db_table = 'search_index_reindex_jobs'
+        ordering = ['-date_created']
+
+    def __str__(self):
+        return f"{self.source}: {self.processed}/{self.total} ({self.status})"
@@ -0,0 +1,13 @@
+from rest_framework import serializers
+
+from search_index.models import ReindexJob
+
+
+class ReindexJobSerializer(serializers.ModelSerializer):
+    """
+    Read-only serializer exposing the progress of a background reindex job.
+    """
+
+    class Meta:
+        model = ReindexJob
+        fields = '__all__'
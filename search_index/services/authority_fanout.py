@@ -0,0 +1,199 @@
+import logging
+import time
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from catalog.services import response_cache
+from finding_aids.indexers.finding_aids_meilisearch_indexer import FindingMeilisearchIndexer
+from finding_aids.indexers.finding_aids_new_catalog_bulk_indexer import FindingAidsNewCatalogBulkIndexer
+from finding_aids.models import FindingAidsEntity
+from isad.indexers.isad_meilisearch_indexer import ISADMeilisearchIndexer
+from isad.models import Isad
+from isad.tasks import index_isad_solr_batch
+from search_index.models import ReindexJob
+
+logger = logging.getLogger(__name__)
+
+# For every authority model ("app_label.model_name"):
+#   fields: the fields that end up in indexed documents (labels, facet values)
+#   finding_aids / isad: lookups from the indexed model to the authority record
+AUTHORITY_DEPENDENCIES = {
+    'authority.person': {
+        'fields': ['first_name', 'last_name', 'wikidata_id'],
+        'finding_aids': ['subject_person', 'findingaidsentityassociatedperson__associated_person'],
+        'isad': [],
+    },
+    'authority.corporation': {
+        'fields': ['name', 'wikidata_id'],
+        'finding_aids': ['subject_corporation', 'findingaidsentityassociatedcorporation__associated_corporation'],
+        'isad': [],
+    },
+    'authority.country': {
+        'fields': ['country', 'wikidata_id'],
+        'finding_aids': ['spatial_coverage_country', 'findingaidsentityassociatedcountry__associated_country'],
+        'isad': [],
+    },
+    'authority.place': {
+        'fields': ['place', 'wikidata_id'],
+        'finding_aids': ['spatial_coverage_place', 'findingaidsentityassociatedplace__associated_place'],
+        'isad': [],
+    },
+    'controlled_list.keyword': {
+        'fields': ['keyword'],
+        'finding_aids': ['subject_keyword'],
+        'isad': [],
+    },
+    'authority.language': {
+        'fields': ['language', 'wikidata_id'],
+        'finding_aids': ['findingaidsentitylanguage__language'],
+        'isad': ['language'],
+    },
+}
+
+
+def get_label(instance):
+    return instance._meta.label_lower
+
+
+def get_source(instance):
+    return '%s:%s' % (get_label(instance), instance.pk)
+
+
+def has_indexed_changes(instance):
+    """
+    Returns True if a saved authority record differs from the stored one in an indexed field.
+
+    New records are not referenced by anything yet, so they never have indexed changes.
+    """
+    if instance.pk is None:
+        return False
+    fields = AUTHORITY_DEPENDENCIES[get_label(instance)]['fields']
+    stored = type(instance).objects.filter(pk=instance.pk).values(*fields).first()
+    if stored is None:
+        return False
+    return any(stored[field] != getattr(instance, field) for field in fields)
+
+
+def _get_dependent_ids(model, lookups, pk):
+    if not lookups:
+        return []
+    condition = Q()
+    for lookup in lookups:
+        condition |= Q(**{lookup: pk})
+    return list(model.objects.filter(condition).order_by('id').values_list('id', flat=True).distinct())
+
+
+def get_dependent_ids(label, pk):
+    """
+    Resolves every finding aids entity and ISAD record referencing an authority record.
+
+    Each indexed model is resolved with a single query, OR-ing the M2M and
+    through-table lookups.
+
+    Returns:
+        tuple: (finding aids entity ids, ISAD ids)
+    """
+    dependencies = AUTHORITY_DEPENDENCIES[label]
+    finding_aids_ids = _get_dependent_ids(FindingAidsEntity, dependencies['finding_aids'], pk)
+    isad_ids = _get_dependent_ids(Isad, dependencies['isad'], pk)
+    return finding_aids_ids, isad_ids
+
+
+def create_job(instance):
+    """
+    Creates a queued reindex job for an authority record.
+
+    Returns None if a job for the same record is still queued: it will pick
+    up the latest values anyway.
+    """
+    source = get_source(instance)
+    if ReindexJob.objects.filter(source=source, status=ReindexJob.QUEUED).exists():
+        return None
+    return ReindexJob.objects.create(source=source)
+
+
+def run_job(job, label, pk):
+    """
+    Reindexes the records depending on an authority record, in throttled batches.
+
+    Every batch is sent to Solr (without committing) and Meilisearch, then the
+    job progress is saved and the worker sleeps AUTHORITY_REINDEX_THROTTLE
+    seconds, so a widely used authority record does not flood the indexes.
+    Solr is committed once at the end. The cached catalog responses of the
+    dependent records are retired before indexing starts. Records rejected by
+    Solr are counted in job.errors; a job with errors ends as failed.
+    """
+    batch_size = getattr(settings, 'AUTHORITY_REINDEX_BATCH_SIZE', 200)
+    throttle = getattr(settings, 'AUTHORITY_REINDEX_THROTTLE', 1.0)
+
+    job.status = ReindexJob.RUNNING
+    job.date_started = timezone.now()
+    job.save(update_fields=['status', 'date_started'])
+
+    try:
+        finding_aids_ids, isad_ids = get_dependent_ids(label, pk)
+        invalidate_responses(finding_aids_ids, isad_ids)
+        job.total = len(finding_aids_ids) + len(isad_ids)
+        job.save(update_fields=['total'])
+
+        solr_indexer = FindingAidsNewCatalogBulkIndexer(batch_size=batch_size)
+        batches = [(finding_aids_ids, _index_finding_aids_batch), (isad_ids, _index_isad_batch)]
+        for ids, index_batch in batches:
+            for start in range(0, len(ids), batch_size):
+                batch = ids[start:start + batch_size]
+                job.errors += index_batch(batch, solr_indexer)
+                job.processed += len(batch)
+                job.save(update_fields=['processed', 'errors'])
+                logger.info("Reindex job %s (%s): %s/%s", job.id, job.source, job.processed, job.total)
+                if throttle and job.processed < job.total:
+                    time.sleep(throttle)
+
+        if job.total:
+            solr_indexer.commit()
+        if job.errors:
+            job.status = ReindexJob.FAILED
+            job.error = "%s of %s records could not be indexed." % (job.errors, job.total)
+        else:
+            job.status = ReindexJob.FINISHED
+    except Exception as e:
+        logger.exception("Reindex job %s (%s) failed", job.id, job.source)
+        job.status = ReindexJob.FAILED
+        job.error = str(e)
+
+    job.date_finished = timezone.now()
+    job.save(update_fields=['status', 'error', 'date_finished'])
+    return job
+
+
+def invalidate_responses(finding_aids_ids, isad_ids):
+    """
+    Retires the cached catalog responses showing the authority record.
+    """
+    response_cache.invalidate(
+        response_cache.FINDING_AIDS,
+        FindingAidsEntity.objects.filter(id__in=finding_aids_ids).values_list('catalog_id', flat=True)
+    )
+    response_cache.invalidate(
+        response_cache.ARCHIVAL_UNIT, Isad.objects.filter(id__in=isad_ids).values_list('archival_unit_id', flat=True)
+    )
+
+
+def _index_finding_aids_batch(ids, solr_indexer):
+    """
+    Indexes a batch of finding aids entities. Returns the number of documents Solr rejected.
+    """
+    errors = solr_indexer.errors
+    solr_indexer.index_batch(ids)
+    FindingMeilisearchIndexer.sync(ids, digital_version_resolver=solr_indexer.digital_version_resolver)
+    return solr_indexer.errors - errors
+
+
+def _index_isad_batch(ids, solr_indexer):
+    """
+    Indexes a batch of ISAD records. Returns the number of documents Solr rejected.
+    """
+    existing_ids, errors = index_isad_solr_batch(ids)
+    ISADMeilisearchIndexer.sync(existing_ids)
+    return errors
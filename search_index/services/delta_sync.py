@@ -0,0 +1,296 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from redis.exceptions import LockError
+
+from clockwork_api.services import index_queue, meilisearch_sync
+from finding_aids.indexers.finding_aids_meilisearch_indexer import FindingMeilisearchIndexer
+from finding_aids.indexers.finding_aids_new_catalog_bulk_indexer import FindingAidsNewCatalogBulkIndexer
+from finding_aids.models import FindingAidsEntity
+from isad.indexers.isad_meilisearch_indexer import ISADMeilisearchIndexer
+from isad.indexers.isad_new_catalog_indexer import ISADNewCatalogIndexer
+from isad.models import Isad
+from isad.tasks import index_isad_solr_batch
+from search_index.models import SearchIndexTombstone, SearchIndexWatermark
+
+logger = logging.getLogger(__name__)
+
+TARGETS = [SearchIndexWatermark.SOLR_CATALOG, SearchIndexWatermark.MEILISEARCH_AMS]
+
+# Own timestamps of a record: any of them moving past the mark means the record changed.
+OWN_DATE_FIELDS = ['date_created', 'date_updated', 'date_published', 'date_indexed_changed']
+
+# Related records whose change alters the indexed document of a finding aids entity.
+FINDING_AIDS_RELATED_DATE_LOOKUPS = [
+    'container__date_updated',
+    'archival_unit__date_updated',
+    'archival_unit__parent__date_updated',
+    'archival_unit__parent__parent__date_updated',
+    'archival_unit__isad__date_updated',
+    'archival_unit__isad__date_published',
+    'genre__date_updated',
+    'spatial_coverage_country__date_updated',
+    'spatial_coverage_place__date_updated',
+    'subject_person__date_updated',
+    'subject_corporation__date_updated',
+    'subject_heading__date_updated',
+    'subject_keyword__date_updated',
+    'findingaidsentityassociatedperson__associated_person__date_updated',
+    'findingaidsentityassociatedcorporation__associated_corporation__date_updated',
+    'findingaidsentityassociatedcountry__associated_country__date_updated',
+    'findingaidsentityassociatedplace__associated_place__date_updated',
+    'findingaidsentitylanguage__language__date_updated',
+]
+
+# Related records whose change alters the indexed document of an ISAD record.
+ISAD_RELATED_DATE_LOOKUPS = [
+    'archival_unit__date_updated',
+    'archival_unit__parent__date_updated',
+    'archival_unit__parent__parent__date_updated',
+    'isaar__date_updated',
+    'language__date_updated',
+]
+
+
+def get_watermark(target):
+    """
+    Returns the high-water mark of a target, or None if it was never synced.
+    """
+    watermark = SearchIndexWatermark.objects.filter(target=target).first()
+    return watermark.value if watermark else None
+
+
+def set_watermark(target, value, failed_runs=0):
+    SearchIndexWatermark.objects.update_or_create(
+        target=target, defaults={'value': value, 'failed_runs': failed_runs}
+    )
+
+
+def get_failed_runs(target):
+    """
+    Returns the number of failed runs since the watermark of a target last moved.
+    """
+    watermark = SearchIndexWatermark.objects.filter(target=target).first()
+    return watermark.failed_runs if watermark else 0
+
+
+def get_overlap():
+    """
+    Returns how far before the start of a run the next run starts looking for changes.
+
+    Rows saved by transactions that were still open when the run started carry
+    a timestamp before the start but only become visible after it.
+    """
+    return timedelta(seconds=getattr(settings, 'SEARCH_INDEX_SYNC_OVERLAP', 60))
+
+
+def get_changed_ids(model, related_lookups, since, extra_filter=None):
+    """
+    Returns the ids of records changed (directly or through a related record) after `since`.
+
+    Every lookup is run as its own narrow query so each one can use the date
+    index of the related table, instead of one wide OR over all the joins.
+
+    Args:
+        model: FindingAidsEntity or Isad.
+        related_lookups: lookups ending in a date field of a related record.
+        since: the watermark; None selects every record.
+        extra_filter: optional Q applied to every query.
+
+    Returns:
+        list: sorted primary keys.
+    """
+    qs = model.objects.all()
+    if extra_filter is not None:
+        qs = qs.filter(extra_filter)
+    if since is None:
+        return list(qs.order_by('id').values_list('id', flat=True))
+
+    own_changes = Q()
+    for field in OWN_DATE_FIELDS:
+        own_changes |= Q(**{'%s__gt' % field: since})
+
+    ids = set(qs.filter(own_changes).values_list('id', flat=True))
+    for lookup in related_lookups:
+        ids.update(qs.filter(**{'%s__gt' % lookup: since}).values_list('id', flat=True))
+    return sorted(ids)
+
+
+def get_changed_finding_aids_ids(since):
+    return get_changed_ids(
+        FindingAidsEntity, FINDING_AIDS_RELATED_DATE_LOOKUPS, since, extra_filter=Q(is_template=False)
+    )
+
+
+def get_changed_isad_ids(since):
+    return get_changed_ids(Isad, ISAD_RELATED_DATE_LOOKUPS, since)
+
+
+def get_tombstones(since):
+    """
+    Returns the document ids deleted after `since`, grouped by record type.
+    """
+    tombstones = SearchIndexTombstone.objects.all()
+    if since is not None:
+        tombstones = tombstones.filter(date_deleted__gt=since)
+    deleted = {SearchIndexTombstone.FINDING_AIDS: [], SearchIndexTombstone.ISAD: []}
+    for record_type, document_id in tombstones.values_list('record_type', 'document_id'):
+        deleted[record_type].append(document_id)
+    return deleted
+
+
+def sync_target(target, since=None, dry_run=False):
+    """
+    Sends every change after the target's watermark to the target index.
+
+    Runs of the same target never overlap: a run started while another one
+    holds the lock is skipped. A target without a watermark is skipped as
+    well, instead of reindexing every record into the live index; pass
+    `since` (or rebuild the catalog) to sync it for the first time.
+
+    The new watermark is the start time of the run minus SEARCH_INDEX_SYNC_OVERLAP,
+    so records saved while the sync is running are picked up by the next run.
+    After a run with failed updates the watermark stays put and the records
+    are retried by the next run, until SEARCH_INDEX_SYNC_MAX_FAILED_RUNS runs in a
+    row failed: then the records are logged as given up and the watermark moves on.
+
+    Args:
+        target: SearchIndexWatermark.SOLR_CATALOG or SearchIndexWatermark.MEILISEARCH_AMS.
+        since: overrides the stored watermark (None uses the stored one).
+        dry_run: only count the changes, do not index or move the watermark.
+
+    Returns:
+        dict: the watermark used, the number of finding aids, ISAD and deleted
+        records, and the number of failed updates; or the reason in 'skipped'
+        if the run was skipped.
+    """
+    if dry_run:
+        return _sync_target(target, since, dry_run)
+
+    lock = index_queue.lock(
+        'search_index_sync:%s' % target, timeout=getattr(settings, 'SEARCH_INDEX_SYNC_LOCK_TIMEOUT', 60 * 60)
+    )
+    if not lock.acquire(blocking=False):
+        logger.info("Sync of %s is already running, skipped.", target)
+        return {'target': target, 'since': since, 'skipped': 'running'}
+    try:
+        return _sync_target(target, since, dry_run)
+    finally:
+        try:
+            lock.release()
+        except LockError:
+            logger.warning("Sync lock of %s expired before the run finished.", target)
+
+
+def _sync_target(target, since, dry_run):
+    started = timezone.now()
+    since = since or get_watermark(target)
+    if since is None:
+        logger.warning("%s has no watermark, skipped. Run sync_search_indexes with --since to sync it.", target)
+        return {'target': target, 'since': None, 'skipped': 'no watermark'}
+
+    finding_aids_ids = get_changed_finding_aids_ids(since)
+    isad_ids = get_changed_isad_ids(since)
+    deleted = get_tombstones(since)
+
+    result = {
+        'target': target,
+        'since': since,
+        'finding_aids': len(finding_aids_ids),
+        'isad': len(isad_ids),
+        'deleted': sum(len(ids) for ids in deleted.values()),
+    }
+    if dry_run:
+        return result
+
+    if target == SearchIndexWatermark.SOLR_CATALOG:
+        result['errors'] = _sync_solr_catalog(finding_aids_ids, isad_ids, deleted)
+    elif target == SearchIndexWatermark.MEILISEARCH_AMS:
+        result['errors'] = _sync_meilisearch_ams(finding_aids_ids, isad_ids, deleted)
+    else:
+        raise ValueError("Unknown search index target: %s" % target)
+
+    if not result['errors']:
+        set_watermark(target, started - get_overlap())
+        logger.info("Synced %s since %s: %s", target, since, result)
+        return result
+
+    failed_runs = get_failed_runs(target) + 1
+    if failed_runs < getattr(settings, 'SEARCH_INDEX_SYNC_MAX_FAILED_RUNS', 3):
+        SearchIndexWatermark.objects.filter(target=target).update(failed_runs=failed_runs)
+        logger.warning("Sync of %s since %s had errors, watermark not moved: %s", target, since, result)
+    else:
+        set_watermark(target, started - get_overlap())
+        logger.error(
+            "Sync of %s since %s failed %s times in a row, giving up on finding aids %s, ISAD %s, deleted %s: %s",
+            target, since, failed_runs, finding_aids_ids, isad_ids, deleted, result
+        )
+    return result
+
+
+def sync_all(dry_run=False):
+    """
+    Syncs every target, then prunes tombstones that every target has processed.
+    """
+    results = [sync_target(target, dry_run=dry_run) for target in TARGETS]
+    if not dry_run:
+        prune_tombstones()
+    return results
+
+
+def prune_tombstones():
+    """
+    Deletes tombstones older than the watermark of every target.
+
+    Returns:
+        int: number of deleted tombstones.
+    """
+    watermarks = [get_watermark(target) for target in TARGETS]
+    if None in watermarks:
+        return 0
+    deleted, _ = SearchIndexTombstone.objects.filter(date_deleted__lte=min(watermarks)).delete()
+    return deleted
+
+
+def _sync_solr_catalog(finding_aids_ids, isad_ids, deleted):
+    """
+    Sends the changes to the Solr catalog core with a single commit. Returns the number of errors.
+    """
+    solr_indexer = FindingAidsNewCatalogBulkIndexer()
+    solr_indexer.index_ids(finding_aids_ids)
+    errors = solr_indexer.errors
+
+    for start in range(0, len(isad_ids), solr_indexer.batch_size):
+        _, isad_errors = index_isad_solr_batch(isad_ids[start:start + solr_indexer.batch_size])
+        errors += isad_errors
+
+    deleted_ids = deleted[SearchIndexTombstone.FINDING_AIDS] + deleted[SearchIndexTombstone.ISAD]
+    if deleted_ids:
+        r = ISADNewCatalogIndexer.send_update({'delete': deleted_ids})
+        if r.status_code != 200:
+            errors += len(deleted_ids)
+
+    solr_indexer.commit()
+    return errors
+
+
+def _sync_meilisearch_ams(finding_aids_ids, isad_ids, deleted):
+    """
+    Sends the changes to the Meilisearch AMS index and waits for the tasks. Returns the number of failed tasks.
+    """
+    task_uids = FindingMeilisearchIndexer.sync(finding_aids_ids)['task_uids']
+    task_uids += ISADMeilisearchIndexer.sync(isad_ids)['task_uids']
+
+    if deleted[SearchIndexTombstone.FINDING_AIDS]:
+        task_uids += meilisearch_sync.delete_documents(
+            deleted[SearchIndexTombstone.FINDING_AIDS], FindingMeilisearchIndexer.get_index_name()
+        )
+    if deleted[SearchIndexTombstone.ISAD]:
+        task_uids += meilisearch_sync.delete_documents(
+            deleted[SearchIndexTombstone.ISAD], ISADMeilisearchIndexer.get_index_name()
+        )
+
+    return len(meilisearch_sync.wait_for_tasks(task_uids))
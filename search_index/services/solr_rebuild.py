@@ -0,0 +1,231 @@
+import logging
+
+from django.conf import settings
+from django.utils import timezone
+from requests.auth import HTTPBasicAuth
+
+from clockwork_api.http import Session
+from finding_aids.indexers.finding_aids_new_catalog_bulk_indexer import FindingAidsNewCatalogBulkIndexer
+from finding_aids.indexers.finding_aids_new_catalog_parallel_indexer import FindingAidsNewCatalogParallelIndexer
+from finding_aids.models import FindingAidsEntity
+from isad.models import Isad
+from isad.tasks import index_isad_solr_batch
+from search_index.models import SearchIndexWatermark
+from search_index.services import delta_sync
+
+logger = logging.getLogger(__name__)
+
+CORE_SWAP = 'core'
+ALIAS = 'alias'
+
+# ISAD documents share the catalog core with finding aids documents.
+ISAD_QUERY = 'primary_type:"Archival Unit"'
+FINDING_AIDS_QUERY = 'record_origin:"Archives" AND -primary_type:"Archival Unit"'
+FOREIGN_QUERY = '*:* AND -record_origin:"Archives"'
+
+
+class SolrRebuildError(Exception):
+    pass
+
+
+def get_session():
+    session = Session()
+    session.auth = HTTPBasicAuth(getattr(settings, "SOLR_USERNAME", None), getattr(settings, "SOLR_PASSWORD", None))
+    return session
+
+
+def get_solr_base_url():
+    return getattr(settings, "SOLR_URL", "http://localhost:8983/solr")
+
+
+def get_live_name():
+    """
+    Returns the name the catalog is served under (a core, or an alias in alias mode).
+    """
+    return getattr(settings, "SOLR_CORE_CATALOG_NEW", "catalog")
+
+
+def get_swap_mode():
+    return getattr(settings, "SOLR_SWAP_MODE", CORE_SWAP)
+
+
+def get_shadow_name(session):
+    """
+    Returns the core or collection the next rebuild writes into.
+
+    In core mode this is SOLR_CORE_CATALOG_SHADOW (default "<live>_shadow");
+    a CORE SWAP exchanges the two names, so the same shadow name is reused
+    by every rebuild. In alias mode it is whichever collection of
+    SOLR_CATALOG_COLLECTIONS the live alias does not point to.
+    """
+    if get_swap_mode() == CORE_SWAP:
+        return getattr(settings, "SOLR_CORE_CATALOG_SHADOW", "%s_shadow" % get_live_name())
+
+    collections = getattr(settings, "SOLR_CATALOG_COLLECTIONS", ["%s_blue" % get_live_name(), "%s_green" % get_live_name()])
+    current = get_alias_target(session)
+    return next(c for c in collections if c != current)
+
+
+def get_alias_target(session):
+    r = session.get("%s/admin/collections" % get_solr_base_url(), params={'action': 'LISTALIASES', 'wt': 'json'})
+    _check(r, "LISTALIASES")
+    return r.json().get('aliases', {}).get(get_live_name())
+
+
+def count_documents(session, name, query='*:*'):
+    r = session.get("%s/%s/select" % (get_solr_base_url(), name), params={'q': query, 'rows': 0, 'wt': 'json'})
+    _check(r, "count on %s" % name)
+    return r.json()['response']['numFound']
+
+
+def clear(session, name):
+    r = session.post(
+        "%s/%s/update" % (get_solr_base_url(), name),
+        params={'commit': 'true'}, json={'delete': {'query': '*:*'}},
+        timeout=getattr(settings, "SOLR_COMMIT_TIMEOUT", 300)
+    )
+    _check(r, "clearing %s" % name)
+
+
+def commit(session, name):
+    r = session.post(
+        "%s/%s/update" % (get_solr_base_url(), name),
+        params={'commit': 'true'}, json={},
+        timeout=getattr(settings, "SOLR_COMMIT_TIMEOUT", 300)
+    )
+    _check(r, "commit on %s" % name)
+
+
+def get_indexable_finding_aids():
+    """
+    Returns the finding aids entities that belong in the catalog.
+    """
+    return FindingAidsEntity.objects.filter(published=True, is_template=False, archival_unit__isad__published=True)
+
+
+def get_expected_counts():
+    """
+    Returns the number of documents the catalog should hold, counted in the database.
+    """
+    return {
+        'finding_aids': get_indexable_finding_aids().count(),
+        'isad': Isad.objects.filter(published=True).count(),
+    }
+
+
+def validate(session, name, tolerance=0):
+    """
+    Compares the document counts of a core with the database counts.
+
+    Returns:
+        dict: {record type: (documents in Solr, rows in the database)} for each record type.
+
+    Raises:
+        SolrRebuildError: if any count differs by more than `tolerance`.
+    """
+    expected = get_expected_counts()
+    counts = {
+        'finding_aids': (count_documents(session, name, FINDING_AIDS_QUERY), expected['finding_aids']),
+        'isad': (count_documents(session, name, ISAD_QUERY), expected['isad']),
+    }
+    for record_type, (indexed, in_database) in counts.items():
+        if abs(indexed - in_database) > tolerance:
+            raise SolrRebuildError(
+                "%s has %s %s documents, the database has %s." % (name, indexed, record_type, in_database)
+            )
+    return counts
+
+
+def swap(session, shadow):
+    """
+    Makes the shadow core (or collection) live.
+
+    Core mode issues a CORE SWAP, alias mode points the live alias at the
+    shadow collection. Both are atomic for searchers.
+    """
+    live = get_live_name()
+    if get_swap_mode() == CORE_SWAP:
+        r = session.get(
+            "%s/admin/cores" % get_solr_base_url(),
+            params={'action': 'SWAP', 'core': live, 'other': shadow, 'wt': 'json'}
+        )
+        _check(r, "CORE SWAP %s <-> %s" % (live, shadow))
+    else:
+        r = session.get(
+            "%s/admin/collections" % get_solr_base_url(),
+            params={'action': 'CREATEALIAS', 'name': live, 'collections': shadow, 'wt': 'json'}
+        )
+        _check(r, "CREATEALIAS %s -> %s" % (live, shadow))
+    logger.info("Catalog %s now serves %s", live, shadow)
+
+
+def rebuild(batch_size=None, tolerance=0, swap_cores=True, force=False, workers=None):
+    """
+    Rebuilds the catalog into the shadow core and swaps it in.
+
+    Steps:
+        1. refuse to run if the live core holds documents this app does not
+           index (they would be lost by the swap), unless `force` is set
+        2. clear the shadow core, index every published finding aids entity
+           (on a process pool sharded by series when `workers` > 1) and ISAD
+           record into it and commit once
+        3. validate the shadow document counts against the database
+        4. swap the shadow core in
+        5. replay the changes made while the rebuild was running (delta
+           sync from the rebuild start) into the new live core
+
+    Returns:
+        dict: the shadow name, the validated counts and whether it was swapped in.
+
+    Raises:
+        SolrRebuildError: on failed Solr requests or a failed validation;
+        the live core is left untouched.
+    """
+    started = timezone.now()
+    session = get_session()
+    shadow = get_shadow_name(session)
+
+    if not force:
+        foreign = count_documents(session, get_live_name(), FOREIGN_QUERY)
+        if foreign:
+            raise SolrRebuildError(
+                "%s holds %s documents not indexed by this application; a swap would drop them." % (
+                    get_live_name(), foreign
+                )
+            )
+
+    clear(session, shadow)
+
+    if workers and workers > 1:
+        parallel_indexer = FindingAidsNewCatalogParallelIndexer(workers=workers, batch_size=batch_size, solr_core=shadow)
+        parallel_indexer.index_all()
+        errors = parallel_indexer.errors + len(parallel_indexer.failures)
+    else:
+        indexer = FindingAidsNewCatalogBulkIndexer(batch_size=batch_size, solr_core=shadow)
+        indexer.index_ids(list(
+            get_indexable_finding_aids().order_by('archival_unit_id', 'id').values_list('id', flat=True)
+        ))
+        errors = indexer.errors
+
+    shadow_url = "%s/%s" % (get_solr_base_url(), shadow)
+    isad_batch_size = batch_size or getattr(settings, "SOLR_INDEX_BATCH_SIZE", 500)
+    isad_ids = list(Isad.objects.filter(published=True).order_by('id').values_list('id', flat=True))
+    for start in range(0, len(isad_ids), isad_batch_size):
+        index_isad_solr_batch(isad_ids[start:start + isad_batch_size], solr_url=shadow_url)
+
+    commit(session, shadow)
+    if errors:
+        raise SolrRebuildError("%s documents or shards failed to index into %s." % (errors, shadow))
+
+    counts = validate(session, shadow, tolerance=tolerance)
+    if not swap_cores:
+        return {'shadow': shadow, 'counts': counts, 'swapped': False}
+
+    swap(session, shadow)
+    delta_sync.sync_target(SearchIndexWatermark.SOLR_CATALOG, since=started)
+    return {'shadow': shadow, 'counts': counts, 'swapped': True}
+
+
+def _check(response, action):
+    if response.status_code != 200:
+        raise SolrRebuildError("Solr %s failed (%s): %s" % (action, response.status_code, response.text))
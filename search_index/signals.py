@@ -0,0 +1,78 @@
+from django.db import transaction
+from django.db.models.signals import post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from hashids import Hashids
+
+from authority.models import Corporation, Country, Language, Person, Place
+from controlled_list.models import Keyword
+from finding_aids.models import FindingAidsEntity
+from isad.models import Isad
+from search_index.models import SearchIndexTombstone
+from search_index.services import authority_fanout
+from search_index.tasks import reindex_authority_dependents
+
+AUTHORITY_MODELS = [Person, Corporation, Country, Place, Keyword, Language]
+
+
+@receiver(pre_delete, sender=FindingAidsEntity)
+def create_finding_aids_tombstone(sender, instance, **kwargs):
+    """
+    Records the deletion of a finding aids entity for the incremental index sync.
+
+    The document id matches the one used by the catalog and Meilisearch indexers.
+    """
+    if instance.catalog_id:
+        document_id = instance.catalog_id
+    else:
+        document_id = Hashids(salt="osacontent", min_length=10).encode(instance.id)
+    SearchIndexTombstone.objects.create(
+        record_type=SearchIndexTombstone.FINDING_AIDS, object_id=instance.id, document_id=document_id
+    )
+
+
+@receiver(pre_delete, sender=Isad)
+def create_isad_tombstone(sender, instance, **kwargs):
+    """
+    Records the deletion of an ISAD record for the incremental index sync.
+    """
+    archival_unit = instance.archival_unit
+    document_id = Hashids(salt="osaarchives", min_length=8).encode(
+        archival_unit.fonds * 1000000 + archival_unit.subfonds * 1000 + archival_unit.series
+    )
+    SearchIndexTombstone.objects.create(
+        record_type=SearchIndexTombstone.ISAD, object_id=instance.id, document_id=document_id
+    )
+
+
+def check_authority_changes(sender, instance, **kwargs):
+    """
+    Remembers whether an authority record is saved with a changed label or wikidata id.
+    """
+    instance._search_index_changed = authority_fanout.has_indexed_changes(instance)
+
+
+def reindex_authority_dependents_on_save(sender, instance, created, **kwargs):
+    """
+    Queues a reindex of the records referencing a changed authority record.
+
+    The job is created right away, so its progress can be followed; the
+    task is sent once the transaction is committed.
+    """
+    if created or not getattr(instance, '_search_index_changed', False):
+        return
+    instance._search_index_changed = False
+    job = authority_fanout.create_job(instance)
+    if job:
+        label, pk = authority_fanout.get_label(instance), instance.pk
+        transaction.on_commit(lambda: reindex_authority_dependents.delay(job.id, label, pk))
+
+
+for authority_model in AUTHORITY_MODELS:
+    pre_save.connect(
+        check_authority_changes, sender=authority_model,
+        dispatch_uid='search_index_check_%s' % authority_model.__name__
+    )
+    post_save.connect(
+        reindex_authority_dependents_on_save, sender=authority_model,
+        dispatch_uid='search_index_reindex_%s' % authority_model.__name__
+    )
@@ -0,0 +1,32 @@
+from celery import shared_task
+
+from search_index.models import ReindexJob
+from search_index.services import authority_fanout, delta_sync
+
+
+@shared_task
+def sync_search_indexes():
+    """
+    Sends every record changed since the last run to the Solr catalog and
+    the Meilisearch AMS index, and removes deleted records from both.
+
+    Returns:
+        list: one result dict per target (see delta_sync.sync_target).
+    """
+    results = delta_sync.sync_all()
+    for result in results:
+        result['since'] = result['since'].isoformat() if result['since'] else None
+    return results
+
+
+@shared_task
+def reindex_authority_dependents(job_id, label, pk):
+    """
+    Reindexes every finding aids entity and ISAD record referencing an
+    authority record (see authority_fanout.run_job).
+
+    Progress is stored on the ReindexJob.
+    """
+    job = ReindexJob.objects.get(pk=job_id)
+    authority_fanout.run_job(job, label, pk)
+    return job.status
@@ -0,0 +1,138 @@
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from archival_unit.tests.helpers import make_fonds, make_subfonds, make_series
+from authority.models import Language, Place
+from clockwork_api.tests.no_index_signals_mixin import NoIndexSignalsMixin
+from container.tests.helpers import make_container
+from controlled_list.models import AccessRight, CarrierType, Keyword, PrimaryType
+from finding_aids.models import FindingAidsEntityLanguage
+from finding_aids.tests.helpers import make_finding_aids
+from isad.tests.helpers import make_isad
+from search_index.models import ReindexJob
+from search_index.services import authority_fanout
+
+
+@override_settings(AUTHORITY_REINDEX_THROTTLE=0)
+class AuthorityFanoutTests(NoIndexSignalsMixin, TestCase):
+    fixtures = ['carrier_types', 'primary_types', 'access_rights']
+
+    def setUp(self):
+        super().setUp()
+        series = make_series(make_subfonds(make_fonds()))
+        self.isad = make_isad(series)
+        container = make_container(series, CarrierType.objects.first())
+        primary_type = PrimaryType.objects.first()
+        access_rights = AccessRight.objects.first()
+        self.fa_1 = make_finding_aids(container, primary_type, access_rights, folder_no=1)
+        self.fa_2 = make_finding_aids(container, primary_type, access_rights, folder_no=2)
+        self.fa_3 = make_finding_aids(container, primary_type, access_rights, folder_no=3)
+
+        self.place = Place.objects.create(place='Budapest')
+        self.keyword = Keyword.objects.create(keyword='Samizdat')
+        self.language = Language.objects.create(language='Hungarian')
+
+    def test_get_dependent_ids_through_m2m_and_through_table(self):
+        self.fa_1.spatial_coverage_place.add(self.place)
+        self.fa_3.spatial_coverage_place.add(self.place)
+        self.fa_3.findingaidsentityassociatedplace_set.create(associated_place=self.place)
+
+        self.assertEqual(
+            authority_fanout.get_dependent_ids('authority.place', self.place.pk), ([self.fa_1.id, self.fa_3.id], [])
+        )
+
+    def test_get_dependent_ids_with_isad(self):
+        FindingAidsEntityLanguage.objects.create(fa_entity=self.fa_2, language=self.language)
+        self.isad.language.add(self.language)
+
+        self.assertEqual(
+            authority_fanout.get_dependent_ids('authority.language', self.language.pk), ([self.fa_2.id], [self.isad.id])
+        )
+
+    def test_has_indexed_changes(self):
+        self.assertFalse(authority_fanout.has_indexed_changes(Keyword(keyword='New')))
+        self.assertFalse(authority_fanout.has_indexed_changes(self.keyword))
+
+        self.keyword.keyword = 'Samizdat literature'
+        self.assertTrue(authority_fanout.has_indexed_changes(self.keyword))
+
+    def test_create_job_skips_queued_duplicates(self):
+        job = authority_fanout.create_job(self.keyword)
+
+        self.assertEqual(job.source, 'controlled_list.keyword:%s' % self.keyword.pk)
+        self.assertIsNone(authority_fanout.create_job(self.keyword))
+
+        job.status = ReindexJob.RUNNING
+        job.save()
+        self.assertIsNotNone(authority_fanout.create_job(self.keyword))
+
+    @override_settings(AUTHORITY_REINDEX_BATCH_SIZE=2)
+    @patch('search_index.services.authority_fanout._index_isad_batch', return_value=0)
+    @patch('search_index.services.authority_fanout._index_finding_aids_batch', return_value=0)
+    @patch('search_index.services.authority_fanout.FindingAidsNewCatalogBulkIndexer')
+    def test_run_job(self, bulk_indexer, index_finding_aids_batch, index_isad_batch):
+        for fa in (self.fa_1, self.fa_2, self.fa_3):
+            fa.subject_keyword.add(self.keyword)
+        job = authority_fanout.create_job(self.keyword)
+
+        authority_fanout.run_job(job, 'controlled_list.keyword', self.keyword.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ReindexJob.FINISHED)
+        self.assertEqual((job.processed, job.total), (3, 3))
+        self.assertIsNotNone(job.date_finished)
+        self.assertEqual(
+            [c.args[0] for c in index_finding_aids_batch.call_args_list], [[self.fa_1.id, self.fa_2.id], [self.fa_3.id]]
+        )
+        index_isad_batch.assert_not_called()
+        bulk_indexer.return_value.commit.assert_called_once_with()
+
+    @patch('search_index.services.authority_fanout._index_finding_aids_batch', side_effect=RuntimeError('Solr is down'))
+    @patch('search_index.services.authority_fanout.FindingAidsNewCatalogBulkIndexer')
+    def test_run_job_failure(self, bulk_indexer, index_finding_aids_batch):
+        self.fa_1.subject_keyword.add(self.keyword)
+        job = authority_fanout.create_job(self.keyword)
+
+        authority_fanout.run_job(job, 'controlled_list.keyword', self.keyword.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ReindexJob.FAILED)
+        self.assertEqual(job.error, 'Solr is down')
+        bulk_indexer.return_value.commit.assert_not_called()
+
+    @patch('search_index.services.authority_fanout.FindingMeilisearchIndexer')
+    @patch('search_index.services.authority_fanout.ISADMeilisearchIndexer')
+    @patch('search_index.services.authority_fanout.index_isad_solr_batch', return_value=([], 1))
+    @patch('search_index.services.authority_fanout.FindingAidsNewCatalogBulkIndexer')
+    def test_rejected_documents_fail_the_job(self, bulk_indexer, index_isad_solr_batch, isad_meilisearch_indexer,
+                                             finding_aids_meilisearch_indexer):
+        solr_indexer = bulk_indexer.return_value
+        solr_indexer.errors = 0
+
+        def index_batch(ids):
+            solr_indexer.errors += 1
+
+        solr_indexer.index_batch.side_effect = index_batch
+        self.fa_1.findingaidsentitylanguage_set.create(language=self.language)
+        self.isad.language.add(self.language)
+        job = authority_fanout.create_job(self.language)
+
+        authority_fanout.run_job(job, 'authority.language', self.language.pk)
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.errors, job.processed), (ReindexJob.FAILED, 2, 2))
+        self.assertEqual(job.error, '2 of 2 records could not be indexed.')
+
+    @patch('search_index.signals.reindex_authority_dependents')
+    def test_renaming_queues_a_job(self, task):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.keyword.save()
+        self.assertFalse(ReindexJob.objects.exists())
+
+        self.keyword.keyword = 'Samizdat literature'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.keyword.save()
+
+        job = ReindexJob.objects.get()
+        task.delay.assert_called_once_with(job.id, 'controlled_list.keyword', self.keyword.pk)
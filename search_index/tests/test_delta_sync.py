@@ -0,0 +1,186 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from archival_unit.models import ArchivalUnit
+from archival_unit.tests.helpers import make_fonds, make_subfonds, make_series
+from authority.models import Place
+from clockwork_api.tests.no_index_signals_mixin import NoIndexSignalsMixin
+from container.models import Container
+from container.tests.helpers import make_container
+from controlled_list.models import AccessRight, CarrierType, Keyword, PrimaryType
+from finding_aids.models import FindingAidsEntity
+from finding_aids.tests.helpers import make_finding_aids
+from isad.models import Isad
+from isad.tests.helpers import make_isad
+from search_index.models import SearchIndexTombstone, SearchIndexWatermark
+from search_index.services import delta_sync
+
+
+class DeltaSyncTests(NoIndexSignalsMixin, TestCase):
+    fixtures = ['carrier_types', 'primary_types', 'access_rights']
+
+    def setUp(self):
+        super().setUp()
+        self.series = make_series(make_subfonds(make_fonds()))
+        self.isad = make_isad(self.series)
+        self.containers = [
+            make_container(self.series, CarrierType.objects.first(), container_no=i) for i in (1, 2)
+        ]
+        primary_type = PrimaryType.objects.first()
+        access_rights = AccessRight.objects.first()
+        self.fa_1 = make_finding_aids(self.containers[0], primary_type, access_rights, folder_no=1)
+        self.fa_2 = make_finding_aids(self.containers[1], primary_type, access_rights, folder_no=1)
+        self.fa_3 = make_finding_aids(self.containers[1], primary_type, access_rights, folder_no=2)
+
+        # Everything above happened before the watermark.
+        self.watermark = timezone.now() + timedelta(seconds=1)
+        self.later = self.watermark + timedelta(seconds=1)
+        for model in (ArchivalUnit, Container, FindingAidsEntity, Isad):
+            model.objects.update(date_created=self.watermark - timedelta(days=1))
+        ArchivalUnit.objects.update(date_updated=None)
+        Container.objects.update(date_updated=None)
+
+        patcher = patch('search_index.services.delta_sync.index_queue.lock')
+        self.lock = patcher.start().return_value
+        self.lock.acquire.return_value = True
+        self.addCleanup(patcher.stop)
+
+    def test_nothing_changed(self):
+        self.assertEqual(delta_sync.get_changed_finding_aids_ids(self.watermark), [])
+        self.assertEqual(delta_sync.get_changed_isad_ids(self.watermark), [])
+
+    def test_without_watermark_everything_is_changed(self):
+        self.assertEqual(delta_sync.get_changed_finding_aids_ids(None), [self.fa_1.id, self.fa_2.id, self.fa_3.id])
+
+    def test_own_change(self):
+        FindingAidsEntity.objects.filter(pk=self.fa_1.pk).update(date_updated=self.later)
+
+        self.assertEqual(delta_sync.get_changed_finding_aids_ids(self.watermark), [self.fa_1.id])
+
+    def test_publication_and_confidentiality_changes(self):
+        with patch('django.utils.timezone.now', return_value=self.later):
+            self.fa_1.unpublish()
+            self.fa_2.set_confidential()
+        self.assertEqual(delta_sync.get_changed_finding_aids_ids(self.watermark), [self.fa_1.id, self.fa_2.id])
+        self.assertFalse(FindingAidsEntity.objects.filter(date_updated__isnull=False).exists())
+
+        with patch('django.utils.timezone.now', return_value=self.later):
+            self.isad.unpublish()
+        self.assertEqual(delta_sync.get_changed_isad_ids(self.watermark), [self.isad.id])
+
+    def test_container_change(self):
+        Container.objects.filter(pk=self.containers[1].pk).update(date_updated=self.later)
+
+        self.assertEqual(delta_sync.get_changed_finding_aids_ids(self.watermark), [self.fa_2.id, self.fa_3.id])
+
+    def test_archival_unit_change(self):
+        ArchivalUnit.objects.filter(level='F').update(date_updated=self.later)
+
+        self.assertEqual(delta_sync.get_changed_finding_aids_ids(self.watermark), [self.fa_1.id, self.fa_2.id, self.fa_3.id])
+        self.assertEqual(delta_sync.get_changed_isad_ids(self.watermark), [self.isad.id])
+
+    def test_authority_change(self):
+        place = Place.objects.create(place='Budapest')
+        keyword = Keyword.objects.create(keyword='Samizdat')
+        self.fa_1.spatial_coverage_place.add(place)
+        self.fa_3.subject_keyword.add(keyword)
+        Place.objects.update(date_updated=self.watermark - timedelta(days=1))
+        Keyword.objects.update(date_updated=self.later)
+
+        self.assertEqual(delta_sync.get_changed_finding_aids_ids(self.watermark), [self.fa_3.id])
+
+    def test_delete_creates_tombstone(self):
+        catalog_id = self.fa_1.catalog_id
+        self.fa_1.delete()
+
+        tombstone = SearchIndexTombstone.objects.get()
+        self.assertEqual(tombstone.record_type, SearchIndexTombstone.FINDING_AIDS)
+        self.assertEqual(tombstone.document_id, catalog_id)
+        self.assertEqual(delta_sync.get_tombstones(self.watermark - timedelta(days=1))['finding_aids'], [catalog_id])
+
+    @patch('search_index.services.delta_sync._sync_solr_catalog', return_value=0)
+    def test_sync_moves_watermark(self, sync_solr_catalog):
+        delta_sync.set_watermark(SearchIndexWatermark.SOLR_CATALOG, self.watermark)
+        FindingAidsEntity.objects.filter(pk=self.fa_2.pk).update(date_updated=self.later)
+
+        with patch('django.utils.timezone.now', return_value=self.later):
+            result = delta_sync.sync_target(SearchIndexWatermark.SOLR_CATALOG)
+
+        self.assertEqual(result['finding_aids'], 1)
+        sync_solr_catalog.assert_called_once_with([self.fa_2.id], [], {'finding_aids': [], 'isad': []})
+        self.assertEqual(
+            delta_sync.get_watermark(SearchIndexWatermark.SOLR_CATALOG), self.later - delta_sync.get_overlap()
+        )
+        self.lock.release.assert_called_once()
+
+    @patch('search_index.services.delta_sync._sync_solr_catalog')
+    def test_sync_without_watermark_is_skipped(self, sync_solr_catalog):
+        SearchIndexWatermark.objects.all().delete()
+
+        result = delta_sync.sync_target(SearchIndexWatermark.SOLR_CATALOG)
+
+        self.assertEqual(result['skipped'], 'no watermark')
+        sync_solr_catalog.assert_not_called()
+
+    @patch('search_index.services.delta_sync._sync_solr_catalog')
+    def test_running_sync_is_skipped(self, sync_solr_catalog):
+        delta_sync.set_watermark(SearchIndexWatermark.SOLR_CATALOG, self.watermark)
+        self.lock.acquire.return_value = False
+
+        result = delta_sync.sync_target(SearchIndexWatermark.SOLR_CATALOG)
+
+        self.assertEqual(result['skipped'], 'running')
+        sync_solr_catalog.assert_not_called()
+        self.lock.release.assert_not_called()
+
+    @patch('search_index.services.delta_sync._sync_meilisearch_ams', return_value=2)
+    def test_failed_sync_keeps_watermark(self, sync_meilisearch_ams):
+        delta_sync.set_watermark(SearchIndexWatermark.MEILISEARCH_AMS, self.watermark)
+
+        result = delta_sync.sync_target(SearchIndexWatermark.MEILISEARCH_AMS)
+
+        self.assertEqual(result['errors'], 2)
+        self.assertEqual(delta_sync.get_watermark(SearchIndexWatermark.MEILISEARCH_AMS), self.watermark)
+        self.assertEqual(delta_sync.get_failed_runs(SearchIndexWatermark.MEILISEARCH_AMS), 1)
+
+    @override_settings(SEARCH_INDEX_SYNC_MAX_FAILED_RUNS=2)
+    @patch('search_index.services.delta_sync._sync_meilisearch_ams', return_value=1)
+    def test_repeatedly_failing_sync_moves_watermark(self, sync_meilisearch_ams):
+        delta_sync.set_watermark(SearchIndexWatermark.MEILISEARCH_AMS, self.watermark)
+
+        with patch('django.utils.timezone.now', return_value=self.later):
+            delta_sync.sync_target(SearchIndexWatermark.MEILISEARCH_AMS)
+            self.assertEqual(delta_sync.get_watermark(SearchIndexWatermark.MEILISEARCH_AMS), self.watermark)
+
+            with self.assertLogs('search_index.services.delta_sync', level='ERROR'):
+                delta_sync.sync_target(SearchIndexWatermark.MEILISEARCH_AMS)
+
+        self.assertEqual(
+            delta_sync.get_watermark(SearchIndexWatermark.MEILISEARCH_AMS), self.later - delta_sync.get_overlap()
+        )
+        self.assertEqual(delta_sync.get_failed_runs(SearchIndexWatermark.MEILISEARCH_AMS), 0)
+
+    @patch('search_index.services.delta_sync.index_isad_solr_batch', return_value=([], 1))
+    @patch('search_index.services.delta_sync.FindingAidsNewCatalogBulkIndexer')
+    def test_rejected_isad_update_keeps_watermark(self, bulk_indexer, index_isad_solr_batch):
+        bulk_indexer.return_value.errors = 0
+        bulk_indexer.return_value.batch_size = 500
+        delta_sync.set_watermark(SearchIndexWatermark.SOLR_CATALOG, self.watermark)
+        Isad.objects.filter(pk=self.isad.pk).update(date_updated=self.later)
+
+        result = delta_sync.sync_target(SearchIndexWatermark.SOLR_CATALOG)
+
+        index_isad_solr_batch.assert_called_once_with([self.isad.id])
+        self.assertEqual(result['errors'], 1)
+        self.assertEqual(delta_sync.get_watermark(SearchIndexWatermark.SOLR_CATALOG), self.watermark)
+
+    def test_prune_tombstones_waits_for_every_target(self):
+        self.fa_1.delete()
+        delta_sync.set_watermark(SearchIndexWatermark.SOLR_CATALOG, self.later)
+        self.assertEqual(delta_sync.prune_tombstones(), 0)
+
+        delta_sync.set_watermark(SearchIndexWatermark.MEILISEARCH_AMS, self.later)
+        self.assertEqual(delta_sync.prune_tombstones(), 1)
@@ -0,0 +1,97 @@
+from unittest.mock import Mock, patch
+
+from django.test import TestCase, override_settings
+
+from search_index.services import solr_rebuild
+
+
+def _response(payload=None, status_code=200):
+    return Mock(status_code=status_code, text='', json=Mock(return_value=payload or {}))
+
+
+def _count(num_found):
+    return _response({'response': {'numFound': num_found}})
+
+
+@override_settings(SOLR_URL='http://solr', SOLR_CORE_CATALOG_NEW='catalog', SOLR_USERNAME='solr', SOLR_PASSWORD='solr')
+class SolrRebuildTests(TestCase):
+    def setUp(self):
+        self.session = Mock()
+        self.session.post.return_value = _response()
+        patcher = patch('search_index.services.solr_rebuild.get_session', return_value=self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_validate_compares_counts_with_database(self):
+        self.session.get.side_effect = [_count(10), _count(2)]
+        with patch('search_index.services.solr_rebuild.get_expected_counts',
+                   return_value={'finding_aids': 10, 'isad': 3}):
+            with self.assertRaises(solr_rebuild.SolrRebuildError):
+                solr_rebuild.validate(self.session, 'catalog_shadow')
+
+        self.session.get.side_effect = [_count(10), _count(2)]
+        with patch('search_index.services.solr_rebuild.get_expected_counts',
+                   return_value={'finding_aids': 10, 'isad': 3}):
+            counts = solr_rebuild.validate(self.session, 'catalog_shadow', tolerance=1)
+        self.assertEqual(counts, {'finding_aids': (10, 10), 'isad': (2, 3)})
+
+    def test_core_swap(self):
+        self.assertEqual(solr_rebuild.get_shadow_name(self.session), 'catalog_shadow')
+        self.session.get.return_value = _response()
+
+        solr_rebuild.swap(self.session, 'catalog_shadow')
+
+        url = self.session.get.call_args.args[0]
+        params = self.session.get.call_args.kwargs['params']
+        self.assertEqual(url, 'http://solr/admin/cores')
+        self.assertEqual((params['action'], params['core'], params['other']), ('SWAP', 'catalog', 'catalog_shadow'))
+
+    @override_settings(SOLR_SWAP_MODE='alias', SOLR_CATALOG_COLLECTIONS=['catalog_blue', 'catalog_green'])
+    def test_alias_switch(self):
+        self.session.get.return_value = _response({'aliases': {'catalog': 'catalog_blue'}})
+        shadow = solr_rebuild.get_shadow_name(self.session)
+        self.assertEqual(shadow, 'catalog_green')
+
+        self.session.get.return_value = _response()
+        solr_rebuild.swap(self.session, shadow)
+
+        params = self.session.get.call_args.kwargs['params']
+        self.assertEqual((params['action'], params['name'], params['collections']), ('CREATEALIAS', 'catalog', 'catalog_green'))
+
+    def test_rebuild_refuses_to_drop_foreign_documents(self):
+        self.session.get.return_value = _count(5)
+
+        with self.assertRaises(solr_rebuild.SolrRebuildError):
+            solr_rebuild.rebuild()
+        self.session.post.assert_not_called()
+
+    @patch('search_index.services.solr_rebuild.delta_sync.sync_target')
+    @patch('search_index.services.solr_rebuild.index_isad_solr_batch')
+    @patch('search_index.services.solr_rebuild.FindingAidsNewCatalogBulkIndexer')
+    def test_rebuild_swaps_after_validation(self, bulk_indexer, index_isad_solr_batch, sync_target):
+        bulk_indexer.return_value.errors = 0
+        bulk_indexer.return_value.batch_size = 500
+        self.session.get.side_effect = [_count(0), _count(0), _count(0), _response()]
+
+        result = solr_rebuild.rebuild()
+
+        self.assertTrue(result['swapped'])
+        bulk_indexer.assert_called_once_with(batch_size=None, solr_core='catalog_shadow')
+        self.assertEqual(self.session.get.call_args.kwargs['params']['action'], 'SWAP')
+        sync_target.assert_called_once()
+
+    @patch('search_index.services.solr_rebuild.delta_sync.sync_target')
+    @patch('search_index.services.solr_rebuild.index_isad_solr_batch')
+    @patch('search_index.services.solr_rebuild.FindingAidsNewCatalogBulkIndexer')
+    def test_rebuild_does_not_swap_on_count_mismatch(self, bulk_indexer, index_isad_solr_batch, sync_target):
+        bulk_indexer.return_value.errors = 0
+        bulk_indexer.return_value.batch_size = 500
+        self.session.get.side_effect = [_count(0), _count(0), _count(0)]
+
+        with patch('search_index.services.solr_rebuild.get_expected_counts',
+                   return_value={'finding_aids': 3, 'isad': 0}):
+            with self.assertRaises(solr_rebuild.SolrRebuildError):
+                solr_rebuild.rebuild()
+
+        self.assertEqual(self.session.get.call_count, 3)
+        sync_target.assert_not_called()
@@ -0,0 +1,30 @@
+from rest_framework.reverse import reverse
+
+from clockwork_api.tests.test_views_base_class import TestViewsBaseClass
+from search_index.models import ReindexJob
+
+
+class ReindexJobViewsTests(TestViewsBaseClass):
+    def setUp(self):
+        super().setUp()
+        self.failed_job = ReindexJob.objects.create(
+            source='authority.person:1', status=ReindexJob.FAILED, total=4, processed=4, errors=1
+        )
+        self.finished_job = ReindexJob.objects.create(source='authority.person:2', status=ReindexJob.FINISHED)
+
+    def test_list_filters_by_status(self):
+        response = self.client.get(reverse('search_index-v1:reindex-job-list'), {'status': ReindexJob.FAILED})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([job['id'] for job in response.data['results']], [self.failed_job.id])
+
+    def test_detail(self):
+        response = self.client.get(reverse('search_index-v1:reindex-job-detail', kwargs={'pk': self.failed_job.id}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['status'], response.data['errors']), (ReindexJob.FAILED, 1))
+
+    def test_jobs_are_read_only(self):
+        response = self.client.delete(reverse('search_index-v1:reindex-job-detail', kwargs={'pk': self.failed_job.id}))
+
+        self.assertEqual(response.status_code, 405)
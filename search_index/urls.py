@@ -0,0 +1,15 @@
+"""
+URL configuration for the `search_index` app.
+
+Exposes read-only access to the background reindex jobs.
+"""
+from django.urls import path
+
+from search_index.views import ReindexJobDetail, ReindexJobList
+
+app_name = 'search_index'
+
+urlpatterns = [
+    path('reindex-jobs/', ReindexJobList.as_view(), name='reindex-job-list'),
+    path('reindex-jobs/<int:pk>/', ReindexJobDetail.as_view(), name='reindex-job-detail'),
+]
@@ -0,0 +1,33 @@
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import generics
+
+from search_index.models import ReindexJob
+from search_index.serializers import ReindexJobSerializer
+
+
+class ReindexJobList(generics.ListAPIView):
+    """
+    Returns the background reindex jobs, newest first.
+
+    Jobs are queued when an authority record used by indexed records changes.
+
+    Query Parameters:
+       source (str):
+           What triggered the job, e.g. "authority.person:12".
+       status (str):
+           One of: queued, running, finished, failed.
+    """
+    queryset = ReindexJob.objects.all()
+    serializer_class = ReindexJobSerializer
+    filter_backends = (DjangoFilterBackend,)
+    filterset_fields = ['source', 'status']
+
+
+class ReindexJobDetail(generics.RetrieveAPIView):
+    """
+    Returns the progress of a background reindex job.
+
+    Clients poll this endpoint until the status is 'finished' or 'failed'.
+    """
+    queryset = ReindexJob.objects.all()
+    serializer_class = ReindexJobSerializer